@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from backend.config.database import get_db
+from backend.config.database import get_db, get_write_db
 from backend.config.settings import settings
 from backend.services.auth_service import AuthenticationService
 from backend.schemas import (
@@ -36,6 +36,7 @@ def get_current_user(
     """
     Verify JWT token and return current user.
     Can be used as dependency for protected endpoints.
+    The user is served from the principal cache, so a warm request makes no DB query.
     """
     if not authorization:
         raise HTTPException(
@@ -66,8 +67,8 @@ def get_current_user(
         )
     
     user_id = payload.get("user_id")  # user_id is already a string
-    user = AuthenticationService.get_user_by_id(db, user_id)
-    if not user or not user.is_active:
+    user = AuthenticationService.get_principal(db, user_id)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
@@ -78,11 +79,14 @@ def get_current_user(
 
 def get_api_key_user(
     x_api_key: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    write_db: Session = Depends(get_write_db),
 ) -> User:
     """
     Verify API key and return associated user.
     Alternative to JWT for programmatic access.
+    Lookups use the read pool; the occasional last_used_at write uses the
+    write engine (sessions only connect when first used).
     """
     if not x_api_key:
         raise HTTPException(
@@ -90,7 +94,7 @@ def get_api_key_user(
             detail="Missing X-API-Key header",
         )
     
-    user = AuthenticationService.verify_api_key(db, x_api_key)
+    user = AuthenticationService.verify_api_key(db, x_api_key, write_db=write_db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -113,7 +117,7 @@ def get_api_key_user(
 )
 async def register(
     register_data: RegisterRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """
     Register a new user account.
@@ -124,7 +128,8 @@ async def register(
     - **last_name**: User's last name
     """
     try:
-        user, api_key = AuthenticationService.register_user(db, register_data)
+        password_hash = await AuthenticationService.ahash_password(register_data.password)
+        user, api_key = AuthenticationService.register_user(db, register_data, password_hash=password_hash)
         
         # Log registration
         audit = AuditLog(
@@ -178,7 +183,7 @@ async def register(
 )
 async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """
     Authenticate user and get JWT tokens.
@@ -188,7 +193,7 @@ async def login(
     
     Returns JWT access and refresh tokens for subsequent API calls.
     """
-    user = AuthenticationService.login_user(db, login_data)
+    user = await AuthenticationService.alogin_user(db, login_data)
     
     if not user:
         # Log failed attempt
@@ -332,7 +337,7 @@ async def get_profile(
 async def create_api_key(
     request: APIKeyCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
 ):
     """
     Create a new API key for the current user.
@@ -413,7 +418,7 @@ async def list_api_keys(
 async def revoke_api_key(
     key_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
 ):
     """
     Revoke (deactivate) an API key.
@@ -1,13 +1,23 @@
 """Birth chart endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from typing import AsyncIterator, Optional, Union
 from uuid import UUID
-from backend.config.database import get_db
+import json
+from backend.config.database import WriteSessionLocal, get_db, get_write_db
 from backend.services.calculation_service import CalculationService
+from backend.services.calculation_executor import get_calculation_executor
+from backend.services.chart_batch import (
+    BATCH_FORMATS, BatchTooLargeError, ChartBatchImporter, detect_format, iter_birth_data_rows, spool_body
+)
+from backend.services.chart_columns import find_chart_ids, load_projections, parse_fields, write_chart_columns
+from backend.calculations.exceptions import CalculationBusyError
 from backend.models.database import BirthChart, User
 from backend.schemas import (
-    CreateBirthChartRequest, BirthChartResponse, BirthChartData
+    CreateBirthChartRequest, BirthChartResponse, BirthChartData, BirthChartProjection
 )
 from backend.api.v1.auth import get_current_user
 import logging
@@ -16,13 +26,19 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chart", tags=["Charts"])
 calc_service = CalculationService()
+calc_executor = get_calculation_executor()
+
+
+def _split(values: Optional[str]) -> Optional[list[str]]:
+    names = [v.strip() for v in (values or "").split(",") if v.strip()]
+    return names or None
 
 
 @router.post("", response_model=BirthChartResponse, status_code=status.HTTP_201_CREATED)
 async def create_birth_chart(
     chart_request: CreateBirthChartRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
 ):
     """
     Generate and store a birth chart.
@@ -32,7 +48,9 @@ async def create_birth_chart(
     """
     try:
         # Generate birth chart
-        chart_data_dict = calc_service.generate_birth_chart(chart_request.birth_data)
+        chart_data_dict = await calc_executor.generate_birth_chart(
+            chart_request.birth_data, calc_service
+        )
         
         # Validate chart_data structure
         chart_data_obj = BirthChartData(**chart_data_dict)
@@ -52,6 +70,8 @@ async def create_birth_chart(
         )
         
         db.add(db_chart)
+        db.flush()
+        write_chart_columns(db, [(db_chart.chart_id, chart_data_dict)])
         db.commit()
         db.refresh(db_chart)
         
@@ -78,6 +98,12 @@ async def create_birth_chart(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except CalculationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Birth chart generation error: {str(e)}")
         raise HTTPException(
@@ -86,6 +112,121 @@ async def create_birth_chart(
         )
 
 
+@router.post("/batch")
+async def create_birth_charts_batch(
+    request: Request,
+    input_format: Optional[str] = Query(None, alias="format", pattern="^(csv|jsonl)$"),
+    ayanamsa: float = Query(24.6978),
+    house_system: str = Query("PLACIDUS"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Generate and store birth charts for a whole cohort.
+    
+    The request body is a CSV file (header: date,time,timezone,latitude,
+    longitude,location_name) or JSONL with one birth data object per line;
+    the format comes from ?format= or the Content-Type. The upload is
+    spooled to a temporary file as it arrives and parsed lazily; bodies over
+    CHART_BATCH_MAX_BYTES get a 413. Charts are computed in the calculation
+    pool and inserted in chunked transactions.
+    
+    The response is NDJSON: one {"type": "error"} record per rejected row,
+    {"type": "progress"} after each committed chunk and a final
+    {"type": "summary"} with totals and rows/sec.
+    """
+    stream_format = input_format or detect_format(request.headers.get("content-type"))
+    if stream_format not in BATCH_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specify ?format=csv or ?format=jsonl (or a text/csv or application/x-ndjson body)",
+        )
+    
+    try:
+        body = await spool_body(request.stream())
+    except BatchTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    try:
+        rows = iter_birth_data_rows(body, stream_format)
+        # Pull the first row now so a bad CSV header is a 400, not a stream error
+        first = next(rows, None)
+    except ValueError as e:
+        body.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    def all_rows():
+        if first is not None:
+            yield first
+            yield from rows
+    
+    importer = ChartBatchImporter(calc_executor, session_factory=WriteSessionLocal)
+    
+    async def encode() -> AsyncIterator[str]:
+        try:
+            async for record in importer.run(all_rows(), current_user.user_id, ayanamsa, house_system):
+                yield json.dumps(record) + "\n"
+        except Exception as e:
+            logger.error(f"Chart batch error: {str(e)}")
+            yield json.dumps({"type": "error", "detail": "Chart batch failed"}) + "\n"
+        finally:
+            body.close()
+    
+    return StreamingResponse(
+        encode(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/search",
+    response_model=list[BirthChartProjection],
+    response_model_exclude_unset=True,
+)
+async def search_charts(
+    planet: str = Query(..., description="Planet or angle, e.g. Moon or Ascendant"),
+    zodiac_sign: Optional[str] = None,
+    nakshatra: Optional[str] = None,
+    house: Optional[int] = Query(None, ge=1, le=12),
+    fields: Optional[str] = Query("birth_date,birth_time,birth_location,created_at"),
+    planets: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Find charts by planet placement, e.g. ?planet=Moon&nakshatra=Rohini.
+    
+    Runs against the indexed chart_planet_positions table; results use the
+    same field projection as GET /chart?fields=.
+    """
+    try:
+        field_names = parse_fields(fields)
+        chart_ids = find_chart_ids(
+            db, current_user.user_id, planet,
+            zodiac_sign=zodiac_sign, nakshatra=nakshatra, house=house,
+            skip=skip, limit=min(limit, 100),
+        )
+        return [
+            BirthChartProjection(**chart)
+            for chart in load_projections(db, chart_ids, field_names, _split(planets))
+        ]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Search charts error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search charts",
+        )
+
+
 @router.get("/{chart_id}", response_model=BirthChartResponse)
 async def get_birth_chart(
     chart_id: UUID,
@@ -133,18 +274,43 @@ async def get_birth_chart(
         )
 
 
-@router.get("", response_model=list[BirthChartResponse])
+@router.get(
+    "",
+    response_model=list[Union[BirthChartResponse, BirthChartProjection]],
+    response_model_exclude_unset=True,
+)
 async def list_charts(
     skip: int = 0,
     limit: int = 10,
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. planet_positions,ascendant"),
+    planets: Optional[str] = Query(None, description="Comma-separated planets for planet_positions, e.g. Sun,Moon"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List user's birth charts."""
+    """
+    List user's birth charts.
+    
+    With ?fields= only those fields are returned, read from the columnar
+    chart tables instead of the full chart_data blob.
+    """
     try:
         if limit > 100:
             limit = 100
         
+        if fields or planets:
+            field_names = parse_fields(fields or "planet_positions")
+            chart_ids = db.execute(
+                select(BirthChart.chart_id).where(
+                    BirthChart.user_id == current_user.user_id,
+                ).order_by(
+                    BirthChart.created_at.desc()
+                ).offset(skip).limit(limit)
+            ).scalars().all()
+            return [
+                BirthChartProjection(**chart)
+                for chart in load_projections(db, chart_ids, field_names, _split(planets))
+            ]
+        
         charts = db.query(BirthChart).filter(
             BirthChart.user_id == current_user.user_id,
         ).order_by(
@@ -169,6 +335,11 @@ async def list_charts(
             for chart in charts
         ]
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"List charts error: {str(e)}")
         raise HTTPException(
@@ -1,9 +1,12 @@
 """Health check endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
-from backend.config.database import get_db
+from backend.config.database import get_async_db, get_db, get_pool_stats
 from backend.models.database import User
 from backend.schemas import HealthResponse, SystemStats
 from backend.api.v1.auth import get_current_user
@@ -15,7 +18,7 @@ router = APIRouter(prefix="/health", tags=["Health"])
 
 
 @router.get("", response_model=HealthResponse)
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """
     Check API health status.
     
@@ -26,8 +29,8 @@ async def health_check(db: Session = Depends(get_db)):
     - calculation_engines_status: "ready" or "error"
     """
     try:
-        # Check database
-        db.execute("SELECT 1")
+        # Check database (async session: the probe does not block the event loop)
+        await db.execute(text("SELECT 1"))
         database_status = "connected"
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}")
@@ -42,8 +45,13 @@ async def health_check(db: Session = Depends(get_db)):
         logger.error(f"Calculation engines health check failed: {str(e)}")
         calculation_engines_status = "error"
     
-    # Check cache
-    cache_status = "operational"  # Simplified for now
+    # Check cache (degraded when a configured Redis tier is unreachable)
+    from backend.services.chart_cache import get_chart_cache
+    chart_cache = get_chart_cache()
+    if chart_cache is not None and chart_cache.redis_configured and chart_cache.redis_client is None:
+        cache_status = "degraded"
+    else:
+        cache_status = "operational"
     
     # Determine overall status
     if database_status == "error" or calculation_engines_status == "error":
@@ -63,6 +71,36 @@ async def health_check(db: Session = Depends(get_db)):
     )
 
 
+@router.get("/ready")
+async def readiness_check():
+    """
+    Readiness of the worker serving the probe.
+    
+    Returns 503 until this worker has finished startup and while it drains
+    during shutdown or recycling. Siblings starting or being recycled do
+    not fail the probe; see /health/workers for the whole pool.
+    """
+    from backend.services.worker_runtime import worker_status
+    
+    worker = worker_status()
+    if not worker["ready"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=worker)
+    return worker
+
+
+@router.get("/workers")
+async def workers_check():
+    """
+    Readiness of every worker of this server.
+    
+    Under the multi-worker runner each worker registers itself, so any
+    worker can report the whole pool; a single-process server reports itself.
+    """
+    from backend.services.worker_runtime import pool_status
+    
+    return pool_status()
+
+
 @router.get("/stats", response_model=SystemStats)
 async def get_system_stats(
     current_user: User = Depends(get_current_user),
@@ -81,6 +119,9 @@ async def get_system_stats(
         total_users = db.query(UserModel).count()
         total_predictions = db.query(Prediction).count()
         total_charts = db.query(BirthChart).count()
+        active_connections = sum(
+            pool.get("checked_out", 0) for pool in get_pool_stats().values() if pool
+        )
         
         return SystemStats(
             total_users=total_users,
@@ -89,7 +130,7 @@ async def get_system_stats(
             api_uptime_percentage=99.9,
             average_response_time_ms=145.5,
             cache_hit_rate=0.82,
-            database_connections_active=5,
+            database_connections_active=active_connections,
             timestamp=datetime.utcnow(),
         )
         
@@ -101,3 +142,25 @@ async def get_system_stats(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve statistics",
         )
+
+
+@router.get("/calculations")
+async def get_calculation_stats():
+    """Calculation executor queue depth and per-task timings, plus cache and result store stats."""
+    from backend.services.calculation_executor import get_calculation_executor
+    from backend.services.chart_cache import get_chart_cache
+    from backend.services.result_store import get_result_store
+    
+    chart_cache = get_chart_cache()
+    result_store = get_result_store()
+    return {
+        "executor": get_calculation_executor().get_stats(),
+        "chart_cache": chart_cache.get_stats() if chart_cache is not None else None,
+        "result_store": result_store.get_stats() if result_store is not None else None,
+    }
+
+
+@router.get("/database")
+async def get_database_stats():
+    """Connection pool utilization for the read, write and async engines."""
+    return {"pools": get_pool_stats()}
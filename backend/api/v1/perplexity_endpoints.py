@@ -61,8 +61,9 @@ def _init_services():
     
     if _llm_service is None:
         try:
-            _llm_service = create_cached_perplexity_service()
             _vector_store = create_faiss_vector_store()
+            # Shares the vector store's embedding model for the semantic cache tier
+            _llm_service = create_cached_perplexity_service(embedding_service=_vector_store.embedding_service)
             _kb_service = KnowledgeService()
             _interp_service = InterpretationService()
             _hybrid_service = HybridInterpretationService(
@@ -77,6 +78,12 @@ def _init_services():
             raise
 
 
+async def shutdown_services():
+    """Close the LLM service's pooled HTTP connections (app shutdown)"""
+    if _llm_service is not None:
+        await _llm_service.aclose()
+
+
 @router.post("/interpretations/hybrid", response_model=InterpretationResponse)
 async def hybrid_interpretation(request: InterpretationRequest):
     """
@@ -88,7 +95,7 @@ async def hybrid_interpretation(request: InterpretationRequest):
     try:
         _init_services()
         
-        result = _hybrid_service.interpret(
+        result = await _hybrid_service.ainterpret(
             chart_data=request.chart_data.dict(),
             interpretation_type=request.type,
             strategy=request.strategy,
@@ -116,7 +123,7 @@ async def llm_interpretation(request: InterpretationRequest):
     try:
         _init_services()
         
-        result = _hybrid_service.interpret(
+        result = await _hybrid_service.ainterpret(
             chart_data=request.chart_data.dict(),
             interpretation_type=request.type,
             strategy="llm",
@@ -145,7 +152,7 @@ async def kb_interpretation(request: InterpretationRequest):
     try:
         _init_services()
         
-        result = _hybrid_service.interpret(
+        result = await _hybrid_service.ainterpret(
             chart_data=request.chart_data.dict(),
             interpretation_type=request.type,
             strategy="kb",
@@ -173,7 +180,7 @@ async def template_interpretation(request: InterpretationRequest):
     try:
         _init_services()
         
-        result = _hybrid_service.interpret(
+        result = await _hybrid_service.ainterpret(
             chart_data=request.chart_data.dict(),
             interpretation_type=request.type,
             strategy="template",
@@ -269,6 +276,7 @@ async def get_stats():
             "hybrid_stats": _hybrid_service.get_stats() if _hybrid_service else {},
             "llm_stats": _llm_service.get_budget_remaining() if _llm_service else {},
             "cache_stats": _llm_service.get_cache_stats() if _llm_service else {},
+            "client_stats": _llm_service.get_client_stats() if _llm_service else {},
             "vector_stats": _vector_store.get_stats() if _vector_store else {},
         }
         
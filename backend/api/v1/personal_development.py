@@ -23,10 +23,11 @@ Prohibited Use:
 - Compensation decisions
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel, Field
 from typing import Dict, List, Any, Optional
 from datetime import date
+import asyncio
 import logging
 import os
 
@@ -37,7 +38,9 @@ from backend.calculations.personal_development_engine import (
 )
 from backend.calculations.team_dynamics_engine import TeamDynamicsEngine
 from backend.calculations.numerology_engine import NumerologyCalculator
+from backend.calculations.exceptions import CalculationBusyError
 from backend.agents.personal_development_agent import PersonalDevelopmentAgent
+from backend.services.calculation_executor import get_calculation_executor
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +49,7 @@ router = APIRouter(prefix="/personal-development", tags=["personal-development"]
 # Initialize services
 insights_engine = FlexibleInsightsEngine()
 team_engine = TeamDynamicsEngine()
+calc_executor = get_calculation_executor()
 numerology_calc = NumerologyCalculator()
 
 
@@ -299,11 +303,14 @@ async def analyze_team(request: TeamAnalysisRequest):
             f"with {len(request.team_members)} members"
         )
 
-        # Analyze team
-        analysis = team_engine.analyze_team(
+        # Analyze team off the event loop; uncached readings fan out over the
+        # calculation pool, one pending slot per chunk in flight
+        analysis = await asyncio.to_thread(
+            team_engine.analyze_team,
             request.team_members,
             request.team_name,
             request.include_pairwise_analysis,
+            executor=calc_executor,
         )
 
         # Format top synergies
@@ -335,6 +342,12 @@ async def analyze_team(request: TeamAnalysisRequest):
             disclaimer=analysis.disclaimer,
         )
 
+    except CalculationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Error analyzing team: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,15 +1,22 @@
 """Prediction endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, Optional
 from uuid import UUID
-from backend.config.database import get_db
+import json
+from backend.config.database import get_db, get_write_db
 from backend.services.calculation_service import CalculationService
-from backend.models.database import Prediction, User
+from backend.services.calculation_executor import ExecutorSlot, get_calculation_executor
+from backend.calculations.exceptions import CalculationBusyError, InvalidPredictionWindowError
+from backend.calculations.transit_engine import TransitAnalyzer
+from backend.models.database import BirthChart, Prediction, User
 from backend.schemas import (
     PredictionRequest, PredictionResponse,
-    PredictionWithRemedies
+    PredictionWithRemedies, TransitRequest
 )
 from backend.api.v1.auth import get_current_user
 import logging
@@ -18,13 +25,59 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/predict", tags=["Predictions"])
 calc_service = CalculationService()
+calc_executor = get_calculation_executor()
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _stream_response(
+    records: Iterator[Dict[str, Any]],
+    stream_format: str,
+    slot: ExecutorSlot,
+) -> StreamingResponse:
+    """
+    Encode result records as NDJSON lines or server-sent events.
+    
+    The (synchronous) record generator is run in the threadpool, so each
+    record is sent as soon as it is produced. Errors after the first byte
+    are reported as a final {"type": "error"} record. The calculation
+    executor slot is held until the stream ends or the client goes away.
+    """
+    def encode() -> Iterator[str]:
+        failed = False
+        try:
+            for record in records:
+                yield _encode_record(record, stream_format)
+        except Exception as e:
+            failed = True
+            logger.error(f"Stream error: {str(e)}")
+            yield _encode_record({"type": "error", "detail": "Calculation failed"}, stream_format)
+        finally:
+            slot.release(failed=failed)
+    
+    return StreamingResponse(
+        encode(),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _encode_record(record: Dict[str, Any], stream_format: str) -> str:
+    payload = json.dumps(jsonable_encoder(record))
+    if stream_format == "sse":
+        return f"event: {record['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
 
 
 @router.post("", response_model=PredictionResponse, status_code=status.HTTP_201_CREATED)
 async def create_prediction(
     prediction_request: PredictionRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
+    read_db: Session = Depends(get_db),
 ):
     """
     Generate comprehensive astrological prediction.
@@ -37,11 +90,23 @@ async def create_prediction(
     - Range: 0.0 to 1.0
     """
     try:
+        # A saved chart for this birth data lets transit results be persisted
+        birth_data = prediction_request.birth_data
+        chart_id = read_db.query(BirthChart.chart_id).filter(
+            BirthChart.user_id == current_user.user_id,
+            BirthChart.birth_date == birth_data.date,
+            BirthChart.birth_time == birth_data.time,
+            BirthChart.birth_latitude == birth_data.latitude,
+            BirthChart.birth_longitude == birth_data.longitude,
+            BirthChart.deleted_at.is_(None),
+        ).scalar()
+        
         # Generate syncretic prediction
-        result = calc_service.get_syncretic_prediction(
-            birth_data=prediction_request.birth_data,
+        result = await calc_executor.get_syncretic_prediction(
+            birth_data=birth_data,
             query=prediction_request.query,
             prediction_window_days=prediction_request.prediction_window_days,
+            chart_id=chart_id,
         )
         
         # Calculate prediction window
@@ -51,7 +116,7 @@ async def create_prediction(
         # Store prediction in database
         db_prediction = Prediction(
             user_id=current_user.user_id,
-            chart_id=None,  # Will be populated if chart is saved
+            chart_id=chart_id,
             prediction_type="syncretic",
             prediction_date_start=prediction_start,
             prediction_date_end=prediction_end,
@@ -102,6 +167,12 @@ async def create_prediction(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except CalculationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}")
         raise HTTPException(
@@ -110,6 +181,104 @@ async def create_prediction(
         )
 
 
+@router.post("/stream")
+async def stream_prediction(
+    prediction_request: PredictionRequest,
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$"),
+    top_k: Optional[int] = Query(None, ge=1, le=1000, description="Only emit the strongest events"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream a syncretic prediction as NDJSON or server-sent events.
+    
+    Emits one {"type": "event"} record per event as each system (KP, Dasha,
+    Transit) finishes, then a {"type": "summary"} record. With top_k only
+    the strongest events are emitted, highest first. Streamed predictions
+    are not stored.
+    """
+    try:
+        slot = calc_executor.reserve("syncretic_prediction_stream")
+    except CalculationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+    
+    try:
+        records = calc_service.iter_syncretic_prediction(
+            birth_data=prediction_request.birth_data,
+            query=prediction_request.query,
+            prediction_window_days=prediction_request.prediction_window_days,
+            top_k=top_k,
+        )
+    except InvalidPredictionWindowError as e:
+        slot.release()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return _stream_response(records, stream_format, slot)
+
+
+@router.post("/transits/stream")
+async def stream_transit_activations(
+    transit_request: TransitRequest,
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$"),
+    top_k: Optional[int] = Query(None, ge=1, le=1000, description="Only emit the strongest activations"),
+    exact_timing: bool = Query(False, description="Exact star ingresses instead of the daily scan"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream transit activations as NDJSON or server-sent events.
+    
+    Without top_k, activations are emitted in date order as the scan finds
+    them, so the first record arrives before the whole window is computed.
+    With top_k, a bounded heap keeps the strongest activations, which are
+    emitted highest first once the scan ends. A {"type": "summary"} record
+    closes the stream.
+    """
+    try:
+        chart_data = await calc_executor.generate_birth_chart(
+            transit_request.birth_data, calc_service
+        )
+        slot = calc_executor.reserve("transit_stream")
+    except CalculationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+    
+    start_date = transit_request.query_date or datetime.now(timezone.utc)
+    if start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=timezone.utc)
+    end_date = start_date + timedelta(days=transit_request.window_days)
+    
+    def records() -> Iterator[Dict[str, Any]]:
+        analyzer = TransitAnalyzer()
+        if top_k is None:
+            events = analyzer.iter_transit_activations(
+                chart_data, start_date, end_date, exact_timing=exact_timing
+            )
+        else:
+            events = analyzer.top_transit_activations(
+                chart_data, start_date, end_date, k=top_k, exact_timing=exact_timing
+            )
+        count = 0
+        for event in events:
+            count += 1
+            yield {"type": "event", "event": event}
+        yield {
+            "type": "summary",
+            "event_count": count,
+            "window_start": start_date,
+            "window_end": end_date,
+        }
+    
+    return _stream_response(records(), stream_format, slot)
+
+
 @router.get("/{prediction_id}", response_model=PredictionResponse)
 async def get_prediction(
     prediction_id: UUID,
@@ -6,12 +6,22 @@ FastAPI endpoints for relationship compatibility analysis.
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 from typing import Dict, List, Any, Optional
+from dataclasses import asdict
+import asyncio
 import logging
 
+from backend.api.v1.auth import get_current_user
 from backend.calculations.synastry_engine import SynastryCalculator, SynastryResult
+from backend.config.database import get_db
+from backend.models.database import User
+from backend.schemas import BirthDataInput
+from backend.services.chart_columns import load_synastry_matrix
 from backend.agents.synastry_agent import SynastryAgent
 from backend.services.calculation_service import CalculationService
+from backend.services.calculation_executor import get_calculation_executor
+from backend.calculations.exceptions import CalculationBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +30,7 @@ router = APIRouter(prefix="/synastry", tags=["synastry"])
 # Initialize services
 synastry_calculator = SynastryCalculator()
 calculation_service = CalculationService()
+calc_executor = get_calculation_executor()
 
 
 # Request/Response Models
@@ -50,6 +61,16 @@ class QuickCompatibilityRequest(BaseModel):
     person2_name: Optional[str] = Field(None, description="Second person's name")
 
 
+class MatchRequest(BaseModel):
+    """Rank stored charts by compatibility with one person."""
+    birth_data: BirthDataInput = Field(..., description="Person to find matches for")
+    candidate_chart_ids: Optional[List[str]] = Field(
+        None,
+        description="Charts to rank (default: all of your stored charts)"
+    )
+    top_k: int = Field(default=10, ge=1, le=100, description="Number of matches to return")
+
+
 class AspectInterpretationRequest(BaseModel):
     """Request for aspect interpretation."""
     planet1: str = Field(..., description="First planet")
@@ -121,9 +142,11 @@ async def analyze_synastry(request: SynastryRequest):
             location_name="",
         )
 
-        # Generate charts
-        chart1 = calculation_service.generate_birth_chart(birth_data1)
-        chart2 = calculation_service.generate_birth_chart(birth_data2)
+        # Generate both charts concurrently in the calculation pool
+        chart1, chart2 = await asyncio.gather(
+            calc_executor.generate_birth_chart(birth_data1, calculation_service),
+            calc_executor.generate_birth_chart(birth_data2, calculation_service),
+        )
 
         # Calculate synastry
         result = synastry_calculator.calculate_synastry(
@@ -168,11 +191,45 @@ async def analyze_synastry(request: SynastryRequest):
             message=f"Synastry analysis complete. Overall compatibility: {result.compatibility_score.overall_score:.0f}/100",
         )
 
+    except CalculationBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Error in synastry analysis: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/matches")
+async def find_matches(
+    request: MatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Rank your stored charts by compatibility with one person.
+
+    Candidates are packed into a longitude matrix (from the columnar chart
+    tables) and scored in one broadcast pass with the same aspect rules as
+    /analyze, so thousands of candidates rank in well under a second.
+    """
+    try:
+        chart = await calc_executor.generate_birth_chart(request.birth_data, calculation_service)
+        candidates = load_synastry_matrix(db, current_user.user_id, request.candidate_chart_ids)
+        matches = await asyncio.to_thread(
+            synastry_calculator.rank_matches, chart, candidates, request.top_k
+        )
+        return {
+            "status": "success",
+            "candidates": len(candidates),
+            "matches": [asdict(match) for match in matches],
+        }
+
+    except CalculationBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except Exception as e:
+        logger.error(f"Error ranking matches: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/compatibility/{chart1_id}/{chart2_id}")
 async def quick_compatibility(
     chart1_id: str,
@@ -303,10 +360,12 @@ async def get_info():
             "House overlay interpretation",
             "Composite chart calculation",
             "Compatibility scoring",
+            "Many-to-many match ranking",
             "AI-powered relationship insights",
         ],
         "endpoints": {
             "/analyze": "Full synastry analysis",
+            "/matches": "Rank stored charts by compatibility",
             "/compatibility/{chart1_id}/{chart2_id}": "Quick compatibility check",
             "/aspects/interpret": "Aspect interpretation",
             "/agent/analyze": "AI agent analysis",
@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from backend.config.database import get_db
 from backend.services.calculation_service import CalculationService
+from backend.services.calculation_executor import get_calculation_executor
+from backend.calculations.exceptions import CalculationBusyError
 from backend.models.database import User
 from backend.schemas import TransitRequest, TransitResponse, HealthResponse, SystemStats
 from backend.api.v1.auth import get_current_user
@@ -16,6 +18,7 @@ transits_router = APIRouter(prefix="/transits", tags=["Transits"])
 health_router = APIRouter(prefix="/health", tags=["Health"])
 
 calc_service = CalculationService()
+calc_executor = get_calculation_executor()
 
 
 # ============================================================================
@@ -35,7 +38,9 @@ async def analyze_transits(
     """
     try:
         # Generate birth chart
-        chart_data = calc_service.generate_birth_chart(transit_request.birth_data)
+        chart_data = await calc_executor.generate_birth_chart(
+            transit_request.birth_data, calc_service
+        )
         
         # Analyze transits (simplified for now)
         transit_response = {
@@ -49,6 +54,12 @@ async def analyze_transits(
         
         return transit_response
         
+    except CalculationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Transit analysis error: {str(e)}")
         raise HTTPException(
@@ -5,17 +5,24 @@ Implements the complete Vimshottari dasha system used in Vedic astrology:
 - Mahadasha (120-year planetary periods)
 - Antardasha (sub-periods within Mahadasha)
 - Pratyantardasha (micro-periods within Antardasha)
+- Sookshma and Prana (the two finest sub-levels, via DashaTimeline)
 
 The Vimshottari dasha is the most widely used planetary period system,
 indicating which planet "rules" a given time period and influences events.
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from bisect import bisect_right
+from functools import lru_cache
 import math
 
+import numpy as np
+
+from .exceptions import DashaCalculationError
+
 # Precision constant for floating-point boundary calculations
 # Used to handle edge cases where values are very close to boundaries
 CALCULATION_EPSILON = 1e-9
@@ -38,6 +45,12 @@ DASHA_YEARS = {
 # Total dasha cycle = 120 years
 TOTAL_DASHA_CYCLE = 120
 
+# Dasha levels, coarsest first
+DASHA_LEVELS = ['Mahadasha', 'Antardasha', 'Pratyantardasha', 'Sookshma', 'Prana']
+
+DAYS_PER_YEAR = 365.25
+SECONDS_PER_YEAR = DAYS_PER_YEAR * 86400
+
 
 @dataclass
 class DashaPosition:
@@ -75,6 +88,19 @@ class DashaPhase:
     end_age_at_birth: float
 
 
+@dataclass
+class DashaPeriod:
+    """A single period of a DashaTimeline at one level."""
+    planet: str
+    level: str              # One of DASHA_LEVELS
+    start_date: datetime
+    end_date: datetime
+    
+    @property
+    def duration_days(self) -> float:
+        return (self.end_date - self.start_date).total_seconds() / 86400
+
+
 class DashaCalculator:
     """
     Complete Vimshottari dasha calculation engine.
@@ -172,6 +198,9 @@ class DashaCalculator:
         Calculate complete dasha position (Mahadasha, Antardasha, Pratyantardasha)
         at any given query date.
         
+        Resolved on a DashaTimeline, so single lookups and timeline scans
+        share one model of the period boundaries.
+        
         Args:
             birth_date: Native's birth date
             moon_longitude: Moon's longitude at birth (for determining starting dasha)
@@ -181,204 +210,15 @@ class DashaCalculator:
         
         Returns:
             DashaPosition with complete period information
-        """
-        # Time elapsed since birth
-        time_elapsed = query_date - birth_date
-        days_elapsed = time_elapsed.days + time_elapsed.seconds / 86400
-        years_elapsed = days_elapsed / 365.25
-        
-        # Total dasha years from birth
-        total_dasha_years_elapsed = dasha_balance_years + years_elapsed
-        
-        # Which Mahadasha are we in?
-        mahadasha_index = int(total_dasha_years_elapsed / self.total_cycle) % 9
-        years_in_cycle = total_dasha_years_elapsed % self.total_cycle
-        
-        # Calculate current Mahadasha
-        mahadasha_planet, mahadasha_start_year, mahadasha_end_year = \
-            self._get_current_mahadasha(years_in_cycle)
-        
-        # Convert to actual dates
-        mahadasha_start = birth_date + timedelta(days=mahadasha_start_year * 365.25)
-        mahadasha_end = birth_date + timedelta(days=mahadasha_end_year * 365.25)
-        mahadasha_remaining = (mahadasha_end - query_date).days / 365.25
-        mahadasha_years = self.years[mahadasha_planet]
-        
-        # Calculate Antardasha within current Mahadasha
-        years_in_mahadasha = (total_dasha_years_elapsed - mahadasha_start_year) % mahadasha_years
-        antardasha_planet, antardasha_start_year, antardasha_end_year = \
-            self._get_current_antardasha(mahadasha_planet, years_in_mahadasha)
-        
-        # Convert to actual dates
-        antardasha_start = birth_date + timedelta(days=antardasha_start_year * 365.25)
-        antardasha_end = birth_date + timedelta(days=antardasha_end_year * 365.25)
-        antardasha_remaining = (antardasha_end - query_date).days / 365.25
-        antardasha_years = self._get_antardasha_duration(mahadasha_planet, antardasha_planet)
-        
-        # Calculate Pratyantardasha within current Antardasha
-        days_in_antardasha = (query_date - antardasha_start).days
-        pratyantardasha_planet, pratyantardasha_start_day, pratyantardasha_end_day = \
-            self._get_current_pratyantardasha(
-                antardasha_planet,
-                days_in_antardasha,
-                self._get_antardasha_duration_days(mahadasha_planet, antardasha_planet)
-            )
-        
-        pratyantardasha_start = antardasha_start + timedelta(days=pratyantardasha_start_day)
-        pratyantardasha_end = antardasha_start + timedelta(days=pratyantardasha_end_day)
-        pratyantardasha_remaining = (pratyantardasha_end - query_date).days
-        pratyantardasha_years = pratyantardasha_end_day - pratyantardasha_start_day
-        
-        # Calculate percentage through cycle
-        percentage = (total_dasha_years_elapsed % self.total_cycle) / self.total_cycle * 100
-        
-        return DashaPosition(
-            dasha_planet=mahadasha_planet,
-            dasha_start=mahadasha_start,
-            dasha_end=mahadasha_end,
-            dasha_years=mahadasha_years,
-            dasha_remaining=mahadasha_remaining,
-            
-            antardasha_planet=antardasha_planet,
-            antardasha_start=antardasha_start,
-            antardasha_end=antardasha_end,
-            antardasha_years=antardasha_years,
-            antardasha_remaining=antardasha_remaining,
-            
-            pratyantardasha_planet=pratyantardasha_planet,
-            pratyantardasha_start=pratyantardasha_start,
-            pratyantardasha_end=pratyantardasha_end,
-            pratyantardasha_years=pratyantardasha_years,
-            pratyantardasha_remaining=pratyantardasha_remaining,
-            
-            percentage_complete=percentage
-        )
-    
-    
-    def _get_current_mahadasha(self, years_in_cycle: float) -> Tuple[str, float, float]:
-        """
-        Determine which Mahadasha period we're in and its dates.
-        
-        Args:
-            years_in_cycle: Years into the 120-year cycle
         
-        Returns:
-            Tuple of (planet_name, start_year, end_year)
+        Raises:
+            DashaCalculationError: If query_date is before the cycle start
         """
-        cumulative_years = 0
-        
-        for planet in self.sequence:
-            planet_years = self.years[planet]
-            end_year = cumulative_years + planet_years
-            
-            if years_in_cycle < end_year:
-                return planet, cumulative_years, end_year
-            
-            cumulative_years = end_year
-        
-        # Shouldn't reach here, but fallback to last planet
-        return self.sequence[-1], cumulative_years - self.years[self.sequence[-1]], cumulative_years
-    
-    
-    def _get_current_antardasha(self, mahadasha_planet: str, years_in_mahadasha: float) -> Tuple[str, float, float]:
-        """
-        Determine which Antardasha (sub-period) we're in within current Mahadasha.
-        
-        Each Mahadasha is subdivided into 9 Antardashas (one for each planet).
-        The sub-periods are proportional to each planet's dasha years.
-        
-        Args:
-            mahadasha_planet: Current Mahadasha planet
-            years_in_mahadasha: Years elapsed in current Mahadasha
-        
-        Returns:
-            Tuple of (planet_name, start_year, end_year) relative to Mahadasha start
-        """
-        mahadasha_duration = self.years[mahadasha_planet]
-        
-        # Each Antardasha duration = (Antardasha planet years / 120) * Mahadasha duration
-        cumulative_years = 0
-        
-        for planet in self.sequence:
-            antardasha_duration = (self.years[planet] / self.total_cycle) * mahadasha_duration
-            end_year = cumulative_years + antardasha_duration
-            
-            if years_in_mahadasha < end_year:
-                return planet, cumulative_years, end_year
-            
-            cumulative_years = end_year
-        
-        # Fallback to last planet
-        return self.sequence[-1], cumulative_years - self._get_antardasha_duration(mahadasha_planet, self.sequence[-1]), cumulative_years
-    
-    
-    def _get_antardasha_duration(self, mahadasha_planet: str, antardasha_planet: str) -> float:
-        """
-        Calculate duration of an Antardasha in years.
-        
-        Formula: (Antardasha planet years / 120 years total) * Mahadasha duration
-        
-        Args:
-            mahadasha_planet: Current Mahadasha lord
-            antardasha_planet: Current Antardasha lord
-        
-        Returns:
-            Duration in years (can be fractional)
-        """
-        mahadasha_duration = self.years[mahadasha_planet]
-        antardasha_planet_years = self.years[antardasha_planet]
-        return (antardasha_planet_years / self.total_cycle) * mahadasha_duration
-    
-    
-    def _get_antardasha_duration_days(self, mahadasha_planet: str, antardasha_planet: str) -> float:
-        """
-        Calculate duration of an Antardasha in days.
-        
-        Args:
-            mahadasha_planet: Current Mahadasha lord
-            antardasha_planet: Current Antardasha lord
-        
-        Returns:
-            Duration in days
-        """
-        years = self._get_antardasha_duration(mahadasha_planet, antardasha_planet)
-        return years * 365.25
-    
-    
-    def _get_current_pratyantardasha(
-        self,
-        antardasha_planet: str,
-        days_in_antardasha: float,
-        antardasha_duration_days: float
-    ) -> Tuple[str, float, float]:
-        """
-        Determine which Pratyantardasha we're in.
-        
-        The Antardasha is subdivided into 9 Pratyantardashas.
-        Similar proportional calculation as Antardasha within Mahadasha.
-        
-        Args:
-            antardasha_planet: Current Antardasha planet
-            days_in_antardasha: Days elapsed in current Antardasha
-            antardasha_duration_days: Total duration of Antardasha in days
-        
-        Returns:
-            Tuple of (planet_name, start_day, end_day)
-        """
-        cumulative_days = 0
-        
-        for planet in self.sequence:
-            # Pratyantardasha duration = (Prat planet years / 120) * Antardasha duration
-            pratyantardasha_duration = (self.years[planet] / self.total_cycle) * antardasha_duration_days
-            end_day = cumulative_days + pratyantardasha_duration
-            
-            if days_in_antardasha < end_day:
-                return planet, cumulative_days, end_day
-            
-            cumulative_days = end_day
-        
-        # Fallback
-        return self.sequence[-1], cumulative_days - (self.years[self.sequence[-1]] / self.total_cycle) * antardasha_duration_days, cumulative_days
+        query_epoch = DashaTimeline._to_epoch(query_date)
+        years_elapsed = (query_epoch - DashaTimeline._to_epoch(birth_date)) / SECONDS_PER_YEAR
+        cycles = max(1, math.ceil((dasha_balance_years + years_elapsed) / TOTAL_DASHA_CYCLE))
+        timeline = _cached_timeline(birth_date, float(dasha_balance_years), cycles)
+        return timeline.position_at(query_date)
     
     
     def get_dasha_timeline(
@@ -498,6 +338,30 @@ class DashaCalculator:
         return favorable_periods
     
     
+    def build_timeline(
+        self,
+        birth_date: datetime,
+        dasha_balance_years: float,
+        years: float = TOTAL_DASHA_CYCLE,
+        depth: int = len(DASHA_LEVELS)
+    ) -> 'DashaTimeline':
+        """
+        Build a reusable DashaTimeline for repeated lookups.
+        
+        Prefer this over calling calculate_dasha_position() in a loop.
+        
+        Args:
+            birth_date: Native's birth date
+            dasha_balance_years: Balance of dasha at birth
+            years: Years after birth to cover
+            depth: Number of levels (1=Mahadasha ... 5=Prana)
+        
+        Returns:
+            DashaTimeline for the native
+        """
+        return DashaTimeline(birth_date, dasha_balance_years, years=years, depth=depth)
+    
+    
     def format_dasha_position(self, position: DashaPosition) -> str:
         """
         Format dasha position for display.
@@ -536,6 +400,258 @@ CYCLE PROGRESS: {position.percentage_complete:.1f}% through 120-year Vimshottari
         return output
 
 
+class DashaTimeline:
+    """
+    Precomputed Vimshottari timeline for one native.
+    
+    All period boundaries of every level (Mahadasha down to Prana) are
+    generated in closed form once and kept as sorted arrays of epoch
+    seconds, so a point lookup is a binary search, a range query is
+    O(log n + k) and many dates can be resolved at once with searchsorted.
+    
+    DashaCalculator.calculate_dasha_position resolves on this timeline.
+    The cycle starts `dasha_balance_years` before birth with Ketu, and
+    every sub-level also runs through DASHA_SEQUENCE starting at Ketu.
+    """
+    
+    def __init__(
+        self,
+        birth_date: datetime,
+        dasha_balance_years: float = 0.0,
+        years: float = TOTAL_DASHA_CYCLE,
+        depth: int = len(DASHA_LEVELS)
+    ):
+        """
+        Build the timeline.
+        
+        Args:
+            birth_date: Native's birth date (naive values are treated as UTC)
+            dasha_balance_years: Years of the cycle elapsed at birth
+            years: Years after birth the timeline must cover
+            depth: Number of levels to build (1-5)
+        """
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise DashaCalculationError(f"Dasha depth must be 1-{len(DASHA_LEVELS)}, got {depth}")
+        if years <= 0:
+            raise DashaCalculationError(f"Timeline length must be positive, got {years}")
+        
+        self.birth_date = birth_date
+        self.dasha_balance_years = dasha_balance_years
+        self.levels = DASHA_LEVELS[:depth]
+        self._naive = birth_date.tzinfo is None
+        
+        birth_epoch = self._to_epoch(birth_date)
+        self.cycle_start = birth_epoch - dasha_balance_years * SECONDS_PER_YEAR
+        n_cycles = max(1, math.ceil((dasha_balance_years + years) / TOTAL_DASHA_CYCLE))
+        self.end_epoch = self.cycle_start + n_cycles * TOTAL_DASHA_CYCLE * SECONDS_PER_YEAR
+        
+        proportions = np.array([DASHA_YEARS[p] for p in DASHA_SEQUENCE], dtype=np.float64) / TOTAL_DASHA_CYCLE
+        offsets = np.concatenate(([0.0], np.cumsum(proportions)[:-1]))
+        
+        # Level boundaries within one cycle, as fractions of the cycle
+        self._starts: List[np.ndarray] = []
+        self._lords: List[np.ndarray] = []
+        starts = np.zeros(1)
+        durations = np.ones(1)
+        cycle_offsets = np.arange(n_cycles, dtype=np.float64)
+        for _ in self.levels:
+            starts = (starts[:, None] + durations[:, None] * offsets[None, :]).ravel()
+            durations = (durations[:, None] * proportions[None, :]).ravel()
+            absolute = (cycle_offsets[:, None] + starts[None, :]).ravel()
+            self._starts.append(self.cycle_start + absolute * TOTAL_DASHA_CYCLE * SECONDS_PER_YEAR)
+            self._lords.append(np.tile(np.arange(9, dtype=np.int8), absolute.size // 9))
+    
+    # ==================== CONVERSION ====================
+    
+    @staticmethod
+    def _to_epoch(date: datetime) -> float:
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return date.timestamp()
+    
+    def _to_epochs(self, dates: Union[Sequence[datetime], np.ndarray]) -> np.ndarray:
+        if isinstance(dates, np.ndarray) and np.issubdtype(dates.dtype, np.datetime64):
+            return dates.astype('datetime64[us]').astype(np.float64) / 1e6
+        return np.array([self._to_epoch(d) for d in dates], dtype=np.float64)
+    
+    def _to_datetime(self, epoch: float) -> datetime:
+        date = datetime.fromtimestamp(epoch, tz=timezone.utc)
+        return date.replace(tzinfo=None) if self._naive else date
+    
+    def _level_index(self, level: str) -> int:
+        try:
+            return self.levels.index(level)
+        except ValueError:
+            raise DashaCalculationError(f"Dasha level not in timeline: {level}")
+    
+    def _period(self, level_index: int, index: int) -> DashaPeriod:
+        starts = self._starts[level_index]
+        end = starts[index + 1] if index + 1 < starts.size else self.end_epoch
+        return DashaPeriod(
+            planet=DASHA_SEQUENCE[self._lords[level_index][index]],
+            level=self.levels[level_index],
+            start_date=self._to_datetime(float(starts[index])),
+            end_date=self._to_datetime(float(end)),
+        )
+    
+    def _index_at(self, level_index: int, epoch: float) -> int:
+        if not self.cycle_start <= epoch < self.end_epoch:
+            raise DashaCalculationError("Date outside the dasha timeline")
+        return bisect_right(self._starts[level_index], epoch) - 1
+    
+    # ==================== LOOKUP ====================
+    
+    def period_at(self, date: datetime, level: str = 'Mahadasha') -> DashaPeriod:
+        """
+        Get the period of one level running at a date.
+        
+        Args:
+            date: Query date
+            level: One of the timeline's levels
+        
+        Returns:
+            DashaPeriod containing the date
+        """
+        level_index = self._level_index(level)
+        return self._period(level_index, self._index_at(level_index, self._to_epoch(date)))
+    
+    def periods_at(self, date: datetime) -> List[DashaPeriod]:
+        """Get the running period of every level at a date, coarsest first."""
+        epoch = self._to_epoch(date)
+        return [self._period(i, self._index_at(i, epoch)) for i in range(len(self.levels))]
+    
+    def periods_between(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        level: str = 'Mahadasha'
+    ) -> List[DashaPeriod]:
+        """
+        List the periods of one level that overlap a date range.
+        
+        Args:
+            start_date: Range start
+            end_date: Range end
+            level: One of the timeline's levels
+        
+        Returns:
+            DashaPeriod list in chronological order
+        """
+        level_index = self._level_index(level)
+        starts = self._starts[level_index]
+        start = max(self._to_epoch(start_date), self.cycle_start)
+        end = min(self._to_epoch(end_date), self.end_epoch)
+        if end < start:
+            return []
+        first = max(int(np.searchsorted(starts, start, side='right')) - 1, 0)
+        last = int(np.searchsorted(starts, end, side='left'))
+        return [self._period(level_index, i) for i in range(first, last)]
+    
+    def lords_at(
+        self,
+        dates: Union[Sequence[datetime], np.ndarray],
+        level: str = 'Mahadasha'
+    ) -> np.ndarray:
+        """
+        Vectorized lord lookup for many dates.
+        
+        Args:
+            dates: Datetimes or a datetime64 array
+            level: One of the timeline's levels
+        
+        Returns:
+            Array of DASHA_SEQUENCE indices, one per date
+        """
+        level_index = self._level_index(level)
+        epochs = self._to_epochs(dates)
+        if epochs.size and (epochs.min() < self.cycle_start or epochs.max() >= self.end_epoch):
+            raise DashaCalculationError("Date outside the dasha timeline")
+        index = np.searchsorted(self._starts[level_index], epochs, side='right') - 1
+        return self._lords[level_index][index]
+    
+    def position_at(self, date: datetime) -> DashaPosition:
+        """
+        Build a DashaPosition (Mahadasha to Pratyantardasha) for a date.
+        
+        Args:
+            date: Query date
+        
+        Returns:
+            DashaPosition with the timeline's exact period boundaries
+        """
+        return self.positions_at([date])[0]
+    
+    def positions_at(self, dates: Union[Sequence[datetime], np.ndarray]) -> List[DashaPosition]:
+        """
+        Vectorized position_at() for many dates (e.g. every day of a scan).
+        
+        Args:
+            dates: Datetimes or a datetime64 array
+        
+        Returns:
+            One DashaPosition per date
+        """
+        if len(self.levels) < 3:
+            raise DashaCalculationError("DashaPosition needs a timeline depth of at least 3")
+        
+        epochs = self._to_epochs(dates)
+        if epochs.size and (epochs.min() < self.cycle_start or epochs.max() >= self.end_epoch):
+            raise DashaCalculationError("Date outside the dasha timeline")
+        
+        planets, starts, ends = [], [], []
+        for level_index in range(3):
+            bounds = np.append(self._starts[level_index], self.end_epoch)
+            index = np.searchsorted(bounds, epochs, side='right') - 1
+            planets.append([DASHA_SEQUENCE[i] for i in self._lords[level_index][index]])
+            starts.append(bounds[index].tolist())
+            ends.append(bounds[index + 1].tolist())
+        
+        # Period boundaries repeat across consecutive dates; convert each once
+        datetimes: Dict[float, datetime] = {}
+        
+        def to_datetime(epoch: float) -> datetime:
+            if epoch not in datetimes:
+                datetimes[epoch] = self._to_datetime(epoch)
+            return datetimes[epoch]
+        
+        cycle_years = (epochs - self.cycle_start) / SECONDS_PER_YEAR % TOTAL_DASHA_CYCLE
+        percentages = (cycle_years / TOTAL_DASHA_CYCLE * 100).tolist()
+        
+        positions = []
+        for i, epoch in enumerate(epochs.tolist()):
+            maha, antar, pratyantar = planets[0][i], planets[1][i], planets[2][i]
+            positions.append(DashaPosition(
+                dasha_planet=maha,
+                dasha_start=to_datetime(starts[0][i]),
+                dasha_end=to_datetime(ends[0][i]),
+                dasha_years=DASHA_YEARS[maha],
+                dasha_remaining=(ends[0][i] - epoch) / SECONDS_PER_YEAR,
+                
+                antardasha_planet=antar,
+                antardasha_start=to_datetime(starts[1][i]),
+                antardasha_end=to_datetime(ends[1][i]),
+                antardasha_years=(ends[1][i] - starts[1][i]) / SECONDS_PER_YEAR,
+                antardasha_remaining=(ends[1][i] - epoch) / SECONDS_PER_YEAR,
+                
+                pratyantardasha_planet=pratyantar,
+                pratyantardasha_start=to_datetime(starts[2][i]),
+                pratyantardasha_end=to_datetime(ends[2][i]),
+                pratyantardasha_years=(ends[2][i] - starts[2][i]) / 86400,
+                pratyantardasha_remaining=(ends[2][i] - epoch) / 86400,
+                
+                percentage_complete=percentages[i]
+            ))
+        return positions
+
+
+@lru_cache(maxsize=64)
+def _cached_timeline(birth_date: datetime, dasha_balance_years: float, cycles: int) -> DashaTimeline:
+    """Depth-3 timeline covering whole cycles, shared by repeated point lookups."""
+    return DashaTimeline(
+        birth_date, dasha_balance_years, years=cycles * TOTAL_DASHA_CYCLE - dasha_balance_years, depth=3
+    )
+
+
 # Convenience functions
 def create_dasha_calculator() -> DashaCalculator:
     """Factory function to create a DashaCalculator instance."""
@@ -11,12 +11,14 @@ Features:
 - Aspect calculations
 - Retrograde detection
 - Timezone and DST handling
+- Vectorized batch positions (NumPy arrays) for scans over many dates
 """
 
 import swisseph as swe
-from typing import Dict, List, Tuple, Optional
+import numpy as np
+from typing import Dict, List, Tuple, Optional, Sequence, Iterable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from functools import lru_cache
 import logging
@@ -25,6 +27,13 @@ from .exceptions import PlanetNotFoundError, EphemerisError, HouseCalculationErr
 
 logger = logging.getLogger(__name__)
 
+# Precision constant for floating-point boundary calculations
+CALCULATION_EPSILON = 1e-9
+
+# Arc lengths used by the vectorized derivations
+SIGN_LENGTH_DEGREES = 30.0
+NAKSHATRA_LENGTH_DEGREES = 360.0 / 27  # 13°20'
+
 
 class HouseSystem(Enum):
     """House calculation systems."""
@@ -88,6 +97,126 @@ class AspectData:
     applying: bool             # True if aspect is applying (getting closer)
 
 
+def sign_indices(longitudes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized zodiac sign lookup.
+
+    Args:
+        longitudes: Array of longitudes in degrees (any shape)
+
+    Returns:
+        Integer array of the same shape with sign indices 0-11 (0 = Aries)
+    """
+    lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+    return (lon // SIGN_LENGTH_DEGREES).astype(np.int8) % 12
+
+
+def nakshatra_indices(longitudes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized nakshatra lookup.
+
+    Args:
+        longitudes: Array of sidereal longitudes in degrees (any shape)
+
+    Returns:
+        Integer array of the same shape with nakshatra indices 0-26 (0 = Ashwini)
+    """
+    lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+    return np.minimum(lon // NAKSHATRA_LENGTH_DEGREES, 26).astype(np.int8)
+
+
+def retrograde_mask(speeds: np.ndarray) -> np.ndarray:
+    """
+    Vectorized retrograde detection.
+
+    Args:
+        speeds: Array of signed longitudinal speeds (degrees/day)
+
+    Returns:
+        Boolean array, True where the body is retrograde (speed < 0)
+    """
+    return np.asarray(speeds) < 0
+
+
+@dataclass
+class PlanetPositionBatch:
+    """
+    Struct-of-arrays result of EphemerisCalculator.get_positions_batch.
+
+    All position arrays are shaped [n_times, n_planets]. Unlike PlanetPosition,
+    ``speed`` keeps its sign so retrograde motion can be derived from it.
+    """
+    planets: List[str]         # Column order of the arrays
+    jd: np.ndarray             # Julian Days (UT), shape [n_times]
+    longitude: np.ndarray      # 0-360 degrees
+    latitude: np.ndarray       # -90 to +90 degrees
+    distance: np.ndarray       # AU
+    speed: np.ndarray          # Signed degrees per day
+    tropical: bool
+
+    @property
+    def sign_index(self) -> np.ndarray:
+        """Sign indices 0-11 into EphemerisCalculator.SIGNS."""
+        return sign_indices(self.longitude)
+
+    @property
+    def degree_in_sign(self) -> np.ndarray:
+        """Degrees within the sign (0-30)."""
+        return np.mod(self.longitude, SIGN_LENGTH_DEGREES)
+
+    @property
+    def nakshatra_index(self) -> np.ndarray:
+        """Nakshatra indices 0-26 into EphemerisCalculator.NAKSHATRAS."""
+        return nakshatra_indices(self.longitude)
+
+    @property
+    def is_retrograde(self) -> np.ndarray:
+        """Boolean retrograde mask."""
+        return retrograde_mask(self.speed)
+
+    def column(self, planet_name: str) -> int:
+        """
+        Get the array column for a planet.
+
+        Raises:
+            PlanetNotFoundError: If the planet is not part of this batch
+        """
+        try:
+            return self.planets.index(planet_name)
+        except ValueError:
+            raise PlanetNotFoundError(f"Planet not in batch: {planet_name}")
+
+    def to_positions(self, time_index: int) -> Dict[str, PlanetPosition]:
+        """
+        Materialize one row of the batch as PlanetPosition objects.
+
+        Args:
+            time_index: Row index into the batch
+
+        Returns:
+            Dict mapping planet names to PlanetPosition objects
+        """
+        signs = self.sign_index[time_index]
+        naks = self.nakshatra_index[time_index]
+        positions = {}
+        for j, name in enumerate(self.planets):
+            longitude = float(self.longitude[time_index, j])
+            speed = float(self.speed[time_index, j])
+            positions[name] = PlanetPosition(
+                planet_name=name,
+                longitude=longitude,
+                latitude=float(self.latitude[time_index, j]),
+                distance=float(self.distance[time_index, j]),
+                speed=abs(speed),
+                is_retrograde=speed < 0,
+                house=None,
+                sign=EphemerisCalculator.SIGNS[signs[j]],
+                degree_in_sign=longitude % SIGN_LENGTH_DEGREES,
+                nakshatra=None if self.tropical else EphemerisCalculator.NAKSHATRAS[naks[j]]
+            )
+        return positions
+
+
 class EphemerisCalculator:
     """
     Main class for Swiss Ephemeris calculations.
@@ -126,7 +255,14 @@ class EphemerisCalculator:
         'Rahu': swe.MEAN_NODE,     # Moon's mean ascending node
         'Ketu': 'KETU_SPECIAL',    # Calculated as Rahu + 180°
     }
-    
+
+    # Default planet order for full-chart calculations
+    ALL_PLANETS = [
+        'Sun', 'Moon', 'Mercury', 'Venus', 'Mars',
+        'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto',
+        'Rahu', 'Ketu'
+    ]
+
     def __init__(self, ayanamsa_system: Ayanamsa = Ayanamsa.LAHIRI):
         """
         Initialize ephemeris calculator.
@@ -158,6 +294,58 @@ class EphemerisCalculator:
         jd = swe.julday(year, month, day, hour, swe.GREG_CAL)
         return jd
 
+    @staticmethod
+    def datetimes_to_jd(dates: Iterable[datetime]) -> np.ndarray:
+        """
+        Convert a sequence of datetimes to an array of Julian Days.
+
+        Args:
+            dates: Python datetime objects (UTC)
+
+        Returns:
+            Float64 array of Julian Day Numbers
+        """
+        return np.fromiter(
+            (swe.julday(d.year, d.month, d.day,
+                        d.hour + d.minute / 60.0 + d.second / 3600.0, swe.GREG_CAL)
+             for d in dates),
+            dtype=np.float64
+        )
+
+    @staticmethod
+    def jd_to_datetime(jd: float) -> datetime:
+        """
+        Convert a Julian Day (UT) to a timezone-aware UTC datetime.
+
+        Args:
+            jd: Julian Day Number
+
+        Returns:
+            datetime rounded to the nearest second
+        """
+        year, month, day, hour = swe.revjul(jd, swe.GREG_CAL)
+        base = datetime(year, month, day, tzinfo=timezone.utc)
+        return base + timedelta(seconds=round(hour * 3600.0))
+
+    def jd_range(self, start: datetime, end: datetime, step_days: float = 1.0) -> np.ndarray:
+        """
+        Build an evenly spaced Julian Day grid from start to end (inclusive).
+
+        Args:
+            start: First timestamp (UTC)
+            end: Last timestamp (UTC)
+            step_days: Grid step in days (fractions allowed)
+
+        Returns:
+            Float64 array of Julian Day Numbers
+        """
+        if step_days <= 0:
+            raise ValueError("step_days must be positive")
+        jd_start = self._datetime_to_jd(start)
+        jd_end = self._datetime_to_jd(end)
+        count = int(np.floor((jd_end - jd_start) / step_days + CALCULATION_EPSILON)) + 1
+        return jd_start + np.arange(max(count, 0), dtype=np.float64) * step_days
+
     @lru_cache(maxsize=256)
     def _get_planet_data_cached(
         self,
@@ -288,14 +476,87 @@ class EphemerisCalculator:
         planets = {}
         
         # Sun through Pluto + nodes
-        for planet_name in ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 
-                           'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto',
-                           'Rahu', 'Ketu']:
+        for planet_name in self.ALL_PLANETS:
             planets[planet_name] = self.get_planet_position(planet_name, date, tropical)
         
         return planets
     
     
+    def get_positions_batch(
+        self,
+        jd_array: Sequence[float],
+        planets: Optional[Sequence[str]] = None,
+        tropical: bool = False
+    ) -> PlanetPositionBatch:
+        """
+        Get positions for many planets at many Julian Days in one call.
+        
+        Results are written straight into preallocated NumPy arrays instead of
+        building a PlanetPosition per planet per timestamp. Ketu is derived
+        from the Rahu evaluation, so requesting both costs one node lookup.
+        
+        Args:
+            jd_array: Julian Days (UT) to evaluate, shape [n_times]
+            planets: Planet names in column order (default: ALL_PLANETS)
+            tropical: Use tropical (True) or sidereal (False) zodiac
+        
+        Returns:
+            PlanetPositionBatch with arrays shaped [n_times, n_planets]
+        
+        Raises:
+            PlanetNotFoundError: If any planet name is not recognized
+            EphemerisError: If Swiss Ephemeris fails for a timestamp
+        
+        Example:
+            >>> calc = EphemerisCalculator()
+            >>> jd = calc.jd_range(datetime(2025, 1, 1), datetime(2025, 12, 31))
+            >>> batch = calc.get_positions_batch(jd)
+            >>> batch.longitude.shape
+            (365, 12)
+        """
+        names = list(planets) if planets is not None else list(self.ALL_PLANETS)
+        for name in names:
+            if name not in self.PLANETS:
+                raise PlanetNotFoundError(f"Unknown planet: {name}")
+        
+        jd = np.atleast_1d(np.asarray(jd_array, dtype=np.float64))
+        flags = swe.FLG_SPEED if tropical else swe.FLG_SPEED | swe.FLG_SIDEREAL
+        
+        # [field, time, planet] where field = longitude, latitude, distance, speed
+        data = np.empty((4, jd.size, len(names)), dtype=np.float64)
+        raw_cache: Dict[int, np.ndarray] = {}
+        
+        def raw_series(planet_id: int) -> np.ndarray:
+            if planet_id not in raw_cache:
+                try:
+                    rows = [swe.calc_ut(t, planet_id, flags)[0] for t in jd.tolist()]
+                except swe.Error as e:
+                    raise EphemerisError(f"Swiss Ephemeris batch calculation failed: {e}")
+                raw_cache[planet_id] = np.array(rows, dtype=np.float64).reshape(jd.size, -1)[:, :4]
+            return raw_cache[planet_id]
+        
+        for j, name in enumerate(names):
+            if name == 'Ketu':
+                series = raw_series(self.PLANETS['Rahu'])
+                data[0, :, j] = np.mod(series[:, 0] + 180.0, 360.0)
+                data[1, :, j] = -series[:, 1]
+                data[2:, :, j] = series[:, 2:].T
+            else:
+                series = raw_series(self.PLANETS[name])
+                data[0, :, j] = np.mod(series[:, 0], 360.0)
+                data[1:, :, j] = series[:, 1:].T
+        
+        return PlanetPositionBatch(
+            planets=names,
+            jd=jd,
+            longitude=data[0],
+            latitude=data[1],
+            distance=data[2],
+            speed=data[3],
+            tropical=tropical
+        )
+    
+    
     def get_house_cusps(
         self,
         date: datetime,
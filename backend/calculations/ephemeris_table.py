@@ -0,0 +1,285 @@
+"""
+Precomputed Ephemeris Table
+
+Stores sidereal longitudes and speeds for all planets on a fixed time grid
+(default 6 hours, 1900-2100) in a binary .npy file that is opened with
+``mmap_mode='r'``. Every worker process that loads the same file shares the
+same page-cache pages, and transit scans become array lookups with cubic
+Hermite interpolation instead of repeated Swiss Ephemeris calls.
+
+Files:
+- ``<name>.npy``  float64 array shaped [2, n_steps, n_planets] (longitude, speed)
+- ``<name>.json`` metadata (grid start, step, planet order, ayanamsa)
+
+Build a table once per deployment:
+    python -m backend.calculations.ephemeris_table --output data/ephemeris_6h
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+import argparse
+import json
+import logging
+import os
+
+import numpy as np
+
+from .ephemeris import EphemerisCalculator, Ayanamsa
+from .exceptions import EphemerisError, PlanetNotFoundError
+
+logger = logging.getLogger(__name__)
+
+TABLE_FORMAT_VERSION = 1
+
+# Environment variable pointing at a prebuilt table (path without extension)
+EPHEMERIS_TABLE_ENV = "EPHEMERIS_TABLE_PATH"
+
+# Rows computed per Swiss Ephemeris batch while building
+BUILD_CHUNK_STEPS = 8192
+
+
+class EphemerisTable:
+    """
+    Memory-mapped, interpolated ephemeris lookup.
+
+    Longitudes are interpolated with a cubic Hermite spline that uses the
+    stored speeds as end-point derivatives, so positions and speeds stay
+    continuous across grid points (including the 360° -> 0° wrap).
+    """
+
+    def __init__(self, data: np.ndarray, metadata: Dict, path: Optional[Path] = None):
+        """
+        Wrap an already loaded table array.
+
+        Args:
+            data: Array shaped [2, n_steps, n_planets] (longitude, speed)
+            metadata: Table metadata (see build())
+            path: Source path, if loaded from disk
+        """
+        if data.ndim != 3 or data.shape[0] != 2:
+            raise EphemerisError(f"Invalid ephemeris table shape: {data.shape}")
+
+        self.path = path
+        self.metadata = metadata
+        self.planets: List[str] = list(metadata['planets'])
+        self.start_jd = float(metadata['start_jd'])
+        self.step_days = float(metadata['step_days'])
+        self.n_steps = int(data.shape[1])
+        self.end_jd = self.start_jd + (self.n_steps - 1) * self.step_days
+        self.ayanamsa = metadata.get('ayanamsa')
+        self.tropical = bool(metadata.get('tropical', False))
+
+        self._longitude = data[0]
+        self._speed = data[1]
+        self._columns = {name: i for i, name in enumerate(self.planets)}
+
+    # ==================== CONSTRUCTION ====================
+
+    @classmethod
+    def build(
+        cls,
+        output_path: str,
+        start: datetime = datetime(1900, 1, 1),
+        end: datetime = datetime(2100, 1, 1),
+        step_hours: float = 6.0,
+        planets: Optional[Sequence[str]] = None,
+        ayanamsa: Ayanamsa = Ayanamsa.LAHIRI,
+        tropical: bool = False
+    ) -> 'EphemerisTable':
+        """
+        Compute a table with Swiss Ephemeris and write it to disk.
+
+        Args:
+            output_path: Destination path without extension
+            start: First grid timestamp (UTC)
+            end: Last grid timestamp (UTC)
+            step_hours: Grid step in hours
+            planets: Planets to include (default: all 12)
+            ayanamsa: Ayanamsa used for sidereal longitudes
+            tropical: Store tropical instead of sidereal longitudes
+
+        Returns:
+            The newly written table, opened memory-mapped
+        """
+        calc = EphemerisCalculator(ayanamsa)
+        names = list(planets) if planets is not None else list(EphemerisCalculator.ALL_PLANETS)
+        jd = calc.jd_range(start, end, step_hours / 24.0)
+        if jd.size < 2:
+            raise EphemerisError("Ephemeris table needs at least two grid points")
+
+        base = Path(output_path)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        npy_path = base.with_suffix('.npy')
+
+        data = np.lib.format.open_memmap(
+            npy_path, mode='w+', dtype=np.float64, shape=(2, jd.size, len(names))
+        )
+        for offset in range(0, jd.size, BUILD_CHUNK_STEPS):
+            chunk = jd[offset:offset + BUILD_CHUNK_STEPS]
+            batch = calc.get_positions_batch(chunk, names, tropical=tropical)
+            data[0, offset:offset + chunk.size] = batch.longitude
+            data[1, offset:offset + chunk.size] = batch.speed
+        data.flush()
+        del data
+
+        metadata = {
+            'format_version': TABLE_FORMAT_VERSION,
+            'start_jd': float(jd[0]),
+            'step_days': step_hours / 24.0,
+            'n_steps': int(jd.size),
+            'planets': names,
+            'ayanamsa': ayanamsa.name,
+            'tropical': tropical,
+        }
+        base.with_suffix('.json').write_text(json.dumps(metadata, indent=2))
+
+        logger.info(f"✅ Ephemeris table written: {npy_path} ({jd.size} steps x {len(names)} planets)")
+        return cls.load(str(base))
+
+    @classmethod
+    def load(cls, path: str) -> 'EphemerisTable':
+        """
+        Open a table from disk as a read-only memory map.
+
+        Args:
+            path: Table path without extension
+
+        Returns:
+            EphemerisTable backed by the shared page cache
+        """
+        base = Path(path)
+        meta_path = base.with_suffix('.json')
+        npy_path = base.with_suffix('.npy')
+        if not meta_path.exists() or not npy_path.exists():
+            raise EphemerisError(f"Ephemeris table not found: {base}")
+
+        metadata = json.loads(meta_path.read_text())
+        if metadata.get('format_version') != TABLE_FORMAT_VERSION:
+            raise EphemerisError(
+                f"Unsupported ephemeris table version: {metadata.get('format_version')}"
+            )
+
+        data = np.load(npy_path, mmap_mode='r')
+        return cls(data, metadata, path=base)
+
+    # ==================== LOOKUP ====================
+
+    def covers(self, jd_start: float, jd_end: Optional[float] = None) -> bool:
+        """Check whether a Julian Day (or range) lies inside the table."""
+        jd_end = jd_start if jd_end is None else jd_end
+        return self.start_jd <= jd_start and jd_end <= self.end_jd
+
+    def _column_indices(self, planets: Optional[Sequence[str]]) -> Tuple[List[str], np.ndarray]:
+        names = list(planets) if planets is not None else self.planets
+        try:
+            cols = np.array([self._columns[name] for name in names], dtype=np.intp)
+        except KeyError as e:
+            raise PlanetNotFoundError(f"Planet not in ephemeris table: {e.args[0]}")
+        return names, cols
+
+    def interpolate(
+        self,
+        jd_array: Sequence[float],
+        planets: Optional[Sequence[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolate longitudes and speeds at arbitrary Julian Days.
+
+        Args:
+            jd_array: Julian Days (UT), shape [n_times]
+            planets: Planet names in column order (default: all in table)
+
+        Returns:
+            Tuple of (longitude, speed) arrays shaped [n_times, n_planets]
+
+        Raises:
+            EphemerisError: If any Julian Day falls outside the table
+            PlanetNotFoundError: If a planet is not stored in the table
+        """
+        jd = np.atleast_1d(np.asarray(jd_array, dtype=np.float64))
+        _, cols = self._column_indices(planets)
+
+        if jd.size and not self.covers(float(jd.min()), float(jd.max())):
+            raise EphemerisError(
+                f"Julian Day outside ephemeris table range "
+                f"[{self.start_jd}, {self.end_jd}]"
+            )
+
+        position = (jd - self.start_jd) / self.step_days
+        index = np.clip(np.floor(position).astype(np.intp), 0, self.n_steps - 2)
+        u = (position - index)[:, None]
+
+        h = self.step_days
+        lon0 = self._longitude[index][:, cols]
+        lon1 = self._longitude[index + 1][:, cols]
+        m0 = self._speed[index][:, cols] * h
+        m1 = self._speed[index + 1][:, cols] * h
+
+        # Unwrapped end-point difference so 359° -> 1° is +2°, not -358°
+        delta = np.mod(lon1 - lon0 + 180.0, 360.0) - 180.0
+
+        u2 = u * u
+        u3 = u2 * u
+        longitude = lon0 + (-2 * u3 + 3 * u2) * delta + (u3 - 2 * u2 + u) * m0 + (u3 - u2) * m1
+        speed = ((-6 * u2 + 6 * u) * delta + (3 * u2 - 4 * u + 1) * m0 + (3 * u2 - 2 * u) * m1) / h
+
+        return np.mod(longitude, 360.0), speed
+
+    def interpolate_dates(
+        self,
+        dates: Sequence[datetime],
+        planets: Optional[Sequence[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Same as interpolate() but takes UTC datetimes."""
+        jd = EphemerisCalculator.datetimes_to_jd(dates)
+        return self.interpolate(jd, planets)
+
+
+@lru_cache(maxsize=4)
+def load_ephemeris_table(path: str) -> EphemerisTable:
+    """
+    Load (once per process) a memory-mapped ephemeris table.
+
+    Because the array is mapped read-only, forked or separately started
+    workers that open the same file share its physical pages.
+    """
+    return EphemerisTable.load(path)
+
+
+def get_default_ephemeris_table() -> Optional[EphemerisTable]:
+    """
+    Return the table configured via EPHEMERIS_TABLE_PATH, if present.
+
+    Returns:
+        EphemerisTable, or None when no table is configured or readable
+    """
+    path = os.getenv(EPHEMERIS_TABLE_ENV)
+    if not path:
+        return None
+    try:
+        return load_ephemeris_table(path)
+    except EphemerisError as e:
+        logger.warning(f"Ephemeris table unavailable, falling back to Swiss Ephemeris: {e}")
+        return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build a precomputed ephemeris table")
+    parser.add_argument('--output', required=True, help="Output path without extension")
+    parser.add_argument('--start-year', type=int, default=1900)
+    parser.add_argument('--end-year', type=int, default=2100)
+    parser.add_argument('--step-hours', type=float, default=6.0)
+    parser.add_argument('--ayanamsa', default='LAHIRI', choices=[a.name for a in Ayanamsa])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = EphemerisTable.build(
+        args.output,
+        start=datetime(args.start_year, 1, 1),
+        end=datetime(args.end_year, 1, 1),
+        step_hours=args.step_hours,
+        ayanamsa=Ayanamsa[args.ayanamsa],
+    )
+    print(f"Table covers JD {table.start_jd:.2f} - {table.end_jd:.2f}")
@@ -69,3 +69,8 @@ class TransitCalculationError(CalculationError):
 class InterpretationError(CalculationError):
     """Raised when interpretation generation fails."""
     pass
+
+
+class CalculationBusyError(CalculationError):
+    """Raised when the calculation executor queue is full."""
+    pass
@@ -2,15 +2,22 @@
 KP (Krishnamurti Paddhati) Calculation Engine
 
 This module implements the core KP astrology calculations:
-- Sub-lord calculation (249 subdivisions per zodiac)
+- Sub-lord calculation (243 subs, 252 sign-split divisions per zodiac)
 - Cuspal sub-lords (house cusp analysis)
 - Significator analysis
 - Ruling planets calculation
+
+Sub-lord lookups use a precomputed boundary table (243 subs, split wherever
+one of the sign boundaries falls inside a sub, giving 252 entries), searched
+with bisect for single longitudes and NumPy searchsorted for arrays.
 """
 
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from bisect import bisect_right
+
+import numpy as np
 
 # Precision constant for floating-point boundary calculations
 # Used to handle edge cases where values are very close to boundaries
@@ -47,6 +54,67 @@ NAKSHATRA_NAMES = [
 # Nakshatra lords (cycle of 9 planets repeating 3 times)
 NAKSHATRA_LORDS = SUB_LORD_SEQUENCE * 3  # 27 nakshatras
 
+NAKSHATRA_LENGTH = 13 + (20/60)  # 13.333333 degrees
+SIGN_LENGTH = 30.0
+
+
+def _build_sub_lord_table():
+    """
+    Build the KP sub division table (252 entries).
+    
+    Each entry is one arc with a constant sign, nakshatra and sub-lord:
+    the 243 nakshatra subs (9 per nakshatra) split wherever a sign
+    boundary falls inside a sub. Sub arcs are accumulated exactly as the
+    original per-call scan did, and nakshatra starts are shifted down by
+    CALCULATION_EPSILON to keep the inclusive-lower-bound convention.
+    
+    Returns:
+        Tuple of (starts, entries) where starts is the sorted list of entry
+        start longitudes and entries holds
+        (nakshatra_index, sub_lord_index, sub_lord_start, sub_lord_end, sign_index)
+    """
+    starts = []
+    entries = []
+    for nak in range(27):
+        nak_start = nak * NAKSHATRA_LENGTH
+        cumulative_arc = 0.0
+        for sub_index, planet in enumerate(SUB_LORD_SEQUENCE):
+            arc_length = VIMSHOTTARI_PROPORTIONS[planet]
+            sub_start, sub_end = cumulative_arc, cumulative_arc + arc_length
+            if sub_index == 0:
+                absolute_start = max(nak_start - CALCULATION_EPSILON, 0.0)
+            else:
+                absolute_start = nak_start + sub_start
+            
+            # Split at sign boundaries that fall strictly inside the sub arc
+            arc_points = [absolute_start]
+            next_sign = (int(nak_start + sub_start) // 30 + 1) * SIGN_LENGTH
+            while (nak_start + sub_start + CALCULATION_EPSILON < next_sign
+                   < nak_start + sub_end - CALCULATION_EPSILON):
+                arc_points.append(next_sign)
+                next_sign += SIGN_LENGTH
+            
+            for point in arc_points:
+                sign_index = int((max(point, nak_start) + CALCULATION_EPSILON) / SIGN_LENGTH) % 12
+                starts.append(point)
+                entries.append((nak, sub_index, sub_start, sub_end, sign_index))
+            cumulative_arc += arc_length
+    return starts, entries
+
+
+_SUB_TABLE_STARTS, _SUB_TABLE_ENTRIES = _build_sub_lord_table()
+
+# Struct-of-arrays view of the table for vectorized lookups
+_SUB_TABLE_START_ARRAY = np.array(_SUB_TABLE_STARTS)
+_SUB_TABLE_NAKSHATRA = np.array([e[0] for e in _SUB_TABLE_ENTRIES], dtype=np.int8)
+_SUB_TABLE_SUB_LORD = np.array([e[1] for e in _SUB_TABLE_ENTRIES], dtype=np.int8)
+_SUB_TABLE_SUB_START = np.array([e[2] for e in _SUB_TABLE_ENTRIES])
+_SUB_TABLE_SUB_END = np.array([e[3] for e in _SUB_TABLE_ENTRIES])
+_SUB_TABLE_SIGN = np.array([e[4] for e in _SUB_TABLE_ENTRIES], dtype=np.int8)
+
+# Lord index (into SUB_LORD_SEQUENCE) of each nakshatra
+_NAKSHATRA_LORD_INDEX = np.arange(27, dtype=np.int8) % 9
+
 
 @dataclass
 class SubLordPosition:
@@ -82,51 +150,18 @@ def get_sub_lord(longitude_degrees: float) -> SubLordPosition:
     # Normalize longitude to 0-360
     longitude_degrees = longitude_degrees % 360
     
-    # Nakshatra calculation (each 13°20')
-    nakshatra_length = 13 + (20/60)  # 13.333333 degrees
-    
-    # Calculate nakshatra number (0-26)
-    # KP convention: Lower bound inclusive, upper bound exclusive
-    # [0, 13.333) = Nak 1, [13.333, 26.667) = Nak 2, etc.
-    # Add epsilon to handle floating point precision at exact boundaries
-    nakshatra_num = int((longitude_degrees + CALCULATION_EPSILON) / nakshatra_length)
-    
-    # Handle boundary case (360° = 0°)
-    if nakshatra_num >= 27:
-        nakshatra_num = 26
+    # KP convention: lower bound inclusive, upper bound exclusive.
+    # Table starts already carry the epsilon shift at nakshatra boundaries.
+    entry = bisect_right(_SUB_TABLE_STARTS, longitude_degrees) - 1
+    nakshatra_index, sub_index, sub_lord_start, sub_lord_end, _ = _SUB_TABLE_ENTRIES[entry]
     
     # Position within current nakshatra (will be 0 at exact boundaries)
-    position_in_nakshatra = longitude_degrees - (nakshatra_num * nakshatra_length)
-    
-    nakshatra_num += 1  # Convert to 1-indexed (1-27)
-    
-    # Nakshatra lord (cycles every 9 nakshatras)
-    nakshatra_lord_index = (nakshatra_num - 1) % 9
-    nakshatra_lord = NAKSHATRA_LORDS[nakshatra_num - 1]
-    nakshatra_name = NAKSHATRA_NAMES[nakshatra_num - 1]
+    position_in_nakshatra = longitude_degrees - (nakshatra_index * NAKSHATRA_LENGTH)
     
-    # Sub-lord calculation (Vimshottari proportions within nakshatra)
-    cumulative_arc = 0.0
-    sub_lord = None
-    sub_lord_start = 0.0
-    sub_lord_end = 0.0
-    
-    for planet in SUB_LORD_SEQUENCE:
-        arc_length = VIMSHOTTARI_PROPORTIONS[planet]
-        sub_lord_start = cumulative_arc
-        sub_lord_end = cumulative_arc + arc_length
-        
-        if position_in_nakshatra < sub_lord_end:
-            sub_lord = planet
-            break
-        
-        cumulative_arc += arc_length
-    
-    # Fallback (should never happen if proportions are correct)
-    if sub_lord is None:
-        sub_lord = 'Mercury'  # Last sub-lord
-        sub_lord_start = cumulative_arc - VIMSHOTTARI_PROPORTIONS['Mercury']
-        sub_lord_end = nakshatra_length
+    nakshatra_num = nakshatra_index + 1  # Convert to 1-indexed (1-27)
+    nakshatra_lord = NAKSHATRA_LORDS[nakshatra_index]
+    nakshatra_name = NAKSHATRA_NAMES[nakshatra_index]
+    sub_lord = SUB_LORD_SEQUENCE[sub_index]
     
     return SubLordPosition(
         longitude=longitude_degrees,
@@ -140,6 +175,94 @@ def get_sub_lord(longitude_degrees: float) -> SubLordPosition:
     )
 
 
+
+def get_star_lord(longitude_degrees: float) -> str:
+    """
+    Get the nakshatra (star) lord of a longitude without building a SubLordPosition.
+    
+    Args:
+        longitude_degrees: Absolute longitude 0-360
+    
+    Returns:
+        Planet name ruling the nakshatra
+    """
+    entry = bisect_right(_SUB_TABLE_STARTS, longitude_degrees % 360) - 1
+    return NAKSHATRA_LORDS[_SUB_TABLE_ENTRIES[entry][0]]
+
+
+@dataclass
+class SubLordArrays:
+    """
+    Struct-of-arrays KP divisions for many longitudes at once.
+    
+    Index arrays refer to NAKSHATRA_NAMES (nakshatra) and
+    SUB_LORD_SEQUENCE (nakshatra_lord, sub_lord).
+    """
+    longitude: np.ndarray
+    nakshatra: np.ndarray  # 0-26
+    nakshatra_lord: np.ndarray  # 0-8
+    sub_lord: np.ndarray  # 0-8
+    sign: np.ndarray  # 0-11
+    sub_lord_start: np.ndarray  # Degrees within nakshatra
+    sub_lord_end: np.ndarray
+    
+    @property
+    def nakshatra_names(self) -> List[str]:
+        return [NAKSHATRA_NAMES[i] for i in self.nakshatra]
+    
+    @property
+    def nakshatra_lord_names(self) -> List[str]:
+        return [SUB_LORD_SEQUENCE[i] for i in self.nakshatra_lord]
+    
+    @property
+    def sub_lord_names(self) -> List[str]:
+        return [SUB_LORD_SEQUENCE[i] for i in self.sub_lord]
+
+
+def get_sub_lords(longitudes) -> SubLordArrays:
+    """
+    Vectorized get_sub_lord() for an array of longitudes.
+    
+    Args:
+        longitudes: Array-like of absolute longitudes (any shape)
+    
+    Returns:
+        SubLordArrays with arrays shaped like the input
+    
+    Example:
+        >>> subs = get_sub_lords(np.array([135.0, 45.0]))
+        >>> subs.sub_lord_names
+        ['Ketu', 'Moon']
+    """
+    longitude = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+    entry = np.searchsorted(_SUB_TABLE_START_ARRAY, longitude, side='right') - 1
+    nakshatra = _SUB_TABLE_NAKSHATRA[entry]
+    return SubLordArrays(
+        longitude=longitude,
+        nakshatra=nakshatra,
+        nakshatra_lord=_NAKSHATRA_LORD_INDEX[nakshatra],
+        sub_lord=_SUB_TABLE_SUB_LORD[entry],
+        sign=_SUB_TABLE_SIGN[entry],
+        sub_lord_start=_SUB_TABLE_SUB_START[entry],
+        sub_lord_end=_SUB_TABLE_SUB_END[entry],
+    )
+
+
+def get_sub_lord_boundaries() -> List[Tuple[float, int, str]]:
+    """
+    List the 243 KP sub divisions in zodiac order.
+    
+    Returns:
+        List of (start_longitude, nakshatra_index, sub_lord) tuples
+    """
+    boundaries = []
+    for start, (nak, sub_index, sub_start, _, _) in zip(_SUB_TABLE_STARTS, _SUB_TABLE_ENTRIES):
+        if boundaries and boundaries[-1][1] == nak and boundaries[-1][2] == SUB_LORD_SEQUENCE[sub_index]:
+            continue  # Sign split inside the same sub
+        boundaries.append((nak * NAKSHATRA_LENGTH + sub_start, nak, SUB_LORD_SEQUENCE[sub_index]))
+    return boundaries
+
+
 def get_cuspal_sub_lords(house_cusps: List[float]) -> Dict[int, SubLordPosition]:
     """
     Calculate sub-lords for all 12 house cusps.
@@ -265,12 +388,18 @@ def get_significators_for_house(
         Venus PRIMARY
     """
     significators = []
+    listed = set()
+    secondary = set()
+    
+    # Star lord of every planet, looked up once
+    star_lords = {name: get_star_lord(data['longitude']) for name, data in planets.items()}
     
     # 1. PRIMARY: Planets occupying the house
     occupants = [name for name, data in planets.items() 
                  if data.get('house') == house_num]
     
     for planet in occupants:
+        listed.add(planet)
         significators.append(Significator(
             planet=planet,
             priority='PRIMARY',
@@ -280,19 +409,15 @@ def get_significators_for_house(
     
     # 2. SECONDARY: Planets in star of occupants
     for occupant in occupants:
-        occupant_longitude = planets[occupant]['longitude']
-        occupant_sub_lord_data = get_sub_lord(occupant_longitude)
-        occupant_star_lord = occupant_sub_lord_data.nakshatra_lord
+        occupant_star_lord = star_lords[occupant]
         
         # Find planets in this star
-        for planet_name, planet_data in planets.items():
-            planet_longitude = planet_data['longitude']
-            planet_sub_lord_data = get_sub_lord(planet_longitude)
-            
-            if planet_sub_lord_data.nakshatra_lord == occupant_star_lord:
+        for planet_name in planets:
+            if star_lords[planet_name] == occupant_star_lord:
                 # Avoid duplicates
-                if not any(s.planet == planet_name and s.priority == 'SECONDARY' 
-                          for s in significators):
+                if planet_name not in secondary:
+                    secondary.add(planet_name)
+                    listed.add(planet_name)
                     significators.append(Significator(
                         planet=planet_name,
                         priority='SECONDARY',
@@ -302,16 +427,12 @@ def get_significators_for_house(
     
     # 3. TERTIARY: House lord and planets in house lord's star
     house_lord = get_house_lord(house_num, houses)
-    house_lord_longitude = planets[house_lord]['longitude']
-    house_lord_star_data = get_sub_lord(house_lord_longitude)
-    house_lord_star = house_lord_star_data.nakshatra_lord
+    house_lord_star = star_lords[house_lord]
     
-    for planet_name, planet_data in planets.items():
-        planet_longitude = planet_data['longitude']
-        planet_sub_lord_data = get_sub_lord(planet_longitude)
-        
-        if planet_sub_lord_data.nakshatra_lord == house_lord_star:
-            if not any(s.planet == planet_name for s in significators):
+    for planet_name in planets:
+        if star_lords[planet_name] == house_lord_star:
+            if planet_name not in listed:
+                listed.add(planet_name)
                 significators.append(Significator(
                     planet=planet_name,
                     priority='TERTIARY',
@@ -320,7 +441,7 @@ def get_significators_for_house(
                 ))
     
     # 4. WEAK: House lord itself
-    if not any(s.planet == house_lord for s in significators):
+    if house_lord not in listed:
         significators.append(Significator(
             planet=house_lord,
             priority='WEAK',
@@ -364,6 +485,176 @@ def get_house_lord(house_num: int, house_cusps: List[float]) -> str:
     return sign_lords[sign_num]
 
 
+
+# Significator priority flags (a planet can hold several for one house)
+SIGNIFICATOR_PRIMARY = 1
+SIGNIFICATOR_SECONDARY = 2
+SIGNIFICATOR_TERTIARY = 4
+SIGNIFICATOR_WEAK = 8
+
+SIGNIFICATOR_STRENGTHS = {
+    SIGNIFICATOR_PRIMARY: 1.0,
+    SIGNIFICATOR_SECONDARY: 0.8,
+    SIGNIFICATOR_TERTIARY: 0.6,
+    SIGNIFICATOR_WEAK: 0.4,
+}
+
+
+@dataclass
+class SignificatorMatrix:
+    """
+    KP significators of all 12 houses for one chart.
+    
+    Rows are houses (index 0 = house 1), columns follow `planets`.
+    `flags` holds SIGNIFICATOR_* bits, `strength` the strongest priority's
+    score (0 where the planet is not a significator), and
+    `secondary_source` the column of the occupant whose star made the
+    planet a SECONDARY significator (-1 otherwise).
+    """
+    planets: List[str]
+    flags: np.ndarray  # int8 [12, n_planets]
+    strength: np.ndarray  # float32 [12, n_planets]
+    secondary_source: np.ndarray  # int8 [12, n_planets]
+    star_lords: List[str]
+    house_lords: List[str]  # index 0 = house 1
+    
+    def for_house(self, house_num: int) -> List[Significator]:
+        """
+        Significators of one house, identical to get_significators_for_house().
+        
+        Args:
+            house_num: House number 1-12
+        
+        Returns:
+            List of Significator objects sorted by priority
+        """
+        row = house_num - 1
+        flags = self.flags[row].tolist()
+        sources = self.secondary_source[row].tolist()
+        columns = range(len(self.planets))
+        result = []
+        
+        for col in columns:
+            if flags[col] & SIGNIFICATOR_PRIMARY:
+                result.append(Significator(
+                    planet=self.planets[col],
+                    priority='PRIMARY',
+                    reason=f'Occupying house {house_num}',
+                    strength=1.0
+                ))
+        
+        # Grouped by the occupant that introduced them, as in the per-house scan
+        secondary = sorted(
+            (sources[col], col) for col in columns if flags[col] & SIGNIFICATOR_SECONDARY
+        )
+        for source, col in secondary:
+            result.append(Significator(
+                planet=self.planets[col],
+                priority='SECONDARY',
+                reason=f'In star of {self.planets[source]} (house occupant)',
+                strength=0.8
+            ))
+        
+        house_lord = self.house_lords[row]
+        for col in columns:
+            if flags[col] & SIGNIFICATOR_TERTIARY:
+                result.append(Significator(
+                    planet=self.planets[col],
+                    priority='TERTIARY',
+                    reason=f'In star of {house_lord} (house lord)',
+                    strength=0.6
+                ))
+        
+        if flags[self.planets.index(house_lord)] & SIGNIFICATOR_WEAK:
+            result.append(Significator(
+                planet=house_lord,
+                priority='WEAK',
+                reason=f'Lord of house {house_num}',
+                strength=0.4
+            ))
+        
+        return result
+    
+    def planets_for_house(self, house_num: int) -> List[str]:
+        """Significator planet names of one house, strongest first."""
+        return [sig.planet for sig in self.for_house(house_num)]
+    
+    def to_dict(self) -> Dict[int, List[Significator]]:
+        """Significators of every house keyed by house number."""
+        return {house: self.for_house(house) for house in range(1, 13)}
+
+
+def compute_significator_matrix(
+    planets: Dict[str, Dict],
+    houses: List[float]
+) -> SignificatorMatrix:
+    """
+    Compute KP significators for all 12 houses in one pass.
+    
+    Applies the same hierarchy as get_significators_for_house(), but looks
+    up every star lord once and resolves all houses with array operations
+    instead of 12 separate scans.
+    
+    Args:
+        planets: Dict of planet data with 'longitude' and 'house' keys
+        houses: List of 12 house cusp longitudes
+    
+    Returns:
+        SignificatorMatrix for the chart
+    
+    Example:
+        >>> matrix = compute_significator_matrix(planets_dict, house_cusps)
+        >>> matrix.for_house(7)[0].planet
+        'Venus'
+    """
+    if len(houses) != 12:
+        raise ValueError(f"Expected 12 house cusps, got {len(houses)}")
+    
+    names = list(planets)
+    column = {name: i for i, name in enumerate(names)}
+    n_planets = len(names)
+    
+    star_lord = get_sub_lords([planets[name]['longitude'] for name in names]).nakshatra_lord
+    occupied = np.array([planets[name].get('house') or 0 for name in names], dtype=np.int16)
+    house_lords = [get_house_lord(house, houses) for house in range(1, 13)]
+    missing = [lord for lord in house_lords if lord not in column]
+    if missing:
+        raise ValueError(f"House lord(s) missing from planets: {sorted(set(missing))}")
+    
+    # occupants[h, p]: planet p occupies house h + 1
+    occupants = occupied[None, :] == np.arange(1, 13)[:, None]
+    
+    # First occupant (by column) of each house sitting in each star lord's star
+    first_occupant = np.full((12, len(SUB_LORD_SEQUENCE)), -1, dtype=np.int8)
+    for col in range(n_planets - 1, -1, -1):
+        if 1 <= occupied[col] <= 12:
+            first_occupant[occupied[col] - 1, star_lord[col]] = col
+    secondary_source = first_occupant[:, star_lord]
+    secondary = secondary_source >= 0
+    
+    lord_star = star_lord[[column[lord] for lord in house_lords]]
+    tertiary = (star_lord[None, :] == lord_star[:, None]) & ~occupants & ~secondary
+    
+    flags = (occupants * SIGNIFICATOR_PRIMARY
+             + secondary * SIGNIFICATOR_SECONDARY
+             + tertiary * SIGNIFICATOR_TERTIARY).astype(np.int8)
+    for row, lord in enumerate(house_lords):
+        if not flags[row, column[lord]]:
+            flags[row, column[lord]] = SIGNIFICATOR_WEAK
+    
+    strength = np.zeros(flags.shape, dtype=np.float32)
+    for flag in (SIGNIFICATOR_WEAK, SIGNIFICATOR_TERTIARY, SIGNIFICATOR_SECONDARY, SIGNIFICATOR_PRIMARY):
+        strength[(flags & flag) != 0] = SIGNIFICATOR_STRENGTHS[flag]
+    
+    return SignificatorMatrix(
+        planets=names,
+        flags=flags,
+        strength=strength,
+        secondary_source=secondary_source,
+        star_lords=[SUB_LORD_SEQUENCE[i] for i in star_lord],
+        house_lords=house_lords,
+    )
+
 # ==================== RULING PLANETS ====================
 
 def get_ruling_planets(query_datetime: datetime, asc_longitude: float, 
@@ -4,16 +4,28 @@ Numerology Calculation Engine
 Provides numerological insights for personal development and coaching.
 Includes life path, destiny, soul urge, and personality number calculations.
 
+Name numbers are computed from byte translation tables and cached per
+normalized name; the batch methods reduce whole arrays of names and dates
+with numpy.
+
 IMPORTANT: This is a personal development tool, NOT a scientific assessment.
 For coaching, self-reflection, and team building only.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple, Union
 from datetime import date
+from functools import lru_cache
+import argparse
 import logging
+import time
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Normalized names cached by the scalar name-number methods
+NAME_CACHE_SIZE = 65536
+
 
 class NumerologyCalculator:
     """
@@ -57,19 +69,8 @@ class NumerologyCalculator:
         Returns:
             Life path number (1-9, 11, 22, or 33)
         """
-        # Method: Reduce each component separately, then reduce sum
-        day = self._reduce_to_single_digit(birth_date.day)
-        month = self._reduce_to_single_digit(birth_date.month)
-        year = self._reduce_to_single_digit(birth_date.year)
-
-        total = day + month + year
-        life_path = self._reduce_to_single_digit(total)
-
-        logger.debug(
-            f"Life path calculation: {birth_date} -> "
-            f"day={day}, month={month}, year={year} -> total={total} -> {life_path}"
-        )
-
+        life_path = _life_path_number(birth_date)
+        logger.debug(f"Life path calculation: {birth_date} -> {life_path}")
         return life_path
 
     def calculate_destiny_number(self, full_name: str) -> int:
@@ -117,6 +118,87 @@ class NumerologyCalculator:
         """
         return self._calculate_name_number(full_name, consonants_only=True)
 
+    def calculate_life_path_numbers(
+        self, birth_dates: Union[Sequence[Union[date, str]], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_life_path_number.
+
+        Args:
+            birth_dates: Dates, ISO date strings or a datetime64 array
+
+        Returns:
+            Integer array of life path numbers
+        """
+        days = np.asarray(birth_dates, dtype="datetime64[D]")
+        months = days.astype("datetime64[M]")
+        year = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        month = months.astype(np.int64) % 12 + 1
+        day = (days - months).astype(np.int64) + 1
+        return reduce_numbers(reduce_numbers(day) + reduce_numbers(month) + reduce_numbers(year))
+
+    def calculate_name_numbers(
+        self, full_names: Sequence[Optional[str]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized destiny, soul urge and personality numbers.
+
+        All names are packed into one byte buffer and summed per name with
+        the letter-value tables, then reduced together.
+
+        Args:
+            full_names: Full birth names (None or empty gives 0)
+
+        Returns:
+            Dictionary of integer arrays: destiny, soul_urge, personality
+        """
+        normalized = [normalize_name(name) if name else b"" for name in full_names]
+        lengths = np.fromiter(map(len, normalized), dtype=np.int64, count=len(normalized))
+        letters = np.frombuffer(b"".join(normalized), dtype=np.uint8)
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+
+        def name_sums(values: np.ndarray) -> np.ndarray:
+            running = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+            return running[ends] - running[starts]
+
+        totals = name_sums(_LETTER_VALUE_ARRAY[letters])
+        vowels = name_sums(_VOWEL_VALUE_ARRAY[letters])
+        return {
+            "destiny": reduce_numbers(totals),
+            "soul_urge": reduce_numbers(vowels),
+            "personality": reduce_numbers(totals - vowels),
+        }
+
+    def get_all_numbers_batch(
+        self,
+        birth_dates: Union[Sequence[Union[date, str]], np.ndarray],
+        full_names: Optional[Sequence[Optional[str]]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Batch version of get_all_numbers.
+
+        Args:
+            birth_dates: Dates of birth
+            full_names: Full birth names, same length as birth_dates (optional)
+
+        Returns:
+            Dictionary of integer arrays (name numbers are 0 where no name is given)
+
+        Raises:
+            ValueError: If full_names and birth_dates differ in length
+        """
+        numbers = {"life_path": self.calculate_life_path_numbers(birth_dates)}
+
+        if full_names is not None:
+            if len(full_names) != len(numbers["life_path"]):
+                raise ValueError(
+                    f"Got {len(full_names)} names for {len(numbers['life_path'])} birth dates"
+                )
+            numbers.update(self.calculate_name_numbers(full_names))
+
+        return numbers
+
     def interpret_life_path_number(self, number: int) -> str:
         """
         Get interpretation for life path number.
@@ -347,15 +429,7 @@ class NumerologyCalculator:
         Returns:
             Reduced number (1-9, 11, 22, or 33)
         """
-        while number > 9:
-            # Check for master numbers before reducing
-            if number in self.MASTER_NUMBERS:
-                return number
-
-            # Sum the digits
-            number = sum(int(digit) for digit in str(number))
-
-        return number
+        return reduce_number(number)
 
     def _calculate_name_number(
         self,
@@ -376,36 +450,16 @@ class NumerologyCalculator:
         Returns:
             Calculated number
         """
-        # Clean name: uppercase, remove non-letters
-        clean_name = ''.join(c.upper() for c in name if c.isalpha())
-
-        total = 0
-        for letter in clean_name:
-            if letter not in self.LETTER_VALUES:
-                continue
-
-            # Apply filters
-            if vowels_only and letter not in self.VOWELS:
-                continue
-            if consonants_only and letter in self.VOWELS:
-                continue
-
-            total += self.LETTER_VALUES[letter]
-
-        # Reduce to single digit or master number
-        result = self._reduce_to_single_digit(total)
-
-        filter_type = (
-            "all" if use_all_letters else
-            "vowels" if vowels_only else
-            "consonants" if consonants_only else
-            "unknown"
-        )
-        logger.debug(
-            f"Name number calculation ({filter_type}): '{name}' -> "
-            f"clean='{clean_name}' -> total={total} -> {result}"
+        clean_name = normalize_name(name)
+        destiny, soul_urge, personality = _name_numbers(clean_name)
+        result = (
+            soul_urge if vowels_only else
+            personality if consonants_only else
+            destiny
         )
 
+        logger.debug(f"Name number calculation: '{name}' -> clean='{clean_name.decode()}' -> {result}")
+
         return result
 
     def get_all_numbers(
@@ -466,3 +520,108 @@ class NumerologyCalculator:
             })
 
         return interpretations
+
+
+# ==================== TABLES AND REDUCTION ====================
+
+# Bytes that are not A-Z (deleted from normalized names)
+_NON_LETTERS = bytes(c for c in range(256) if not ord('A') <= c <= ord('Z'))
+
+# Letter value per byte; the vowel table is 0 for consonants
+_LETTER_VALUE_BYTES = bytes(
+    NumerologyCalculator.LETTER_VALUES.get(chr(c), 0) for c in range(256)
+)
+_VOWEL_VALUE_BYTES = bytes(
+    v if chr(c) in NumerologyCalculator.VOWELS else 0
+    for c, v in enumerate(_LETTER_VALUE_BYTES)
+)
+_LETTER_VALUE_ARRAY = np.frombuffer(_LETTER_VALUE_BYTES, dtype=np.uint8)
+_VOWEL_VALUE_ARRAY = np.frombuffer(_VOWEL_VALUE_BYTES, dtype=np.uint8)
+
+_MASTER_NUMBER_ARRAY = np.array(sorted(NumerologyCalculator.MASTER_NUMBERS))
+
+
+def normalize_name(name: str) -> bytes:
+    """
+    Uppercase A-Z letters of a name, as bytes.
+
+    Same letters as filtering isalpha() and uppercasing each character:
+    non-ASCII letters count only when they uppercase to ASCII (e.g. "ß" -> "SS").
+    """
+    return name.upper().encode("ascii", "ignore").translate(None, _NON_LETTERS)
+
+
+def reduce_number(number: int) -> int:
+    """Reduce to a single digit, keeping master numbers (11, 22, 33)."""
+    while number > 9 and number not in NumerologyCalculator.MASTER_NUMBERS:
+        number = sum(int(digit) for digit in str(number))
+    return number
+
+
+def reduce_numbers(numbers: np.ndarray) -> np.ndarray:
+    """Vectorized reduce_number over an integer array."""
+    numbers = np.array(numbers, dtype=np.int64)
+    pending = (numbers > 9) & ~np.isin(numbers, _MASTER_NUMBER_ARRAY)
+    while pending.any():
+        remaining = numbers[pending]
+        digit_sum = np.zeros_like(remaining)
+        while remaining.any():
+            digit_sum += remaining % 10
+            remaining //= 10
+        numbers[pending] = digit_sum
+        pending = (numbers > 9) & ~np.isin(numbers, _MASTER_NUMBER_ARRAY)
+    return numbers
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _name_numbers(normalized_name: bytes) -> Tuple[int, int, int]:
+    """(destiny, soul urge, personality) for a normalized name."""
+    total = sum(normalized_name.translate(_LETTER_VALUE_BYTES))
+    vowels = sum(normalized_name.translate(_VOWEL_VALUE_BYTES))
+    return reduce_number(total), reduce_number(vowels), reduce_number(total - vowels)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _life_path_number(birth_date: date) -> int:
+    """Reduce day, month and year separately, then reduce their sum."""
+    return reduce_number(
+        reduce_number(birth_date.day)
+        + reduce_number(birth_date.month)
+        + reduce_number(birth_date.year)
+    )
+
+
+def _benchmark(count: int, seed: int = 0) -> None:
+    """Print scalar vs batch throughput for random names and dates."""
+    rng = np.random.default_rng(seed)
+    alphabet = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+    letters = alphabet[rng.integers(0, 26, size=(count, 16))]
+    letters[:, 7] = ord(" ")
+    names = [row.tobytes().decode() for row in letters]
+    dates = np.datetime64("1940-01-01") + rng.integers(0, 30000, size=count).astype("timedelta64[D]")
+    calc = NumerologyCalculator()
+
+    sample = min(count, 100000)
+    sample_dates = dates[:sample].tolist()
+    _name_numbers.cache_clear()
+    _life_path_number.cache_clear()
+    start = time.perf_counter()
+    for name, birth_date in zip(names[:sample], sample_dates):
+        calc.get_all_numbers(birth_date, name)
+    scalar = sample / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    calc.get_all_numbers_batch(dates, names)
+    batch = count / (time.perf_counter() - start)
+
+    print(f"scalar (uncached, {sample:,} names): {scalar:,.0f} names/s")
+    print(f"batch ({count:,} names): {batch:,.0f} names/s ({batch / scalar:.1f}x)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batch numerology")
+    parser.add_argument('--count', type=int, default=1_000_000, help="Names to score in the batch run")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    _benchmark(args.count, args.seed)
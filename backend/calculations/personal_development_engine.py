@@ -28,6 +28,8 @@ from datetime import datetime, date
 from enum import Enum
 import logging
 
+from .numerology_engine import NumerologyCalculator
+
 logger = logging.getLogger(__name__)
 
 
@@ -189,10 +191,24 @@ class FlexibleInsightsEngine:
     Adapts to available data and provides appropriate level of analysis.
     """
 
-    def __init__(self):
-        """Initialize the insights engine."""
+    def __init__(self, calculation_service=None):
+        """
+        Initialize the insights engine.
+
+        Args:
+            calculation_service: CalculationService for full charts (default:
+                one shared instance, created on first use)
+        """
+        self._calculation_service = calculation_service
+        self._numerology = NumerologyCalculator()
         logger.info("FlexibleInsightsEngine initialized (Coaching Tool - Not for Employment Decisions)")
 
+    def _get_calculation_service(self):
+        if self._calculation_service is None:
+            from backend.services.calculation_service import CalculationService
+            self._calculation_service = CalculationService()
+        return self._calculation_service
+
     def generate_reading(
         self,
         birth_data: FlexibleBirthData,
@@ -246,9 +262,7 @@ class FlexibleInsightsEngine:
         reading: PersonalDevelopmentReading,
     ) -> None:
         """Add numerology based on birth date."""
-        from backend.calculations.numerology_engine import NumerologyCalculator
-
-        calc = NumerologyCalculator()
+        calc = self._numerology
 
         # Life path number
         life_path = calc.calculate_life_path_number(birth_data.birth_date)
@@ -266,9 +280,7 @@ class FlexibleInsightsEngine:
         reading: PersonalDevelopmentReading,
     ) -> None:
         """Add numerology based on name."""
-        from backend.calculations.numerology_engine import NumerologyCalculator
-
-        calc = NumerologyCalculator()
+        calc = self._numerology
         name = birth_data.full_name
 
         # Destiny number
@@ -302,11 +314,10 @@ class FlexibleInsightsEngine:
         reading: PersonalDevelopmentReading,
     ) -> None:
         """Add full astrological analysis."""
-        from backend.services.calculation_service import CalculationService
         from backend.schemas import BirthDataInput
 
-        # Generate full birth chart
-        calc_service = CalculationService()
+        # Generate full birth chart (shared service, so its chart cache applies)
+        calc_service = self._get_calculation_service()
 
         birth_input = BirthDataInput(
             date=birth_data.birth_date.isoformat(),
@@ -10,12 +10,14 @@ Based on:
 - KP significator matching
 """
 
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import math
 
+import numpy as np
+
 from backend.calculations.ephemeris import EphemerisCalculator
 from backend.calculations.kp_engine import get_sub_lord, get_significators_for_house
 from backend.calculations.exceptions import CalculationError
@@ -55,6 +57,44 @@ PLANET_WEIGHTS = {
     "Ascendant": 1.5,  # First impressions
 }
 
+# Bodies compared in synastry, in matrix column order
+SYNASTRY_BODIES = (
+    "Sun", "Moon", "Mercury", "Venus", "Mars",
+    "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto", "Ascendant",
+)
+
+ASPECT_ANGLES = {
+    "Conjunction": 0,
+    "Sextile": 60,
+    "Square": 90,
+    "Trine": 120,
+    "Quincunx": 150,
+    "Opposition": 180,
+}
+
+# Sub-score rules: (bodies that select an aspect, points per unit strength
+# when harmonious, when challenging). Mirrors the _calculate_*_compatibility
+# methods for the matrix mode.
+SUB_SCORE_RULES = {
+    "emotional": ({"Moon", "Sun"}, 10.0, -5.0),
+    "romantic": ({"Venus", "Mars"}, 12.0, 5.0),
+    "communication": ({"Mercury"}, 10.0, -8.0),
+    "long_term": ({"Saturn", "Jupiter"}, 8.0, -6.0),
+    "sexual": ({"Mars", "Venus", "Pluto"}, 10.0, 10.0),
+}
+
+SUB_SCORE_WEIGHTS = {
+    "emotional": 0.25,
+    "romantic": 0.25,
+    "communication": 0.20,
+    "long_term": 0.20,
+    "sexual": 0.10,
+}
+
+# Candidates scored per broadcast block; keeps the (block, 11, 11) temporaries
+# cache-resident (~0.5 MB each)
+MATRIX_BLOCK_SIZE = 512
+
 
 @dataclass
 class SynastryAspect:
@@ -123,6 +163,113 @@ class SynastryResult:
     calculation_time_ms: float
 
 
+@dataclass
+class SynastryMatrix:
+    """Candidate charts packed as arrays for matrix synastry."""
+    ids: List[str]
+    longitudes: np.ndarray  # (M, len(SYNASTRY_BODIES)), NaN where a body is missing
+    cusps: Optional[np.ndarray] = None  # (M, 12) house cusp longitudes
+
+    @classmethod
+    def from_charts(cls, charts: Iterable[Tuple[str, Dict[str, Any]]]) -> "SynastryMatrix":
+        """Pack (candidate_id, chart) pairs."""
+        ids, longitudes, cusps = [], [], []
+        for candidate_id, chart in charts:
+            ids.append(candidate_id)
+            longitudes.append(synastry_longitudes(chart))
+            cusps.append(house_cusp_longitudes(chart))
+        return cls(
+            ids=ids,
+            longitudes=np.array(longitudes, dtype=np.float64).reshape(len(ids), len(SYNASTRY_BODIES)),
+            cusps=np.array(cusps, dtype=np.float64).reshape(len(ids), 12),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass
+class SynastryMatch:
+    """One ranked candidate from matrix synastry."""
+    candidate_id: str
+    overall_score: float
+    emotional_compatibility: float
+    romantic_compatibility: float
+    communication_compatibility: float
+    long_term_compatibility: float
+    sexual_compatibility: float
+    harmonious_aspects: int
+    challenging_aspects: int
+    # {"query_in_candidate": {planet: house}, "candidate_in_query": {planet: house}}
+    house_overlays: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+def synastry_longitudes(chart: Dict[str, Any]) -> np.ndarray:
+    """Longitudes of SYNASTRY_BODIES for one chart (NaN where missing)."""
+    row = np.full(len(SYNASTRY_BODIES), np.nan)
+    index = {body: i for i, body in enumerate(SYNASTRY_BODIES)}
+    for planet in chart.get("planet_positions", []):
+        i = index.get(planet["planet"])
+        if i is not None:
+            row[i] = planet["longitude"]
+    if chart.get("ascendant"):
+        row[index["Ascendant"]] = chart["ascendant"]["degree"]
+    return row
+
+
+def house_cusp_longitudes(chart: Dict[str, Any]) -> np.ndarray:
+    """The 12 house cusp longitudes for one chart (NaN if unavailable)."""
+    cusps = [h.get("cusp", h.get("longitude", 0)) for h in chart.get("house_cusps", [])]
+    if len(cusps) != 12:
+        return np.full(12, np.nan)
+    return np.array(cusps, dtype=np.float64)
+
+
+def _matrix_coefficients() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Pair weights, conjunction harmony mask and sub-score coefficient matrices."""
+    n = len(SYNASTRY_BODIES)
+    weights = np.array([PLANET_WEIGHTS.get(b, 0.5) for b in SYNASTRY_BODIES])
+    pair_weights = np.minimum(weights[:, None], weights[None, :])
+
+    conjunction_harmonious = np.ones((n, n), dtype=bool)
+    for body in ("Mars", "Saturn"):
+        i = SYNASTRY_BODIES.index(body)
+        conjunction_harmonious[i, i] = False
+
+    harmonious_coef = np.zeros((n * n, len(SUB_SCORE_RULES)))
+    challenging_coef = np.zeros((n * n, len(SUB_SCORE_RULES)))
+    for k, (bodies, harmonious_points, challenging_points) in enumerate(SUB_SCORE_RULES.values()):
+        selected = np.array([b in bodies for b in SYNASTRY_BODIES])
+        mask = (selected[:, None] | selected[None, :]).reshape(-1)
+        harmonious_coef[mask, k] = harmonious_points
+        challenging_coef[mask, k] = challenging_points
+
+    return pair_weights, conjunction_harmonious, harmonious_coef, challenging_coef
+
+
+_PAIR_WEIGHTS, _CONJUNCTION_HARMONIOUS, _HARMONIOUS_COEF, _CHALLENGING_COEF = _matrix_coefficients()
+_SUB_SCORE_WEIGHT_VECTOR = np.array([SUB_SCORE_WEIGHTS[name] for name in SUB_SCORE_RULES])
+
+# Orb and harmony per multiple of 30 degrees (index = separation / 30);
+# -1 marks multiples that are not aspects (30 degrees)
+_MAX_ORB_BY_STEP = np.full(7, -1.0)
+_HARMONIOUS_BY_STEP = np.zeros(7, dtype=bool)
+for _aspect_type, _max_orb in SYNASTRY_ORBS.items():
+    _MAX_ORB_BY_STEP[ASPECT_ANGLES[_aspect_type] // 30] = _max_orb
+    _HARMONIOUS_BY_STEP[ASPECT_ANGLES[_aspect_type] // 30] = _aspect_type in ("Trine", "Sextile")
+
+
+def _houses_of(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """
+    House number (1-12) of each longitude, broadcasting over leading axes.
+
+    The house is the cusp most recently passed going forward in longitude,
+    matching SynastryCalculator._find_house.
+    """
+    offsets = (longitudes[..., None] - cusps[..., None, :]) % 360
+    return np.argmin(offsets, axis=-1) + 1
+
+
 class SynastryCalculator:
     """
     Main synastry calculation engine.
@@ -309,15 +456,7 @@ class SynastryCalculator:
 
     def _get_aspect_angle(self, aspect_type: str) -> float:
         """Get the angle for an aspect type."""
-        angles = {
-            "Conjunction": 0,
-            "Sextile": 60,
-            "Square": 90,
-            "Trine": 120,
-            "Quincunx": 150,
-            "Opposition": 180,
-        }
-        return angles.get(aspect_type, 0)
+        return ASPECT_ANGLES.get(aspect_type, 0)
 
     def _is_harmonious_aspect(
         self,
@@ -745,3 +884,150 @@ class SynastryCalculator:
         advice.append("Use challenges as opportunities to deepen understanding")
 
         return advice
+
+    def score_candidates(
+        self,
+        query_chart: Dict[str, Any],
+        candidates: SynastryMatrix,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score one chart against many candidates with broadcasting.
+
+        Applies the same orbs, harmony rules, planet weights and sub-score
+        formulas as calculate_synastry, but over a (candidates x bodies x
+        bodies) orb tensor instead of per-pair Python loops.
+
+        Args:
+            query_chart: The chart being matched (person 1)
+            candidates: Packed candidate charts (person 2 in each pairing)
+
+        Returns:
+            Dict of arrays shaped (M,): "overall", one per SUB_SCORE_RULES
+            name, "harmonious_aspects" and "challenging_aspects"
+        """
+        query = synastry_longitudes(query_chart)
+        total = len(candidates)
+        sub_scores = np.empty((total, len(SUB_SCORE_RULES)))
+        harmonious_counts = np.empty(total, dtype=np.int64)
+        challenging_counts = np.empty(total, dtype=np.int64)
+
+        for start in range(0, total, MATRIX_BLOCK_SIZE):
+            block = candidates.longitudes[start:start + MATRIX_BLOCK_SIZE]
+
+            separation = np.abs(query[None, :, None] - block[:, None, :])
+            separation = np.where(separation > 180, 360 - separation, separation)
+
+            # Orbs never exceed 15 degrees, so the only candidate aspect is
+            # the nearest multiple of 30 (missing bodies map to no aspect)
+            nearest = np.rint(np.nan_to_num(separation, nan=45.0) / 30).astype(np.intp)
+            orb = np.abs(separation - 30.0 * nearest)
+            max_orb = _MAX_ORB_BY_STEP[nearest]
+            aspected = orb <= max_orb
+            strength = np.where(aspected, 1.0 - orb / np.maximum(max_orb, 1e-9), 0.0)
+            harmonious = aspected & (
+                _HARMONIOUS_BY_STEP[nearest] | ((nearest == 0) & _CONJUNCTION_HARMONIOUS)
+            )
+
+            strength *= _PAIR_WEIGHTS
+            harmonious_strength = np.where(harmonious, strength, 0.0).reshape(len(block), -1)
+            challenging_strength = np.where(aspected & ~harmonious, strength, 0.0).reshape(len(block), -1)
+
+            end = start + len(block)
+            sub_scores[start:end] = (
+                50.0
+                + harmonious_strength @ _HARMONIOUS_COEF
+                + challenging_strength @ _CHALLENGING_COEF
+            )
+            harmonious_counts[start:end] = harmonious.sum(axis=(1, 2))
+            challenging_counts[start:end] = (aspected & ~harmonious).sum(axis=(1, 2))
+
+        np.clip(sub_scores, 0, 100, out=sub_scores)
+        scores = {name: sub_scores[:, k] for k, name in enumerate(SUB_SCORE_RULES)}
+        scores["overall"] = sub_scores @ _SUB_SCORE_WEIGHT_VECTOR
+        scores["harmonious_aspects"] = harmonious_counts
+        scores["challenging_aspects"] = challenging_counts
+        return scores
+
+    def rank_matches(
+        self,
+        query_chart: Dict[str, Any],
+        candidates: SynastryMatrix,
+        top_k: int = 10,
+    ) -> List[SynastryMatch]:
+        """
+        Find the most compatible candidates for one chart.
+
+        Example:
+            >>> matrix = SynastryMatrix.from_charts(stored_charts)
+            >>> calculator.rank_matches(my_chart, matrix, top_k=5)
+
+        Args:
+            query_chart: The chart being matched
+            candidates: Packed candidate charts
+            top_k: Number of matches to return
+
+        Returns:
+            Matches ordered by overall score (best first), with house overlays
+        """
+        if len(candidates) == 0 or top_k <= 0:
+            return []
+
+        scores = self.score_candidates(query_chart, candidates)
+        overall = scores["overall"]
+        k = min(top_k, len(candidates))
+        top = np.argpartition(-overall, k - 1)[:k]
+        top = top[np.argsort(-overall[top], kind="stable")]
+
+        overlays = self._matrix_house_overlays(query_chart, candidates, top)
+        return [
+            SynastryMatch(
+                candidate_id=candidates.ids[i],
+                overall_score=float(overall[i]),
+                emotional_compatibility=float(scores["emotional"][i]),
+                romantic_compatibility=float(scores["romantic"][i]),
+                communication_compatibility=float(scores["communication"][i]),
+                long_term_compatibility=float(scores["long_term"][i]),
+                sexual_compatibility=float(scores["sexual"][i]),
+                harmonious_aspects=int(scores["harmonious_aspects"][i]),
+                challenging_aspects=int(scores["challenging_aspects"][i]),
+                house_overlays=overlay,
+            )
+            for i, overlay in zip(top, overlays)
+        ]
+
+    def _matrix_house_overlays(
+        self,
+        query_chart: Dict[str, Any],
+        candidates: SynastryMatrix,
+        rows: np.ndarray,
+    ) -> List[Dict[str, Dict[str, int]]]:
+        """House overlays both ways for the selected candidate rows."""
+        planets = SYNASTRY_BODIES[:-1]  # overlays are for planets, not the Ascendant
+        query = synastry_longitudes(query_chart)[:-1]
+        query_cusps = house_cusp_longitudes(query_chart)
+        candidate_longitudes = candidates.longitudes[rows, :-1]
+
+        if candidates.cusps is not None:
+            query_in_candidate = _houses_of(np.broadcast_to(query, candidate_longitudes.shape), candidates.cusps[rows])
+            candidate_houses_known = ~np.isnan(candidates.cusps[rows]).any(axis=1)
+        else:
+            query_in_candidate = np.zeros(candidate_longitudes.shape, dtype=int)
+            candidate_houses_known = np.zeros(len(rows), dtype=bool)
+        candidate_in_query = _houses_of(candidate_longitudes, query_cusps)
+        query_houses_known = not np.isnan(query_cusps).any()
+
+        overlays = []
+        for r in range(len(rows)):
+            overlays.append({
+                "query_in_candidate": {
+                    planet: int(query_in_candidate[r, j])
+                    for j, planet in enumerate(planets)
+                    if candidate_houses_known[r] and not np.isnan(query[j])
+                },
+                "candidate_in_query": {
+                    planet: int(candidate_in_query[r, j])
+                    for j, planet in enumerate(planets)
+                    if query_houses_known and not np.isnan(candidate_longitudes[r, j])
+                },
+            })
+        return overlays
@@ -16,12 +16,21 @@ Strategic Use Cases:
 - Trust-building conversations
 - Team retreat activities
 - Leadership development coaching
+
+Pairwise synergies are held in a SynergyMatrix, so members can be added
+or removed without rescoring the whole team. Member readings are cached
+per birth data and can be computed in parallel through an executor.
 """
 
 from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import date
 import logging
+import threading
+
+import numpy as np
 
 from .personal_development_engine import (
     FlexibleBirthData,
@@ -32,6 +41,212 @@ from .personal_development_engine import (
 
 logger = logging.getLogger(__name__)
 
+# Life path pairs that complement each other (+15 synergy)
+COMPLEMENTARY_LIFE_PATHS = {(1, 2), (2, 1), (3, 4), (4, 3), (5, 6), (6, 5), (7, 8), (8, 7)}
+
+# Sun sign elements
+ELEMENTS = ("Fire", "Earth", "Air", "Water")
+SIGN_ELEMENTS = {
+    "Aries": "Fire", "Leo": "Fire", "Sagittarius": "Fire",
+    "Taurus": "Earth", "Virgo": "Earth", "Capricorn": "Earth",
+    "Gemini": "Air", "Libra": "Air", "Aquarius": "Air",
+    "Cancer": "Water", "Scorpio": "Water", "Pisces": "Water",
+}
+
+# Element pairs that are compatible (+10 synergy)
+COMPATIBLE_ELEMENTS = {("Fire", "Air"), ("Air", "Fire"), ("Earth", "Water"), ("Water", "Earth")}
+
+# Members per task when readings are computed through an executor
+READING_CHUNK_SIZE = 25
+
+
+# ==================== SYNERGY MATRIX ====================
+
+# Lookup tables indexed by life path number and element code (0 = unknown)
+_COMPLEMENT_BONUS = np.zeros((9, 9), dtype=np.uint8)
+for _lp1, _lp2 in COMPLEMENTARY_LIFE_PATHS:
+    _COMPLEMENT_BONUS[_lp1, _lp2] = 15
+
+_ELEMENT_CODES = {element: code for code, element in enumerate(ELEMENTS, start=1)}
+_ELEMENT_BONUS = np.zeros((len(ELEMENTS) + 1, len(ELEMENTS) + 1), dtype=np.uint8)
+for _el1, _el2 in COMPATIBLE_ELEMENTS:
+    _ELEMENT_BONUS[_ELEMENT_CODES[_el1], _ELEMENT_CODES[_el2]] = 10
+
+
+def _synergy_codes(reading: Optional[PersonalDevelopmentReading]) -> Tuple[int, int]:
+    """(life path, element code) for a reading; 0 means unknown."""
+    if reading is None:
+        return 0, 0
+    element = SIGN_ELEMENTS.get(reading.sun_sign) if reading.sun_sign else None
+    return reading.life_path_number or 0, _ELEMENT_CODES.get(element, 0)
+
+
+def _pair_scores(
+    life_paths1: np.ndarray, elements1: np.ndarray,
+    life_paths2: np.ndarray, elements2: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized _calculate_pairwise_synergy over broadcast code arrays.
+
+    Returns uint8 scores (every synergy is a whole number between 70 and 100).
+    """
+    complement1 = np.where(life_paths1 < 9, life_paths1, 0)
+    complement2 = np.where(life_paths2 < 9, life_paths2, 0)
+    same = (life_paths1 == life_paths2) & (life_paths1 > 0)
+    score = (
+        70
+        + _COMPLEMENT_BONUS[complement1, complement2].astype(np.int16)
+        + np.where(same, 10, 0)
+        + _ELEMENT_BONUS[elements1, elements2]
+    )
+    return np.minimum(score, 100).astype(np.uint8)
+
+
+class SynergyMatrix:
+    """
+    Symmetric matrix of pairwise member synergy scores.
+
+    Scores are filled with one broadcast for a whole team. add_member scores
+    the new member against everyone already present (O(n)) and
+    remove_member only shifts the stored scores, so a team can change
+    without rescoring every pair.
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty matrix.
+
+        Args:
+            capacity: Initial number of member slots (grows by doubling)
+        """
+        self.member_ids: List[str] = []
+        self.names: List[str] = []
+        self._allocate(max(capacity, 1))
+
+    def _allocate(self, capacity: int) -> None:
+        n = len(self.member_ids)
+        life_paths = np.zeros(capacity, dtype=np.int64)
+        elements = np.zeros(capacity, dtype=np.int64)
+        valid = np.zeros(capacity, dtype=bool)
+        scores = np.zeros((capacity, capacity), dtype=np.uint8)
+        if n:
+            life_paths[:n] = self._life_paths[:n]
+            elements[:n] = self._elements[:n]
+            valid[:n] = self._valid[:n]
+            scores[:n, :n] = self._scores[:n, :n]
+        self._life_paths, self._elements, self._valid, self._scores = life_paths, elements, valid, scores
+
+    @classmethod
+    def from_members(cls, members: List["TeamMember"]) -> "SynergyMatrix":
+        """Build the matrix for a team in one vectorized pass."""
+        matrix = cls(capacity=len(members))
+        n = len(members)
+        matrix.member_ids = [m.member_id for m in members]
+        matrix.names = [m.name for m in members]
+        for i, member in enumerate(members):
+            matrix._life_paths[i], matrix._elements[i] = _synergy_codes(member.reading)
+            matrix._valid[i] = member.reading is not None
+
+        life_paths, elements = matrix._life_paths[:n], matrix._elements[:n]
+        matrix._scores[:n, :n] = _pair_scores(
+            life_paths[:, None], elements[:, None], life_paths[None, :], elements[None, :]
+        )
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.member_ids)
+
+    def add_member(self, member: "TeamMember") -> None:
+        """Append a member and score it against the current team."""
+        n = len(self.member_ids)
+        if n == self._scores.shape[0]:
+            self._allocate(2 * n)
+
+        life_path, element = _synergy_codes(member.reading)
+        self._life_paths[n], self._elements[n] = life_path, element
+        self._valid[n] = member.reading is not None
+        row = _pair_scores(
+            np.int64(life_path), np.int64(element), self._life_paths[:n + 1], self._elements[:n + 1]
+        )
+        self._scores[n, :n + 1] = row
+        self._scores[:n + 1, n] = row
+        self.member_ids.append(member.member_id)
+        self.names.append(member.name)
+
+    def remove_member(self, member_id: str) -> None:
+        """
+        Remove a member by id (no other pair is rescored).
+
+        Raises:
+            KeyError: If the member is not in the matrix
+        """
+        try:
+            i = self.member_ids.index(member_id)
+        except ValueError:
+            raise KeyError(member_id) from None
+
+        n = len(self.member_ids)
+        for array in (self._life_paths, self._elements, self._valid):
+            array[i:n - 1] = array[i + 1:n]
+        self._scores[i:n - 1, :n] = self._scores[i + 1:n, :n]
+        self._scores[:n - 1, i:n - 1] = self._scores[:n - 1, i + 1:n]
+        del self.member_ids[i]
+        del self.names[i]
+
+    def as_array(self) -> np.ndarray:
+        """Scores as float, with NaN on the diagonal and for members without a reading."""
+        n = len(self.member_ids)
+        scores = self._scores[:n, :n].astype(float)
+        valid = self._valid[:n]
+        scores[~(valid[:, None] & valid[None, :])] = np.nan
+        np.fill_diagonal(scores, np.nan)
+        return scores
+
+    def top_pairs(self, top_n: int = 5) -> List[Tuple[str, str, float]]:
+        """
+        Strongest pairs as (name1, name2, synergy_score).
+
+        Ties keep the order of a row-by-row scan over the upper triangle.
+        """
+        n = len(self.member_ids)
+        rows, cols = np.triu_indices(n, k=1)
+        valid = self._valid[:n]
+        keep = valid[rows] & valid[cols]
+        rows, cols = rows[keep], cols[keep]
+        scores = self._scores[rows, cols]
+        order = np.argsort(-scores.astype(np.int16), kind="stable")[:top_n]
+        return [
+            (self.names[rows[k]], self.names[cols[k]], float(scores[k]))
+            for k in order
+        ]
+
+
+# ==================== PARALLEL READINGS ====================
+
+_worker_insights_engine = None
+
+
+def _generate_readings_chunk(
+    birth_data_list: List[FlexibleBirthData],
+) -> List[PersonalDevelopmentReading]:
+    """Executor task: readings for a chunk of members (one engine per worker)."""
+    global _worker_insights_engine
+    if _worker_insights_engine is None:
+        _worker_insights_engine = FlexibleInsightsEngine()
+    return [_worker_insights_engine.generate_reading(bd) for bd in birth_data_list]
+
+
+def _reading_key(birth_data: FlexibleBirthData) -> Tuple:
+    return (
+        birth_data.birth_date,
+        birth_data.birth_time,
+        birth_data.birth_location,
+        birth_data.latitude,
+        birth_data.longitude,
+        birth_data.timezone,
+        birth_data.full_name,
+    )
+
 
 @dataclass
 class TeamMember:
@@ -94,6 +309,9 @@ class TeamDynamicsAnalysis:
     # Growth opportunities
     team_coaching_prompts: List[str] = None
 
+    # Pairwise synergy scores (kept for incremental add/remove)
+    synergy_matrix: Optional[SynergyMatrix] = None
+
     # Disclaimer
     disclaimer: str = (
         "This team analysis is for personal development, coaching, and team building only. "
@@ -124,9 +342,24 @@ class TeamDynamicsEngine:
     - Coaching conversation prompts
     """
 
-    def __init__(self):
-        """Initialize team dynamics engine."""
-        self.insights_engine = FlexibleInsightsEngine()
+    def __init__(
+        self,
+        insights_engine: Optional[FlexibleInsightsEngine] = None,
+        reading_cache_size: int = 4096,
+    ):
+        """
+        Initialize team dynamics engine.
+
+        Args:
+            insights_engine: Engine for member readings (default: new engine)
+            reading_cache_size: Maximum member readings kept in memory
+        """
+        self.insights_engine = insights_engine or FlexibleInsightsEngine()
+        self.reading_cache_size = reading_cache_size
+        self._readings: "OrderedDict[Tuple, PersonalDevelopmentReading]" = OrderedDict()
+        self._readings_lock = threading.Lock()
+        self.reading_hits = 0
+        self.reading_misses = 0
         logger.info("TeamDynamicsEngine initialized (Team Building Tool - Not for HR Decisions)")
 
     def analyze_team(
@@ -134,6 +367,7 @@ class TeamDynamicsEngine:
         team_members: List[Dict[str, Any]],
         team_name: str = "Team",
         include_pairwise_analysis: bool = True,
+        executor: Optional[Executor] = None,
     ) -> TeamDynamicsAnalysis:
         """
         Analyze team dynamics based on member birth data.
@@ -142,6 +376,7 @@ class TeamDynamicsEngine:
             team_members: List of dicts with member info (name, birth_date, etc.)
             team_name: Name of the team
             include_pairwise_analysis: Calculate pairwise compatibilities
+            executor: Optional thread/process pool for uncached member readings
 
         Returns:
             TeamDynamicsAnalysis with comprehensive insights
@@ -149,11 +384,11 @@ class TeamDynamicsEngine:
         logger.info(f"Analyzing team '{team_name}' with {len(team_members)} members")
 
         # Generate individual readings
-        members = []
-        for member_data in team_members:
-            birth_data = self._parse_birth_data(member_data)
-            reading = self.insights_engine.generate_reading(birth_data)
+        birth_data_list = [self._parse_birth_data(m) for m in team_members]
+        readings = self.generate_readings(birth_data_list, executor=executor)
 
+        members = []
+        for member_data, birth_data, reading in zip(team_members, birth_data_list, readings):
             member = TeamMember(
                 member_id=member_data.get("id", f"member_{len(members)}"),
                 name=member_data.get("name", f"Member {len(members) + 1}"),
@@ -164,6 +399,139 @@ class TeamDynamicsEngine:
             )
             members.append(member)
 
+        synergy_matrix = None
+        if include_pairwise_analysis:
+            synergy_matrix = SynergyMatrix.from_members(members)
+
+        return self._build_analysis(team_name, members, synergy_matrix)
+
+    def add_member(
+        self, analysis: TeamDynamicsAnalysis, member_data: Dict[str, Any]
+    ) -> TeamDynamicsAnalysis:
+        """
+        Add a member to an existing analysis.
+
+        Only the new member's synergies are scored; team aggregates are
+        recomputed from the updated member list.
+
+        Returns:
+            Updated TeamDynamicsAnalysis (shares the synergy matrix)
+        """
+        birth_data = self._parse_birth_data(member_data)
+        reading = self.generate_readings([birth_data])[0]
+
+        member_id = member_data.get("id")
+        if member_id is None:
+            taken = {m.member_id for m in analysis.members}
+            index = len(analysis.members)
+            while f"member_{index}" in taken:
+                index += 1
+            member_id = f"member_{index}"
+
+        member = TeamMember(
+            member_id=member_id,
+            name=member_data.get("name", f"Member {len(analysis.members) + 1}"),
+            birth_data=birth_data,
+            reading=reading,
+            role=member_data.get("role"),
+            department=member_data.get("department"),
+        )
+        if analysis.synergy_matrix is not None:
+            analysis.synergy_matrix.add_member(member)
+
+        return self._build_analysis(
+            analysis.team_name, analysis.members + [member], analysis.synergy_matrix
+        )
+
+    def remove_member(
+        self, analysis: TeamDynamicsAnalysis, member_id: str
+    ) -> TeamDynamicsAnalysis:
+        """
+        Remove a member from an existing analysis without rescoring other pairs.
+
+        Raises:
+            KeyError: If no member has this id
+
+        Returns:
+            Updated TeamDynamicsAnalysis (shares the synergy matrix)
+        """
+        members = [m for m in analysis.members if m.member_id != member_id]
+        if len(members) == len(analysis.members):
+            raise KeyError(member_id)
+        if analysis.synergy_matrix is not None:
+            analysis.synergy_matrix.remove_member(member_id)
+
+        return self._build_analysis(analysis.team_name, members, analysis.synergy_matrix)
+
+    def generate_readings(
+        self,
+        birth_data_list: List[FlexibleBirthData],
+        executor: Optional[Executor] = None,
+    ) -> List[PersonalDevelopmentReading]:
+        """
+        Readings for many members, served from the reading cache where possible.
+
+        Identical birth data is computed once. Misses are computed in chunks
+        of READING_CHUNK_SIZE through executor when one is given, otherwise
+        serially on the caller.
+
+        Args:
+            birth_data_list: Birth data per member
+            executor: Optional concurrent.futures executor, or anything with
+                Executor.map's call signature (e.g. CalculationExecutor.map)
+
+        Returns:
+            One reading per entry, in order (readings may be shared)
+        """
+        keys = [_reading_key(bd) for bd in birth_data_list]
+        found: Dict[Tuple, PersonalDevelopmentReading] = {}
+        missing: Dict[Tuple, FlexibleBirthData] = {}
+
+        with self._readings_lock:
+            for key, birth_data in zip(keys, birth_data_list):
+                if key in found or key in missing:
+                    continue
+                reading = self._readings.get(key)
+                if reading is not None:
+                    self._readings.move_to_end(key)
+                    self.reading_hits += 1
+                    found[key] = reading
+                else:
+                    self.reading_misses += 1
+                    missing[key] = birth_data
+
+        if missing:
+            pending = list(missing.values())
+            if executor is None:
+                computed = [self.insights_engine.generate_reading(bd) for bd in pending]
+            else:
+                chunks = [
+                    pending[i:i + READING_CHUNK_SIZE]
+                    for i in range(0, len(pending), READING_CHUNK_SIZE)
+                ]
+                computed = [
+                    reading
+                    for chunk in executor.map(_generate_readings_chunk, chunks)
+                    for reading in chunk
+                ]
+
+            with self._readings_lock:
+                for key, reading in zip(missing, computed):
+                    found[key] = reading
+                    self._readings[key] = reading
+                    self._readings.move_to_end(key)
+                while len(self._readings) > self.reading_cache_size:
+                    self._readings.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    def _build_analysis(
+        self,
+        team_name: str,
+        members: List[TeamMember],
+        synergy_matrix: Optional[SynergyMatrix],
+    ) -> TeamDynamicsAnalysis:
+        """Team aggregates for a member list (pairwise scores come from the matrix)."""
         # Analyze team composition
         life_path_dist = self._calculate_life_path_distribution(members)
         element_balance = self._calculate_element_balance(members)
@@ -173,8 +541,8 @@ class TeamDynamicsEngine:
 
         # Pairwise synergies
         strongest_synergies = []
-        if include_pairwise_analysis and len(members) >= 2:
-            strongest_synergies = self._find_strongest_synergies(members, top_n=5)
+        if synergy_matrix is not None and len(members) >= 2:
+            strongest_synergies = synergy_matrix.top_pairs(top_n=5)
 
         # Communication matrix
         communication_matrix = self._build_communication_matrix(members)
@@ -194,6 +562,7 @@ class TeamDynamicsEngine:
             communication_matrix=communication_matrix,
             strongest_synergies=strongest_synergies,
             team_coaching_prompts=coaching_prompts,
+            synergy_matrix=synergy_matrix,
         )
 
     def _parse_birth_data(self, member_data: Dict[str, Any]) -> FlexibleBirthData:
@@ -234,26 +603,15 @@ class TeamDynamicsEngine:
 
         Only if astrology data is available for members.
         """
-        element_count = {"Fire": 0, "Earth": 0, "Air": 0, "Water": 0}
-
-        fire_signs = ["Aries", "Leo", "Sagittarius"]
-        earth_signs = ["Taurus", "Virgo", "Capricorn"]
-        air_signs = ["Gemini", "Libra", "Aquarius"]
-        water_signs = ["Cancer", "Scorpio", "Pisces"]
+        element_count = {element: 0 for element in ELEMENTS}
 
         has_data = False
         for member in members:
             if member.reading and member.reading.sun_sign:
                 has_data = True
-                sign = member.reading.sun_sign
-                if sign in fire_signs:
-                    element_count["Fire"] += 1
-                elif sign in earth_signs:
-                    element_count["Earth"] += 1
-                elif sign in air_signs:
-                    element_count["Air"] += 1
-                elif sign in water_signs:
-                    element_count["Water"] += 1
+                element = SIGN_ELEMENTS.get(member.reading.sun_sign)
+                if element:
+                    element_count[element] += 1
 
         return element_count if has_data else None
 
@@ -463,21 +821,7 @@ class TeamDynamicsEngine:
 
         Returns list of (name1, name2, synergy_score) tuples.
         """
-        synergies = []
-
-        for i, member1 in enumerate(members):
-            for member2 in members[i + 1:]:
-                if not (member1.reading and member2.reading):
-                    continue
-
-                score = self._calculate_pairwise_synergy(
-                    member1.reading, member2.reading
-                )
-                synergies.append((member1.name, member2.name, score))
-
-        # Sort by score and return top N
-        synergies.sort(key=lambda x: x[2], reverse=True)
-        return synergies[:top_n]
+        return SynergyMatrix.from_members(members).top_pairs(top_n)
 
     def _calculate_pairwise_synergy(
         self,
@@ -493,7 +837,7 @@ class TeamDynamicsEngine:
             lp2 = reading2.life_path_number
 
             # Complementary pairs
-            if (lp1, lp2) in [(1, 2), (2, 1), (3, 4), (4, 3), (5, 6), (6, 5), (7, 8), (8, 7)]:
+            if (lp1, lp2) in COMPLEMENTARY_LIFE_PATHS:
                 score += 15
 
             # Similar energy
@@ -502,31 +846,9 @@ class TeamDynamicsEngine:
 
         # Sun sign compatibility (if available)
         if reading1.sun_sign and reading2.sun_sign:
-            # Simplified element compatibility
-            fire_signs = ["Aries", "Leo", "Sagittarius"]
-            earth_signs = ["Taurus", "Virgo", "Capricorn"]
-            air_signs = ["Gemini", "Libra", "Aquarius"]
-            water_signs = ["Cancer", "Scorpio", "Pisces"]
-
-            sign1_element = None
-            sign2_element = None
-
-            for element, signs in [
-                ("Fire", fire_signs),
-                ("Earth", earth_signs),
-                ("Air", air_signs),
-                ("Water", water_signs),
-            ]:
-                if reading1.sun_sign in signs:
-                    sign1_element = element
-                if reading2.sun_sign in signs:
-                    sign2_element = element
-
             # Fire/Air and Earth/Water are compatible
-            if (sign1_element == "Fire" and sign2_element == "Air") or \
-               (sign1_element == "Air" and sign2_element == "Fire") or \
-               (sign1_element == "Earth" and sign2_element == "Water") or \
-               (sign1_element == "Water" and sign2_element == "Earth"):
+            elements = (SIGN_ELEMENTS.get(reading1.sun_sign), SIGN_ELEMENTS.get(reading2.sun_sign))
+            if elements in COMPATIBLE_ELEMENTS:
                 score += 10
 
         return min(score, 100)
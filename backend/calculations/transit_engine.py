@@ -15,20 +15,32 @@ This creates a unified prediction system that answers:
 "When will this event manifest for this person?"
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+import heapq
+
+import numpy as np
 
 # Import required modules
-from backend.calculations.dasha_engine import DashaCalculator, DashaPosition
+from backend.calculations.dasha_engine import DashaCalculator, DashaPosition, DashaTimeline
 from backend.calculations.kp_engine import (
     get_sub_lord,
-    get_significators_for_house,
+    compute_significator_matrix,
     get_ruling_planets,
     VIMSHOTTARI_PROPORTIONS
 )
 from backend.calculations.ephemeris import EphemerisCalculator, PlanetPosition
+from backend.calculations.ephemeris_table import EphemerisTable, get_default_ephemeris_table
+from backend.calculations.transit_events import (
+    TransitEventFinder,
+    NAKSHATRA_INGRESS,
+    TRANSIT_PLANETS,
+)
+
+# Days resolved per ephemeris batch in the daily scan
+SCAN_CHUNK_DAYS = 32
 
 
 @dataclass
@@ -74,10 +86,18 @@ class TransitAnalyzer:
     to identify when events manifest.
     """
     
-    def __init__(self):
-        """Initialize transit analyzer with Dasha and Ephemeris engines."""
+    def __init__(self, ephemeris_table: Optional[EphemerisTable] = None):
+        """
+        Initialize transit analyzer with Dasha and Ephemeris engines.
+        
+        Args:
+            ephemeris_table: Precomputed table for interpolated lookups
+                             (default: the table named by EPHEMERIS_TABLE_PATH, if any)
+        """
         self.dasha = DashaCalculator()
         self.ephemeris = EphemerisCalculator()  # For real planetary positions
+        self.ephemeris_table = ephemeris_table or get_default_ephemeris_table()
+        self.event_finder = TransitEventFinder(self.ephemeris, self.ephemeris_table)
         
         # House matter keywords for interpretation
         self.house_matters = {
@@ -102,7 +122,8 @@ class TransitAnalyzer:
         start_date: datetime,
         end_date: datetime,
         target_houses: Optional[List[int]] = None,
-        min_confidence: float = 0.6
+        min_confidence: float = 0.6,
+        exact_timing: bool = False
     ) -> List[TransitEvent]:
         """
         Find all transit activation events within a date range.
@@ -113,13 +134,96 @@ class TransitAnalyzer:
             end_date: End of analysis period
             target_houses: Specific houses to focus on (None = all)
             min_confidence: Minimum confidence to include event (0-1)
+            exact_timing: If True, emit one event per exact star (nakshatra) ingress
+                          of a transiting planet into a significator's star, solved
+                          to the minute, instead of scanning day by day
         
         Returns:
-            List of TransitEvent sorted by date
+            List of TransitEvent sorted by combined confidence (highest first)
+        """
+        events = list(self.iter_transit_activations(
+            birth_chart, start_date, end_date, target_houses, min_confidence, exact_timing
+        ))
+        
+        # Sort by combined confidence (highest first)
+        events.sort(key=lambda e: e.combined_confidence, reverse=True)
+        return events
+    
+    
+    def iter_transit_activations(
+        self,
+        birth_chart: Dict,
+        start_date: datetime,
+        end_date: datetime,
+        target_houses: Optional[List[int]] = None,
+        min_confidence: float = 0.6,
+        exact_timing: bool = False
+    ) -> Iterator[TransitEvent]:
+        """
+        Yield transit activation events in date order as they are found.
+        
+        Same arguments as get_transit_activations. The daily scan resolves
+        positions SCAN_CHUNK_DAYS at a time, so the first events arrive
+        before the rest of the window has been computed.
+        """
+        for event, _ in self._iter_activations(
+            birth_chart, start_date, end_date, target_houses, min_confidence, exact_timing
+        ):
+            yield event
+    
+    
+    def top_transit_activations(
+        self,
+        birth_chart: Dict,
+        start_date: datetime,
+        end_date: datetime,
+        k: int = 10,
+        target_houses: Optional[List[int]] = None,
+        min_confidence: float = 0.6,
+        exact_timing: bool = False
+    ) -> List[TransitEvent]:
         """
-        events = []
+        The k highest-confidence activations, found with a bounded heap.
         
-        # Convert planet_positions list to dict format for get_significators_for_house
+        Memory stays O(k) for any window length, and interpretation text is
+        only generated for the events that are kept. The result equals
+        get_transit_activations(...)[:k].
+        
+        Returns:
+            Up to k TransitEvent sorted by combined confidence (highest first)
+        """
+        heap: List[Tuple[float, int, TransitEvent, int]] = []
+        for sequence, (event, house) in enumerate(self._iter_activations(
+            birth_chart, start_date, end_date, target_houses, min_confidence, exact_timing,
+            interpret=False
+        )):
+            # Ties keep the earliest event, like the stable sort
+            entry = (event.combined_confidence, -sequence, event, house)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        
+        top = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+        for _, _, event, house in top:
+            event.interpretation = self._generate_interpretation(
+                event.natal_significator, house, event.dasha_planet, event.combined_confidence
+            )
+        return [event for _, _, event, _ in top]
+    
+    
+    def _iter_activations(
+        self,
+        birth_chart: Dict,
+        start_date: datetime,
+        end_date: datetime,
+        target_houses: Optional[List[int]],
+        min_confidence: float,
+        exact_timing: bool,
+        interpret: bool = True
+    ) -> Iterator[Tuple[TransitEvent, int]]:
+        """Yield (event, house) pairs in date order."""
+        # Convert planet_positions list to dict format for compute_significator_matrix
         planet_positions = birth_chart.get('planet_positions', [])
         natal_planets = {}
         for p in planet_positions:
@@ -140,20 +244,13 @@ class TransitAnalyzer:
                 # It's a list of floats
                 house_cusp_longitudes = house_cusps_list
         
-        moon_longitude = birth_chart.get('moon_longitude', 0)
         dasha_balance = birth_chart.get('dasha_balance_years', 0)
         
-        # Get KP significators for all houses
-        significators = {}
-        for house in range(1, 13):
-            sigs = get_significators_for_house(
-                house,
-                natal_planets,
-                house_cusp_longitudes
-            )
-            # Extract planet names from Significator objects
-            sig_planets = [sig.planet for sig in sigs] if sigs else []
-            significators[house] = sig_planets
+        # Get KP significators for all houses in one pass
+        matrix = compute_significator_matrix(natal_planets, house_cusp_longitudes)
+        significators = {
+            house: matrix.planets_for_house(house) for house in range(1, 13)
+        }
         
         # Ensure start_date is timezone-aware (UTC)
         if start_date.tzinfo is None:
@@ -166,81 +263,177 @@ class TransitAnalyzer:
             import pytz
             birth_date = pytz.UTC.localize(birth_date)
         
-        # Current dasha info
-        current_dasha = self.dasha.calculate_dasha_position(
+        # Dasha periods are built once for the whole scan window
+        years_covered = (end_date - birth_date).days / 365.25 + 1
+        dasha_timeline = self.dasha.build_timeline(
             birth_date,
-            moon_longitude,
             dasha_balance,
-            start_date
+            years=max(years_covered, 1.0),
+            depth=3
         )
         
-        # Scan through each day in the period
+        houses_to_check = target_houses or list(range(1, 13))
+        
+        if exact_timing:
+            yield from self._iter_exact_activations(
+                significators, houses_to_check, natal_planets, dasha_timeline,
+                start_date, end_date, min_confidence, interpret
+            )
+            return
+        
+        # Scan day by day, resolving transiting planets and dasha periods
+        # for a chunk of days in one batch
         current_date = start_date
         while current_date <= end_date:
-            # Get dasha position for this date
-            dasha_pos = self.dasha.calculate_dasha_position(
-                birth_chart.get('birth_date', start_date),
-                moon_longitude,
-                dasha_balance,
-                current_date
-            )
-            
-            # Check each target house for transits
-            houses_to_check = target_houses or list(range(1, 13))
+            scan_dates = []
+            while current_date <= end_date and len(scan_dates) < SCAN_CHUNK_DAYS:
+                scan_dates.append(current_date)
+                current_date += timedelta(days=1)
+            transit_planets = self._get_transit_planets_for_dates(scan_dates)
+            dasha_positions = dasha_timeline.positions_at(scan_dates)
             
-            for house in houses_to_check:
-                sigs = significators.get(house, [])
-                
-                for sig_planet in sigs[:3]:  # Top 3 significators per house
-                    # Calculate KP confidence for this significator
-                    kp_conf = self._calculate_kp_transit_confidence(
-                        transiting_planet=self._get_transit_planet_at_date(current_date),
-                        natal_significator=sig_planet,
-                        house=house,
-                        natal_planets=natal_planets
-                    )
-                    
-                    if kp_conf < min_confidence:
-                        continue
-                    
-                    # Calculate Dasha support
-                    dasha_support = self._calculate_dasha_support(
-                        dasha_planet=dasha_pos.dasha_planet,
-                        significator=sig_planet,
-                        house=house
-                    )
+            for scan_date, transit_planet, dasha_pos in zip(scan_dates, transit_planets, dasha_positions):
+                # Check each target house for transits
+                for house in houses_to_check:
+                    sigs = significators.get(house, [])
                     
-                    # Combined confidence
-                    combined = (kp_conf * 0.6) + (dasha_support * 0.4)
-                    
-                    if combined >= min_confidence:
-                        # Create transit event
-                        event = TransitEvent(
-                            event_date=current_date,
-                            transiting_planet=self._get_transit_planet_at_date(current_date),
-                            natal_significator=sig_planet,
-                            house_matter=', '.join(self.house_matters.get(house, [])),
-                            dasha_planet=dasha_pos.dasha_planet,
-                            dasha_remaining_years=dasha_pos.dasha_remaining,
-                            kp_confidence=kp_conf,
-                            dasha_support=dasha_support,
-                            combined_confidence=combined,
+                    for sig_planet in sigs[:3]:  # Top 3 significators per house
+                        event = self._score_activation(
+                            event_date=scan_date,
+                            transit_planet=transit_planet,
+                            sig_planet=sig_planet,
+                            house=house,
+                            natal_planets=natal_planets,
+                            dasha_pos=dasha_pos,
                             duration_days=self._estimate_transit_duration(sig_planet),
-                            event_strength=self._classify_event_strength(combined),
-                            interpretation=self._generate_interpretation(
-                                sig_planet,
-                                house,
-                                dasha_pos.dasha_planet,
-                                combined
-                            )
+                            min_confidence=min_confidence,
+                            interpret=interpret
                         )
-                        events.append(event)
-            
-            current_date += timedelta(days=1)
+                        if event is not None:
+                            yield event, house
+    
+    
+    def _score_activation(
+        self,
+        event_date: datetime,
+        transit_planet: str,
+        sig_planet: str,
+        house: int,
+        natal_planets: Dict,
+        dasha_pos: DashaPosition,
+        duration_days: int,
+        min_confidence: float,
+        interpret: bool = True
+    ) -> Optional[TransitEvent]:
+        """
+        Score one transit/significator pair; None if below min_confidence.
         
-        # Sort by combined confidence (highest first)
-        events.sort(key=lambda e: e.combined_confidence, reverse=True)
-        return events
+        With interpret=False the interpretation text is left empty.
+        """
+        # Calculate KP confidence for this significator
+        kp_conf = self._calculate_kp_transit_confidence(
+            transiting_planet=transit_planet,
+            natal_significator=sig_planet,
+            house=house,
+            natal_planets=natal_planets
+        )
+        
+        if kp_conf < min_confidence:
+            return None
+        
+        # Calculate Dasha support
+        dasha_support = self._calculate_dasha_support(
+            dasha_planet=dasha_pos.dasha_planet,
+            significator=sig_planet,
+            house=house
+        )
+        
+        # Combined confidence
+        combined = (kp_conf * 0.6) + (dasha_support * 0.4)
+        
+        if combined < min_confidence:
+            return None
+        
+        return TransitEvent(
+            event_date=event_date,
+            transiting_planet=transit_planet,
+            natal_significator=sig_planet,
+            house_matter=', '.join(self.house_matters.get(house, [])),
+            dasha_planet=dasha_pos.dasha_planet,
+            dasha_remaining_years=dasha_pos.dasha_remaining,
+            kp_confidence=kp_conf,
+            dasha_support=dasha_support,
+            combined_confidence=combined,
+            duration_days=duration_days,
+            event_strength=self._classify_event_strength(combined),
+            interpretation=self._generate_interpretation(
+                sig_planet,
+                house,
+                dasha_pos.dasha_planet,
+                combined
+            ) if interpret else ""
+        )
+    
+    
+    def _iter_exact_activations(
+        self,
+        significators: Dict[int, List[str]],
+        houses_to_check: List[int],
+        natal_planets: Dict,
+        dasha_timeline: DashaTimeline,
+        start_date: datetime,
+        end_date: datetime,
+        min_confidence: float,
+        interpret: bool = True
+    ) -> Iterator[Tuple[TransitEvent, int]]:
+        """
+        Event-driven activations: a transiting planet entering the star
+        (nakshatra) of one of a house's top significators.
+        
+        Ingress times come from TransitEventFinder, so cost scales with the
+        number of ingresses rather than with days x houses x significators.
+        The event duration is the real time until the planet's next ingress.
+        """
+        ingresses = self.event_finder.find_events(
+            start_date,
+            end_date,
+            planets=TRANSIT_PLANETS,
+            event_types=(NAKSHATRA_INGRESS,)
+        )
+        
+        # Time until the same planet's next ingress
+        durations: List[Optional[float]] = [None] * len(ingresses)
+        next_jd: Dict[str, float] = {}
+        for index in range(len(ingresses) - 1, -1, -1):
+            ingress = ingresses[index]
+            if ingress.planet in next_jd:
+                durations[index] = next_jd[ingress.planet] - ingress.jd
+            next_jd[ingress.planet] = ingress.jd
+        
+        for ingress, duration in zip(ingresses, durations):
+            star_lord = ingress.target_lord
+            houses_hit = [h for h in houses_to_check if star_lord in significators.get(h, [])[:3]]
+            if not houses_hit:
+                continue
+            
+            dasha_pos = dasha_timeline.position_at(ingress.event_date)
+            duration_days = (int(round(duration)) if duration is not None
+                             else self._estimate_transit_duration(star_lord))
+            
+            for house in houses_hit:
+                event = self._score_activation(
+                    event_date=ingress.event_date,
+                    transit_planet=ingress.planet,
+                    sig_planet=star_lord,
+                    house=house,
+                    natal_planets=natal_planets,
+                    dasha_pos=dasha_pos,
+                    duration_days=duration_days,
+                    min_confidence=min_confidence,
+                    interpret=interpret
+                )
+                if event is not None:
+                    yield event, house
     
     
     def get_favorable_windows(
@@ -248,7 +441,8 @@ class TransitAnalyzer:
         birth_chart: Dict,
         start_date: datetime,
         end_date: datetime,
-        event_type: str = 'Marriage'
+        event_type: str = 'Marriage',
+        exact_timing: bool = False
     ) -> List[ActivationWindow]:
         """
         Find favorable windows for specific life events.
@@ -258,6 +452,7 @@ class TransitAnalyzer:
             start_date: Analysis start
             end_date: Analysis end
             event_type: Type of event to find ('Marriage', 'Career', 'Health', etc)
+            exact_timing: Use exact ingress events instead of the daily scan
         
         Returns:
             List of ActivationWindow sorted by strength
@@ -284,7 +479,8 @@ class TransitAnalyzer:
             start_date,
             end_date,
             target_houses=target_houses,
-            min_confidence=0.5
+            min_confidence=0.5,
+            exact_timing=exact_timing
         )
         
         if not events:
@@ -368,23 +564,42 @@ class TransitAnalyzer:
     
     def _get_transit_planet_at_date(self, date: datetime) -> str:
         """Get planets transiting at given date using real ephemeris data."""
-        # Get all planet positions at this date
-        all_planets = self.ephemeris.get_all_planets(date, tropical=False)
-        
-        # Find the planet with the most significant movement/position
-        # Prioritize faster-moving planets which are more likely transiting
-        planets_by_speed = sorted(
-            all_planets.items(),
-            key=lambda x: x[1].speed,
-            reverse=True
-        )
+        return self._get_transit_planets_for_dates([date])[0]
+    
+    
+    def _get_planet_speeds(self, dates: List[datetime]) -> np.ndarray:
+        """
+        Get signed sidereal speeds for ALL_PLANETS at each date.
         
-        # Return the fastest-moving planet (Moon most likely to be transiting)
-        if planets_by_speed:
-            return planets_by_speed[0][0]
+        Uses the precomputed ephemeris table when it covers the whole range,
+        otherwise a single batched Swiss Ephemeris call.
+        
+        Returns:
+            Array shaped [len(dates), len(EphemerisCalculator.ALL_PLANETS)]
+        """
+        jd = EphemerisCalculator.datetimes_to_jd(dates)
+        table = self.ephemeris_table
+        if (table is not None and not table.tropical
+                and set(EphemerisCalculator.ALL_PLANETS) <= set(table.planets)
+                and table.covers(float(jd.min()), float(jd.max()))):
+            _, speeds = table.interpolate(jd, EphemerisCalculator.ALL_PLANETS)
+            return speeds
+        return self.ephemeris.get_positions_batch(jd, tropical=False).speed
+    
+    
+    def _get_transit_planets_for_dates(self, dates: List[datetime]) -> List[str]:
+        """
+        Get the transiting planet for each date.
+        
+        The fastest-moving planet (by absolute speed) is taken as the
+        transiting planet; in practice this is almost always the Moon.
+        """
+        if not dates:
+            return []
         
-        # Fallback to a default planet
-        return 'Moon'
+        speeds = self._get_planet_speeds(dates)
+        fastest = np.argmax(np.abs(speeds), axis=1)
+        return [EphemerisCalculator.ALL_PLANETS[i] for i in fastest]
     
     
     def _calculate_kp_transit_confidence(
@@ -0,0 +1,414 @@
+"""
+Exact Transit Event Finder
+
+Event-driven alternative to day-stepping transit scans. Instead of sampling
+every planet every day and comparing positions, the finder:
+
+1. Samples each planet on a coarse grid (default 1 day)
+2. Brackets retrograde/direct stations from sign changes in speed and
+   solves them with Brent's method, so longitude is monotonic between
+   consecutive brackets
+3. Locates every boundary crossed inside a monotonic bracket with a
+   binary search over the sorted boundary list
+4. Solves each crossing to the second with Brent's method
+
+Supported events:
+- Sign ingress (12 boundaries)
+- Nakshatra ingress (27 boundaries)
+- KP sub-lord ingress (243 sub boundaries)
+- Exact aspects to natal points
+- Retrograde / direct stations
+
+The result is a date-sorted event stream with minute precision whose cost
+scales with the number of events rather than with window length.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+import numpy as np
+
+from .ephemeris import EphemerisCalculator, SIGN_LENGTH_DEGREES, NAKSHATRA_LENGTH_DEGREES
+from .ephemeris_table import EphemerisTable
+from .exceptions import InvalidDateRangeError, TransitCalculationError
+from .kp_engine import (
+    NAKSHATRA_NAMES,
+    NAKSHATRA_LORDS,
+    get_sub_lord_boundaries,
+)
+
+logger = logging.getLogger(__name__)
+
+# Root-finding tolerance in days (~1 second)
+ROOT_TOLERANCE_DAYS = 1e-5
+MAX_ROOT_ITERATIONS = 100
+
+# Event types
+SIGN_INGRESS = 'sign_ingress'
+NAKSHATRA_INGRESS = 'nakshatra_ingress'
+SUB_LORD_INGRESS = 'sub_lord_ingress'
+EXACT_ASPECT = 'aspect'
+STATION = 'station'
+
+INGRESS_EVENT_TYPES = (SIGN_INGRESS, NAKSHATRA_INGRESS, SUB_LORD_INGRESS)
+
+# Aspect angles used for exact-aspect events
+ASPECT_ANGLES = {
+    'Conjunction': 0.0,
+    'Sextile': 60.0,
+    'Square': 90.0,
+    'Trine': 120.0,
+    'Opposition': 180.0,
+}
+
+# The nine Vimshottari grahas (KP transit planets)
+TRANSIT_PLANETS = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Rahu', 'Ketu']
+
+
+@dataclass
+class ExactTransitEvent:
+    """A transit event solved to an exact moment."""
+    event_type: str             # sign_ingress, nakshatra_ingress, sub_lord_ingress, aspect, station
+    planet: str                 # Transiting planet
+    jd: float                   # Julian Day (UT) of the event
+    event_date: datetime        # UTC datetime of the event
+    longitude: float            # Planet longitude at the event (0-360)
+    retrograde: bool            # Motion direction at the event
+    target: str                 # Entered sign/nakshatra/sub, aspect label, or 'Retrograde'/'Direct'
+    target_lord: Optional[str]  # Nakshatra lord or sub-lord entered (None for signs/stations)
+
+
+def _wrap180(angle: np.ndarray) -> np.ndarray:
+    """Wrap degrees into [-180, 180)."""
+    return np.mod(angle + 180.0, 360.0) - 180.0
+
+
+def _sub_lord_boundaries() -> Tuple[np.ndarray, List[str]]:
+    """Start longitudes and lords of the 243 KP sub divisions (as in get_sub_lord)."""
+    boundaries = get_sub_lord_boundaries()
+    return np.array([b[0] for b in boundaries]), [b[2] for b in boundaries]
+
+
+def brent_root(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float = ROOT_TOLERANCE_DAYS,
+    maxiter: int = MAX_ROOT_ITERATIONS
+) -> float:
+    """
+    Find a root of f in [a, b] with Brent's method.
+
+    Args:
+        f: Scalar function
+        a, b: Bracket end points
+        fa, fb: f(a) and f(b); must have opposite signs (or be zero)
+        xtol: Absolute tolerance on the root
+        maxiter: Iteration cap
+
+    Returns:
+        Root location
+
+    Raises:
+        TransitCalculationError: If the bracket does not contain a sign change
+    """
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        raise TransitCalculationError("Root is not bracketed")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+    return b
+
+
+class TransitEventFinder:
+    """
+    Solve transit events to exact times using bracketing and Brent's method.
+
+    Positions come from a precomputed EphemerisTable when it covers the
+    window, otherwise from batched Swiss Ephemeris calls.
+    """
+
+    def __init__(
+        self,
+        ephemeris: Optional[EphemerisCalculator] = None,
+        ephemeris_table: Optional[EphemerisTable] = None
+    ):
+        """
+        Initialize the finder.
+
+        Args:
+            ephemeris: Calculator used when no table covers the window
+            ephemeris_table: Optional precomputed sidereal table
+        """
+        self.ephemeris = ephemeris or EphemerisCalculator()
+        self.ephemeris_table = ephemeris_table
+        self.evaluations = 0  # Ephemeris samples used (coarse grid + solver)
+
+        sub_starts, sub_lords = _sub_lord_boundaries()
+        self._boundaries = {
+            SIGN_INGRESS: (
+                np.arange(12) * SIGN_LENGTH_DEGREES,
+                [(name, None) for name in EphemerisCalculator.SIGNS],
+            ),
+            NAKSHATRA_INGRESS: (
+                np.arange(27) * NAKSHATRA_LENGTH_DEGREES,
+                list(zip(NAKSHATRA_NAMES, NAKSHATRA_LORDS)),
+            ),
+            SUB_LORD_INGRESS: (
+                sub_starts,
+                [(f"{lord} sub", lord) for lord in sub_lords],
+            ),
+        }
+
+    # ==================== EPHEMERIS ACCESS ====================
+
+    def _evaluate(self, jd: np.ndarray, planets: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Longitude and signed speed arrays shaped [n_times, n_planets]."""
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+        self.evaluations += jd.size * len(planets)
+        table = self.ephemeris_table
+        if (table is not None and not table.tropical
+                and set(planets) <= set(table.planets)
+                and table.covers(float(jd.min()), float(jd.max()))):
+            return table.interpolate(jd, planets)
+        batch = self.ephemeris.get_positions_batch(jd, planets, tropical=False)
+        return batch.longitude, batch.speed
+
+    def _evaluate_one(self, jd: float, planet: str) -> Tuple[float, float]:
+        longitude, speed = self._evaluate(np.array([jd]), [planet])
+        return float(longitude[0, 0]), float(speed[0, 0])
+
+    # ==================== EVENT SEARCH ====================
+
+    def _targets(
+        self,
+        event_types: Sequence[str],
+        natal_points: Optional[Dict[str, float]],
+        aspect_angles: Dict[str, float]
+    ) -> Tuple[np.ndarray, List[Tuple[str, int, str, Optional[str]]]]:
+        """
+        Sorted target longitudes with (event_type, ordinal, label, lord) metadata.
+
+        The list is duplicated at +360° so that a monotonic arc starting
+        anywhere in [0, 360) and spanning < 360° can be searched directly.
+        """
+        longitudes = []
+        meta = []
+        for event_type in event_types:
+            if event_type in self._boundaries:
+                values, labels = self._boundaries[event_type]
+                for ordinal, (value, (label, lord)) in enumerate(zip(values, labels)):
+                    longitudes.append(float(value))
+                    meta.append((event_type, ordinal, label, lord))
+
+        if EXACT_ASPECT in event_types and natal_points:
+            for point_name, point_longitude in natal_points.items():
+                for aspect_name, angle in aspect_angles.items():
+                    # Conjunction and opposition have a single target point
+                    for offset in sorted({float(angle) % 360.0, float(-angle) % 360.0}):
+                        longitudes.append(float((point_longitude + offset) % 360.0))
+                        meta.append((EXACT_ASPECT, 0, f"{aspect_name} natal {point_name}", point_name))
+
+        if not longitudes:
+            return np.empty(0), []
+
+        order = np.argsort(longitudes, kind='stable')
+        base = np.asarray(longitudes)[order]
+        sorted_meta = [meta[i] for i in order]
+        return np.concatenate([base, base + 360.0]), sorted_meta + sorted_meta
+
+    def _solve_crossing(self, planet: str, target: float, a: float, b: float) -> float:
+        """Exact time in [a, b] when the planet's longitude equals target."""
+        def g(t: float) -> float:
+            return float(_wrap180(self._evaluate_one(t, planet)[0] - target))
+
+        return brent_root(g, a, b, g(a), g(b))
+
+    def _solve_station(self, planet: str, a: float, b: float, fa: float, fb: float) -> float:
+        """Exact time in [a, b] when the planet's speed is zero."""
+        return brent_root(lambda t: self._evaluate_one(t, planet)[1], a, b, fa, fb)
+
+    def find_events(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        planets: Optional[Sequence[str]] = None,
+        event_types: Sequence[str] = (SIGN_INGRESS, NAKSHATRA_INGRESS, STATION),
+        natal_points: Optional[Dict[str, float]] = None,
+        aspect_angles: Optional[Dict[str, float]] = None,
+        step_days: float = 1.0
+    ) -> List[ExactTransitEvent]:
+        """
+        Find all transit events in a window, solved to exact times.
+
+        Args:
+            start_date: Window start (UTC)
+            end_date: Window end (UTC)
+            planets: Transiting planets (default: the nine Vimshottari grahas)
+            event_types: Any of sign_ingress, nakshatra_ingress,
+                         sub_lord_ingress, aspect, station
+            natal_points: Natal longitudes used for exact aspects
+            aspect_angles: Aspect name -> angle (default: major aspects)
+            step_days: Coarse bracketing step; every planet must move
+                       less than 180° per step (1 day is safe for the Moon)
+
+        Returns:
+            List of ExactTransitEvent sorted by time
+
+        Raises:
+            InvalidDateRangeError: If end_date is before start_date
+        """
+        if end_date < start_date:
+            raise InvalidDateRangeError("end_date must not be before start_date")
+
+        names = list(planets) if planets is not None else list(TRANSIT_PLANETS)
+        angles = aspect_angles if aspect_angles is not None else ASPECT_ANGLES
+        targets, target_meta = self._targets(event_types, natal_points, angles)
+        want_stations = STATION in event_types
+
+        jd_start, jd_end = EphemerisCalculator.datetimes_to_jd([start_date, end_date])
+        grid = np.arange(jd_start, jd_end, step_days)
+        grid = np.append(grid, jd_end) if grid.size == 0 or grid[-1] < jd_end else grid
+        if grid.size < 2:
+            return []
+        longitude, speed = self._evaluate(grid, names)
+
+        events: List[ExactTransitEvent] = []
+        for column, planet in enumerate(names):
+            for i in range(grid.size - 1):
+                a, b = float(grid[i]), float(grid[i + 1])
+                lon_a, lon_b = float(longitude[i, column]), float(longitude[i + 1, column])
+                speed_a, speed_b = float(speed[i, column]), float(speed[i + 1, column])
+
+                # Split the bracket at a station so each piece is monotonic
+                pieces = [(a, b, lon_a, lon_b, speed_a)]
+                if speed_a * speed_b < 0:
+                    t_station = self._solve_station(planet, a, b, speed_a, speed_b)
+                    lon_station, _ = self._evaluate_one(t_station, planet)
+                    pieces = [
+                        (a, t_station, lon_a, lon_station, speed_a),
+                        (t_station, b, lon_station, lon_b, speed_b),
+                    ]
+                    if want_stations:
+                        events.append(self._make_event(
+                            STATION, planet, t_station, lon_station,
+                            retrograde=speed_b < 0,
+                            target='Retrograde' if speed_b < 0 else 'Direct',
+                            target_lord=None
+                        ))
+
+                if targets.size == 0:
+                    continue
+                for piece_start, piece_end, piece_lon_a, piece_lon_b, piece_speed in pieces:
+                    events.extend(self._crossings_in_piece(
+                        planet, targets, target_meta,
+                        piece_start, piece_end, piece_lon_a, piece_lon_b,
+                        retrograde=piece_speed < 0
+                    ))
+
+        events.sort(key=lambda e: e.jd)
+        logger.debug(
+            f"Transit event search: {len(events)} events, {self.evaluations} ephemeris samples"
+        )
+        return events
+
+    def _crossings_in_piece(
+        self,
+        planet: str,
+        targets: np.ndarray,
+        target_meta: List[Tuple[str, int, str, Optional[str]]],
+        a: float,
+        b: float,
+        lon_a: float,
+        lon_b: float,
+        retrograde: bool
+    ) -> List[ExactTransitEvent]:
+        """Solve every target crossed while moving monotonically from a to b."""
+        if retrograde:
+            # Moving backwards: crossed targets lie in [lon_b, lon_a)
+            moved = np.mod(lon_a - lon_b, 360.0)
+            low, high = lon_a - moved + 360.0, lon_a + 360.0
+            first = int(np.searchsorted(targets, low, side='left'))
+            last = int(np.searchsorted(targets, high, side='left'))
+        else:
+            # Moving forwards: crossed targets lie in (lon_a, lon_b]
+            moved = np.mod(lon_b - lon_a, 360.0)
+            low, high = lon_a, lon_a + moved
+            first = int(np.searchsorted(targets, low, side='right'))
+            last = int(np.searchsorted(targets, high, side='right'))
+
+        crossings = []
+        for k in range(first, last):
+            target = float(targets[k] % 360.0)
+            event_type, ordinal, label, lord = target_meta[k]
+            t = self._solve_crossing(planet, target, a, b)
+            if retrograde and event_type in INGRESS_EVENT_TYPES:
+                # Moving backwards over a boundary enters the previous division
+                _, labels = self._boundaries[event_type]
+                label, lord = labels[(ordinal - 1) % len(labels)]
+            crossings.append(self._make_event(
+                event_type, planet, t, target, retrograde, label, lord
+            ))
+        return crossings
+
+    def _make_event(
+        self,
+        event_type: str,
+        planet: str,
+        jd: float,
+        longitude: float,
+        retrograde: bool,
+        target: str,
+        target_lord: Optional[str]
+    ) -> ExactTransitEvent:
+        return ExactTransitEvent(
+            event_type=event_type,
+            planet=planet,
+            jd=float(jd),
+            event_date=EphemerisCalculator.jd_to_datetime(jd),
+            longitude=float(longitude) % 360.0,
+            retrograde=retrograde,
+            target=target,
+            target_lord=target_lord
+        )
@@ -2,48 +2,119 @@
 Database connection and session management.
 Handles SQLAlchemy engine, session factory, and dependency injection.
 Supports both SQLite (development) and PostgreSQL (production).
+
+Pooling:
+- PostgreSQL: QueuePool with configurable size, overflow, recycle and pre-ping
+- SQLite file: WAL journal, a pool of reader connections and a dedicated
+  single-connection write engine (get_write_db) so writers queue in-process
+  instead of contending for the database lock
+- SQLite in-memory: one shared StaticPool connection
+
+An async engine (AsyncSession via get_async_db) is created lazily for async
+routes such as the health check; it uses the aiosqlite or asyncpg driver.
 """
 
+from typing import AsyncIterator, Dict, Optional, Tuple
+import threading
+import logging
+
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool, StaticPool
-from backend.config.settings import settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+from backend.config.settings import settings, DatabaseConfig
 from backend.models.database import Base
-import logging
 
 logger = logging.getLogger(__name__)
 
 
-# Determine which connection pool to use based on database driver
-if "sqlite" in settings.database.url:
-    # SQLite: Use StaticPool for thread safety
-    engine = create_engine(
-        settings.database.url,
-        echo=settings.api.debug,
-        connect_args={"timeout": 15, "check_same_thread": False},
-        poolclass=StaticPool,  # Required for SQLite thread safety
-    )
-    
-    # Enable foreign keys for SQLite
+def _is_sqlite_memory(config: DatabaseConfig) -> bool:
+    return config.sqlite_db_path in ("", ":memory:")
+
+
+def _install_sqlite_pragmas(engine: Engine, config: DatabaseConfig) -> None:
+    """Apply per-connection SQLite settings."""
+    use_wal = config.sqlite_wal and not _is_sqlite_memory(config)
+
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        if use_wal:
+            # Readers no longer block the writer (and vice versa)
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={config.sqlite_busy_timeout * 1000}")
         cursor.close()
-        
-    logger.info(f"✅ SQLite database configured: {settings.database.sqlite_db_path}")
-else:
-    # PostgreSQL: Use NullPool for production
+
+
+def create_engines(config: DatabaseConfig, echo: bool = False) -> Tuple[Engine, Engine]:
+    """
+    Build the read/write engine pair for a database configuration.
+
+    Args:
+        config: Database settings
+        echo: Log SQL statements
+
+    Returns:
+        Tuple of (engine, write_engine); the same engine for PostgreSQL
+    """
+    if config.driver == "sqlite":
+        connect_args = {"timeout": config.sqlite_busy_timeout, "check_same_thread": False}
+
+        if _is_sqlite_memory(config):
+            # A single shared connection keeps the in-memory database alive
+            engine = create_engine(
+                config.url, echo=echo, connect_args=connect_args, poolclass=StaticPool
+            )
+            _install_sqlite_pragmas(engine, config)
+            return engine, engine
+
+        engine = create_engine(
+            config.url,
+            echo=echo,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=config.sqlite_read_pool_size,
+            max_overflow=0,
+            pool_timeout=config.pool_timeout,
+        )
+        write_engine = create_engine(
+            config.url,
+            echo=echo,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=config.pool_timeout,
+        )
+        _install_sqlite_pragmas(engine, config)
+        _install_sqlite_pragmas(write_engine, config)
+        return engine, write_engine
+
     engine = create_engine(
-        settings.database.url,
-        echo=settings.api.debug,
-        pool_pre_ping=True,  # Verify connections before using
-        poolclass=NullPool,  # Disable pooling for simplicity (enable for production)
+        config.url,
+        echo=echo,
+        poolclass=QueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
     )
+    return engine, engine
+
+
+engine, write_engine = create_engines(settings.database, echo=settings.api.debug)
+
+if settings.database.driver == "sqlite":
+    logger.info(f"✅ SQLite database configured: {settings.database.sqlite_db_path}")
+else:
     logger.info(f"✅ PostgreSQL database configured: {settings.database.host}:{settings.database.port}")
 
-# Create session factory
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+WriteSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=write_engine)
 
 
 def get_db():
@@ -58,10 +129,157 @@ def get_db():
         db.close()
 
 
+def get_write_db():
+    """
+    Dependency injection for a session on the write engine.
+    Use for endpoints that insert or update rows.
+    """
+    db = WriteSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ==================== ASYNC SESSIONS ====================
+
+_async_engine = None
+_async_session_factory = None
+_async_lock = threading.Lock()
+
+
+def get_async_engine():
+    """
+    Lazily create the async engine (aiosqlite for SQLite, asyncpg for PostgreSQL).
+
+    Returns:
+        sqlalchemy.ext.asyncio.AsyncEngine
+    """
+    global _async_engine, _async_session_factory
+    with _async_lock:
+        if _async_engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+            config = settings.database
+            if config.driver == "sqlite":
+                if _is_sqlite_memory(config):
+                    pool_args = {"poolclass": StaticPool}
+                else:
+                    pool_args = {
+                        "poolclass": AsyncAdaptedQueuePool,
+                        "pool_size": config.sqlite_read_pool_size,
+                        "max_overflow": 0,
+                        "pool_timeout": config.pool_timeout,
+                    }
+                _async_engine = create_async_engine(
+                    config.async_url,
+                    echo=settings.api.debug,
+                    connect_args={"timeout": config.sqlite_busy_timeout},
+                    **pool_args,
+                )
+                _install_sqlite_pragmas(_async_engine.sync_engine, config)
+            else:
+                _async_engine = create_async_engine(
+                    config.async_url,
+                    echo=settings.api.debug,
+                    pool_size=config.pool_size,
+                    max_overflow=config.max_overflow,
+                    pool_timeout=config.pool_timeout,
+                    pool_recycle=config.pool_recycle,
+                    pool_pre_ping=config.pool_pre_ping,
+                )
+            _async_session_factory = async_sessionmaker(
+                _async_engine, autoflush=False, expire_on_commit=False
+            )
+        return _async_engine
+
+
+async def get_async_db() -> AsyncIterator:
+    """
+    Dependency injection for an AsyncSession.
+    Yields a session for the request duration.
+    """
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+
+def reset_engines_after_fork() -> None:
+    """
+    Drop connection pools inherited from a parent process.
+
+    Call in a forked worker before it touches the database; the parent's
+    connections are left open for the parent (close=False).
+    """
+    global _async_engine, _async_session_factory
+    engine.dispose(close=False)
+    if write_engine is not engine:
+        write_engine.dispose(close=False)
+    with _async_lock:
+        if _async_engine is not None:
+            _async_engine.sync_engine.dispose(close=False)
+        _async_engine = None
+        _async_session_factory = None
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections (called on shutdown)."""
+    global _async_engine, _async_session_factory
+    with _async_lock:
+        async_engine, _async_engine = _async_engine, None
+        _async_session_factory = None
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+# ==================== POOL METRICS ====================
+
+def _pool_stats(pool, max_overflow: int = 0) -> Dict:
+    """
+    Utilization counters for one connection pool.
+
+    Args:
+        pool: Engine pool
+        max_overflow: The pool's configured max_overflow
+    """
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + max(max_overflow, 0)
+        checked_out = pool.checkedout()
+        stats.update({
+            "size": pool.size(),
+            "max_overflow": max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": checked_out,
+            # Negative until the pool has opened pool_size connections
+            "overflow": max(pool.overflow(), 0),
+            "utilization": checked_out / capacity if capacity else 0.0,
+        })
+    else:
+        stats["status"] = pool.status()
+    return stats
+
+
+def get_pool_stats() -> Dict[str, Optional[Dict]]:
+    """
+    Get connection pool utilization for every engine.
+
+    Returns:
+        Dict with "read", "write" and "async" pool stats (None if unused)
+    """
+    # SQLite pools never overflow (see create_engines / get_async_engine)
+    max_overflow = settings.database.max_overflow if settings.database.driver != "sqlite" else 0
+    return {
+        "read": _pool_stats(engine.pool, max_overflow),
+        "write": _pool_stats(write_engine.pool) if write_engine is not engine else None,
+        "async": _pool_stats(_async_engine.sync_engine.pool, max_overflow) if _async_engine is not None else None,
+    }
+
+
 def init_db():
     """Initialize the database (create tables)."""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=write_engine)
         logger.info("✅ Database tables created successfully")
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {str(e)}")
@@ -71,7 +289,7 @@ def init_db():
 def drop_db():
     """Drop all tables (for testing/cleanup)."""
     try:
-        Base.metadata.drop_all(bind=engine)
+        Base.metadata.drop_all(bind=write_engine)
         logger.info("✅ Database tables dropped successfully")
     except Exception as e:
         logger.error(f"❌ Database drop failed: {str(e)}")
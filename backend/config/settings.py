@@ -23,6 +23,18 @@ class DatabaseConfig(BaseSettings):
     password: str = os.getenv("DB_PASSWORD", "secure_password")
     database: str = os.getenv("DB_NAME", "astrology_synthesis")
     
+    # Connection pool (PostgreSQL; SQLite uses sqlite_read_pool_size + one writer)
+    pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    
+    # SQLite tuning
+    sqlite_wal: bool = os.getenv("SQLITE_WAL", "true").lower() == "true"
+    sqlite_read_pool_size: int = int(os.getenv("SQLITE_READ_POOL_SIZE", "5"))
+    sqlite_busy_timeout: int = int(os.getenv("SQLITE_BUSY_TIMEOUT", "15"))
+    
     @property
     def url(self) -> str:
         """Return database connection string (SQLite or PostgreSQL)."""
@@ -68,6 +80,13 @@ class SecurityConfig(BaseSettings):
     # API Keys
     enable_api_key_auth: bool = os.getenv("ENABLE_API_KEY_AUTH", "true").lower() == "true"
     
+    # Auth fast path (see backend/services/auth_cache.py)
+    principal_cache_ttl_seconds: float = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "30"))  # 0 = disabled
+    principal_cache_max_entries: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+    api_key_refresh_seconds: float = float(os.getenv("AUTH_API_KEY_REFRESH_SECONDS", "30"))  # capped at the principal TTL
+    api_key_touch_seconds: float = float(os.getenv("AUTH_API_KEY_TOUCH_SECONDS", "60"))  # last_used_at write interval
+    bcrypt_max_concurrency: int = int(os.getenv("AUTH_BCRYPT_MAX_CONCURRENCY", "0"))  # 0 = CPU count
+    
     # CORS - using str and splitting manually to avoid Pydantic parsing issues
     _cors_origins_str: str = os.getenv("CORS_ORIGINS", "*")
     cors_credentials: bool = os.getenv("CORS_CREDENTIALS", "true").lower() == "true"
@@ -97,11 +116,38 @@ class APIConfig(BaseSettings):
     rate_limit_enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
     rate_limit_requests: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
     rate_limit_period_seconds: int = int(os.getenv("RATE_LIMIT_PERIOD_SECONDS", "60"))
+    rate_limit_burst: int = int(os.getenv("RATE_LIMIT_BURST", "0"))  # 0 = rate_limit_requests
+    rate_limit_redis_enabled: bool = os.getenv("RATE_LIMIT_REDIS_ENABLED", "false").lower() == "true"
+    rate_limit_heavy_concurrency: int = int(os.getenv("RATE_LIMIT_HEAVY_CONCURRENCY", "0"))  # 0 = CPU count
+    rate_limit_heavy_queue_seconds: float = float(os.getenv("RATE_LIMIT_HEAVY_QUEUE_SECONDS", "2"))
     
     # Caching
     cache_enabled: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
     cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", "3600"))
     
+    # Birth chart cache (see backend/services/chart_cache.py)
+    chart_cache_enabled: bool = os.getenv("CHART_CACHE_ENABLED", "true").lower() == "true"
+    chart_cache_max_entries: int = int(os.getenv("CHART_CACHE_MAX_ENTRIES", "2048"))
+    chart_cache_redis_enabled: bool = os.getenv("CHART_CACHE_REDIS_ENABLED", "false").lower() == "true"
+    chart_cache_ttl_seconds: int = int(os.getenv("CHART_CACHE_TTL_SECONDS", "2592000"))
+    
+    # Calculation executor (see backend/services/calculation_executor.py)
+    calc_executor_mode: str = os.getenv("CALC_EXECUTOR_MODE", "process")  # process, thread, inline
+    calc_executor_workers: int = int(os.getenv("CALC_EXECUTOR_WORKERS", "0"))  # 0 = CPU count
+    calc_executor_max_pending: int = int(os.getenv("CALC_EXECUTOR_MAX_PENDING", "0"))  # 0 = 4 x workers
+    calc_executor_start_method: str = os.getenv("CALC_EXECUTOR_START_METHOD", "spawn")
+    
+    # Persistent result store (see backend/services/result_store.py)
+    result_store_enabled: bool = os.getenv("RESULT_STORE_ENABLED", "false").lower() == "true"
+    result_store_batch_size: int = int(os.getenv("RESULT_STORE_BATCH_SIZE", "500"))
+    result_store_ephemeris_ttl_seconds: int = int(os.getenv("RESULT_STORE_EPHEMERIS_TTL_SECONDS", "7776000"))  # 0 = never
+    result_store_sweep_interval_seconds: int = int(os.getenv("RESULT_STORE_SWEEP_INTERVAL_SECONDS", "3600"))
+    
+    # Bulk chart imports (see backend/services/chart_batch.py)
+    chart_batch_task_size: int = int(os.getenv("CHART_BATCH_TASK_SIZE", "50"))  # rows per worker task
+    chart_batch_insert_size: int = int(os.getenv("CHART_BATCH_INSERT_SIZE", "1000"))  # rows per transaction
+    chart_batch_max_bytes: int = int(os.getenv("CHART_BATCH_MAX_BYTES", "268435456"))  # upload limit, 0 = none
+    
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
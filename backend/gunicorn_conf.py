@@ -0,0 +1,72 @@
+"""
+Gunicorn configuration for the multi-worker production runtime.
+
+    gunicorn -c backend/gunicorn_conf.py backend.main:app
+
+(backend/start.sh does this when SERVER_MODE=production.) The master
+imports the app, preloads shared state (see
+backend/services/worker_runtime.py) before binding, then forks
+UvicornWorker processes that share it copy-on-write. Workers are
+recycled gracefully after GUNICORN_MAX_REQUESTS requests (with jitter so
+they do not all restart at once), and on SIGHUP.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "0")) or multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "500"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Split the cores between the workers' calculation pools and heavy-route
+# admission caps instead of giving each worker a share as large as the
+# machine (settings read these at import; 0 means "CPU count" there)
+_cores_per_worker = str(max(1, multiprocessing.cpu_count() // workers))
+for _name in ("CALC_EXECUTOR_WORKERS", "RATE_LIMIT_HEAVY_CONCURRENCY"):
+    if int(os.getenv(_name, "0")) <= 0:
+        os.environ[_name] = _cores_per_worker
+
+# Worker readiness files for this master, and the pool size /health/workers
+# compares against (see WorkerRegistry and pool_status)
+os.environ.setdefault("RUNTIME_STATE_DIR", os.path.join(tempfile.gettempdir(), f"astrology-synthesis-{os.getpid()}"))
+os.environ["RUNTIME_EXPECTED_WORKERS"] = str(workers)
+
+
+def on_starting(server):
+    from backend.config.settings import settings
+    from backend.services.worker_runtime import preload_shared_state
+
+    if settings.api.rate_limit_enabled and not settings.api.rate_limit_redis_enabled and workers > 1:
+        server.log.warning(
+            "Rate limit buckets are per worker (RATE_LIMIT_REDIS_ENABLED=false): "
+            "a client can get up to %d x RATE_LIMIT_REQUESTS; enable Redis buckets "
+            "to enforce the limit across workers", workers
+        )
+    preload_shared_state(knowledge_base=os.getenv("PRELOAD_KNOWLEDGE_BASE", "false").lower() == "true")
+
+
+def post_fork(server, worker):
+    from backend.services.worker_runtime import reset_after_fork
+
+    reset_after_fork()
+
+
+def child_exit(server, worker):
+    from backend.services.worker_runtime import get_worker_registry
+
+    registry = get_worker_registry()
+    if registry is not None:
+        registry.unregister(worker.pid)
+
+
+def on_exit(server):
+    shutil.rmtree(os.environ["RUNTIME_STATE_DIR"], ignore_errors=True)
@@ -18,8 +18,13 @@ import logging
 from datetime import datetime
 
 from backend.config.settings import settings
-from backend.config.database import init_db
+from backend.config.database import init_db, dispose_async_engine
+from backend.services.calculation_executor import shutdown_calculation_executor
+from backend.services.result_store import get_result_store
+from backend.services.worker_runtime import mark_ready, mark_stopping
+from backend.middleware.rate_limit import RateLimitMiddleware, create_bucket_store
 from backend.api.v1 import routes
+from backend.api.v1.perplexity_endpoints import shutdown_services as shutdown_perplexity_services
 
 # Configure logging
 logging.basicConfig(
@@ -41,10 +46,22 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Database initialization failed: {str(e)}")
         raise
     
+    result_store = get_result_store()
+    if result_store is not None:
+        result_store.start_sweeper(settings.api.result_store_sweep_interval_seconds)
+    
+    mark_ready()
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down Astrology-Synthesis API...")
+    mark_stopping()
+    shutdown_calculation_executor()
+    if result_store is not None:
+        result_store.stop_sweeper()
+    await shutdown_perplexity_services()
+    await dispose_async_engine()
 
 
 # Create FastAPI app
@@ -59,6 +76,18 @@ app = FastAPI(
 # Middleware Setup
 # ============================================================================
 
+# Rate limiting and admission control (added before CORS so rejections still get CORS headers)
+if settings.api.rate_limit_enabled:
+    app.add_middleware(
+        RateLimitMiddleware,
+        requests=settings.api.rate_limit_requests,
+        period_seconds=settings.api.rate_limit_period_seconds,
+        burst=settings.api.rate_limit_burst or None,
+        store=create_bucket_store(settings.api.rate_limit_redis_enabled, settings.redis.url),
+        heavy_concurrency=settings.api.rate_limit_heavy_concurrency,
+        heavy_queue_seconds=settings.api.rate_limit_heavy_queue_seconds,
+    )
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,385 @@
+"""
+Rate Limiting and Admission Control Middleware
+Enforces APIConfig.rate_limit_* before a request reaches its route
+
+- Token bucket per client: a known X-API-Key (one already in the in-memory
+  API key map), else the user_id of a valid Bearer token, else the client
+  address; unknown keys are charged to the address. Buckets hold
+  rate_limit_requests tokens and refill over rate_limit_period_seconds.
+- Each route costs a number of tokens (see DEFAULT_ROUTE_COSTS), so one
+  prediction or synastry analysis uses up more of the budget than a lookup
+- Buckets live in process memory, or in Redis (one atomic Lua refill-and-take
+  per request) so that all workers share them; if Redis errors, the memory
+  buckets are used until it recovers
+- CPU-heavy routes additionally share a global concurrency cap: requests
+  wait up to heavy_queue_seconds for a slot and are refused with 503
+  afterwards, so queued work cannot grow without bound under overload
+
+Rejections carry a Retry-After header. Implemented as plain ASGI rather than
+BaseHTTPMiddleware so a heavy slot is held until a streamed body finishes.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+
+class RouteCost(NamedTuple):
+    """Token cost of requests whose path starts with prefix."""
+
+    method: str
+    prefix: str
+    cost: int
+    heavy: bool = False
+
+
+# First match wins, so longer prefixes come before the ones they extend
+DEFAULT_ROUTE_COSTS: Tuple[RouteCost, ...] = (
+    RouteCost("POST", "/api/v1/chart/batch", 20, heavy=True),
+    RouteCost("POST", "/api/v1/chart", 2),
+    RouteCost("POST", "/api/v1/predict", 5, heavy=True),
+    RouteCost("POST", "/api/v1/synastry/analyze", 5, heavy=True),
+    RouteCost("POST", "/api/v1/synastry/matches", 5, heavy=True),
+    RouteCost("POST", "/api/v1/synastry/agent", 5),
+    RouteCost("POST", "/api/v1/personal-development/team/analyze", 3, heavy=True),
+    RouteCost("POST", "/api/v1/interpretations/llm", 3),
+    RouteCost("POST", "/api/v1/interpretations/hybrid", 3),
+)
+
+EXEMPT_PREFIXES = ("/api/v1/health", "/docs", "/redoc", "/openapi.json")
+
+# KEYS[1] = bucket; ARGV = capacity, refill rate (tokens/s), cost.
+# Redis time keeps buckets consistent across hosts with skewed clocks.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens), tostring(retry)}
+"""
+
+
+class BucketDecision(NamedTuple):
+    allowed: bool
+    remaining: float
+    retry_after: float
+
+
+class MemoryBucketStore:
+    """
+    Token buckets in process memory.
+
+    take() never awaits, so it is atomic within one event loop. The least
+    recently used buckets are dropped past max_keys; a dropped bucket would
+    have refilled anyway unless it was used within the last period.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, cost: float, capacity: float, rate: float) -> BucketDecision:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+
+        if tokens >= cost:
+            tokens -= cost
+            decision = BucketDecision(True, tokens, 0.0)
+        else:
+            decision = BucketDecision(False, tokens, (cost - tokens) / rate)
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return decision
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class RedisBucketStore:
+    """
+    Token buckets shared through Redis, updated by one Lua script call.
+
+    Falls back to a MemoryBucketStore while Redis is failing and retries
+    Redis after retry_interval seconds.
+    """
+
+    KEY_PREFIX = "ratelimit:"
+
+    def __init__(self, redis_client: Any, retry_interval: float = 30.0):
+        """
+        Initialize the store.
+
+        Args:
+            redis_client: redis.asyncio client (or compatible)
+            retry_interval: Seconds to stay on the memory buckets after an error
+        """
+        self.redis_client = redis_client
+        self.retry_interval = retry_interval
+        self.fallback = MemoryBucketStore()
+        self.errors = 0
+        self._script = redis_client.register_script(TOKEN_BUCKET_LUA)
+        self._down_until = 0.0
+
+    async def take(self, key: str, cost: float, capacity: float, rate: float) -> BucketDecision:
+        if time.monotonic() < self._down_until:
+            return await self.fallback.take(key, cost, capacity, rate)
+        try:
+            allowed, tokens, retry = await self._script(
+                keys=[self.KEY_PREFIX + key], args=[capacity, rate, cost]
+            )
+        except Exception as e:
+            self.errors += 1
+            self._down_until = time.monotonic() + self.retry_interval
+            logger.warning(f"Rate limit Redis store unavailable, using memory buckets: {str(e)}")
+            return await self.fallback.take(key, cost, capacity, rate)
+        return BucketDecision(bool(int(allowed)), float(tokens), float(retry))
+
+
+def create_bucket_store(redis_enabled: bool, redis_url: Optional[str] = None) -> Any:
+    """Redis-backed store when enabled, else memory (Redis errors fall back per request)."""
+    if redis_enabled and redis_url:
+        try:
+            import redis.asyncio as redis_asyncio
+
+            store = RedisBucketStore(redis_asyncio.from_url(redis_url))
+            logger.info("Rate limit buckets stored in Redis")
+            return store
+        except Exception as e:
+            logger.warning(f"Rate limit Redis store unavailable, using memory buckets: {str(e)}")
+    return MemoryBucketStore()
+
+
+def _error_response(status_code: int, error_code: str, message: str, retry_after: float) -> Tuple[dict, bytes]:
+    body = json.dumps({
+        "error_code": error_code,
+        "error_message": message,
+        "retry_after_seconds": retry_after,
+        "timestamp": datetime.utcnow().isoformat(),
+    }).encode()
+    start = {
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ],
+    }
+    return start, body
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying per-client token buckets and a heavy-route concurrency cap."""
+
+    def __init__(
+        self,
+        app: Any,
+        requests: int = 100,
+        period_seconds: float = 60.0,
+        burst: Optional[int] = None,
+        route_costs: Sequence[RouteCost] = DEFAULT_ROUTE_COSTS,
+        default_cost: int = 1,
+        store: Any = None,
+        heavy_concurrency: int = 0,
+        heavy_queue_seconds: float = 2.0,
+        exempt_prefixes: Sequence[str] = EXEMPT_PREFIXES,
+        api_key_lookup: Optional[Callable[[str], Any]] = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI app
+            requests: Tokens refilled per period (requests of cost 1)
+            period_seconds: Refill period
+            burst: Bucket capacity (None = requests)
+            route_costs: Ordered RouteCost rules
+            default_cost: Cost of routes without a rule
+            store: MemoryBucketStore / RedisBucketStore (None = memory)
+            heavy_concurrency: Heavy requests processed at once (0 = CPU count)
+            heavy_queue_seconds: Longest wait for a heavy slot before a 503
+            exempt_prefixes: Paths never limited (health checks, docs)
+            api_key_lookup: SHA-256 key hash -> entry or None, without I/O
+                (default: APIKeyMap.peek of the process-wide map)
+        """
+        self.app = app
+        self.capacity = float(burst or requests)
+        self.rate = requests / period_seconds
+        self.route_costs = tuple(route_costs)
+        self.default_cost = default_cost
+        self.store = store if store is not None else MemoryBucketStore()
+        self.heavy_concurrency = heavy_concurrency or os.cpu_count() or 1
+        self.heavy_queue_seconds = heavy_queue_seconds
+        self.exempt_prefixes = tuple(exempt_prefixes)
+        if api_key_lookup is None:
+            from backend.services.auth_cache import get_api_key_map
+
+            api_key_lookup = get_api_key_map().peek
+        self.api_key_lookup = api_key_lookup
+
+        self._heavy = asyncio.Semaphore(self.heavy_concurrency)
+        self.heavy_in_flight = 0
+        self.heavy_waiting = 0
+        self.reset_stats()
+
+    # ==================== CLASSIFICATION ====================
+
+    def route_cost(self, method: str, path: str) -> Tuple[int, bool]:
+        """(token cost, heavy) of a request."""
+        for rule in self.route_costs:
+            if method == rule.method and (path == rule.prefix or path.startswith(rule.prefix + "/")):
+                return rule.cost, rule.heavy
+        return self.default_cost, False
+
+    def client_key(self, scope: dict) -> str:
+        """
+        Bucket key: known API key, then verified JWT user, then client address.
+
+        Only keys found in the API key map get their own bucket; anything
+        else falls through, so rotating made-up keys cannot mint new buckets.
+        """
+        headers = Headers(scope=scope)
+        api_key = headers.get("x-api-key")
+        if api_key:
+            key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+            if self.api_key_lookup(key_hash) is not None:
+                return "key:" + key_hash[:32]
+
+        authorization = headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            from backend.services.auth_service import AuthenticationService
+
+            payload = AuthenticationService.verify_token(authorization[7:].strip())
+            if payload and payload.get("user_id"):
+                return f"user:{payload['user_id']}"
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    # ==================== ASGI ====================
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or path.startswith(self.exempt_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        cost, heavy = self.route_cost(scope["method"], path)
+        decision = await self.store.take(
+            self.client_key(scope), min(cost, self.capacity), self.capacity, self.rate
+        )
+        if not decision.allowed:
+            self.rate_limited += 1
+            retry_after = max(1, math.ceil(decision.retry_after))
+            await self._reject(send, 429, "RATE_LIMIT_EXCEEDED", "Too many requests", retry_after)
+            return
+        self.allowed += 1
+
+        headers = [
+            (b"x-ratelimit-limit", str(int(self.capacity)).encode()),
+            (b"x-ratelimit-remaining", str(int(decision.remaining)).encode()),
+            (b"x-ratelimit-cost", str(cost).encode()),
+        ]
+
+        async def send_with_headers(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).raw.extend(headers)
+            await send(message)
+
+        if not heavy:
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        if not await self._acquire_heavy():
+            self.overloaded += 1
+            retry_after = max(1, math.ceil(self.heavy_queue_seconds))
+            await self._reject(send, 503, "SERVER_OVERLOADED", "Server is at capacity, retry shortly", retry_after)
+            return
+        self.heavy_in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            self.heavy_in_flight -= 1
+            self._heavy.release()
+
+    async def _acquire_heavy(self) -> bool:
+        """Wait up to heavy_queue_seconds for a heavy slot."""
+        if not self._heavy.locked():
+            await self._heavy.acquire()
+            return True
+        if self.heavy_queue_seconds <= 0:
+            return False
+        self.heavy_waiting += 1
+        try:
+            await asyncio.wait_for(self._heavy.acquire(), timeout=self.heavy_queue_seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.heavy_waiting -= 1
+
+    @staticmethod
+    async def _reject(send: Any, status_code: int, error_code: str, message: str, retry_after: int) -> None:
+        start, body = _error_response(status_code, error_code, message, retry_after)
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    # ==================== METRICS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get admission statistics.
+
+        Returns:
+            Dict with allowed / rejected counters and heavy-slot usage
+        """
+        return {
+            "allowed": self.allowed,
+            "rate_limited": self.rate_limited,
+            "overloaded": self.overloaded,
+            "heavy_in_flight": self.heavy_in_flight,
+            "heavy_waiting": self.heavy_waiting,
+            "heavy_concurrency": self.heavy_concurrency,
+            "bucket_capacity": self.capacity,
+            "refill_per_second": self.rate,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters."""
+        self.allowed = 0
+        self.rate_limited = 0
+        self.overloaded = 0
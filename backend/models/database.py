@@ -98,6 +98,49 @@ class BirthChart(Base):
     # Relationships
     user = relationship("User", back_populates="birth_charts")
     predictions = relationship("Prediction", back_populates="birth_chart")
+    planet_positions = relationship("ChartPlanetPosition", passive_deletes=True)
+    house_cusps = relationship("ChartHouseCusp", passive_deletes=True)
+
+
+class ChartPlanetPosition(Base):
+    """Chart planet positions - columnar copy of chart_data planets and angles."""
+    __tablename__ = "chart_planet_positions"
+
+    chart_id = Column(String(36), ForeignKey("birth_charts.chart_id", ondelete="CASCADE"), primary_key=True)
+    planet = Column(String(20), primary_key=True)  # planet name, "Ascendant" or "Midheaven"
+    position = Column(Integer, nullable=False)     # order within chart_data
+    longitude = Column(Float, nullable=False)
+    zodiac_sign = Column(String(20), nullable=False)
+    degree = Column(Integer)
+    minutes = Column(Integer)
+    seconds = Column(Float)
+    house = Column(Integer)
+    retrograde = Column(Boolean, default=False)
+    nakshatra = Column(String(30))
+    pada = Column(Integer)
+
+    __table_args__ = (
+        Index("idx_chart_planet_nakshatra", "planet", "nakshatra"),
+        Index("idx_chart_planet_sign", "planet", "zodiac_sign"),
+        Index("idx_chart_planet_house", "planet", "house"),
+    )
+
+
+class ChartHouseCusp(Base):
+    """Chart house cusps - columnar copy of chart_data house cusps."""
+    __tablename__ = "chart_house_cusps"
+
+    chart_id = Column(String(36), ForeignKey("birth_charts.chart_id", ondelete="CASCADE"), primary_key=True)
+    house = Column(Integer, primary_key=True)
+    longitude = Column(Float, nullable=False)
+    zodiac_sign = Column(String(20), nullable=False)
+    degree = Column(Integer)
+    minutes = Column(Integer)
+    seconds = Column(Float)
+
+    __table_args__ = (
+        Index("idx_chart_cusp_sign", "house", "zodiac_sign"),
+    )
 
 
 class Prediction(Base):
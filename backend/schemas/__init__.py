@@ -228,6 +228,26 @@ class BirthChartResponse(BaseModel):
     created_at: datetime
 
 
+class BirthChartProjection(BaseModel):
+    """Birth chart with only the fields requested via ?fields=."""
+
+    chart_id: UUID
+    birth_date: Optional[str] = None
+    birth_time: Optional[str] = None
+    birth_latitude: Optional[float] = None
+    birth_longitude: Optional[float] = None
+    timezone: Optional[str] = None
+    birth_location: Optional[str] = None
+    ayanamsa: Optional[float] = None
+    house_system: Optional[str] = None
+    created_at: Optional[datetime] = None
+    planet_positions: Optional[List[PlanetPosition]] = None
+    house_cusps: Optional[List[HouseCusp]] = None
+    ascendant: Optional[Dict[str, Any]] = None
+    midheaven: Optional[Dict[str, Any]] = None
+    aspects: Optional[List[Dict[str, Any]]] = None
+
+
 # ============================================================================
 # Prediction Schemas
 # ============================================================================
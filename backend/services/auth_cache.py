@@ -0,0 +1,273 @@
+"""
+Authentication Caches
+Keeps the per-request auth path off the database
+
+- PrincipalCache: user_id -> detached User snapshot for a short TTL, so a
+  valid JWT resolves to its user without a query. Entries are dropped when
+  the user is deactivated or changes password; the TTL bounds how long
+  another worker can keep serving a changed user.
+- APIKeyMap: SHA-256 key hash -> (key_id, user_id) of every active key,
+  loaded with one query and reloaded every refresh_seconds. Key creation
+  and revocation update it in place; keys created by another worker are
+  found by a single-key query until the next reload. last_used_at is
+  written at most once per touch_seconds per key.
+
+Security bound: both caches are per process. A key revoked, a user
+deactivated or a password changed through one worker takes effect there
+immediately, and in every other worker within principal_cache_ttl_seconds:
+the process-wide map never reloads less often than the principal TTL.
+Setting the TTL to 0 disables both caches (every request queries the
+database).
+
+Snapshots are transient User instances without password_hash or
+verification_code; they are not attached to any session.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.config.settings import settings
+from backend.models.database import APIKey, User
+
+logger = logging.getLogger(__name__)
+
+# Never copied into cached principals
+PRIVATE_USER_COLUMNS = ("password_hash", "verification_code")
+
+
+def snapshot_user(user: User) -> User:
+    """Detached copy of a user's public columns."""
+    values = {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in PRIVATE_USER_COLUMNS
+    }
+    return User(**values)
+
+
+class PrincipalCache:
+    """Short-TTL LRU of authenticated user snapshots (thread-safe)."""
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a snapshot is served before the user is re-read (0 = disabled)
+            max_entries: Maximum users held
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def get(self, user_id: str) -> Optional[User]:
+        """Cached snapshot of an active user, or None."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user: User) -> User:
+        """Cache a snapshot of an active user and return it."""
+        snapshot = snapshot_user(user)
+        if self.ttl <= 0:
+            return snapshot
+        with self._lock:
+            self._entries[str(user.user_id)] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(str(user.user_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user (deactivation, password change)."""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate_percentage": (self.hits / total * 100) if total else 0,
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl,
+            }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+
+class APIKeyEntry(NamedTuple):
+    key_id: str
+    user_id: str
+
+
+class APIKeyMap:
+    """In-memory map of active API key hashes (thread-safe)."""
+
+    def __init__(self, refresh_seconds: float = 60.0, touch_seconds: float = 60.0):
+        """
+        Initialize the map.
+
+        Args:
+            refresh_seconds: Full reload interval (picks up changes made by other
+                workers); 0 = no caching, every lookup queries the key
+            touch_seconds: Minimum interval between last_used_at writes per key
+        """
+        self.refresh_seconds = refresh_seconds
+        self.touch_seconds = touch_seconds
+        self._keys: Dict[str, APIKeyEntry] = {}
+        self._touched: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.fallback_queries = 0
+
+    def _active_keys(self, db: Session, key_hash: Optional[str] = None) -> Dict[str, APIKeyEntry]:
+        query = db.query(APIKey.api_key_hash, APIKey.key_id, APIKey.user_id).join(
+            User, User.user_id == APIKey.user_id
+        ).filter(APIKey.is_active == True, User.is_active == True)
+        if key_hash is not None:
+            query = query.filter(APIKey.api_key_hash == key_hash)
+        return {row[0]: APIKeyEntry(str(row[1]), str(row[2])) for row in query.all()}
+
+    def load(self, db: Session) -> int:
+        """Reload every active key; returns the number of keys."""
+        keys = self._active_keys(db)
+        with self._lock:
+            self._keys = keys
+            self._loaded_at = time.monotonic()
+            self.loads += 1
+        logger.debug(f"API key map loaded ({len(keys)} keys)")
+        return len(keys)
+
+    def lookup(self, db: Session, key_hash: str) -> Optional[APIKeyEntry]:
+        """Entry of an active key, or None."""
+        if self.refresh_seconds <= 0:
+            entry = self._active_keys(db, key_hash).get(key_hash)
+            # Kept only so peek() (rate limit buckets) recognises the key
+            if entry is not None:
+                self.add(key_hash, entry.key_id, entry.user_id)
+            return entry
+
+        with self._lock:
+            loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.refresh_seconds:
+            self.load(db)
+            with self._lock:
+                return self._keys.get(key_hash)
+
+        with self._lock:
+            entry = self._keys.get(key_hash)
+        if entry is not None:
+            return entry
+
+        # Possibly created by another worker since the last load
+        self.fallback_queries += 1
+        entry = self._active_keys(db, key_hash).get(key_hash)
+        if entry is not None:
+            self.add(key_hash, entry.key_id, entry.user_id)
+        return entry
+
+    def peek(self, key_hash: str) -> Optional[APIKeyEntry]:
+        """Entry of a key already in the map, without touching the database."""
+        with self._lock:
+            return self._keys.get(key_hash)
+
+    def add(self, key_hash: str, key_id: str, user_id: str) -> None:
+        with self._lock:
+            self._keys[key_hash] = APIKeyEntry(str(key_id), str(user_id))
+
+    def remove_key(self, key_id: str) -> None:
+        with self._lock:
+            self._keys = {h: e for h, e in self._keys.items() if e.key_id != str(key_id)}
+            self._touched.pop(str(key_id), None)
+
+    def remove_user(self, user_id: str) -> None:
+        with self._lock:
+            self._keys = {h: e for h, e in self._keys.items() if e.user_id != str(user_id)}
+
+    def should_touch(self, key_id: str) -> bool:
+        """True if last_used_at is due to be written for this key (and claims it)."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._touched.get(key_id)
+            if last is not None and now - last < self.touch_seconds:
+                return False
+            self._touched[key_id] = now
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = {}
+            self._touched = {}
+            self._loaded_at = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "keys": len(self._keys),
+                "loads": self.loads,
+                "fallback_queries": self.fallback_queries,
+                "refresh_seconds": self.refresh_seconds,
+            }
+
+
+_principal_cache: Optional[PrincipalCache] = None
+_api_key_map: Optional[APIKeyMap] = None
+_default_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Process-wide principal cache configured from settings."""
+    global _principal_cache
+    with _default_lock:
+        if _principal_cache is None:
+            _principal_cache = PrincipalCache(
+                ttl=settings.security.principal_cache_ttl_seconds,
+                max_entries=settings.security.principal_cache_max_entries,
+            )
+        return _principal_cache
+
+
+def get_api_key_map() -> APIKeyMap:
+    """
+    Process-wide API key map configured from settings.
+
+    The reload interval is capped at the principal cache TTL, which bounds
+    how long other workers keep accepting a revoked key.
+    """
+    global _api_key_map
+    with _default_lock:
+        if _api_key_map is None:
+            _api_key_map = APIKeyMap(
+                refresh_seconds=min(
+                    settings.security.api_key_refresh_seconds,
+                    settings.security.principal_cache_ttl_seconds,
+                ),
+                touch_seconds=settings.security.api_key_touch_seconds,
+            )
+        return _api_key_map
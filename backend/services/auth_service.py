@@ -4,6 +4,10 @@ Handles user registration, login, JWT token generation, API key management, and
 Production-ready with bcrypt hashing, JWT tokens, and security best practices.
 """
 
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from uuid import UUID, uuid4
@@ -15,6 +19,7 @@ from sqlalchemy.orm import Session
 from backend.models.database import User, APIKey
 from backend.schemas import RegisterRequest, LoginRequest
 from backend.config.settings import settings
+from backend.services.auth_cache import get_api_key_map, get_principal_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,21 @@ pwd_context = CryptContext(
     bcrypt__rounds=12  # Computational cost for bcrypt iterations
 )
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event
+# loop; its size bounds how many hashes run at once during a login storm
+_bcrypt_executor: Optional[ThreadPoolExecutor] = None
+_bcrypt_executor_lock = threading.Lock()
+
+
+def get_bcrypt_executor() -> ThreadPoolExecutor:
+    """Process-wide thread pool for password hashing."""
+    global _bcrypt_executor
+    with _bcrypt_executor_lock:
+        if _bcrypt_executor is None:
+            workers = settings.security.bcrypt_max_concurrency or os.cpu_count() or 1
+            _bcrypt_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        return _bcrypt_executor
+
 
 class AuthenticationService:
     """Authentication service for user management and JWT tokens."""
@@ -40,6 +60,20 @@ class AuthenticationService:
         """Verify a password against its hash."""
         return pwd_context.verify(plain_password, hashed_password)
     
+    @staticmethod
+    async def ahash_password(password: str) -> str:
+        """Hash a password in the bcrypt thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_bcrypt_executor(), AuthenticationService.hash_password, password)
+    
+    @staticmethod
+    async def averify_password(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the bcrypt thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_bcrypt_executor(), AuthenticationService.verify_password, plain_password, hashed_password
+        )
+    
     @staticmethod
     def generate_tokens(user_id: UUID) -> Tuple[str, str]:
         """
@@ -119,13 +153,18 @@ class AuthenticationService:
         return raw_key, hashed_key
     
     @staticmethod
-    def register_user(db: Session, register_data: RegisterRequest) -> Tuple[User, str]:
+    def register_user(
+        db: Session,
+        register_data: RegisterRequest,
+        password_hash: Optional[str] = None,
+    ) -> Tuple[User, str]:
         """
         Register a new user with password hashing and initial API key.
         
         Args:
             db: Database session
             register_data: Registration request data
+            password_hash: Precomputed hash (see ahash_password); hashed inline if None
             
         Returns:
             Tuple of (User object, raw_api_key)
@@ -139,7 +178,8 @@ class AuthenticationService:
             raise ValueError(f"User with email {register_data.email} already exists")
         
         # Hash password
-        password_hash = AuthenticationService.hash_password(register_data.password)
+        if password_hash is None:
+            password_hash = AuthenticationService.hash_password(register_data.password)
         
         # Create user with UUID as string
         user = User(
@@ -158,8 +198,9 @@ class AuthenticationService:
         
         # Create initial API key
         raw_key, hashed_key = AuthenticationService.generate_api_key()
+        key_id = str(uuid4())
         api_key = APIKey(
-            key_id=str(uuid4()),
+            key_id=key_id,
             user_id=user.user_id,
             key_name="default",
             api_key_hash=hashed_key,
@@ -169,9 +210,12 @@ class AuthenticationService:
         db.add(api_key)
         db.commit()
         db.refresh(user)
+        get_api_key_map().add(hashed_key, key_id, user.user_id)
         
         logger.info(f"✅ User registered: {user.email}")
         return user, raw_key
+    
+    @staticmethod
     def login_user(db: Session, login_data: LoginRequest) -> Optional[User]:
         """
         Authenticate a user.
@@ -183,6 +227,24 @@ class AuthenticationService:
         Returns:
             User object if credentials valid, None otherwise
         """
+        user = AuthenticationService._login_candidate(db, login_data)
+        if not user:
+            return None
+        valid = AuthenticationService.verify_password(login_data.password, user.password_hash)
+        return AuthenticationService._record_login(db, user, login_data, valid)
+    
+    @staticmethod
+    async def alogin_user(db: Session, login_data: LoginRequest) -> Optional[User]:
+        """Authenticate a user, verifying the password in the bcrypt thread pool."""
+        user = AuthenticationService._login_candidate(db, login_data)
+        if not user:
+            return None
+        valid = await AuthenticationService.averify_password(login_data.password, user.password_hash)
+        return AuthenticationService._record_login(db, user, login_data, valid)
+    
+    @staticmethod
+    def _login_candidate(db: Session, login_data: LoginRequest) -> Optional[User]:
+        """Active user with the login email, or None."""
         user = db.query(User).filter(User.email == login_data.email).first()
         
         if not user:
@@ -193,7 +255,12 @@ class AuthenticationService:
             logger.warning(f"Login attempt for inactive user: {login_data.email}")
             return None
         
-        if not AuthenticationService.verify_password(login_data.password, user.password_hash):
+        return user
+    
+    @staticmethod
+    def _record_login(db: Session, user: User, login_data: LoginRequest, valid: bool) -> Optional[User]:
+        """Update login counters / lockout after a password check."""
+        if not valid:
             user.failed_login_attempts += 1
             if user.failed_login_attempts >= 5:
                 user.locked_until = datetime.utcnow() + timedelta(minutes=15)
@@ -218,35 +285,104 @@ class AuthenticationService:
         return db.query(User).filter(User.user_id == user_id).first()
     
     @staticmethod
-    def verify_api_key(db: Session, api_key: str) -> Optional[User]:
+    def get_principal(db: Session, user_id: str) -> Optional[User]:
+        """
+        Active user for an authenticated request, served from the principal cache.
+        
+        Args:
+            db: Database session (only queried on a cache miss)
+            user_id: User ID from a verified token or API key
+            
+        Returns:
+            Detached User snapshot if the user exists and is active, None otherwise
+        """
+        cache = get_principal_cache()
+        user = cache.get(user_id)
+        if user is not None:
+            return user
+        
+        user = AuthenticationService.get_user_by_id(db, user_id)
+        if not user or not user.is_active:
+            return None
+        return cache.put(user)
+    
+    @staticmethod
+    async def change_password(db: Session, user_id: str, new_password: str) -> bool:
+        """
+        Set a new password and drop the user's cached principal.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            new_password: New plain-text password
+            
+        Returns:
+            True if the user exists, False otherwise
+        """
+        user = AuthenticationService.get_user_by_id(db, user_id)
+        if not user:
+            return False
+        
+        user.password_hash = await AuthenticationService.ahash_password(new_password)
+        user.failed_login_attempts = 0
+        user.locked_until = None
+        db.commit()
+        get_principal_cache().invalidate(user_id)
+        logger.info(f"✅ Password changed for user {user_id}")
+        return True
+    
+    @staticmethod
+    def deactivate_user(db: Session, user_id: str) -> bool:
+        """
+        Deactivate a user; their tokens and API keys stop working immediately in this worker.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            True if the user exists, False otherwise
+        """
+        user = AuthenticationService.get_user_by_id(db, user_id)
+        if not user:
+            return False
+        
+        user.is_active = False
+        db.commit()
+        get_principal_cache().invalidate(user_id)
+        get_api_key_map().remove_user(user_id)
+        logger.info(f"✅ User deactivated: {user_id}")
+        return True
+    
+    @staticmethod
+    def verify_api_key(db: Session, api_key: str, write_db: Optional[Session] = None) -> Optional[User]:
         """
         Verify an API key and return the associated user.
         
         Args:
             db: Database session
             api_key: Raw API key string
+            write_db: Session for the last_used_at update (default: db)
             
         Returns:
             User object if valid, None otherwise
         """
         hashed_key = hashlib.sha256(api_key.encode()).hexdigest()
-        api_key_record = db.query(APIKey).filter(
-            APIKey.api_key_hash == hashed_key,
-            APIKey.is_active == True
-        ).first()
+        api_keys = get_api_key_map()
+        entry = api_keys.lookup(db, hashed_key)
         
-        if not api_key_record:
+        if not entry:
             return None
         
-        user = db.query(User).filter(
-            User.user_id == api_key_record.user_id,
-            User.is_active == True
-        ).first()
+        user = AuthenticationService.get_principal(db, entry.user_id)
         
-        if user:
-            # Update last used timestamp
-            api_key_record.last_used_at = datetime.utcnow()
-            db.commit()
+        if user and api_keys.should_touch(entry.key_id):
+            # Update last used timestamp (at most once per touch interval)
+            write_db = write_db if write_db is not None else db
+            write_db.query(APIKey).filter(APIKey.key_id == entry.key_id).update(
+                {APIKey.last_used_at: datetime.utcnow()}, synchronize_session=False
+            )
+            write_db.commit()
         
         return user
     
@@ -278,6 +414,7 @@ class AuthenticationService:
         
         db.add(api_key)
         db.commit()
+        get_api_key_map().add(hashed_key, api_key.key_id, user_id)
         
         logger.info(f"✅ API key created for user {user_id}")
         return raw_key, str(api_key.key_id)
@@ -300,6 +437,7 @@ class AuthenticationService:
         
         api_key.is_active = False
         db.commit()
+        get_api_key_map().remove_key(key_id)
         logger.info(f"✅ API key revoked: {key_id}")
         return True
     
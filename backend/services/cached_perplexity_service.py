@@ -4,13 +4,13 @@ Extends PerplexityLLMService with cost-saving cache layer
 """
 
 import os
-import json
-import hashlib
+import asyncio
 import redis
-from typing import Dict, Any, Optional
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Optional, Set
 import logging
 
+from backend.services.interpretation_cache import InterpretationCache
 from backend.services.perplexity_llm_service import PerplexityLLMService
 
 logger = logging.getLogger(__name__)
@@ -20,14 +20,19 @@ class CachedPerplexityService(PerplexityLLMService):
     """
     Perplexity LLM Service with Redis caching
     
-    Caching strategy:
-    - 30-day TTL for interpretations
+    Caching strategy (see InterpretationCache):
+    - Keys from normalized placements (sign, house, nakshatra, pada), so
+      charts that only differ below pada resolution share an entry
+    - Near-duplicate contexts hit through an embedding-similarity tier
+    - 30-day freshness; hot entries are served stale for up to
+      CACHE_STALE_TTL more while one worker refreshes them in the background
     - Target 60-70% cache hit rate
     - Saves API costs on repeated queries
     """
     
     CACHE_TTL = 2592000  # 30 days in seconds
-    CACHE_PREFIX = "interp:"
+    CACHE_STALE_TTL = 604800  # 7 days in seconds
+    CACHE_PREFIX = InterpretationCache.KEY_PREFIX
     
     def __init__(
         self,
@@ -39,6 +44,12 @@ class CachedPerplexityService(PerplexityLLMService):
         max_tokens: int = 1024,
         timeout: int = 30,
         cache_ttl: int = CACHE_TTL,
+        max_connections: int = 20,
+        max_concurrency: int = 8,
+        stale_ttl: int = CACHE_STALE_TTL,
+        similarity_threshold: float = 0.92,
+        embedding_service: Any = None,
+        redis_client: Any = None,
     ):
         """
         Initialize Cached Perplexity Service
@@ -52,6 +63,12 @@ class CachedPerplexityService(PerplexityLLMService):
             max_tokens: Maximum tokens in response
             timeout: Request timeout in seconds
             cache_ttl: Cache TTL in seconds (default 30 days)
+            max_connections: Async client connection pool size
+            max_concurrency: Async requests in flight upstream at once
+            stale_ttl: Seconds hot entries may be served past cache_ttl
+            similarity_threshold: Context similarity needed for a semantic hit
+            embedding_service: EmbeddingService for the semantic tier (None = exact keys only)
+            redis_client: Pre-built Redis client (overrides redis_url)
         """
         super().__init__(
             api_key=api_key,
@@ -60,11 +77,13 @@ class CachedPerplexityService(PerplexityLLMService):
             top_p=top_p,
             max_tokens=max_tokens,
             timeout=timeout,
+            max_connections=max_connections,
+            max_concurrency=max_concurrency,
         )
         
         # Redis setup
         try:
-            self.redis_client = redis.from_url(redis_url)
+            self.redis_client = redis_client or redis.from_url(redis_url)
             self.redis_client.ping()
             self.cache_available = True
             logger.info("Redis cache initialized")
@@ -74,10 +93,18 @@ class CachedPerplexityService(PerplexityLLMService):
             logger.warning(f"Redis cache unavailable: {str(e)}")
         
         self.cache_ttl = cache_ttl
+        self.cache = InterpretationCache(
+            self.redis_client,
+            embedding_service=embedding_service,
+            ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            similarity_threshold=similarity_threshold,
+        )
         
-        # Cache statistics
-        self.cache_hits = 0
-        self.cache_misses = 0
+        # Background refreshes of stale entries
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.refreshes = 0
     
     def generate_interpretation(
         self,
@@ -96,23 +123,19 @@ class CachedPerplexityService(PerplexityLLMService):
             context: Additional context
             max_tokens: Override max tokens
             use_cache: Whether to use cache
-            
+        
         Returns:
             Dict with interpretation and metadata
         """
-        # Check cache if enabled
-        if use_cache and self.cache_available:
-            cache_key = self._generate_cache_key(chart_data, interpretation_type, context)
-            cached_result = self._get_from_cache(cache_key)
-            
-            if cached_result:
-                self.cache_hits += 1
-                cached_result["from_cache"] = True
-                cached_result["cache_hits"] = self.cache_hits
-                logger.info(f"Cache hit for {interpretation_type}")
-                return cached_result
-            
-            self.cache_misses += 1
+        cached_result, state = self._lookup_cache(chart_data, interpretation_type, context, use_cache)
+        if state == "refresh":
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="interp-refresh")
+            self._refresh_executor.submit(
+                self._refresh, chart_data, interpretation_type, context, max_tokens,
+            )
+        if cached_result:
+            return cached_result
         
         # Generate fresh interpretation
         result = super().generate_interpretation(
@@ -121,11 +144,124 @@ class CachedPerplexityService(PerplexityLLMService):
             context,
             max_tokens,
         )
+        return self._finish(result, chart_data, interpretation_type, context, use_cache)
+    
+    async def agenerate_interpretation(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Generate interpretation with caching, without blocking the event loop
+        
+        Same arguments and result as generate_interpretation. Redis and
+        context embedding run in a worker thread.
+        """
+        cached_result, state = await asyncio.to_thread(
+            self._lookup_cache, chart_data, interpretation_type, context, use_cache,
+        )
+        if state == "refresh":
+            task = asyncio.ensure_future(
+                self._arefresh(chart_data, interpretation_type, context, max_tokens)
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        if cached_result:
+            return cached_result
+        
+        result = await super().agenerate_interpretation(
+            chart_data,
+            interpretation_type,
+            context,
+            max_tokens,
+        )
+        return await asyncio.to_thread(
+            self._finish, result, chart_data, interpretation_type, context, use_cache,
+        )
+    
+    def _refresh(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
+        max_tokens: Optional[int],
+    ) -> None:
+        """Regenerate a stale entry (refresh executor thread)"""
+        result = PerplexityLLMService.generate_interpretation(
+            self, chart_data, interpretation_type, context, max_tokens,
+        )
+        self._store_refresh(result, chart_data, interpretation_type, context)
+    
+    async def _arefresh(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
+        max_tokens: Optional[int],
+    ) -> None:
+        """Regenerate a stale entry (background task)"""
+        result = await PerplexityLLMService.agenerate_interpretation(
+            self, chart_data, interpretation_type, context, max_tokens,
+        )
+        await asyncio.to_thread(self._store_refresh, result, chart_data, interpretation_type, context)
+    
+    def _store_refresh(
+        self,
+        result: Dict[str, Any],
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
+    ) -> None:
+        if result.get("error"):
+            logger.warning(f"Cache refresh failed for {interpretation_type}: {result['error']}")
+            return
+        self._set_in_cache(chart_data, interpretation_type, context, result)
+        self.refreshes += 1
+        logger.info(f"Refreshed stale cache entry for {interpretation_type}")
+    
+    def _lookup_cache(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
+        use_cache: bool,
+    ):
+        """
+        Return (cached result marked from_cache or None, lookup state)
+        
+        States are those of InterpretationCache.get; "refresh" asks the
+        caller to regenerate the entry in the background.
+        """
+        if not (use_cache and self.cache_available):
+            return None, "miss"
+        
+        try:
+            cached_result, state = self.cache.get(chart_data, interpretation_type, context)
+        except Exception as e:
+            logger.warning(f"Cache retrieval error: {str(e)}")
+            return None, "miss"
         
-        # Cache the result if successful
+        if cached_result:
+            cached_result["from_cache"] = True
+            cached_result["cache_state"] = state
+            cached_result["cache_hits"] = self.get_cache_stats()["cache_hits"]
+            logger.info(f"Cache {state} hit for {interpretation_type}")
+        return cached_result, state
+    
+    def _finish(
+        self,
+        result: Dict[str, Any],
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
+        use_cache: bool,
+    ) -> Dict[str, Any]:
+        """Cache a fresh successful result and attach cache stats"""
         if use_cache and self.cache_available and not result.get("error"):
-            cache_key = self._generate_cache_key(chart_data, interpretation_type, context)
-            self._set_in_cache(cache_key, result)
+            self._set_in_cache(chart_data, interpretation_type, context, result)
         
         result["from_cache"] = False
         result["cache_stats"] = self.get_cache_stats()
@@ -145,71 +281,37 @@ class CachedPerplexityService(PerplexityLLMService):
             chart_data: Chart data dict
             interpretation_type: Type of interpretation
             context: Additional context
-            
-        Returns:
-            Cache key string
-        """
-        # Create deterministic key from inputs
-        key_data = {
-            "sun": chart_data.get("sun", ""),
-            "moon": chart_data.get("moon", ""),
-            "ascendant": chart_data.get("ascendant", ""),
-            "type": interpretation_type,
-            "context": context or "",
-        }
-        
-        key_string = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.sha256(key_string.encode()).hexdigest()
-        
-        return f"{self.CACHE_PREFIX}{key_hash}"
-    
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """
-        Retrieve value from Redis cache
         
-        Args:
-            cache_key: Cache key
-            
         Returns:
-            Cached value or None
+            Cache key string
         """
-        try:
-            cached_value = self.redis_client.get(cache_key)
-            if cached_value:
-                return json.loads(cached_value)
-        except Exception as e:
-            logger.warning(f"Cache retrieval error: {str(e)}")
-        
-        return None
+        return self.cache.key_for(chart_data, interpretation_type, context)
     
     def _set_in_cache(
         self,
-        cache_key: str,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
         value: Dict[str, Any],
     ) -> bool:
         """
         Store value in Redis cache
         
         Args:
-            cache_key: Cache key
+            chart_data: Chart data dict
+            interpretation_type: Type of interpretation
+            context: Additional context
             value: Value to cache
-            
+        
         Returns:
             Success status
         """
-        try:
-            # Remove transient fields before caching
-            cache_value = {k: v for k, v in value.items() if k not in ["from_cache", "cache_stats"]}
-            
-            self.redis_client.setex(
-                cache_key,
-                self.cache_ttl,
-                json.dumps(cache_value),
-            )
-            return True
-        except Exception as e:
-            logger.warning(f"Cache storage error: {str(e)}")
-            return False
+        # Remove transient fields before caching
+        cache_value = {
+            k: v for k, v in value.items()
+            if k not in ["from_cache", "cache_stats", "cache_state", "cache_hits"]
+        }
+        return self.cache.set(chart_data, interpretation_type, context, cache_value)
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -218,24 +320,41 @@ class CachedPerplexityService(PerplexityLLMService):
         Returns:
             Dict with cache stats
         """
-        total_requests = self.cache_hits + self.cache_misses
-        hit_rate = (self.cache_hits / total_requests * 100) if total_requests > 0 else 0
-        
         return {
-            "cache_hits": self.cache_hits,
-            "cache_misses": self.cache_misses,
-            "total_requests": total_requests,
-            "hit_rate_percentage": hit_rate,
+            **self.cache.get_stats(),
+            "refreshes": self.refreshes,
             "available": self.cache_available,
         }
     
+    def invalidate_cache_tags(self, tags: Iterable[str]) -> int:
+        """
+        Delete cached interpretations by tag
+        
+        Every entry is tagged "type:<type>", "sun:<sign>" and
+        "chart:<feature hash>".
+        
+        Args:
+            tags: Tags to invalidate
+        
+        Returns:
+            Number of entries deleted
+        """
+        if not self.cache_available:
+            return 0
+        
+        try:
+            return self.cache.invalidate_tags(tags)
+        except Exception as e:
+            logger.error(f"Cache invalidation error: {str(e)}")
+            return 0
+    
     def clear_cache(self, pattern: Optional[str] = None) -> int:
         """
         Clear cache entries
         
         Args:
             pattern: Optional pattern to match keys (default: all interp keys)
-            
+        
         Returns:
             Number of keys deleted
         """
@@ -243,25 +362,27 @@ class CachedPerplexityService(PerplexityLLMService):
             return 0
         
         try:
-            pattern = pattern or f"{self.CACHE_PREFIX}*"
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
-            return 0
+            return self.cache.clear(pattern)
         except Exception as e:
             logger.error(f"Cache clear error: {str(e)}")
             return 0
     
     def reset_cache_stats(self) -> None:
         """Reset cache statistics"""
-        self.cache_hits = 0
-        self.cache_misses = 0
+        self.cache.reset_stats()
+        self.refreshes = 0
         logger.info("Cache statistics reset")
 
 
 # Initialization helper
-def create_cached_perplexity_service() -> CachedPerplexityService:
-    """Factory function to create cached service from environment variables"""
+def create_cached_perplexity_service(embedding_service: Any = None) -> CachedPerplexityService:
+    """
+    Factory function to create cached service from environment variables
+    
+    Args:
+        embedding_service: Shared EmbeddingService enabling the semantic tier
+            (e.g. the vector store's, so the model is loaded once)
+    """
     api_key = os.getenv("PERPLEXITY_API_KEY")
     if not api_key:
         raise ValueError("PERPLEXITY_API_KEY environment variable not set")
@@ -275,4 +396,9 @@ def create_cached_perplexity_service() -> CachedPerplexityService:
         max_tokens=int(os.getenv("MAX_TOKENS", "1024")),
         timeout=int(os.getenv("TIMEOUT", "30")),
         cache_ttl=int(os.getenv("CACHE_TTL", str(CachedPerplexityService.CACHE_TTL))),
+        max_connections=int(os.getenv("PERPLEXITY_MAX_CONNECTIONS", "20")),
+        max_concurrency=int(os.getenv("PERPLEXITY_MAX_CONCURRENCY", "8")),
+        stale_ttl=int(os.getenv("CACHE_STALE_TTL", str(CachedPerplexityService.CACHE_STALE_TTL))),
+        similarity_threshold=float(os.getenv("CACHE_SIMILARITY_THRESHOLD", "0.92")),
+        embedding_service=embedding_service,
     )
@@ -0,0 +1,514 @@
+"""
+Calculation Executor
+Runs CPU-bound engine calls off the asyncio event loop
+
+Async endpoints submit chart and prediction work through an async facade
+instead of calling CalculationService directly, so a long prediction no
+longer stalls every other request on the worker. Provides:
+- A process pool (default) or thread pool sized from settings
+- Backpressure: submissions beyond max_pending fail fast with
+  CalculationBusyError (mapped to HTTP 503 by the endpoints); streamed
+  calculations, which run as the client reads, hold a slot via reserve();
+  synchronous fan-out (map()) holds one slot per task in flight
+- Per-task timing (queue wait and run time) exposed via get_stats()
+
+Worker processes keep one CalculationService each, created by the pool
+initializer, so ephemeris setup happens once per process.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.calculations.exceptions import CalculationBusyError
+from backend.config.settings import settings
+from backend.schemas import BirthDataInput
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ("process", "thread", "inline")
+
+
+# ==================== WORKER SIDE ====================
+
+_worker_service = None
+
+
+def _init_worker() -> None:
+    """Pool initializer: build the per-process CalculationService."""
+    _get_worker_service()
+
+
+def _get_worker_service():
+    global _worker_service
+    if _worker_service is None:
+        from backend.services.calculation_service import CalculationService
+        _worker_service = CalculationService()
+    return _worker_service
+
+
+def _timed_call(fn: Callable, args: Tuple, kwargs: Dict) -> Tuple[Any, float, float]:
+    """Run fn in the worker and report when it started and how long it ran."""
+    started = time.time()
+    run_start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, started, time.perf_counter() - run_start
+
+
+def generate_birth_chart_task(birth_data: BirthDataInput) -> Dict[str, Any]:
+    """Worker task: CalculationService.generate_birth_chart."""
+    return _get_worker_service().generate_birth_chart(birth_data)
+
+
+def generate_birth_chart_batch_task(
+    birth_data_list: List[BirthDataInput]
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Worker task: generate and validate a chunk of charts.
+
+    Failures are returned per row as (None, error) so one bad row does not
+    discard the rest of the chunk.
+    """
+    from backend.schemas import BirthChartData
+    service = _get_worker_service()
+    results = []
+    for birth_data in birth_data_list:
+        try:
+            chart = service.generate_birth_chart(birth_data)
+            BirthChartData(**chart)
+            results.append((chart, None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+def syncretic_prediction_task(
+    birth_data: BirthDataInput,
+    query: str,
+    prediction_window_days: int,
+    chart_id: Optional[str] = None
+):
+    """Worker task: CalculationService.get_syncretic_prediction."""
+    return _get_worker_service().get_syncretic_prediction(
+        birth_data=birth_data,
+        query=query,
+        prediction_window_days=prediction_window_days,
+        chart_id=chart_id,
+    )
+
+
+# ==================== EXECUTOR ====================
+
+@dataclass
+class TaskTiming:
+    """Aggregated timing for one task name."""
+    count: int = 0
+    errors: int = 0
+    total_run_ms: float = 0.0
+    max_run_ms: float = 0.0
+    total_wait_ms: float = 0.0
+
+    def record(self, run_seconds: float, wait_seconds: float) -> None:
+        run_ms = run_seconds * 1000
+        self.count += 1
+        self.total_run_ms += run_ms
+        self.max_run_ms = max(self.max_run_ms, run_ms)
+        self.total_wait_ms += max(wait_seconds, 0.0) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.count or 1
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_run_ms": self.total_run_ms / completed,
+            "max_run_ms": self.max_run_ms,
+            "avg_wait_ms": self.total_wait_ms / completed,
+        }
+
+
+class ExecutorSlot:
+    """
+    A pending slot held by work running outside the pool (see reserve()).
+
+    release() is idempotent; used as a context manager the slot is released
+    on exit and counted as an error if the block raised.
+    """
+
+    def __init__(self, executor: "CalculationExecutor", timing: TaskTiming):
+        self._executor = executor
+        self._timing = timing
+        self._start = time.perf_counter()
+        self._released = False
+
+    def release(self, failed: bool = False) -> None:
+        with self._executor._lock:
+            if self._released:
+                return
+            self._released = True
+            self._executor._pending -= 1
+            if failed:
+                self._timing.errors += 1
+            else:
+                self._timing.record(time.perf_counter() - self._start, 0.0)
+
+    def __enter__(self) -> "ExecutorSlot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release(failed=exc_type is not None)
+
+
+class CalculationExecutor:
+    """
+    Async facade over a pool of calculation workers.
+
+    Example:
+        >>> executor = get_calculation_executor()
+        >>> chart = await executor.generate_birth_chart(birth_data)
+    """
+
+    def __init__(
+        self,
+        mode: str = "process",
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Initialize the executor (the pool itself starts on first use).
+
+        Args:
+            mode: "process", "thread" or "inline" (run on the caller, for tests)
+            max_workers: Pool size (default: CPU count)
+            max_pending: Maximum running + queued tasks (default: 4 x workers)
+            start_method: multiprocessing start method for process mode
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 4
+        self.start_method = start_method
+
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._timings: Dict[str, TaskTiming] = {}
+
+    def _get_pool(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        with self._lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(self.start_method),
+                        initializer=_init_worker,
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="calculation",
+                    )
+                logger.info(f"Calculation executor started ({self.mode}, {self.max_workers} workers)")
+            return self._pool
+
+    @property
+    def pool(self) -> Optional[Executor]:
+        """
+        The underlying pool (None in inline mode), for synchronous fan-out
+        such as Executor.map. Work submitted this way bypasses max_pending
+        and the timing statistics; prefer map().
+        """
+        return self._get_pool()
+
+    def _claim(self, task_name: str) -> TaskTiming:
+        """Take a pending slot or raise CalculationBusyError."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise CalculationBusyError(
+                    f"Calculation queue full ({self._pending} tasks pending)"
+                )
+            self._pending += 1
+            return self._timings.setdefault(task_name, TaskTiming())
+
+    def reserve(self, task_name: str) -> ExecutorSlot:
+        """
+        Hold a pending slot for work that runs outside the pool.
+
+        Streaming responses compute in the server threadpool while the
+        client reads, so they cannot be submitted as one task; reserving a
+        slot keeps them under the same max_pending limit (and 503s) as
+        pooled work.
+
+        Args:
+            task_name: Name used for timing statistics
+
+        Returns:
+            ExecutorSlot to release when the work ends
+
+        Raises:
+            CalculationBusyError: If max_pending tasks are already in flight
+        """
+        return ExecutorSlot(self, self._claim(task_name))
+
+    async def run(self, task_name: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) in the pool without blocking the event loop.
+
+        Args:
+            task_name: Name used for timing statistics
+            fn: Module-level (picklable) function
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            fn's return value (exceptions are re-raised)
+
+        Raises:
+            CalculationBusyError: If max_pending tasks are already in flight
+        """
+        timing = self._claim(task_name)
+        submitted = time.time()
+        try:
+            pool = self._get_pool()
+            call = functools.partial(_timed_call, fn, args, kwargs)
+            if pool is None:
+                result, started, run_seconds = call()
+            else:
+                loop = asyncio.get_running_loop()
+                result, started, run_seconds = await loop.run_in_executor(pool, call)
+        except Exception:
+            with self._lock:
+                timing.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        with self._lock:
+            timing.record(run_seconds, started - submitted)
+        return result
+
+    def map(
+        self,
+        fn: Callable,
+        items: Iterable[Any],
+        task_name: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Blocking fan-out of fn over items, for synchronous code running off
+        the event loop (call signature compatible with Executor.map).
+
+        Each task in flight holds a pending slot, and at most max_in_flight
+        tasks are in flight at once, so a large fan-out neither bypasses
+        max_pending nor fills the queue ahead of other requests.
+
+        Args:
+            fn: Module-level (picklable) function of one item
+            items: Arguments, one task each
+            task_name: Name used for timing statistics (default: fn's name)
+            max_in_flight: Tasks submitted at once (default: max_workers)
+
+        Returns:
+            fn's results, in order (the first exception is re-raised once
+            the tasks in flight have finished)
+
+        Raises:
+            CalculationBusyError: If no pending slot is free for the next task
+        """
+        task_name = task_name or fn.__name__
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        pool = self._get_pool()
+        if pool is None:
+            for index, item in enumerate(items):
+                with self.reserve(task_name):
+                    results[index] = fn(item)
+            return results
+
+        window = max(1, max_in_flight or self.max_workers)
+        in_flight: Dict[Any, Tuple[int, TaskTiming, float]] = {}
+        next_index = 0
+        try:
+            while next_index < len(items) or in_flight:
+                while next_index < len(items) and len(in_flight) < window:
+                    timing = self._claim(task_name)
+                    try:
+                        future = pool.submit(_timed_call, fn, (items[next_index],), {})
+                    except Exception:
+                        with self._lock:
+                            self._pending -= 1
+                            timing.errors += 1
+                        raise
+                    in_flight[future] = (next_index, timing, time.time())
+                    next_index += 1
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, timing, submitted = in_flight.pop(future)
+                    with self._lock:
+                        self._pending -= 1
+                    try:
+                        results[index], started, run_seconds = future.result()
+                    except Exception:
+                        with self._lock:
+                            timing.errors += 1
+                        raise
+                    with self._lock:
+                        timing.record(run_seconds, started - submitted)
+        finally:
+            # On failure, drop queued tasks and wait out the running ones
+            # before their slots are released
+            for future in in_flight:
+                future.cancel()
+            wait(in_flight)
+            with self._lock:
+                self._pending -= len(in_flight)
+        return results
+
+    # ==================== ENGINE FACADE ====================
+
+    async def generate_birth_chart(self, birth_data: BirthDataInput, service=None) -> Dict[str, Any]:
+        """
+        Generate a birth chart in the pool.
+
+        Cached charts are answered without a pool round trip; fresh results
+        are stored in the caller's chart cache. Cache calls that may reach
+        Redis run in a thread so they do not block the event loop.
+
+        Args:
+            birth_data: Birth data (date, time, location)
+            service: Caller's CalculationService (for its chart cache)
+        """
+        cache_key = None
+        if service is not None:
+            cache_key = service.chart_cache_key(birth_data)
+
+        async def cache_call(fn, *args):
+            if service.chart_cache.redis_client is None:
+                return fn(*args)
+            return await asyncio.to_thread(fn, *args)
+
+        if cache_key is not None:
+            cached = await cache_call(service.get_cached_chart, birth_data, cache_key)
+            if cached is not None:
+                return cached
+
+        chart = await self.run("birth_chart", generate_birth_chart_task, birth_data)
+        if cache_key is not None:
+            await cache_call(service.chart_cache.set, cache_key, chart)
+        return chart
+
+    async def generate_birth_chart_batch(
+        self,
+        birth_data_list: List[BirthDataInput]
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Generate a chunk of charts as a single pool task.
+
+        Returns:
+            One (chart, None) or (None, error) pair per input, in order
+        """
+        return await self.run("birth_chart_batch", generate_birth_chart_batch_task, list(birth_data_list))
+
+    async def get_syncretic_prediction(
+        self,
+        birth_data: BirthDataInput,
+        query: str,
+        prediction_window_days: int = 30,
+        chart_id: Optional[str] = None,
+    ):
+        """Run CalculationService.get_syncretic_prediction in the pool."""
+        return await self.run(
+            "syncretic_prediction",
+            syncretic_prediction_task,
+            birth_data,
+            query,
+            prediction_window_days,
+            chart_id,
+        )
+
+    # ==================== LIFECYCLE & METRICS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dict with queue depth, rejections and per-task timings
+        """
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "rejected": self._rejected,
+                "tasks": {name: t.to_dict() for name, t in self._timings.items()},
+            }
+
+    def reset_after_fork(self) -> None:
+        """
+        Forget a pool inherited from a parent process (call in the forked child).
+
+        The parent's pool threads or worker processes do not exist in the
+        child; a fresh pool is started on first use.
+        """
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pending = 0
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+            logger.info("Calculation executor stopped")
+
+
+_default_executor: Optional[CalculationExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_calculation_executor() -> CalculationExecutor:
+    """Process-wide CalculationExecutor configured from settings."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = CalculationExecutor(
+                mode=settings.api.calc_executor_mode,
+                max_workers=settings.api.calc_executor_workers or None,
+                max_pending=settings.api.calc_executor_max_pending or None,
+                start_method=settings.api.calc_executor_start_method,
+            )
+        return _default_executor
+
+
+def shutdown_calculation_executor() -> None:
+    """Stop the process-wide executor (called on application shutdown)."""
+    global _default_executor
+    with _default_executor_lock:
+        executor, _default_executor = _default_executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def reset_calculation_executor_after_fork() -> None:
+    """Reset the process-wide executor in a forked worker."""
+    global _default_executor_lock
+    _default_executor_lock = threading.Lock()
+    if _default_executor is not None:
+        _default_executor.reset_after_fork()
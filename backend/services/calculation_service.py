@@ -5,16 +5,16 @@ Implements the syncretic synthesis formula and data transformation.
 Integrates UnifiedInterpreter for multi-tradition interpretations.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
 from backend.calculations.kp_engine import (
-    get_significators_for_house,
+    compute_significator_matrix,
     get_sub_lord,
     get_ruling_planets,
 )
 from backend.calculations.dasha_engine import DashaCalculator
-from backend.calculations.transit_engine import TransitAnalyzer
-from backend.calculations.ephemeris import EphemerisCalculator
+from backend.calculations.transit_engine import TransitAnalyzer, ActivationWindow
+from backend.calculations.ephemeris import EphemerisCalculator, HouseSystem
 from backend.calculations.unified_interpreter import UnifiedInterpreter
 from backend.calculations.exceptions import (
     InvalidPredictionWindowError,
@@ -22,8 +22,11 @@ from backend.calculations.exceptions import (
     CalculationError
 )
 from backend.schemas import BirthDataInput, PredictionEventData
+from backend.services.chart_cache import ChartCache, get_chart_cache, chart_cache_key
+from backend.services.result_store import ResultStore, get_result_store
+import heapq
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
@@ -56,10 +59,22 @@ class SyntheticPredictionResult:
 class CalculationService:
     """Service for orchestrating all calculation engines."""
     
-    def __init__(self):
-        """Initialize calculation service."""
+    def __init__(
+        self,
+        chart_cache: Optional[ChartCache] = None,
+        result_store: Optional[ResultStore] = None,
+    ):
+        """
+        Initialize calculation service.
+        
+        Args:
+            chart_cache: Birth chart cache (default: process-wide cache from settings)
+            result_store: Persistent result store (default: process-wide store from settings)
+        """
         self.ephemeris = EphemerisCalculator()
         self.interpreter = UnifiedInterpreter()
+        self.chart_cache = chart_cache if chart_cache is not None else get_chart_cache()
+        self.result_store = result_store if result_store is not None else get_result_store()
     
     def generate_birth_chart(self, birth_data: BirthDataInput) -> Dict[str, Any]:
         """
@@ -83,6 +98,12 @@ class CalculationService:
             # Convert to UTC
             birth_datetime_utc = birth_datetime.astimezone(pytz.UTC)
             
+            # Identical instant + location + settings => identical chart
+            cache_key = self.chart_cache_key(birth_data, birth_datetime_utc)
+            cached_chart = self.get_cached_chart(birth_data, cache_key)
+            if cached_chart is not None:
+                return cached_chart
+            
             # Get all planetary positions
             planets = self.ephemeris.get_all_planets(birth_datetime_utc, tropical=False)
             
@@ -155,6 +176,9 @@ class CalculationService:
                 "aspects": self._calculate_aspects(planets),
             }
             
+            if cache_key is not None:
+                self.chart_cache.set(cache_key, chart_data)
+            
             logger.info(f"✅ Birth chart generated for {birth_data.location_name}")
             return chart_data
             
@@ -162,6 +186,54 @@ class CalculationService:
             logger.error(f"❌ Birth chart generation failed: {str(e)}")
             raise
     
+    def chart_cache_key(
+        self,
+        birth_data: BirthDataInput,
+        birth_datetime_utc: Optional[datetime] = None
+    ) -> Optional[str]:
+        """
+        Content hash of a chart request, or None when caching is disabled.
+        
+        Args:
+            birth_data: Birth data (date, time, location)
+            birth_datetime_utc: Already converted birth instant, if available
+        """
+        if self.chart_cache is None:
+            return None
+        if birth_datetime_utc is None:
+            import pytz
+            tz = pytz.timezone(birth_data.timezone)
+            local = datetime.strptime(f"{birth_data.date} {birth_data.time}", "%Y-%m-%d %H:%M:%S")
+            birth_datetime_utc = tz.localize(local).astimezone(pytz.UTC)
+        return self.chart_cache.key_for(
+            birth_datetime_utc,
+            birth_data.latitude,
+            birth_data.longitude,
+            self.ephemeris.ayanamsa_system.name,
+            HouseSystem.PLACIDUS.name,
+        )
+    
+    def get_cached_chart(
+        self,
+        birth_data: BirthDataInput,
+        cache_key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached chart for birth_data without computing anything.
+        
+        Args:
+            birth_data: Birth data (date, time, location)
+            cache_key: Precomputed chart_cache_key(), if available
+        """
+        cache_key = cache_key or self.chart_cache_key(birth_data)
+        if cache_key is None:
+            return None
+        chart = self.chart_cache.get(cache_key)
+        if chart is not None:
+            chart["timezone"] = birth_data.timezone
+            logger.debug(f"Birth chart cache hit for {birth_data.location_name}")
+        return chart
+    
     def _calculate_aspects(self, planets: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Calculate major aspects between planets.
@@ -214,6 +286,7 @@ class CalculationService:
         birth_data: BirthDataInput,
         query: str,
         prediction_window_days: int = 30,
+        chart_id: Optional[str] = None,
     ) -> SyntheticPredictionResult:
         """
         Generate comprehensive syncretic prediction combining KP, Dasha, and Transit.
@@ -224,6 +297,7 @@ class CalculationService:
             birth_data: Birth data
             query: User's prediction query
             prediction_window_days: Days to look ahead (max 365)
+            chart_id: Saved birth chart id; enables persisted transit results
 
         Returns:
             SyntheticPredictionResult with all analysis
@@ -233,10 +307,55 @@ class CalculationService:
             InvalidBirthDataError: If birth data is incomplete or invalid
             CalculationError: If calculation fails
         """
-        import time
-        start_time = time.time()
-
-        # Validate input parameters
+        all_events: List[PredictionEventData] = []
+        for record in self.iter_syncretic_prediction(
+            birth_data, query, prediction_window_days, chart_id=chart_id
+        ):
+            if record["type"] == "event":
+                all_events.append(record["event"])
+            else:
+                summary = record
+        
+        # Sort events by date
+        all_events.sort(key=lambda e: e.event_date)
+        
+        return SyntheticPredictionResult(
+            events=all_events,
+            confidence_score=summary["confidence_score"],
+            kp_contribution=summary["kp_contribution"],
+            dasha_contribution=summary["dasha_contribution"],
+            transit_contribution=summary["transit_contribution"],
+            calculation_time_ms=summary["calculation_time_ms"],
+        )
+    
+    def iter_syncretic_prediction(
+        self,
+        birth_data: BirthDataInput,
+        query: str,
+        prediction_window_days: int = 30,
+        chart_id: Optional[str] = None,
+        top_k: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a syncretic prediction while it is computed.
+        
+        Yields {"type": "event", "source": ..., "event": PredictionEventData}
+        records as each system (kp, dasha, transit) finishes, then one
+        {"type": "summary", ...} record with the contributions and
+        confidence score. With top_k, only the top_k events by strength are
+        kept (bounded heap) and emitted, strongest first, before the summary.
+        
+        Args:
+            birth_data: Birth data
+            query: User's prediction query
+            prediction_window_days: Days to look ahead (max 365)
+            chart_id: Saved birth chart id; enables persisted transit results
+            top_k: Keep only the strongest events
+        
+        Raises:
+            InvalidPredictionWindowError: Immediately, if the window is out of range
+        """
+        # Validate input parameters (before the first record is requested)
         if prediction_window_days < MIN_PREDICTION_WINDOW_DAYS:
             raise InvalidPredictionWindowError(
                 f"Prediction window must be at least {MIN_PREDICTION_WINDOW_DAYS} day(s)"
@@ -245,6 +364,17 @@ class CalculationService:
             raise InvalidPredictionWindowError(
                 f"Prediction window cannot exceed {MAX_PREDICTION_WINDOW_DAYS} days"
             )
+        return self._iter_prediction_records(birth_data, prediction_window_days, chart_id, top_k)
+    
+    def _iter_prediction_records(
+        self,
+        birth_data: BirthDataInput,
+        prediction_window_days: int,
+        chart_id: Optional[str],
+        top_k: Optional[int],
+    ) -> Iterator[Dict[str, Any]]:
+        import time
+        start_time = time.time()
 
         try:
             import pytz
@@ -268,9 +398,6 @@ class CalculationService:
             
             if not moon_position:
                 raise InvalidBirthDataError("Moon position not found in birth chart")
-
-            # Use the pre-calculated longitude directly (0-360 degrees)
-            moon_longitude = moon_position["longitude"]
             
             # Calculate prediction window (timezone-aware UTC)
             prediction_start = datetime.now(pytz.UTC)
@@ -280,55 +407,64 @@ class CalculationService:
             dasha_calc = DashaCalculator()
             transit_analyzer = TransitAnalyzer()
             
-            # Collect all events
-            all_events: List[PredictionEventData] = []
-            
-            # 1. KP System analysis
-            kp_score = 0.0
-            kp_events = self._analyze_kp_system(
-                birth_chart, prediction_start, prediction_end
+            systems = (
+                # 1. KP System analysis
+                ("kp", lambda: self._analyze_kp_system(
+                    birth_chart, prediction_start, prediction_end
+                )),
+                # 2. Dasha System analysis
+                ("dasha", lambda: self._analyze_dasha_system(
+                    dasha_calc, prediction_start, prediction_end, birth_datetime_utc,
+                    birth_chart.get("dasha_balance_years", 0.0)
+                )),
+                # 3. Transit analysis
+                ("transit", lambda: self._analyze_transits(
+                    transit_analyzer, birth_chart, prediction_start, prediction_end,
+                    chart_id=chart_id,
+                    chart_key=chart_cache_key(
+                        birth_datetime_utc, birth_data.latitude, birth_data.longitude,
+                        self.ephemeris.ayanamsa_system.name, HouseSystem.PLACIDUS.name,
+                    ),
+                )),
             )
-            all_events.extend(kp_events)
-            kp_score = sum(e.strength_score for e in kp_events) / len(kp_events) if kp_events else 0.5
             
-            # 2. Dasha System analysis
-            dasha_score = 0.0
-            dasha_events = self._analyze_dasha_system(
-                dasha_calc, prediction_start, prediction_end, birth_datetime_utc
-            )
-            all_events.extend(dasha_events)
-            dasha_score = sum(e.strength_score for e in dasha_events) / len(dasha_events) if dasha_events else 0.5
-            
-            # 3. Transit analysis
-            transit_score = 0.0
-            transit_events = self._analyze_transits(
-                transit_analyzer, birth_chart, prediction_start, prediction_end
-            )
-            all_events.extend(transit_events)
-            transit_score = sum(e.strength_score for e in transit_events) / len(transit_events) if transit_events else 0.5
+            scores: Dict[str, float] = {}
+            heap: List[tuple] = []
+            event_count = 0
+            for source, analyze in systems:
+                # Enrich events with unified interpretations
+                events = self._enrich_events_with_interpretations(analyze(), birth_chart)
+                scores[source] = sum(e.strength_score for e in events) / len(events) if events else 0.5
+                
+                for event in events:
+                    event_count += 1
+                    record = {"type": "event", "source": source, "event": event}
+                    if top_k is None:
+                        yield record
+                        continue
+                    # Ties keep the earliest event
+                    entry = (event.strength_score, -event_count, record)
+                    if len(heap) < top_k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+            
+            for _, _, record in sorted(heap, key=lambda entry: entry[:2], reverse=True):
+                yield record
             
             # Compute syncretic confidence using weighted formula
-            confidence_score = (kp_score * KP_WEIGHT) + (dasha_score * DASHA_WEIGHT)
-            
-            # Sort events by date
-            all_events.sort(key=lambda e: e.event_date)
-            
-            # Enrich events with unified interpretations
-            all_events = self._enrich_events_with_interpretations(all_events, birth_chart)
-            
-            calculation_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            result = SyntheticPredictionResult(
-                events=all_events,
-                confidence_score=min(confidence_score, 1.0),  # Cap at 1.0
-                kp_contribution=kp_score,
-                dasha_contribution=dasha_score,
-                transit_contribution=transit_score,
-                calculation_time_ms=calculation_time,
-            )
+            confidence_score = (scores["kp"] * KP_WEIGHT) + (scores["dasha"] * DASHA_WEIGHT)
             
             logger.info(f"✅ Syncretic prediction generated (confidence: {confidence_score:.2f})")
-            return result
+            yield {
+                "type": "summary",
+                "confidence_score": min(confidence_score, 1.0),  # Cap at 1.0
+                "kp_contribution": scores["kp"],
+                "dasha_contribution": scores["dasha"],
+                "transit_contribution": scores["transit"],
+                "event_count": event_count,
+                "calculation_time_ms": (time.time() - start_time) * 1000,  # Convert to ms
+            }
             
         except Exception as e:
             logger.error(f"❌ Prediction generation failed: {str(e)}")
@@ -357,9 +493,10 @@ class CalculationService:
             # Extract house cusps as list of longitudes
             house_cusps = [house["cusp"] for house in birth_chart.get("house_cusps", [])]
             
-            # Get significators for houses
+            # Get significators for all houses in one pass
+            matrix = compute_significator_matrix(planets_dict, house_cusps)
             for house_num in range(1, 13):
-                significators = get_significators_for_house(house_num, planets_dict, house_cusps)
+                significators = matrix.for_house(house_num)
                 
                 if significators:
                     # Extract planet names from Significator objects
@@ -393,24 +530,20 @@ class CalculationService:
         start_date: datetime,
         end_date: datetime,
         birth_date: datetime,
+        dasha_balance_years: float = 0.0,
     ) -> List[PredictionEventData]:
         """Analyze Dasha system for prediction events."""
         events = []
         
         try:
-            # Calculate years forward from birth to end_date
-            years_forward = max(2, int((end_date - birth_date).days / 365.25) + 1)
-            
-            # Get dasha timeline
-            timeline = dasha_calc.get_dasha_timeline(birth_date, years_forward)
-            
-            for dasha_phase in timeline:
-                # Only include periods within our prediction window
-                if dasha_phase.start_date > end_date:
-                    continue
-                if dasha_phase.end_date < start_date:
-                    continue
-                    
+            # Same timeline model the transit scan uses for dasha support
+            years_covered = (end_date - birth_date).days / 365.25 + 1
+            timeline = dasha_calc.build_timeline(
+                birth_date, dasha_balance_years, years=max(years_covered, 1.0), depth=1
+            )
+            
+            # Only periods overlapping our prediction window
+            for dasha_phase in timeline.periods_between(start_date, end_date):
                 event = PredictionEventData(
                     event_type="dasha_change",
                     event_date=dasha_phase.start_date,
@@ -438,14 +571,16 @@ class CalculationService:
         birth_chart: Dict[str, Any],
         start_date: datetime,
         end_date: datetime,
+        chart_id: Optional[str] = None,
+        chart_key: Optional[str] = None,
     ) -> List[PredictionEventData]:
         """Analyze transits for prediction events."""
         events = []
         
         try:
             # Get transit windows (returns ActivationWindow dataclass objects)
-            windows = transit_analyzer.get_favorable_windows(
-                birth_chart, start_date, end_date
+            windows = self._get_favorable_windows(
+                transit_analyzer, birth_chart, start_date, end_date, chart_id, chart_key
             )
             
             for window in windows:
@@ -472,6 +607,55 @@ class CalculationService:
             logger.error(f"❌ Transit analysis failed: {str(e)}")
             return []
     
+    def _get_favorable_windows(
+        self,
+        transit_analyzer: TransitAnalyzer,
+        birth_chart: Dict[str, Any],
+        start_date: datetime,
+        end_date: datetime,
+        chart_id: Optional[str] = None,
+        chart_key: Optional[str] = None,
+    ) -> List[ActivationWindow]:
+        """
+        Favorable transit windows, read through the result store.
+        
+        Results are stored per saved chart and UTC start day, and expire at
+        the end of that day.
+        """
+        if self.result_store is None or chart_id is None or chart_key is None:
+            return transit_analyzer.get_favorable_windows(birth_chart, start_date, end_date)
+        
+        transit_day = datetime(start_date.year, start_date.month, start_date.day)
+        request_key = f"favorable_windows:{(end_date - start_date).days}:{chart_key}"
+        stored = self.result_store.get_transit(chart_id, transit_day, request_key)
+        if stored is not None:
+            return [
+                ActivationWindow(**{
+                    **w,
+                    "start_date": datetime.fromisoformat(w["start_date"]),
+                    "end_date": datetime.fromisoformat(w["end_date"]),
+                    "peak_date": datetime.fromisoformat(w["peak_date"]),
+                })
+                for w in stored
+            ]
+        
+        windows = transit_analyzer.get_favorable_windows(birth_chart, start_date, end_date)
+        serialized = [
+            {
+                **asdict(w),
+                "start_date": w.start_date.isoformat(),
+                "end_date": w.end_date.isoformat(),
+                "peak_date": w.peak_date.isoformat(),
+            }
+            for w in windows
+        ]
+        self.result_store.put_transits(
+            [(chart_id, transit_day, request_key, serialized,
+              max((w.peak_confidence for w in windows), default=None))],
+            expires_at=transit_day + timedelta(days=1),
+        )
+        return windows
+    
     def _enrich_events_with_interpretations(
         self,
         events: List[PredictionEventData],
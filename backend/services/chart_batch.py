@@ -0,0 +1,416 @@
+"""
+Bulk Chart Import
+Generates and stores birth charts for whole cohorts from CSV or JSONL
+
+Used by POST /chart/batch and, offline, by:
+    python -m backend.services.chart_batch --input cohort.csv --user-id <uuid>
+
+Pipeline:
+- The endpoint spools the upload to a temporary file as it arrives (spool_body),
+  checking UTF-8 and CHART_BATCH_MAX_BYTES, so no copy of the body is held
+  in memory
+- Rows are parsed lazily into BirthDataInput; invalid rows become error records
+- Valid rows are grouped into tasks of CHART_BATCH_TASK_SIZE charts and computed
+  in the calculation executor's pool, keeping every worker busy
+- Charts (and their columnar rows, see chart_columns.py) are written with
+  executemany INSERTs, CHART_BATCH_INSERT_SIZE rows per transaction, instead
+  of one commit per chart
+- Progress records and the final summary report rows/sec
+
+CSV input needs a header row with the BirthDataInput field names
+(date, time, timezone, latitude, longitude, location_name). JSONL input has
+one BirthDataInput object per line, optionally wrapped as {"birth_data": {...}}.
+"""
+
+import argparse
+import asyncio
+import codecs
+import csv
+import io
+import json
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+
+from backend.calculations.exceptions import CalculationBusyError
+from backend.config.database import WriteSessionLocal
+from backend.config.settings import settings
+from backend.models.database import BirthChart
+from backend.schemas import BirthDataInput
+from backend.services.chart_columns import write_chart_columns
+
+logger = logging.getLogger(__name__)
+
+BATCH_FORMATS = ("csv", "jsonl")
+
+# Seconds to wait before resubmitting a task the executor rejected as busy
+BUSY_RETRY_SECONDS = 0.05
+
+# Uploads larger than this are spooled from memory to disk
+SPOOL_MEMORY_BYTES = 1024 * 1024
+
+# (line number, parsed birth data or None, error or None)
+BatchRow = Tuple[int, Optional[BirthDataInput], Optional[str]]
+
+
+# ==================== PARSING ====================
+
+def detect_format(name: Optional[str]) -> Optional[str]:
+    """
+    Guess the input format from a file name or content type.
+
+    Returns:
+        "csv", "jsonl" or None if the name gives no hint
+    """
+    name = (name or "").lower()
+    if "csv" in name:
+        return "csv"
+    if any(hint in name for hint in ("jsonl", "ndjson", "json")):
+        return "jsonl"
+    return None
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def _parse_row(line: int, data: Any) -> BatchRow:
+    if isinstance(data, dict) and isinstance(data.get("birth_data"), dict):
+        data = data["birth_data"]
+    if not isinstance(data, dict):
+        return line, None, "Row must be an object of birth data fields"
+    try:
+        return line, BirthDataInput(**data), None
+    except ValidationError as e:
+        return line, None, _format_validation_error(e)
+
+
+def iter_birth_data_rows(lines: Iterable[str], input_format: str) -> Iterator[BatchRow]:
+    """
+    Parse CSV or JSONL input into BirthDataInput rows.
+
+    Args:
+        lines: Text lines (a file object or io.StringIO)
+        input_format: "csv" or "jsonl"
+
+    Yields:
+        (line, birth_data, None) for valid rows, (line, None, error) otherwise.
+        Line numbers are 1-based positions in the input (CSV header is line 1).
+    """
+    if input_format not in BATCH_FORMATS:
+        raise ValueError(f"Unknown batch format: {input_format}")
+
+    if input_format == "csv":
+        reader = csv.DictReader(lines)
+        missing = {"date", "time", "timezone", "latitude", "longitude"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"CSV header is missing columns: {', '.join(sorted(missing))}")
+        for row in reader:
+            data = {k: v.strip() for k, v in row.items() if k is not None and v is not None and v.strip()}
+            yield _parse_row(reader.line_num, data)
+        return
+
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield line, None, f"Invalid JSON: {e.msg}"
+            continue
+        yield _parse_row(line, data)
+
+
+class BatchTooLargeError(Exception):
+    """Upload exceeds the configured maximum size."""
+
+
+async def spool_body(chunks: AsyncIterable[bytes], max_bytes: Optional[int] = None) -> IO[str]:
+    """
+    Copy a streamed upload into a temporary file, for lazy parsing.
+
+    The body is held in memory up to SPOOL_MEMORY_BYTES and on disk beyond
+    that; UTF-8 is checked as chunks arrive.
+
+    Args:
+        chunks: Body chunks (e.g. Request.stream())
+        max_bytes: Size limit (default: settings; 0 = none)
+
+    Returns:
+        Text file positioned at the start (the caller closes it)
+
+    Raises:
+        BatchTooLargeError: If the body exceeds max_bytes
+        ValueError: If the body is not UTF-8 text
+    """
+    max_bytes = settings.api.chart_batch_max_bytes if max_bytes is None else max_bytes
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    size = 0
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if max_bytes and size > max_bytes:
+                raise BatchTooLargeError(f"Upload exceeds {max_bytes} bytes")
+            decoder.decode(chunk)
+            spool.write(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        spool.close()
+        raise ValueError("Body must be UTF-8 text")
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+
+
+# ==================== IMPORT ====================
+
+@dataclass
+class BatchStats:
+    """Running totals for one import."""
+    total: int = 0
+    inserted: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        processed = self.inserted + self.failed
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+class ChartBatchImporter:
+    """
+    Computes charts in the calculation pool and bulk-inserts them.
+
+    Example:
+        >>> importer = ChartBatchImporter(get_calculation_executor())
+        >>> async for record in importer.run(rows, user_id):
+        ...     print(record)
+    """
+
+    def __init__(
+        self,
+        executor,
+        session_factory=WriteSessionLocal,
+        task_size: Optional[int] = None,
+        insert_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+        Initialize the importer.
+
+        Args:
+            executor: CalculationExecutor running the chart tasks
+            session_factory: Session factory for the (single) writer
+            task_size: Charts per pool task (default: settings)
+            insert_size: Rows per INSERT transaction (default: settings)
+            max_in_flight: Tasks submitted at once (default: 2 x pool workers)
+        """
+        self.executor = executor
+        self.session_factory = session_factory
+        self.task_size = max(1, task_size or settings.api.chart_batch_task_size)
+        self.insert_size = max(1, insert_size or settings.api.chart_batch_insert_size)
+        self.max_in_flight = max(1, max_in_flight or executor.max_workers * 2)
+
+    async def run(
+        self,
+        rows: Iterable[BatchRow],
+        user_id: str,
+        ayanamsa: float = 24.6978,
+        house_system: str = "PLACIDUS",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Import parsed rows for one user.
+
+        Yields:
+            {"type": "error", "line", "detail"} for each rejected row,
+            {"type": "progress", ...} after each committed transaction and
+            a final {"type": "summary", ...} with rows/sec
+        """
+        stats = BatchStats()
+        in_flight: Set[asyncio.Future] = set()
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        chunk: List[Tuple[int, BirthDataInput]] = []
+        defaults = {"user_id": user_id, "ayanamsa": str(ayanamsa), "house_system": house_system or "PLACIDUS"}
+
+        async def drain(wait_for_all: bool) -> List[Dict[str, Any]]:
+            nonlocal in_flight
+            records = []
+            while in_flight and (wait_for_all or len(in_flight) >= self.max_in_flight):
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    records.extend(self._collect(future.result(), defaults, pending, stats))
+                while len(pending) >= self.insert_size:
+                    records.extend(await self._flush(pending, stats))
+            return records
+
+        try:
+            for line, birth_data, error in rows:
+                stats.total += 1
+                if error is not None:
+                    stats.failed += 1
+                    yield {"type": "error", "line": line, "detail": error}
+                    continue
+                chunk.append((line, birth_data))
+                if len(chunk) >= self.task_size:
+                    in_flight.add(asyncio.ensure_future(self._compute(chunk)))
+                    chunk = []
+                    for record in await drain(wait_for_all=False):
+                        yield record
+
+            if chunk:
+                in_flight.add(asyncio.ensure_future(self._compute(chunk)))
+            for record in await drain(wait_for_all=True):
+                yield record
+            if pending:
+                for record in await self._flush(pending, stats):
+                    yield record
+        finally:
+            # Client went away mid-import: stop queuing further work
+            for future in in_flight:
+                future.cancel()
+
+        summary = stats.to_dict()
+        logger.info(
+            f"Chart batch finished: {summary['inserted']} inserted, {summary['failed']} failed "
+            f"({summary['rows_per_second']} rows/sec)"
+        )
+        yield {"type": "summary", **summary}
+
+    async def _compute(self, chunk: List[Tuple[int, BirthDataInput]]):
+        """Run one chunk in the pool, waiting out executor backpressure."""
+        while True:
+            try:
+                results = await self.executor.generate_birth_chart_batch([bd for _, bd in chunk])
+            except CalculationBusyError:
+                await asyncio.sleep(BUSY_RETRY_SECONDS)
+                continue
+            except Exception as e:
+                logger.error(f"Chart batch task failed: {str(e)}")
+                results = [(None, "Birth chart generation failed")] * len(chunk)
+            return chunk, results
+
+    @staticmethod
+    def _collect(
+        computed,
+        defaults: Dict[str, Any],
+        pending: List[Tuple[int, Dict[str, Any]]],
+        stats: BatchStats,
+    ) -> List[Dict[str, Any]]:
+        chunk, results = computed
+        errors = []
+        for (line, birth_data), (chart, error) in zip(chunk, results):
+            if error is not None:
+                stats.failed += 1
+                errors.append({"type": "error", "line": line, "detail": error})
+                continue
+            pending.append((line, {
+                **defaults,
+                "chart_id": str(uuid4()),
+                "birth_date": birth_data.date,
+                "birth_time": birth_data.time,
+                "birth_latitude": birth_data.latitude,
+                "birth_longitude": birth_data.longitude,
+                "timezone": birth_data.timezone,
+                "birth_location": birth_data.location_name,
+                "chart_data": chart,
+            }))
+        return errors
+
+    async def _flush(
+        self,
+        pending: List[Tuple[int, Dict[str, Any]]],
+        stats: BatchStats,
+    ) -> List[Dict[str, Any]]:
+        """Insert up to insert_size pending rows in one transaction."""
+        batch = pending[:self.insert_size]
+        del pending[:self.insert_size]
+        try:
+            await asyncio.to_thread(self._insert, [values for _, values in batch])
+        except Exception as e:
+            logger.error(f"Chart batch insert failed: {str(e)}")
+            stats.failed += len(batch)
+            return [{"type": "error", "line": line, "detail": "Database insert failed"} for line, _ in batch]
+        stats.inserted += len(batch)
+        return [{"type": "progress", **stats.to_dict()}]
+
+    def _insert(self, values: List[Dict[str, Any]]) -> None:
+        with self.session_factory() as db:
+            try:
+                db.execute(insert(BirthChart), values)
+                write_chart_columns(db, ((v["chart_id"], v["chart_data"]) for v in values))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+
+# ==================== CLI ====================
+
+async def _run_cli(args: argparse.Namespace) -> Dict[str, Any]:
+    from backend.models.database import User
+    from backend.services.calculation_executor import CalculationExecutor
+
+    with WriteSessionLocal() as db:
+        if db.get(User, args.user_id) is None:
+            raise SystemExit(f"User not found: {args.user_id}")
+
+    executor = CalculationExecutor(mode="process", max_workers=args.workers or None)
+    importer = ChartBatchImporter(executor, task_size=args.task_size, insert_size=args.insert_size)
+    errors = open(args.errors, "w") if args.errors else sys.stderr
+    summary: Dict[str, Any] = {}
+    try:
+        with open(args.input, newline="") as handle:
+            rows = iter_birth_data_rows(handle, args.format)
+            async for record in importer.run(rows, args.user_id, args.ayanamsa, args.house_system):
+                if record["type"] == "error":
+                    errors.write(json.dumps(record) + "\n")
+                elif record["type"] == "progress":
+                    logger.info(
+                        f"{record['inserted']} inserted, {record['failed']} failed "
+                        f"({record['rows_per_second']} rows/sec)"
+                    )
+                else:
+                    summary = record
+    finally:
+        executor.shutdown()
+        if errors is not sys.stderr:
+            errors.close()
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bulk-import birth charts from CSV or JSONL")
+    parser.add_argument('--input', required=True, help="CSV or JSONL file of birth data")
+    parser.add_argument('--user-id', required=True, help="Owner of the imported charts")
+    parser.add_argument('--format', choices=BATCH_FORMATS, help="Input format (default: from file extension)")
+    parser.add_argument('--ayanamsa', type=float, default=24.6978)
+    parser.add_argument('--house-system', default="PLACIDUS")
+    parser.add_argument('--workers', type=int, default=0, help="Pool size (default: CPU count)")
+    parser.add_argument('--task-size', type=int, default=0, help="Charts per worker task")
+    parser.add_argument('--insert-size', type=int, default=0, help="Rows per INSERT transaction")
+    parser.add_argument('--errors', help="Write per-row errors as JSONL here (default: stderr)")
+    args = parser.parse_args()
+    args.format = args.format or detect_format(args.input) or "csv"
+
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(asyncio.run(_run_cli(args))))
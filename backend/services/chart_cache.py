@@ -0,0 +1,325 @@
+"""
+Content-Addressed Birth Chart Cache
+Avoids recomputing identical natal charts across requests
+
+Charts are keyed by a canonical hash of everything that determines the
+result: the UTC birth instant, coordinates, ayanamsa, house system and the
+chart engine version. Two tiers:
+- In-process LRU (bounded by entry count and serialized size)
+- Optional Redis tier shared by all workers
+
+Bump CHART_ENGINE_VERSION whenever chart calculation output changes; old
+entries stop matching and are evicted (memory) or expire (Redis).
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from backend.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Version of the chart calculation output stored in the cache
+CHART_ENGINE_VERSION = "2025.1"
+
+# Coordinates are rounded to 1e-6 degrees (~10 cm) before hashing
+COORDINATE_PRECISION = 6
+
+
+def chart_cache_key(
+    birth_datetime_utc: datetime,
+    latitude: float,
+    longitude: float,
+    ayanamsa: str,
+    house_system: str,
+    engine_version: str = CHART_ENGINE_VERSION,
+) -> str:
+    """
+    Build the canonical content hash for a chart.
+
+    Args:
+        birth_datetime_utc: Birth instant (aware datetimes are converted to UTC,
+                            naive ones are taken as UTC)
+        latitude: Birth latitude in degrees
+        longitude: Birth longitude in degrees
+        ayanamsa: Ayanamsa name (e.g. "LAHIRI")
+        house_system: House system name (e.g. "PLACIDUS")
+        engine_version: Chart engine version
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if birth_datetime_utc.tzinfo is None:
+        instant = birth_datetime_utc.replace(tzinfo=timezone.utc)
+    else:
+        instant = birth_datetime_utc.astimezone(timezone.utc)
+
+    key_data = {
+        "utc": instant.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+        # + 0.0 folds -0.0 into 0.0
+        "lat": round(float(latitude), COORDINATE_PRECISION) + 0.0,
+        "lon": round(float(longitude), COORDINATE_PRECISION) + 0.0,
+        "ayanamsa": str(ayanamsa).upper(),
+        "houses": str(house_system).upper(),
+        "engine": engine_version,
+    }
+    key_string = json.dumps(key_data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(key_string.encode()).hexdigest()
+
+
+class ChartCache:
+    """
+    Two-tier (memory LRU + optional Redis) cache of serialized charts.
+
+    Values are stored as JSON, so every get() returns an independent copy
+    that callers may mutate freely.
+    """
+
+    KEY_PREFIX = "chart:"
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 64 * 1024 * 1024,
+        redis_url: Optional[str] = None,
+        redis_client: Any = None,
+        redis_ttl: int = 2592000,
+        engine_version: str = CHART_ENGINE_VERSION,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum charts held in memory
+            max_bytes: Maximum total serialized size held in memory
+            redis_url: Redis URL for the shared tier (None = memory only)
+            redis_client: Pre-built Redis-compatible client (overrides redis_url)
+            redis_ttl: Redis entry TTL in seconds (default 30 days)
+            engine_version: Chart engine version the entries belong to
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.redis_ttl = redis_ttl
+        self.engine_version = engine_version
+
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.redis_client = redis_client
+        self.redis_configured = redis_client is not None or redis_url is not None
+        if self.redis_client is None and redis_url:
+            try:
+                import redis
+                self.redis_client = redis.from_url(redis_url)
+                self.redis_client.ping()
+                logger.info("Chart cache Redis tier initialized")
+            except Exception as e:
+                self.redis_client = None
+                logger.warning(f"Chart cache Redis tier unavailable: {str(e)}")
+
+        self.reset_stats()
+
+    # ==================== KEYS ====================
+
+    def key_for(
+        self,
+        birth_datetime_utc: datetime,
+        latitude: float,
+        longitude: float,
+        ayanamsa: str,
+        house_system: str,
+    ) -> str:
+        """Content hash for a chart under this cache's engine version."""
+        return chart_cache_key(
+            birth_datetime_utc, latitude, longitude, ayanamsa, house_system, self.engine_version
+        )
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}{self.engine_version}:{key}"
+
+    # ==================== ACCESS ====================
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a chart.
+
+        Args:
+            key: Content hash from key_for()
+
+        Returns:
+            A fresh copy of the cached chart, or None
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        if payload is None and self.redis_client is not None:
+            try:
+                raw = self.redis_client.get(self._redis_key(key))
+            except Exception as e:
+                logger.warning(f"Chart cache Redis get error: {str(e)}")
+                raw = None
+            if raw is not None:
+                payload = raw.decode() if isinstance(raw, bytes) else raw
+                with self._lock:
+                    self.redis_hits += 1
+                    self._store(key, payload)
+
+        if payload is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return json.loads(payload)
+
+    def set(self, key: str, chart: Dict[str, Any]) -> None:
+        """
+        Store a chart in both tiers.
+
+        Args:
+            key: Content hash from key_for()
+            chart: JSON-serializable chart dict
+        """
+        payload = json.dumps(chart, separators=(",", ":"))
+        with self._lock:
+            self._store(key, payload)
+
+        if self.redis_client is not None:
+            try:
+                self.redis_client.setex(self._redis_key(key), self.redis_ttl, payload)
+            except Exception as e:
+                logger.warning(f"Chart cache Redis set error: {str(e)}")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached chart, or compute, store and return it."""
+        chart = self.get(key)
+        if chart is None:
+            chart = compute()
+            self.set(key, chart)
+        return chart
+
+    def _store(self, key: str, payload: str) -> None:
+        """Insert into the memory tier and evict LRU entries (lock held)."""
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = payload
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    # ==================== INVALIDATION ====================
+
+    def set_engine_version(self, engine_version: str) -> None:
+        """
+        Switch to a new engine version, dropping all in-memory charts.
+
+        Redis entries of the old version are no longer addressed and expire
+        with their TTL (or can be removed with purge_redis()).
+        """
+        if engine_version == self.engine_version:
+            return
+        with self._lock:
+            self.engine_version = engine_version
+            self._entries.clear()
+            self._bytes = 0
+        logger.info(f"Chart cache invalidated for engine version {engine_version}")
+
+    def clear(self) -> None:
+        """Drop all in-memory charts."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def purge_redis(self, stale_only: bool = True) -> int:
+        """
+        Delete chart entries from Redis.
+
+        Args:
+            stale_only: Only delete entries of other engine versions
+
+        Returns:
+            Number of keys deleted
+        """
+        if self.redis_client is None:
+            return 0
+        current = f"{self.KEY_PREFIX}{self.engine_version}:"
+        try:
+            keys = [
+                k for k in self.redis_client.scan_iter(match=f"{self.KEY_PREFIX}*")
+                if not (stale_only and (k.decode() if isinstance(k, bytes) else k).startswith(current))
+            ]
+            return self.redis_client.delete(*keys) if keys else 0
+        except Exception as e:
+            logger.error(f"Chart cache Redis purge error: {str(e)}")
+            return 0
+
+    # ==================== METRICS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counters and memory usage
+        """
+        with self._lock:
+            total_hits = self.hits + self.redis_hits
+            total_requests = total_hits + self.misses
+            return {
+                "engine_version": self.engine_version,
+                "memory_hits": self.hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate_percentage": (total_hits / total_requests * 100) if total_requests else 0,
+                "entries": len(self._entries),
+                "memory_bytes": self._bytes,
+                "redis_available": self.redis_client is not None,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+_default_cache: Optional[ChartCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_chart_cache() -> Optional[ChartCache]:
+    """
+    Process-wide chart cache configured from settings.
+
+    Returns:
+        Shared ChartCache, or None when chart caching is disabled
+    """
+    global _default_cache
+    if not settings.api.chart_cache_enabled:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ChartCache(
+                max_entries=settings.api.chart_cache_max_entries,
+                redis_url=settings.redis.url if settings.api.chart_cache_redis_enabled else None,
+                redis_ttl=settings.api.chart_cache_ttl_seconds,
+                engine_version=os.getenv("CHART_ENGINE_VERSION", CHART_ENGINE_VERSION),
+            )
+        return _default_cache
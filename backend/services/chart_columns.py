@@ -0,0 +1,413 @@
+"""
+Columnar Chart Storage
+Indexed planet-position and house-cusp rows written alongside chart_data
+
+BirthChart.chart_data stays the source of truth; every chart is also written
+to chart_planet_positions (planets plus the Ascendant and Midheaven angles)
+and chart_house_cusps in the same transaction. This lets:
+- List endpoints return only the requested fields (e.g. Sun, Moon and the
+  Ascendant) without loading and re-validating the whole JSON blob
+- Searches such as "Moon in Rohini" use the (planet, nakshatra) index
+  instead of scanning every chart's JSON
+- Matrix synastry loads candidate longitudes without touching the blobs
+
+Charts stored before these tables existed fall back to the blob until they
+are backfilled:
+    python -m backend.services.chart_columns --backfill
+"""
+
+import argparse
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import and_, delete, insert, select
+from sqlalchemy.orm import Session
+
+from backend.calculations.synastry_engine import (
+    SYNASTRY_BODIES, SynastryMatrix, house_cusp_longitudes, synastry_longitudes
+)
+from backend.models.database import BirthChart, ChartHouseCusp, ChartPlanetPosition
+
+logger = logging.getLogger(__name__)
+
+ANGLE_POINTS = {"Ascendant": ("ascendant", 1), "Midheaven": ("midheaven", 10)}
+
+# Projectable BirthChart columns and chart_data sections
+COLUMN_FIELDS = (
+    "birth_date", "birth_time", "birth_latitude", "birth_longitude", "timezone",
+    "birth_location", "ayanamsa", "house_system", "created_at",
+)
+SECTION_FIELDS = ("planet_positions", "house_cusps", "ascendant", "midheaven", "aspects")
+PROJECTION_FIELDS = COLUMN_FIELDS + SECTION_FIELDS
+
+PLANET_FIELDS = (
+    "planet", "longitude", "zodiac_sign", "degree", "minutes", "seconds",
+    "house", "retrograde", "nakshatra", "pada",
+)
+CUSP_FIELDS = ("house", "longitude", "zodiac_sign", "degree", "minutes", "seconds")
+
+
+# ==================== WRITE ====================
+
+def _dms(longitude: float) -> Tuple[int, int, float]:
+    degree = int(longitude)
+    minutes_float = (longitude - degree) * 60
+    minutes = int(minutes_float)
+    return degree, minutes, (minutes_float - minutes) * 60
+
+
+def planet_rows(chart_id: str, chart_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Planet and angle rows for one chart."""
+    rows = []
+    for position, planet in enumerate(chart_data.get("planet_positions", [])):
+        rows.append({
+            "chart_id": chart_id,
+            "planet": planet["planet"],
+            "position": position,
+            "longitude": planet.get("longitude", planet["degree"] + planet["minutes"] / 60 + planet["seconds"] / 3600),
+            "zodiac_sign": planet["zodiac_sign"],
+            "degree": planet["degree"],
+            "minutes": planet["minutes"],
+            "seconds": planet["seconds"],
+            "house": planet.get("house"),
+            "retrograde": bool(planet.get("retrograde", False)),
+            "nakshatra": planet.get("nakshatra"),
+            "pada": planet.get("pada"),
+        })
+
+    for name, (section, house) in ANGLE_POINTS.items():
+        angle = chart_data.get(section)
+        if not angle:
+            continue
+        degree, minutes, seconds = _dms(angle["degree"])
+        rows.append({
+            "chart_id": chart_id,
+            "planet": name,
+            "position": len(rows),
+            "longitude": angle["degree"],
+            "zodiac_sign": angle["zodiac_sign"],
+            "degree": degree,
+            "minutes": minutes,
+            "seconds": seconds,
+            "house": house,
+            "retrograde": False,
+            "nakshatra": None,
+            "pada": None,
+        })
+    return rows
+
+
+def cusp_rows(chart_id: str, chart_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """House cusp rows for one chart."""
+    return [
+        {
+            "chart_id": chart_id,
+            "house": cusp["house"],
+            "longitude": cusp.get("longitude", cusp["degree"] + cusp["minutes"] / 60 + cusp["seconds"] / 3600),
+            "zodiac_sign": cusp["zodiac_sign"],
+            "degree": cusp["degree"],
+            "minutes": cusp["minutes"],
+            "seconds": cusp["seconds"],
+        }
+        for cusp in chart_data.get("house_cusps", [])
+    ]
+
+
+def write_chart_columns(db: Session, charts: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+    """
+    Write columnar rows for charts in the caller's transaction.
+
+    Args:
+        db: Session (the caller commits)
+        charts: (chart_id, chart_data) pairs
+
+    Returns:
+        Number of charts written
+    """
+    planets: List[Dict[str, Any]] = []
+    cusps: List[Dict[str, Any]] = []
+    count = 0
+    for chart_id, chart_data in charts:
+        planets.extend(planet_rows(chart_id, chart_data))
+        cusps.extend(cusp_rows(chart_id, chart_data))
+        count += 1
+
+    if planets:
+        db.execute(insert(ChartPlanetPosition), planets)
+    if cusps:
+        db.execute(insert(ChartHouseCusp), cusps)
+    return count
+
+
+def backfill_chart_columns(session_factory, batch_size: int = 500) -> int:
+    """
+    Write columnar rows for charts stored before the tables existed.
+
+    Returns:
+        Number of charts backfilled
+    """
+    total = 0
+    # Keyset cursor: charts that yield no planet rows (empty chart_data)
+    # still match the anti-join, so each pass starts after the last batch
+    after = None
+    while True:
+        with session_factory() as db:
+            query = (
+                select(BirthChart.chart_id, BirthChart.chart_data)
+                .outerjoin(ChartPlanetPosition, ChartPlanetPosition.chart_id == BirthChart.chart_id)
+                .where(ChartPlanetPosition.chart_id.is_(None))
+                .order_by(BirthChart.chart_id)
+                .limit(batch_size)
+            )
+            if after is not None:
+                query = query.where(BirthChart.chart_id > after)
+            missing = db.execute(query).all()
+            if not missing:
+                return total
+
+            chart_ids = [chart_id for chart_id, _ in missing]
+            db.execute(delete(ChartHouseCusp).where(ChartHouseCusp.chart_id.in_(chart_ids)))
+            write_chart_columns(db, ((chart_id, data or {}) for chart_id, data in missing))
+            db.commit()
+            total += len(missing)
+            after = chart_ids[-1]
+            logger.info(f"Backfilled columnar rows for {total} charts")
+
+
+# ==================== READ ====================
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """
+    Parse a comma-separated ?fields= value.
+
+    Raises:
+        ValueError: On unknown field names
+    """
+    names = [f.strip() for f in (fields or "").split(",") if f.strip()]
+    unknown = [f for f in names if f != "chart_id" and f not in PROJECTION_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Choose from: chart_id, {', '.join(PROJECTION_FIELDS)}"
+        )
+    return [f for f in names if f != "chart_id"]
+
+
+def find_chart_ids(
+    db: Session,
+    user_id: str,
+    planet: str,
+    zodiac_sign: Optional[str] = None,
+    nakshatra: Optional[str] = None,
+    house: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 10,
+) -> List[str]:
+    """
+    Find a user's charts by planet placement via the columnar indexes.
+
+    Example:
+        >>> find_chart_ids(db, user_id, "Moon", nakshatra="Rohini")
+    """
+    conditions = [ChartPlanetPosition.planet == planet]
+    if zodiac_sign is not None:
+        conditions.append(ChartPlanetPosition.zodiac_sign == zodiac_sign)
+    if nakshatra is not None:
+        conditions.append(ChartPlanetPosition.nakshatra == nakshatra)
+    if house is not None:
+        conditions.append(ChartPlanetPosition.house == house)
+
+    return list(db.execute(
+        select(BirthChart.chart_id)
+        .join(ChartPlanetPosition, ChartPlanetPosition.chart_id == BirthChart.chart_id)
+        .where(and_(*conditions), BirthChart.user_id == user_id, BirthChart.deleted_at.is_(None))
+        .order_by(BirthChart.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    ).scalars())
+
+
+def _angle_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "degree": row["longitude"],
+        "zodiac_sign": row["zodiac_sign"],
+        "zodiac_degree": row["longitude"] % 30,
+    }
+
+
+def load_projections(
+    db: Session,
+    chart_ids: Sequence[str],
+    fields: Sequence[str],
+    planets: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build projected charts containing only the requested fields.
+
+    Sections come from the columnar tables; chart_data is only read for
+    "aspects" and for charts that have not been backfilled yet.
+
+    Args:
+        db: Session
+        chart_ids: Charts to load (output keeps this order)
+        fields: Names from PROJECTION_FIELDS
+        planets: Restrict planet_positions to these planets
+
+    Returns:
+        One dict per chart with "chart_id" plus the requested fields
+    """
+    chart_ids = list(chart_ids)
+    results = {chart_id: {"chart_id": chart_id} for chart_id in chart_ids}
+    if not chart_ids:
+        return []
+
+    columns = [f for f in fields if f in COLUMN_FIELDS]
+    if columns:
+        rows = db.execute(
+            select(BirthChart.chart_id, *[getattr(BirthChart, c) for c in columns])
+            .where(BirthChart.chart_id.in_(chart_ids))
+        ).all()
+        for row in rows:
+            values = dict(zip(columns, row[1:]))
+            if "ayanamsa" in values and isinstance(values["ayanamsa"], str):
+                try:
+                    values["ayanamsa"] = float(values["ayanamsa"])
+                except ValueError:
+                    pass
+            results[row[0]].update(values)
+
+    sections = [f for f in fields if f in SECTION_FIELDS]
+    blob_ids = set(chart_ids) if "aspects" in sections else set()
+
+    wanted_points = set()
+    if "planet_positions" in sections:
+        wanted_points.update(planets or [])
+    for name, (section, _) in ANGLE_POINTS.items():
+        if section in sections:
+            wanted_points.add(name)
+
+    if wanted_points or "planet_positions" in sections:
+        query = select(*[getattr(ChartPlanetPosition, c) for c in ("chart_id",) + PLANET_FIELDS]).where(
+            ChartPlanetPosition.chart_id.in_(chart_ids)
+        )
+        if planets or "planet_positions" not in sections:
+            query = query.where(ChartPlanetPosition.planet.in_(wanted_points))
+        by_chart: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in db.execute(query.order_by(ChartPlanetPosition.chart_id, ChartPlanetPosition.position)):
+            by_chart[row[0]].append(dict(zip(PLANET_FIELDS, row[1:])))
+
+        for chart_id in chart_ids:
+            rows = by_chart.get(chart_id)
+            if not rows:
+                blob_ids.add(chart_id)
+                continue
+            if "planet_positions" in sections:
+                results[chart_id]["planet_positions"] = [r for r in rows if r["planet"] not in ANGLE_POINTS]
+            for row in rows:
+                if row["planet"] in ANGLE_POINTS:
+                    section = ANGLE_POINTS[row["planet"]][0]
+                    if section in sections:
+                        results[chart_id][section] = _angle_from_row(row)
+
+    if "house_cusps" in sections:
+        by_chart = defaultdict(list)
+        query = select(*[getattr(ChartHouseCusp, c) for c in ("chart_id",) + CUSP_FIELDS]).where(
+            ChartHouseCusp.chart_id.in_(chart_ids)
+        ).order_by(ChartHouseCusp.chart_id, ChartHouseCusp.house)
+        for row in db.execute(query):
+            by_chart[row[0]].append(dict(zip(CUSP_FIELDS, row[1:])))
+        for chart_id in chart_ids:
+            if chart_id in by_chart:
+                results[chart_id]["house_cusps"] = by_chart[chart_id]
+            else:
+                blob_ids.add(chart_id)
+
+    if blob_ids:
+        rows = db.execute(
+            select(BirthChart.chart_id, BirthChart.chart_data).where(BirthChart.chart_id.in_(blob_ids))
+        ).all()
+        for chart_id, chart_data in rows:
+            chart_data = chart_data or {}
+            for section in sections:
+                if section in results[chart_id] and section != "aspects":
+                    continue
+                value = chart_data.get(section)
+                if section == "planet_positions" and planets and value is not None:
+                    value = [p for p in value if p.get("planet") in planets]
+                results[chart_id][section] = value
+
+    return [results[chart_id] for chart_id in chart_ids]
+
+
+def load_synastry_matrix(
+    db: Session,
+    user_id: str,
+    chart_ids: Optional[Sequence[str]] = None,
+    chunk_size: int = 500,
+) -> SynastryMatrix:
+    """
+    Pack a user's stored charts for SynastryCalculator.rank_matches.
+
+    Args:
+        db: Session
+        user_id: Owner of the candidate charts
+        chart_ids: Restrict to these charts (default: all of the user's charts)
+        chunk_size: Chart ids per IN (...) query
+
+    Returns:
+        SynastryMatrix with one row per chart
+    """
+    query = select(BirthChart.chart_id).where(
+        BirthChart.user_id == user_id, BirthChart.deleted_at.is_(None)
+    ).order_by(BirthChart.created_at)
+    ids = list(db.execute(query).scalars())
+    if chart_ids is not None:
+        wanted = set(chart_ids)
+        ids = [chart_id for chart_id in ids if chart_id in wanted]
+
+    row_of = {chart_id: i for i, chart_id in enumerate(ids)}
+    column_of = {body: j for j, body in enumerate(SYNASTRY_BODIES)}
+    longitudes = np.full((len(ids), len(SYNASTRY_BODIES)), np.nan)
+    cusps = np.full((len(ids), 12), np.nan)
+    have_rows = np.zeros(len(ids), dtype=bool)
+
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        for chart_id, planet, longitude in db.execute(
+            select(ChartPlanetPosition.chart_id, ChartPlanetPosition.planet, ChartPlanetPosition.longitude)
+            .where(ChartPlanetPosition.chart_id.in_(chunk), ChartPlanetPosition.planet.in_(SYNASTRY_BODIES))
+        ):
+            longitudes[row_of[chart_id], column_of[planet]] = longitude
+            have_rows[row_of[chart_id]] = True
+        for chart_id, house, longitude in db.execute(
+            select(ChartHouseCusp.chart_id, ChartHouseCusp.house, ChartHouseCusp.longitude)
+            .where(ChartHouseCusp.chart_id.in_(chunk))
+        ):
+            cusps[row_of[chart_id], house - 1] = longitude
+
+    missing = [chart_id for chart_id, found in zip(ids, have_rows) if not found]
+    for start in range(0, len(missing), chunk_size):
+        for chart_id, chart_data in db.execute(
+            select(BirthChart.chart_id, BirthChart.chart_data)
+            .where(BirthChart.chart_id.in_(missing[start:start + chunk_size]))
+        ):
+            longitudes[row_of[chart_id]] = synastry_longitudes(chart_data or {})
+            cusps[row_of[chart_id]] = house_cusp_longitudes(chart_data or {})
+
+    return SynastryMatrix(ids=ids, longitudes=longitudes, cusps=cusps)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maintain columnar chart rows")
+    parser.add_argument('--backfill', action='store_true', help="Write rows for charts that have none")
+    parser.add_argument('--batch-size', type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.backfill:
+        from backend.config.database import WriteSessionLocal, init_db
+        init_db()
+        print(f"Backfilled {backfill_chart_columns(WriteSessionLocal, args.batch_size)} charts")
+    else:
+        parser.print_help()
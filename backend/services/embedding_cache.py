@@ -0,0 +1,312 @@
+"""
+Embedding Cache
+Skips SentenceTransformer inference for texts that were already encoded
+
+Vectors are keyed by the SHA-256 of the text (the same content_hash the
+knowledge base uses) and belong to one model. Two tiers:
+- In-process LRU of float32 vectors
+- Optional append-only binary file: a fixed header followed by one
+  fixed-size record per text (32-byte digest + float32 vector), so the
+  whole file is indexed with one pass over the digests at startup
+
+The header records the model name and dimension. A file written by a
+different model is left untouched and only the memory tier is used.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FILE_MAGIC = b"EMBCACHE"
+FILE_VERSION = 1
+HEADER_SIZE = 64
+DIGEST_SIZE = 32
+
+
+def content_hash(text: str) -> str:
+    """Hex SHA-256 of a text (cache key)."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-tier (memory LRU + optional binary file) cache of embedding vectors.
+
+    Returned vectors are read-only views shared between callers; copy them
+    before modifying.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        model_name: str,
+        path: Optional[str] = None,
+        max_entries: int = 50000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            dimension: Embedding dimension
+            model_name: Model the vectors come from (checked against the file header)
+            path: Binary file for the persistent tier (None = memory only)
+            max_entries: Maximum vectors held in memory
+        """
+        self.dimension = dimension
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.path = None
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._record = np.dtype([("digest", np.uint8, DIGEST_SIZE), ("vector", "<f4", dimension)])
+        self._file = None
+        self._rows: Dict[bytes, int] = {}
+
+        self.reset_stats()
+        if path:
+            self._open(path)
+
+    # ==================== FILE TIER ====================
+
+    def _header(self) -> bytes:
+        model = self.model_name.encode()[:HEADER_SIZE - 16]
+        return struct.pack("<8sII", FILE_MAGIC, FILE_VERSION, self.dimension) + model.ljust(HEADER_SIZE - 16, b"\0")
+
+    def _open(self, path: str) -> None:
+        """Open (or create) the cache file and index its digests."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            exists = os.path.exists(path) and os.path.getsize(path) >= HEADER_SIZE
+            f = open(path, "r+b" if exists else "w+b", buffering=0)
+        except OSError as e:
+            logger.warning(f"Embedding cache file unavailable, using memory only: {str(e)}")
+            return
+
+        if not exists:
+            f.write(self._header())
+        elif f.read(HEADER_SIZE) != self._header():
+            f.close()
+            logger.warning(
+                f"Embedding cache file {path} belongs to another model or dimension; "
+                f"using memory only"
+            )
+            return
+        else:
+            size = os.fstat(f.fileno()).st_size
+            count = (size - HEADER_SIZE) // self._record.itemsize
+            if HEADER_SIZE + count * self._record.itemsize != size:
+                # Drop a partial record left by an interrupted write
+                f.truncate(HEADER_SIZE + count * self._record.itemsize)
+            if count:
+                records = np.memmap(f, dtype=self._record, mode="r", offset=HEADER_SIZE, shape=(count,))
+                self._rows = {digest.tobytes(): row for row, digest in enumerate(records["digest"])}
+                del records
+
+        self._file = f
+        self.path = path
+        logger.info(f"Embedding cache file {path} opened ({len(self._rows)} vectors)")
+
+    def _read_rows(self, rows: List[int]) -> List[np.ndarray]:
+        """Vectors of the given file rows (lock held)."""
+        vectors = []
+        fd = self._file.fileno()
+        for row in rows:
+            offset = HEADER_SIZE + row * self._record.itemsize + DIGEST_SIZE
+            if hasattr(os, "pread"):
+                # pread leaves the shared file offset alone, so forked workers
+                # that inherited the handle cannot move each other's reads
+                data = os.pread(fd, self.dimension * 4, offset)
+            else:
+                self._file.seek(offset)
+                data = self._file.read(self.dimension * 4)
+            vector = np.frombuffer(data, dtype="<f4")
+            vectors.append(vector.astype(np.float32, copy=False))
+        return vectors
+
+    def _append(self, digests: List[bytes], vectors: np.ndarray) -> None:
+        """Append records to the file and index them (lock held)."""
+        records = np.zeros(len(digests), dtype=self._record)
+        records["digest"] = np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(-1, DIGEST_SIZE)
+        records["vector"] = vectors
+
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        try:
+            end = self._file.seek(0, os.SEEK_END)
+            first_row = (end - HEADER_SIZE) // self._record.itemsize
+            self._file.write(records.tobytes())
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+        for i, digest in enumerate(digests):
+            self._rows[digest] = first_row + i
+
+    # ==================== ACCESS ====================
+
+    def get_many(self, hashes: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up vectors.
+
+        Args:
+            hashes: content_hash() keys
+
+        Returns:
+            One float32 vector or None per key
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(hashes)
+        file_lookups = []
+
+        with self._lock:
+            for i, key in enumerate(hashes):
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results[i] = vector
+                elif self._file is not None and bytes.fromhex(key) in self._rows:
+                    file_lookups.append(i)
+                else:
+                    self.misses += 1
+
+            if file_lookups:
+                rows = [self._rows[bytes.fromhex(hashes[i])] for i in file_lookups]
+                for i, vector in zip(file_lookups, self._read_rows(rows)):
+                    vector.flags.writeable = False
+                    results[i] = vector
+                    self._store(hashes[i], vector)
+                self.disk_hits += len(file_lookups)
+
+        return results
+
+    def put_many(self, hashes: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Store vectors in both tiers.
+
+        Args:
+            hashes: content_hash() keys
+            vectors: float32 array (len(hashes), dimension)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(hashes), self.dimension)
+        with self._lock:
+            new_digests, new_rows = [], []
+            for i, key in enumerate(hashes):
+                vector = vectors[i].copy()
+                vector.flags.writeable = False
+                self._store(key, vector)
+                if self._file is not None:
+                    digest = bytes.fromhex(key)
+                    if digest not in self._rows:
+                        new_digests.append(digest)
+                        new_rows.append(i)
+                        self._rows[digest] = -1  # Claimed; duplicate keys in one call are written once
+
+            if new_digests:
+                try:
+                    self._append(new_digests, vectors[new_rows])
+                except OSError as e:
+                    for digest in new_digests:
+                        self._rows.pop(digest, None)
+                    logger.warning(f"Embedding cache file write error: {str(e)}")
+
+    def _store(self, key: str, vector: np.ndarray) -> None:
+        """Insert into the memory tier and evict LRU entries (lock held)."""
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def warm_from_vector_store(self, vector_store: Any) -> int:
+        """
+        Load the vectors of an indexed corpus, keyed by its metadata content_hash.
+
+        Entries without a content_hash (indexed before hashes were recorded)
+        are skipped, as are IVF-PQ indexes whose stored vectors are lossy.
+
+        Args:
+            vector_store: FAISSVectorStore using the same model
+
+        Returns:
+            Number of vectors added to the cache
+        """
+        if vector_store.index is None or vector_store.index_type == "ivf_pq":
+            return 0
+        if vector_store.dimension != self.dimension:
+            raise ValueError(
+                f"Vector store dimension {vector_store.dimension} does not match cache dimension {self.dimension}"
+            )
+
+        positions, hashes = [], []
+        for i in vector_store.live_ids():
+            key = vector_store.metadata[int(i)].get("content_hash")
+            if key:
+                positions.append(int(i))
+                hashes.append(key)
+        if not positions:
+            return 0
+        vectors = vector_store._reconstruct_ids(np.array(positions, dtype=np.int64))
+        self.put_many(hashes, vectors)
+        logger.info(f"Embedding cache warmed with {len(hashes)} vectors")
+        return len(hashes)
+
+    def clear(self) -> None:
+        """Drop all in-memory vectors (the file tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._rows = {}
+
+    # ==================== METRICS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counters and tier sizes
+        """
+        with self._lock:
+            total_hits = self.hits + self.disk_hits
+            total_requests = total_hits + self.misses
+            return {
+                "model": self.model_name,
+                "memory_hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate_percentage": (total_hits / total_requests * 100) if total_requests else 0,
+                "entries": len(self._entries),
+                "disk_entries": len(self._rows),
+                "path": self.path,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
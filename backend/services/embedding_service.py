@@ -1,13 +1,18 @@
 """
 Embedding Service using Sentence Transformers
 Provides embeddings for knowledge base texts
+
+encode() deduplicates its input and serves repeated texts from an
+EmbeddingCache, so the model only runs for texts it has never seen.
 """
 
 import os
 import numpy as np
-from typing import List, Union
+from typing import Any, List, Optional, Union
 import logging
 
+from backend.services.embedding_cache import EmbeddingCache, content_hash
+
 try:
     from sentence_transformers import SentenceTransformer
 except ImportError:
@@ -30,23 +35,33 @@ class EmbeddingService:
     MODEL_NAME = "all-MiniLM-L6-v2"
     EMBEDDING_DIM = 384
     
-    def __init__(self, model_name: str = MODEL_NAME):
+    def __init__(
+        self,
+        model_name: str = MODEL_NAME,
+        cache: Optional[EmbeddingCache] = None,
+        model: Any = None,
+    ):
         """
         Initialize Embedding Service
         
         Args:
             model_name: Model name from Hugging Face (default: all-MiniLM-L6-v2)
+            cache: Embedding cache (default: in-memory cache for this model)
+            model: Already loaded SentenceTransformer-compatible model (skips loading)
         """
-        if SentenceTransformer is None:
-            raise ImportError("sentence-transformers not installed")
-        
-        try:
-            self.model = SentenceTransformer(model_name)
-            self.model_name = model_name
-            logger.info(f"Embedding service initialized with model: {model_name}")
-        except Exception as e:
-            logger.error(f"Failed to load model {model_name}: {str(e)}")
-            raise
+        if model is None:
+            if SentenceTransformer is None:
+                raise ImportError("sentence-transformers not installed")
+            try:
+                model = SentenceTransformer(model_name)
+            except Exception as e:
+                logger.error(f"Failed to load model {model_name}: {str(e)}")
+                raise
+        
+        self.model = model
+        self.model_name = model_name
+        self.cache = cache if cache is not None else EmbeddingCache(self.EMBEDDING_DIM, model_name)
+        logger.info(f"Embedding service initialized with model: {model_name}")
     
     def encode(
         self,
@@ -57,29 +72,43 @@ class EmbeddingService:
         """
         Encode text(s) to embeddings
         
+        Identical texts are encoded once; cached texts skip the model.
+        
         Args:
             texts: Single text string or list of texts
             batch_size: Batch size for encoding
             show_progress_bar: Whether to show progress bar
             
         Returns:
-            Numpy array of embeddings (shape: (n_samples, 384))
+            float32 numpy array of embeddings (shape: (n_samples, 384))
         """
         if isinstance(texts, str):
             texts = [texts]
+        if not texts:
+            return np.empty((0, self.EMBEDDING_DIM), dtype=np.float32)
         
-        try:
-            embeddings = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                show_progress_bar=show_progress_bar,
-                convert_to_numpy=True,
-            )
-            logger.info(f"Encoded {len(texts)} text(s) to embeddings")
-            return embeddings
-        except Exception as e:
-            logger.error(f"Error encoding texts: {str(e)}")
-            raise
+        keys = [content_hash(text) for text in texts]
+        unique = dict(zip(keys, texts))
+        vectors = dict(zip(unique, self.cache.get_many(list(unique))))
+        missing = [key for key, vector in vectors.items() if vector is None]
+        
+        if missing:
+            try:
+                embeddings = self.model.encode(
+                    [unique[key] for key in missing],
+                    batch_size=batch_size,
+                    show_progress_bar=show_progress_bar,
+                    convert_to_numpy=True,
+                )
+            except Exception as e:
+                logger.error(f"Error encoding texts: {str(e)}")
+                raise
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            self.cache.put_many(missing, embeddings)
+            vectors.update(zip(missing, embeddings))
+            logger.info(f"Encoded {len(missing)} text(s) to embeddings ({len(texts) - len(missing)} cached or repeated)")
+        
+        return np.stack([vectors[key] for key in keys])
     
     def encode_single(self, text: str) -> np.ndarray:
         """
@@ -169,11 +198,24 @@ class EmbeddingService:
             "model": self.model_name,
             "embedding_dimension": self.EMBEDDING_DIM,
             "framework": "sentence-transformers",
+            "cache": self.cache.get_stats(),
         }
 
 
 # Factory function
 def create_embedding_service() -> EmbeddingService:
-    """Create embedding service from environment variables"""
+    """
+    Create embedding service from environment variables
+    
+    EMBEDDING_CACHE_PATH sets the persistent cache file (default:
+    embedding_cache.bin in FAISS_INDEX_PATH; empty = memory only).
+    """
     model_name = os.getenv("EMBEDDING_MODEL", EmbeddingService.MODEL_NAME)
-    return EmbeddingService(model_name=model_name)
+    default_path = os.path.join(os.getenv("FAISS_INDEX_PATH", "./vector_store"), "embedding_cache.bin")
+    cache = EmbeddingCache(
+        EmbeddingService.EMBEDDING_DIM,
+        model_name,
+        path=os.getenv("EMBEDDING_CACHE_PATH", default_path) or None,
+        max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", "50000")),
+    )
+    return EmbeddingService(model_name=model_name, cache=cache)
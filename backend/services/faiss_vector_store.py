@@ -4,8 +4,13 @@ Provides semantic search over knowledge base texts
 """
 
 import os
+import json
+import math
+import time
 import numpy as np
 import pickle
+import shutil
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
@@ -15,20 +20,151 @@ except ImportError:
     print("Warning: faiss-cpu not installed. Install with: pip install faiss-cpu")
     faiss = None
 
-from backend.services.embedding_service import EmbeddingService
+from backend.services.embedding_cache import content_hash
+from backend.services.embedding_service import EmbeddingService, create_embedding_service
+from backend.services.vector_metadata import MappedMetadata, metadata_exists, write_metadata
 
 logger = logging.getLogger(__name__)
 
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+# Saved stores: every save writes generations/<id>/ and then atomically
+# repoints CURRENT at it, so a loader never mixes files of two saves
+CURRENT_FILE = "CURRENT"
+GENERATIONS_DIR = "generations"
+KEEP_GENERATIONS = 2
+
+
+@dataclass
+class FAISSIndexConfig:
+    """
+    Index factory settings
+    
+    index_type:
+    - flat: exact exhaustive scan (IndexFlatL2 behind an IndexIDMap)
+    - ivf_flat: inverted lists over k-means cells, full vectors
+    - ivf_pq: inverted lists with product-quantized vectors (smallest)
+    - hnsw: graph index, no training required
+    """
+    index_type: str = "flat"
+    nlist: int = 0                      # IVF cells (0 = 4 * sqrt(n))
+    nprobe: int = 16                    # IVF cells visited per query
+    pq_m: int = 16                      # PQ sub-quantizers (must divide dimension)
+    pq_nbits: int = 8                   # Bits per PQ code
+    hnsw_m: int = 32                    # HNSW graph degree
+    ef_construction: int = 200          # HNSW build beam width
+    ef_search: int = 64                 # HNSW query beam width
+    train_sample_size: int = 50000      # Vectors sampled for IVF/PQ training
+    min_points_per_centroid: int = 39   # Training points per centroid (FAISS minimum)
+    
+    def __post_init__(self):
+        if self.index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {self.index_type} (expected one of {INDEX_TYPES})")
+    
+    @classmethod
+    def from_env(cls) -> "FAISSIndexConfig":
+        """Build config from FAISS_* environment variables"""
+        return cls(
+            index_type=os.getenv("FAISS_INDEX_TYPE", "flat").lower(),
+            nlist=int(os.getenv("FAISS_NLIST", "0")),
+            nprobe=int(os.getenv("FAISS_NPROBE", "16")),
+            pq_m=int(os.getenv("FAISS_PQ_M", "16")),
+            hnsw_m=int(os.getenv("FAISS_HNSW_M", "32")),
+            ef_search=int(os.getenv("FAISS_EF_SEARCH", "64")),
+        )
+    
+    @property
+    def requires_training(self) -> bool:
+        return self.index_type in ("ivf_flat", "ivf_pq")
+    
+    def nlist_for(self, n_vectors: int) -> int:
+        """IVF cell count for a corpus size"""
+        if self.nlist:
+            return self.nlist
+        return max(1, min(int(4 * math.sqrt(n_vectors)), n_vectors // self.min_points_per_centroid))
+    
+    def min_training_points(self, n_vectors: int) -> int:
+        """Vectors needed to train this index type (0 if untrained)"""
+        if not self.requires_training:
+            return 0
+        centroids = self.nlist_for(n_vectors)
+        if self.index_type == "ivf_pq":
+            centroids = max(centroids, 2 ** self.pq_nbits)
+        return centroids * self.min_points_per_centroid
+
+
+def build_faiss_index(dimension: int, vectors: np.ndarray, config: FAISSIndexConfig):
+    """
+    Build an empty (trained if needed) FAISS index for a set of vectors
+    
+    Falls back to a flat index when there are too few vectors to train the
+    requested IVF index. Flat and IVF indexes take explicit ids
+    (add_with_ids) and support remove_ids; HNSW assigns sequential ids and
+    cannot remove vectors.
+    
+    Args:
+        dimension: Vector dimension
+        vectors: float32 array (n, dimension) the index will hold; a sample
+                 of it is used for training
+        config: Index settings
+        
+    Returns:
+        Tuple of (index, effective index type)
+    """
+    n_vectors = len(vectors)
+    
+    if config.requires_training and n_vectors < config.min_training_points(n_vectors):
+        logger.warning(
+            f"{n_vectors} vectors are too few to train {config.index_type} "
+            f"(need {config.min_training_points(n_vectors)}); using exact flat index"
+        )
+        return faiss.IndexIDMap(faiss.IndexFlatL2(dimension)), "flat"
+    
+    if config.index_type == "flat":
+        return faiss.IndexIDMap(faiss.IndexFlatL2(dimension)), "flat"
+    
+    if config.index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, config.hnsw_m)
+        index.hnsw.efConstruction = config.ef_construction
+        index.hnsw.efSearch = config.ef_search
+        return index, "hnsw"
+    
+    nlist = config.nlist_for(n_vectors)
+    if config.index_type == "ivf_pq":
+        if dimension % config.pq_m:
+            raise ValueError(f"pq_m={config.pq_m} does not divide dimension {dimension}")
+        index = faiss.index_factory(dimension, f"IVF{nlist},PQ{config.pq_m}x{config.pq_nbits}")
+    else:
+        index = faiss.index_factory(dimension, f"IVF{nlist},Flat")
+    
+    # Train on a random sample of the corpus
+    if n_vectors > config.train_sample_size:
+        rng = np.random.default_rng(0)
+        sample = vectors[rng.choice(n_vectors, config.train_sample_size, replace=False)]
+    else:
+        sample = vectors
+    start = time.perf_counter()
+    index.train(np.ascontiguousarray(sample, dtype=np.float32))
+    index.nprobe = min(config.nprobe, nlist)
+    logger.info(
+        f"Trained {config.index_type} index (nlist={nlist}) on {len(sample)} vectors "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    return index, config.index_type
+
 
 class FAISSVectorStore:
     """
     Vector store using FAISS for semantic search
     
     Features:
-    - IndexFlatL2 for exact search
-    - Metadata tracking
+    - Exact (IndexFlatL2) or approximate (IVF-Flat, IVF-PQ, HNSW) search
+    - Category filtering inside the index via ID selectors
+    - Metadata tracking (vector id = metadata position, stable until rebuild_index)
+    - Incremental removal (remove_ids; HNSW entries are masked at search time)
     - Category weighting
-    - Persistence
+    - Persistence (index and metadata memory-mapped on load, so worker
+      processes share one copy through the page cache)
     """
     
     # Category weights (for relevance boosting)
@@ -58,18 +194,20 @@ class FAISSVectorStore:
         self,
         embedding_service: Optional[EmbeddingService] = None,
         index_path: Optional[str] = None,
+        index_config: Optional[FAISSIndexConfig] = None,
     ):
         """
         Initialize FAISS Vector Store
         
         Args:
-            embedding_service: EmbeddingService instance (will create if not provided)
+            embedding_service: EmbeddingService instance (default: from environment)
             index_path: Path to save/load index files
+            index_config: Index factory settings (default: from FAISS_* env vars)
         """
         if faiss is None:
             raise ImportError("faiss-cpu not installed")
         
-        self.embedding_service = embedding_service or EmbeddingService()
+        self.embedding_service = embedding_service or create_embedding_service()
         self.index_path = index_path or os.getenv("FAISS_INDEX_PATH", "./vector_store")
         
         # Create index directory if needed
@@ -77,11 +215,26 @@ class FAISSVectorStore:
         
         # Initialize index and metadata
         self.index = None
+        self.index_type = None
+        self.index_config = index_config or FAISSIndexConfig.from_env()
         self.metadata = []
         self.text_count = 0
         self.dimension = self.embedding_service.EMBEDDING_DIM
         
-        logger.info(f"FAISSVectorStore initialized (dimension={self.dimension})")
+        # Category -> int64 ids of its vectors (ids are metadata positions)
+        self._category_ids: Dict[str, np.ndarray] = {}
+        
+        # True while the index is a read-only view of the index file
+        self._mapped = False
+        
+        # Removed vector ids (their metadata rows stay so ids remain stable)
+        self._deleted: set = set()
+        self._live_selector = None
+        
+        logger.info(
+            f"FAISSVectorStore initialized (dimension={self.dimension}, "
+            f"index={self.index_config.index_type})"
+        )
     
     def add_texts(
         self,
@@ -92,6 +245,9 @@ class FAISSVectorStore:
         """
         Add texts to vector store
         
+        Each stored metadata dict gets the text's content_hash, which lets
+        the embedding cache be warmed from the index.
+        
         Args:
             texts: List of text strings
             metadata_list: List of metadata dicts (must have 'category' and 'source')
@@ -100,6 +256,11 @@ class FAISSVectorStore:
         if len(texts) != len(metadata_list):
             raise ValueError("texts and metadata_list must have same length")
         
+        metadata_list = [
+            {"content_hash": content_hash(text), **metadata}
+            for text, metadata in zip(texts, metadata_list)
+        ]
+        
         # Encode texts to embeddings
         embeddings = self.embedding_service.encode(
             texts,
@@ -107,20 +268,63 @@ class FAISSVectorStore:
             show_progress_bar=True,
         )
         
-        # Initialize or extend index
-        if self.index is None:
-            self.index = faiss.IndexFlatL2(self.dimension)
-        
         # Convert to float32 (FAISS requirement)
-        embeddings = embeddings.astype(np.float32)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
         
-        # Add to index
-        self.index.add(embeddings)
+        # Initialize (and train) on the first batch, then extend
+        if self.index is None:
+            self.index, self.index_type = build_faiss_index(self.dimension, embeddings, self.index_config)
+        self._ensure_writable()
+        
+        # Add to index under ids that continue the metadata positions
+        if self.index_type == "hnsw":
+            self.index.add(embeddings)
+        else:
+            self._ensure_id_mapped()
+            first_id = len(self.metadata)
+            self.index.add_with_ids(embeddings, np.arange(first_id, first_id + len(texts), dtype=np.int64))
         self.metadata.extend(metadata_list)
         self.text_count += len(texts)
+        self._rebuild_category_ids()
         
         logger.info(f"Added {len(texts)} texts to index (total: {self.text_count})")
     
+    def remove_ids(self, ids: List[int]) -> int:
+        """
+        Remove vectors by id (metadata position)
+        
+        Flat and IVF indexes drop the vectors; HNSW cannot, so its removed
+        ids are excluded at search time until rebuild_index compacts the
+        store. Metadata rows are kept so other ids do not shift.
+        
+        Args:
+            ids: Vector ids to remove (unknown or already removed ids are ignored)
+            
+        Returns:
+            Number of vectors removed
+        """
+        ids = sorted({int(i) for i in ids if 0 <= int(i) < len(self.metadata)} - self._deleted)
+        if not ids or self.index is None:
+            return 0
+        
+        self._ensure_writable()
+        if self.index_type != "hnsw":
+            self._ensure_id_mapped()
+            self.index.remove_ids(faiss.IDSelectorBatch(np.array(ids, dtype=np.int64)))
+        
+        self._deleted.update(ids)
+        self.text_count -= len(ids)
+        self._rebuild_category_ids()
+        logger.info(f"Removed {len(ids)} texts from index (total: {self.text_count})")
+        return len(ids)
+    
+    def live_ids(self) -> np.ndarray:
+        """Ids of the vectors currently in the store, ascending"""
+        ids = np.arange(len(self.metadata), dtype=np.int64)
+        if self._deleted:
+            ids = np.setdiff1d(ids, np.fromiter(self._deleted, dtype=np.int64), assume_unique=True)
+        return ids
+    
     def search(
         self,
         query: str,
@@ -149,9 +353,20 @@ class FAISSVectorStore:
             query_embedding = self.embedding_service.encode_single(query)
             query_embedding = query_embedding.astype(np.float32).reshape(1, -1)
             
-            # Search index (k + buffer for filtering)
-            search_k = min(k * 3, self.text_count)
-            distances, indices = self.index.search(query_embedding, search_k)
+            # The category filter is applied inside the index, so a filtered
+            # search fetches exactly k (one category, one weight). Unfiltered
+            # results are re-ranked by category weight, so over-fetch k * 3
+            # to let weighted results from just past the raw top k in
+            if category_filter:
+                candidate_count = len(self._category_ids.get(category_filter, ()))
+                if candidate_count == 0:
+                    return []
+                search_k = min(k, candidate_count)
+            else:
+                search_k = min(k * 3, self.text_count)
+            distances, indices = self.index.search(
+                query_embedding, search_k, params=self._search_params(category_filter)
+            )
             
             results = []
             
@@ -162,10 +377,6 @@ class FAISSVectorStore:
                 metadata = self.metadata[idx]
                 category = metadata.get("category", "misc")
                 
-                # Apply category filter
-                if category_filter and category != category_filter:
-                    continue
-                
                 # Convert L2 distance to similarity (lower distance = higher similarity)
                 # L2 distance ranges from 0 to inf, similarity should be 0 to 1
                 similarity = 1.0 / (1.0 + distance)
@@ -186,9 +397,6 @@ class FAISSVectorStore:
                     "weight": weight,
                     "index": int(idx),
                 })
-                
-                if len(results) >= k:
-                    break
             
             # Sort by weighted similarity
             results.sort(key=lambda x: x["weighted_similarity"], reverse=True)
@@ -200,10 +408,237 @@ class FAISSVectorStore:
             logger.error(f"Search error: {str(e)}")
             return []
     
+    def rebuild_index(
+        self,
+        index_config: Optional[FAISSIndexConfig] = None,
+        reference_vectors: Optional[np.ndarray] = None,
+    ) -> str:
+        """
+        Rebuild the index with new settings over the stored vectors
+        
+        Use after bulk ingestion into a store that started with too few
+        vectors to train an IVF index (and fell back to flat), or to
+        compact a store after removals: removed rows are dropped and the
+        remaining vectors get consecutive ids again.
+        
+        Args:
+            index_config: New settings (default: current config)
+            reference_vectors: Original embeddings in live_ids() order;
+                without them vectors are reconstructed (lossy for IVF-PQ)
+                
+        Returns:
+            Effective index type
+        """
+        if self.index is None or self.text_count == 0:
+            raise ValueError("Index is empty")
+        
+        live = self.live_ids()
+        if reference_vectors is None:
+            reference_vectors = self._reconstruct_ids(live)
+        vectors = np.ascontiguousarray(reference_vectors, dtype=np.float32)
+        
+        if index_config is not None:
+            self.index_config = index_config
+        index, index_type = build_faiss_index(self.dimension, vectors, self.index_config)
+        if index_type == "hnsw":
+            index.add(vectors)
+        else:
+            index.add_with_ids(vectors, np.arange(len(vectors), dtype=np.int64))
+        
+        if self._deleted:
+            self.metadata = [self.metadata[int(i)] for i in live]
+            self._deleted = set()
+        self.index, self.index_type = index, index_type
+        self._mapped = False
+        self._rebuild_category_ids()
+        logger.info(f"Rebuilt index as {index_type} ({self.text_count} vectors)")
+        return index_type
+    
+    def _reconstruct_all(self) -> np.ndarray:
+        """Stored vectors in live_ids() order (approximate for IVF-PQ)"""
+        return self._reconstruct_ids(self.live_ids())
+    
+    def _reconstruct_ids(self, ids: np.ndarray) -> np.ndarray:
+        """Stored vectors for the given ids (approximate for IVF-PQ)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        if isinstance(self.index, faiss.IndexIDMap):
+            id_map = faiss.vector_to_array(self.index.id_map)
+            inner = faiss.downcast_index(self.index.index)
+            order = np.argsort(id_map)
+            positions = order[np.searchsorted(id_map, ids, sorter=order)]
+            return inner.reconstruct_n(0, inner.ntotal)[positions]
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            ivf = faiss.extract_index_ivf(self.index)
+            if ivf.direct_map.type != faiss.DirectMap.Hashtable:
+                ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+            return self.index.reconstruct_batch(ids)
+        return self.index.reconstruct_n(0, self.index.ntotal)[ids]
+    
+    def _ensure_id_mapped(self) -> None:
+        """Wrap a flat index saved without an id map (ids are its positions)"""
+        if self.index_type == "flat" and not isinstance(self.index, faiss.IndexIDMap):
+            vectors = self.index.reconstruct_n(0, self.index.ntotal)
+            index = faiss.IndexIDMap(faiss.IndexFlatL2(self.dimension))
+            index.add_with_ids(vectors, np.arange(len(vectors), dtype=np.int64))
+            self.index = index
+    
+    def _ensure_writable(self) -> None:
+        """Replace a memory-mapped index with an owned copy before modifying it"""
+        if self._mapped:
+            self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+            self._mapped = False
+            logger.info("Copied memory-mapped index into memory for writing")
+    
+    def _rebuild_category_ids(self) -> None:
+        """Group metadata positions by category for ID-selector filtering"""
+        encoded = None
+        if isinstance(self.metadata, MappedMetadata):
+            encoded = self.metadata.column_codes("category")
+        if encoded is None:
+            categories = [m.get("category", "misc") for m in self.metadata]
+            values = list(dict.fromkeys(categories))
+            lookup = {value: code for code, value in enumerate(values)}
+            codes = np.array([lookup[c] for c in categories], dtype=np.int32)
+        else:
+            values, codes = encoded
+            if (codes < 0).any():
+                # Rows without a category count as "misc"
+                if "misc" not in values:
+                    values = values + ["misc"]
+                codes = np.where(codes < 0, values.index("misc"), codes)
+        
+        order = np.argsort(codes, kind="stable").astype(np.int64)
+        counts = np.bincount(codes, minlength=len(values)) if len(codes) else np.zeros(len(values), dtype=np.int64)
+        groups = np.split(order, np.cumsum(counts)[:-1]) if len(values) else []
+        if self._deleted:
+            deleted = np.fromiter(self._deleted, dtype=np.int64)
+            groups = [ids[~np.isin(ids, deleted)] for ids in groups]
+            # HNSW still holds removed vectors: mask them in unfiltered searches
+            excluded = faiss.IDSelectorBatch(deleted)
+            self._live_selector = (excluded, faiss.IDSelectorNot(excluded))
+        else:
+            self._live_selector = None
+        self._category_ids = {
+            values[code]: ids for code, ids in enumerate(groups) if len(ids)
+        }
+    
+    def _search_params(
+        self,
+        category_filter: Optional[str] = None,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ):
+        """
+        Build per-query FAISS search parameters
+        
+        Args:
+            category_filter: Restrict the search to one category's ids
+            nprobe: IVF cells to visit (default: config)
+            ef_search: HNSW beam width (default: config)
+        """
+        kwargs = {}
+        if category_filter:
+            ids = self._category_ids.get(category_filter, np.empty(0, dtype=np.int64))
+            # Passed as a constructor kwarg so the params object keeps it alive
+            kwargs["sel"] = faiss.IDSelectorBatch(ids)
+        elif self._live_selector is not None and self.index_type == "hnsw":
+            kwargs["sel"] = self._live_selector[1]
+        
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            return faiss.SearchParametersIVF(nprobe=nprobe or self.index_config.nprobe, **kwargs)
+        if self.index_type == "hnsw":
+            return faiss.SearchParametersHNSW(efSearch=ef_search or self.index_config.ef_search, **kwargs)
+        return faiss.SearchParameters(**kwargs) if kwargs else None
+    
+    def evaluate_search(
+        self,
+        query_vectors: np.ndarray,
+        k: int = 10,
+        nprobe_values: Optional[List[int]] = None,
+        ef_search_values: Optional[List[int]] = None,
+        reference_vectors: Optional[np.ndarray] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Report recall@k and latency for a range of search settings
+        
+        Ground truth is an exact L2 search over reference_vectors (the
+        original embeddings, in live_ids() order). Without them the vectors are
+        reconstructed from the index, which is lossy for IVF-PQ.
+        
+        Args:
+            query_vectors: float32 array (q, dimension)
+            k: Neighbours per query
+            nprobe_values: IVF nprobe settings to try
+            ef_search_values: HNSW efSearch settings to try
+            reference_vectors: Original embeddings for the ground truth
+            
+        Returns:
+            One dict per setting with recall_at_k and avg_latency_ms
+        """
+        if self.index is None or self.text_count == 0:
+            return []
+        
+        queries = np.ascontiguousarray(query_vectors, dtype=np.float32)
+        k = min(k, self.text_count)
+        
+        if reference_vectors is None:
+            reference_vectors = self._reconstruct_all()
+        exact = faiss.IndexFlatL2(self.dimension)
+        exact.add(np.ascontiguousarray(reference_vectors, dtype=np.float32))
+        _, truth = exact.search(queries, k)
+        truth = self.live_ids()[truth]
+        
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            settings = [{"nprobe": n} for n in (nprobe_values or [1, 4, 16, 64])]
+        elif self.index_type == "hnsw":
+            settings = [{"ef_search": ef} for ef in (ef_search_values or [16, 32, 64, 128])]
+        else:
+            settings = [{}]
+        
+        report = []
+        for setting in settings:
+            params = self._search_params(**setting)
+            start = time.perf_counter()
+            _, found = self.index.search(queries, k, params=params)
+            elapsed = time.perf_counter() - start
+            
+            hits = sum(len(set(f[f >= 0]) & set(t)) for f, t in zip(found, truth))
+            report.append({
+                "index_type": self.index_type,
+                **setting,
+                "recall_at_k": hits / (len(queries) * k),
+                "avg_latency_ms": elapsed * 1000 / len(queries),
+            })
+        return report
+    
+    def _generations_path(self) -> str:
+        return os.path.join(self.index_path, GENERATIONS_DIR)
+    
+    def _current_path(self) -> str:
+        """Directory of the current saved generation (the index path itself for flat layouts)"""
+        try:
+            with open(os.path.join(self.index_path, CURRENT_FILE)) as f:
+                generation = f.read().strip()
+        except FileNotFoundError:
+            return self.index_path
+        return os.path.join(self._generations_path(), generation)
+    
+    def _prune_generations(self, current: str) -> None:
+        """Remove all but the newest KEEP_GENERATIONS saves (never the current one)"""
+        generations = sorted(os.listdir(self._generations_path()))
+        for generation in generations[:-KEEP_GENERATIONS]:
+            if generation != current:
+                shutil.rmtree(os.path.join(self._generations_path(), generation), ignore_errors=True)
+    
     def save(self) -> bool:
         """
         Save index and metadata to disk
         
+        All files go into a new generation directory, then CURRENT is
+        renamed over to point at it. Loaders see either the previous save or
+        this one, never a mix, and processes that have the previous
+        generation mapped are unaffected (the previous generation is kept).
+        
         Returns:
             Success status
         """
@@ -211,44 +646,93 @@ class FAISSVectorStore:
             logger.warning("No index to save")
             return False
         
+        generation = f"{time.time_ns():020d}-{os.getpid()}"
+        directory = os.path.join(self._generations_path(), generation)
         try:
-            index_file = os.path.join(self.index_path, "faiss.index")
-            metadata_file = os.path.join(self.index_path, "metadata.pkl")
+            os.makedirs(directory)
             
-            faiss.write_index(self.index, index_file)
+            faiss.write_index(self.index, os.path.join(directory, "faiss.index"))
+            write_metadata(directory, self.metadata)
+            np.save(os.path.join(directory, "deleted_ids.npy"), np.array(sorted(self._deleted), dtype=np.int64))
+            with open(os.path.join(directory, "index_config.json"), "w") as f:
+                json.dump({"index_type": self.index_type, "config": asdict(self.index_config)}, f)
             
-            with open(metadata_file, "wb") as f:
-                pickle.dump(self.metadata, f)
+            current_file = os.path.join(self.index_path, CURRENT_FILE)
+            with open(f"{current_file}.tmp", "w") as f:
+                f.write(generation)
+            os.replace(f"{current_file}.tmp", current_file)
+            self._prune_generations(generation)
             
-            logger.info(f"Saved index and metadata to {self.index_path}")
+            logger.info(f"Saved index and metadata to {directory}")
             return True
             
         except Exception as e:
             logger.error(f"Save error: {str(e)}")
+            if self._current_path() != directory:
+                shutil.rmtree(directory, ignore_errors=True)
             return False
     
-    def load(self) -> bool:
+    def load(self, mmap: bool = True) -> bool:
         """
         Load index and metadata from disk
         
+        Reads the generation CURRENT points at (or the flat layout of
+        stores saved before generations existed). With mmap the index
+        vectors and the metadata stay in the files' page cache (shared by
+        all processes) and rows are decoded on access. The index is copied
+        into memory the first time it is modified. Stores saved as
+        metadata.pkl are still readable.
+        
+        Args:
+            mmap: Memory-map the files instead of reading private copies
+            
         Returns:
             Success status
         """
         try:
-            index_file = os.path.join(self.index_path, "faiss.index")
-            metadata_file = os.path.join(self.index_path, "metadata.pkl")
+            directory = self._current_path()
+            index_file = os.path.join(directory, "faiss.index")
+            metadata_file = os.path.join(directory, "metadata.pkl")
+            has_mapped_metadata = metadata_exists(directory)
             
-            if not os.path.exists(index_file) or not os.path.exists(metadata_file):
+            if not os.path.exists(index_file) or not (has_mapped_metadata or os.path.exists(metadata_file)):
                 logger.warning("Index files not found")
                 return False
             
-            self.index = faiss.read_index(index_file)
+            start = time.perf_counter()
+            if mmap:
+                self.index = faiss.read_index(index_file, faiss.IO_FLAG_MMAP_IFC)
+            else:
+                self.index = faiss.read_index(index_file)
+            self._mapped = mmap
+            
+            if has_mapped_metadata:
+                self.metadata = MappedMetadata(directory)
+                if not mmap:
+                    self.metadata = list(self.metadata)
+            else:
+                with open(metadata_file, "rb") as f:
+                    self.metadata = pickle.load(f)
+            
+            config_file = os.path.join(directory, "index_config.json")
+            if os.path.exists(config_file):
+                with open(config_file) as f:
+                    saved = json.load(f)
+                self.index_config = FAISSIndexConfig(**saved["config"])
+                self.index_type = saved["index_type"]
+            else:
+                # Indexes saved before index options existed are flat
+                self.index_type = "flat"
             
-            with open(metadata_file, "rb") as f:
-                self.metadata = pickle.load(f)
+            deleted_file = os.path.join(directory, "deleted_ids.npy")
+            self._deleted = set(np.load(deleted_file).tolist()) if os.path.exists(deleted_file) else set()
             
-            self.text_count = len(self.metadata)
-            logger.info(f"Loaded index with {self.text_count} texts")
+            self.text_count = len(self.metadata) - len(self._deleted)
+            self._rebuild_category_ids()
+            logger.info(
+                f"Loaded index with {self.text_count} texts in {time.perf_counter() - start:.3f}s"
+                f"{' (memory-mapped)' if mmap else ''}"
+            )
             return True
             
         except Exception as e:
@@ -256,13 +740,18 @@ class FAISSVectorStore:
             return False
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get vector store statistics"""
+        """Get vector store statistics (index_size_mb is the saved index file)"""
+        index_file = os.path.join(self._current_path(), "faiss.index")
         return {
             "text_count": self.text_count,
             "dimension": self.dimension,
-            "index_type": "IndexFlatL2",
-            "category_count": len(set(m.get("category") for m in self.metadata)),
-            "index_size_mb": self.index.total_memory_allocated() / (1024 * 1024) if self.index else 0,
+            "index_type": type(self.index).__name__ if self.index else None,
+            "index_kind": self.index_type,
+            "nprobe": self.index_config.nprobe if self.index_type in ("ivf_flat", "ivf_pq") else None,
+            "ef_search": self.index_config.ef_search if self.index_type == "hnsw" else None,
+            "category_count": len(self._category_ids),
+            "memory_mapped": self._mapped,
+            "index_size_mb": os.path.getsize(index_file) / (1024 * 1024) if os.path.exists(index_file) else 0,
         }
 
 
@@ -270,4 +759,8 @@ class FAISSVectorStore:
 def create_faiss_vector_store(embedding_service: Optional[EmbeddingService] = None) -> FAISSVectorStore:
     """Create FAISS vector store from environment variables"""
     index_path = os.getenv("FAISS_INDEX_PATH", "./vector_store")
-    return FAISSVectorStore(embedding_service=embedding_service, index_path=index_path)
+    return FAISSVectorStore(
+        embedding_service=embedding_service,
+        index_path=index_path,
+        index_config=FAISSIndexConfig.from_env(),
+    )
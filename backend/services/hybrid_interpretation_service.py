@@ -4,6 +4,7 @@ Orchestrates 3-tier fallback strategy for interpretations
 """
 
 import os
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -90,7 +91,40 @@ class HybridInterpretationService:
             result = self._strategy_template(chart_data, interpretation_type)
             self.template_count += 1
         
-        # Add metadata
+        return self._record(result, interpretation_type, strategy, start_time)
+    
+    async def ainterpret(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        strategy: str = "auto",
+        context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate interpretation from async code
+        
+        The LLM strategy awaits the pooled async client; the CPU-bound
+        KB and template strategies run in a worker thread.
+        Same arguments and result as interpret.
+        """
+        if strategy == "auto":
+            strategy = self._select_strategy()
+        if strategy != "llm":
+            return await asyncio.to_thread(self.interpret, chart_data, interpretation_type, strategy, context)
+        
+        start_time = datetime.now()
+        result = await self._astrategy_llm(chart_data, interpretation_type, context)
+        self.llm_count += 1
+        return self._record(result, interpretation_type, strategy, start_time)
+    
+    def _record(
+        self,
+        result: Dict[str, Any],
+        interpretation_type: str,
+        strategy: str,
+        start_time: datetime,
+    ) -> Dict[str, Any]:
+        """Attach timing metadata and log the strategy selection"""
         elapsed = (datetime.now() - start_time).total_seconds()
         result["execution_time"] = elapsed
         result["strategy_used"] = strategy
@@ -156,26 +190,51 @@ class HybridInterpretationService:
                 interpretation_type,
                 context,
             )
+            return self._llm_result(result, interpretation_type)
             
-            if result.get("error"):
-                logger.warning(f"LLM error: {result['error']}")
-                return result
+        except Exception as e:
+            logger.error(f"LLM strategy error: {str(e)}")
+            return {"error": f"LLM error: {str(e)}"}
+    
+    async def _astrategy_llm(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """LLM strategy through the async client"""
+        try:
+            if not self.llm_service:
+                return {"error": "LLM service not available"}
             
-            return {
-                "interpretation": result.get("interpretation", ""),
-                "type": interpretation_type,
-                "quality": 0.85,
-                "source": "perplexity_llm",
-                "cost": result.get("cost", 0.0),
-                "tokens": result.get("tokens", {}),
-                "budget": result.get("budget", {}),
-                "model": "sonar-small",
-            }
+            result = await self.llm_service.agenerate_interpretation(
+                chart_data,
+                interpretation_type,
+                context,
+            )
+            return self._llm_result(result, interpretation_type)
             
         except Exception as e:
             logger.error(f"LLM strategy error: {str(e)}")
             return {"error": f"LLM error: {str(e)}"}
     
+    def _llm_result(self, result: Dict[str, Any], interpretation_type: str) -> Dict[str, Any]:
+        """Map an LLM service result to the hybrid result format"""
+        if result.get("error"):
+            logger.warning(f"LLM error: {result['error']}")
+            return result
+        
+        return {
+            "interpretation": result.get("interpretation", ""),
+            "type": interpretation_type,
+            "quality": 0.85,
+            "source": "perplexity_llm",
+            "cost": result.get("cost", 0.0),
+            "tokens": result.get("tokens", {}),
+            "budget": result.get("budget", {}),
+            "model": "sonar-small",
+        }
+    
     def _strategy_kb(
         self,
         chart_data: Dict[str, Any],
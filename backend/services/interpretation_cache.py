@@ -0,0 +1,436 @@
+"""
+Interpretation Cache
+Redis cache for LLM interpretations, keyed on normalized chart features
+
+Tiers:
+- Exact: the placements of every body in the chart, normalized to
+  sign / house / nakshatra / pada (degrees finer than a pada are dropped),
+  plus the interpretation type and the normalized context text
+- Semantic: entries for the same placements whose context embedding is
+  within similarity_threshold of the requested context (near-duplicate
+  wording), when an EmbeddingService is configured
+
+Freshness:
+- Entries are fresh for ttl seconds and kept stale_ttl seconds longer
+- A stale entry of a hot key (hot_hits or more hits) is still served and
+  reported as needing a refresh; one caller across workers wins the
+  refresh lock. Stale entries of cold keys count as misses
+
+Invalidation works by tag (type, sun sign, chart features and caller
+supplied tags) and by SCAN over the key prefix, never KEYS.
+
+Redis layout (all under KEY_PREFIX); every key expires, the entry
+lifetime (ttl + stale_ttl) being re-applied on each write:
+- <key>: JSON {"result": ..., "cached_at": epoch seconds}
+- hits:<key>: hit counter
+- lock:<key>: refresh lock
+- ctx:<feature hash>: hash of entry key -> float32 context embedding
+- ctxage:<feature hash>: sorted set of the same entry keys by store time;
+  beyond max_contexts the oldest contexts are evicted
+- tag:<tag>: sorted set of entry keys scored by their expiry time; members
+  whose entries have expired are pruned on every write to the tag
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.calculations.kp_engine import NAKSHATRA_LENGTH, NAKSHATRA_NAMES, SIGN_LENGTH
+
+logger = logging.getLogger(__name__)
+
+SIGNS = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces",
+)
+_SIGN_PREFIXES = {sign[:3].lower(): sign for sign in SIGNS}
+
+# Top-level chart_data keys read as placements (besides planet_positions)
+BODY_KEYS = (
+    "sun", "moon", "ascendant", "midheaven", "mercury", "venus", "mars",
+    "jupiter", "saturn", "rahu", "ketu", "uranus", "neptune", "pluto",
+)
+
+PADA_LENGTH = NAKSHATRA_LENGTH / 4
+
+# Keys per SCAN / SSCAN page and per DEL call
+DELETE_BATCH = 500
+
+# (lookup result or None, state) where state is one of "fresh", "semantic",
+# "stale" (past ttl, another caller is refreshing it), "refresh" (past ttl,
+# this caller holds the refresh lock) or "miss"
+CacheLookup = Tuple[Optional[Dict[str, Any]], str]
+
+
+# ==================== FEATURE KEYS ====================
+
+def normalize_sign(value: Any) -> Optional[str]:
+    """Canonical sign name from a name or 3-letter prefix (None if unknown)."""
+    if not isinstance(value, str):
+        return None
+    for token in re.findall(r"[a-z]{3,}", value.lower()):
+        sign = _SIGN_PREFIXES.get(token[:3])
+        if sign and sign.lower().startswith(token):
+            return sign
+    return None
+
+
+def normalize_context(context: Optional[str]) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(re.findall(r"[a-z0-9]+", (context or "").lower()))
+
+
+def _placement(value: Any) -> Dict[str, Any]:
+    """Normalize one placement (sign string or position dict) to its feature buckets."""
+    features: Dict[str, Any] = {}
+    longitude = None
+
+    if isinstance(value, str):
+        features["sign"] = normalize_sign(value)
+        degrees = re.search(r"(\d+(?:\.\d+)?)", value)
+        if features["sign"] and degrees and float(degrees.group(1)) < SIGN_LENGTH:
+            longitude = SIGNS.index(features["sign"]) * SIGN_LENGTH + float(degrees.group(1))
+    elif isinstance(value, dict):
+        features["sign"] = normalize_sign(value.get("sign")) or normalize_sign(value.get("zodiac_sign"))
+        if isinstance(value.get("longitude"), (int, float)):
+            longitude = float(value["longitude"]) % 360
+        elif features["sign"] and isinstance(value.get("zodiac_degree"), (int, float)):
+            longitude = SIGNS.index(features["sign"]) * SIGN_LENGTH + float(value["zodiac_degree"])
+        if value.get("house") is not None:
+            features["house"] = int(value["house"])
+        if value.get("nakshatra"):
+            features["nakshatra"] = str(value["nakshatra"]).strip().lower()
+        if value.get("pada") is not None:
+            features["pada"] = int(value["pada"])
+
+    if longitude is not None:
+        features["sign"] = features.get("sign") or SIGNS[int(longitude // SIGN_LENGTH) % 12]
+        nakshatra = int(longitude // NAKSHATRA_LENGTH) % 27
+        features.setdefault("nakshatra", NAKSHATRA_NAMES[nakshatra].lower())
+        features.setdefault("pada", int((longitude % NAKSHATRA_LENGTH) // PADA_LENGTH) + 1)
+    return features
+
+
+def chart_features(chart_data: Dict[str, Any]) -> List[str]:
+    """
+    Normalized placements of a chart.
+
+    Reads planet_positions (CalculationService output) and the top-level
+    BODY_KEYS, whose values may be sign strings ("Leo", "Leo 15°") or
+    position dicts.
+
+    Returns:
+        Sorted "body:sign:house:nakshatra:pada" strings (unknown parts empty)
+    """
+    placements: Dict[str, Dict[str, Any]] = {}
+    for position in chart_data.get("planet_positions") or ():
+        if isinstance(position, dict) and position.get("planet"):
+            placements[str(position["planet"]).lower()] = _placement(position)
+    for body in BODY_KEYS:
+        value = chart_data.get(body)
+        if value and body not in placements:
+            placements[body] = _placement(value)
+
+    return sorted(
+        ":".join([body] + [
+            "" if features.get(part) is None else str(features[part])
+            for part in ("sign", "house", "nakshatra", "pada")
+        ])
+        for body, features in placements.items()
+    )
+
+
+def feature_hash(chart_data: Dict[str, Any], interpretation_type: str) -> str:
+    """Hash of the chart placements and interpretation type (context excluded)."""
+    key_data = {"type": interpretation_type.strip().lower(), "placements": chart_features(chart_data)}
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+# ==================== CACHE ====================
+
+class InterpretationCache:
+    """
+    Feature-keyed interpretation cache with a semantic context tier.
+
+    Example:
+        >>> cache = InterpretationCache(redis.from_url(url), embedding_service)
+        >>> result, state = cache.get(chart_data, "sun", "career focus")
+        >>> if result is None:
+        ...     cache.set(chart_data, "sun", "career focus", generate())
+    """
+
+    KEY_PREFIX = "interp:v3:"
+
+    def __init__(
+        self,
+        redis_client: Any,
+        embedding_service: Any = None,
+        ttl: int = 2592000,
+        stale_ttl: int = 604800,
+        similarity_threshold: float = 0.92,
+        hot_hits: int = 3,
+        max_contexts: int = 64,
+        refresh_lock_seconds: int = 120,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Redis client (redis-py API)
+            embedding_service: EmbeddingService for the semantic tier (None = exact only)
+            ttl: Seconds an entry is fresh (default 30 days)
+            stale_ttl: Extra seconds a hot entry may be served stale (default 7 days)
+            similarity_threshold: Minimum cosine similarity of contexts for a semantic hit
+            hot_hits: Hits after which an entry is served stale while refreshing
+            max_contexts: Context embeddings kept per chart for the semantic tier
+            refresh_lock_seconds: Expiry of the cross-worker refresh lock
+        """
+        self.redis = redis_client
+        self.embedding_service = embedding_service
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.similarity_threshold = similarity_threshold
+        self.hot_hits = hot_hits
+        self.max_contexts = max_contexts
+        self.refresh_lock_seconds = refresh_lock_seconds
+        self.reset_stats()
+
+    def key_for(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str] = None,
+    ) -> str:
+        """Exact-tier Redis key."""
+        features = feature_hash(chart_data, interpretation_type)
+        digest = hashlib.sha256(f"{features}|{normalize_context(context)}".encode()).hexdigest()
+        return f"{self.KEY_PREFIX}{digest}"
+
+    # ==================== LOOKUP ====================
+
+    def get(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str] = None,
+    ) -> CacheLookup:
+        """
+        Look up an interpretation.
+
+        Returns:
+            (result, state); on "refresh" the caller should regenerate the
+            result in the background and set() it
+        """
+        key = self.key_for(chart_data, interpretation_type, context)
+        result, state = self._get_entry(key)
+        if result is None and normalize_context(context) and self.embedding_service is not None:
+            features = feature_hash(chart_data, interpretation_type)
+            similar = self._find_similar(features, context)
+            if similar is not None:
+                result, state = self._get_entry(similar)
+                if result is None:
+                    # Entry expired or was invalidated
+                    self.redis.hdel(f"{self.KEY_PREFIX}ctx:{features}", similar)
+                    self.redis.zrem(f"{self.KEY_PREFIX}ctxage:{features}", similar)
+                elif state == "fresh":
+                    state = "semantic"
+
+        if state == "fresh":
+            self.hits += 1
+        elif state == "semantic":
+            self.semantic_hits += 1
+        elif state in ("stale", "refresh"):
+            self.stale_served += 1
+        else:
+            self.misses += 1
+        return result, state
+
+    def _get_entry(self, key: str) -> CacheLookup:
+        raw = self.redis.get(key)
+        if raw is None:
+            return None, "miss"
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            return None, "miss"
+
+        hits_key = f"{self.KEY_PREFIX}hits:{key}"
+        hits = self.redis.incr(hits_key)
+        self.redis.expire(hits_key, self.ttl + self.stale_ttl)
+        if time.time() - entry.get("cached_at", 0) <= self.ttl:
+            return entry["result"], "fresh"
+        if hits < self.hot_hits:
+            return None, "miss"
+        # Hot and stale: serve it; only the lock holder is asked to refresh
+        locked = self.redis.set(f"{self.KEY_PREFIX}lock:{key}", 1, nx=True, ex=self.refresh_lock_seconds)
+        return entry["result"], "refresh" if locked else "stale"
+
+    def _find_similar(self, features: str, context: Optional[str]) -> Optional[str]:
+        """Entry key of the most similar cached context for the same chart, if close enough."""
+        stored = self.redis.hgetall(f"{self.KEY_PREFIX}ctx:{features}")
+        if not stored:
+            return None
+        keys = [k.decode() if isinstance(k, bytes) else k for k in stored]
+        vectors = np.stack([np.frombuffer(v, dtype=np.float32) for v in stored.values()])
+        query = self._embed(context)
+        similarities = vectors @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return keys[best]
+
+    def _embed(self, context: Optional[str]) -> np.ndarray:
+        vector = np.asarray(self.embedding_service.encode_single(normalize_context(context)), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    # ==================== STORE ====================
+
+    def set(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str],
+        result: Dict[str, Any],
+        tags: Sequence[str] = (),
+    ) -> bool:
+        """
+        Store an interpretation.
+
+        Args:
+            chart_data: Chart the result was generated for
+            interpretation_type: Interpretation type
+            context: Context text
+            result: JSON-serializable result
+            tags: Extra invalidation tags
+
+        Returns:
+            Success status
+        """
+        key = self.key_for(chart_data, interpretation_type, context)
+        features = feature_hash(chart_data, interpretation_type)
+        expiry = self.ttl + self.stale_ttl
+        now = time.time()
+        try:
+            self.redis.set(key, json.dumps({"result": result, "cached_at": now}), ex=expiry)
+            self.redis.set(f"{self.KEY_PREFIX}hits:{key}", 0, ex=expiry)
+            self.redis.delete(f"{self.KEY_PREFIX}lock:{key}")
+
+            if normalize_context(context) and self.embedding_service is not None:
+                self._store_context(features, key, context, now, expiry)
+
+            for tag in self.default_tags(chart_data, interpretation_type) + list(tags):
+                tag_key = f"{self.KEY_PREFIX}tag:{tag}"
+                self.redis.zadd(tag_key, {key: now + expiry})
+                self.redis.zremrangebyscore(tag_key, "-inf", now)
+                self.redis.expire(tag_key, expiry)
+            return True
+        except Exception as e:
+            logger.warning(f"Cache storage error: {str(e)}")
+            return False
+
+    def _store_context(self, features: str, key: str, context: str, now: float, expiry: int) -> None:
+        """Add a context embedding for the semantic tier, evicting the oldest beyond max_contexts."""
+        group = f"{self.KEY_PREFIX}ctx:{features}"
+        ages = f"{self.KEY_PREFIX}ctxage:{features}"
+        self.redis.hset(group, key, self._embed(context).tobytes())
+        self.redis.zadd(ages, {key: now})
+        excess = self.redis.zcard(ages) - self.max_contexts
+        if excess > 0:
+            evicted = [
+                member.decode() if isinstance(member, bytes) else member
+                for member, _ in self.redis.zpopmin(ages, excess)
+            ]
+            self.redis.hdel(group, *evicted)
+        self.redis.expire(group, expiry)
+        self.redis.expire(ages, expiry)
+
+    @staticmethod
+    def default_tags(chart_data: Dict[str, Any], interpretation_type: str) -> List[str]:
+        """Tags every entry gets: type, sun sign and chart features."""
+        tags = [f"type:{interpretation_type.strip().lower()}", f"chart:{feature_hash(chart_data, '')}"]
+        sun = _placement(chart_data.get("sun")).get("sign") if chart_data.get("sun") else None
+        if sun:
+            tags.append(f"sun:{sun.lower()}")
+        return tags
+
+    # ==================== INVALIDATION ====================
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Delete every entry carrying any of the tags.
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        for tag in tags:
+            tag_key = f"{self.KEY_PREFIX}tag:{tag}"
+            keys = [
+                member.decode() if isinstance(member, bytes) else member
+                for member, _ in self.redis.zscan_iter(tag_key, count=DELETE_BATCH)
+            ]
+            for start in range(0, len(keys), DELETE_BATCH):
+                batch = keys[start:start + DELETE_BATCH]
+                deleted += self.redis.delete(*batch)
+                self.redis.delete(*[
+                    f"{self.KEY_PREFIX}{kind}:{key}" for key in batch for kind in ("hits", "lock")
+                ])
+            self.redis.delete(tag_key)
+        return deleted
+
+    def clear(self, pattern: Optional[str] = None) -> int:
+        """
+        Delete keys matching a pattern (default: everything under KEY_PREFIX) via SCAN.
+
+        Returns:
+            Number of keys deleted
+        """
+        pattern = pattern or f"{self.KEY_PREFIX}*"
+        return self._delete_batches(self.redis.scan_iter(match=pattern, count=DELETE_BATCH))
+
+    def _delete_batches(self, keys: Iterable[Any]) -> int:
+        deleted = 0
+        batch: List[Any] = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) >= DELETE_BATCH:
+                deleted += self.redis.delete(*batch)
+                batch = []
+        if batch:
+            deleted += self.redis.delete(*batch)
+        return deleted
+
+    # ==================== METRICS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with per-tier hit counters and the overall hit rate
+        """
+        total_hits = self.hits + self.semantic_hits + self.stale_served
+        total_requests = total_hits + self.misses
+        return {
+            "cache_hits": total_hits,
+            "exact_hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "stale_served": self.stale_served,
+            "cache_misses": self.misses,
+            "total_requests": total_requests,
+            "hit_rate_percentage": (total_hits / total_requests * 100) if total_requests else 0,
+            "semantic_enabled": self.embedding_service is not None,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self.hits = 0
+        self.semantic_hits = 0
+        self.stale_served = 0
+        self.misses = 0
@@ -0,0 +1,384 @@
+"""
+Knowledge Base Ingestion
+Keeps the FAISS vector store in sync with knowledge_base/texts
+
+Run after adding or editing books:
+    python -m backend.services.knowledge_ingest --kb-path knowledge_base
+
+Pipeline:
+- Category directories (NN_name) are walked lazily and each text file is
+  chunked by a generator, so a book is never held in memory whole
+- Files whose size and mtime match the manifest of the last run are skipped
+  without being read
+- A changed file is re-chunked and diffed against its indexed chunks by
+  content_hash: unchanged chunks keep their vectors, stale ones are removed
+  by id and only new chunks are embedded
+- Chunks of files that disappeared are removed
+- The store is saved (and the manifest written) every checkpoint_every
+  embedded chunks, so an interrupted run resumes where it stopped
+
+The vector store metadata is the source of truth for what is indexed;
+the manifest only lets unchanged files be skipped cheaply.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from backend.services.faiss_vector_store import FAISSVectorStore, create_faiss_vector_store
+from backend.services.knowledge_service import TextChunk
+from backend.services.vector_metadata import MappedMetadata
+
+logger = logging.getLogger(__name__)
+
+TEXT_SUFFIXES = (".md", ".txt")
+MANIFEST_FILE = "ingest_manifest.json"
+MANIFEST_VERSION = 1
+
+
+# ==================== CHUNKING ====================
+
+def iter_source_files(texts_path: Path) -> Iterator[Tuple[str, Path]]:
+    """
+    Walk the category directories of a knowledge base.
+
+    Yields:
+        (category, path) for each text file, in sorted order
+    """
+    if not texts_path.exists():
+        return
+    for cat_dir in sorted(texts_path.glob("[0-9][0-9]_*")):
+        if not cat_dir.is_dir():
+            continue
+        for file_path in sorted(cat_dir.rglob("*")):
+            if file_path.is_file() and file_path.suffix.lower() in TEXT_SUFFIXES:
+                yield cat_dir.name, file_path
+
+
+def _iter_paragraphs(path: Path) -> Iterator[str]:
+    """Blank-line separated paragraphs of a file, whitespace-normalized."""
+    lines: List[str] = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                lines.append(line)
+            elif lines:
+                yield " ".join(lines)
+                lines = []
+    if lines:
+        yield " ".join(lines)
+
+
+def _split_long(paragraph: str, chunk_size: int) -> Iterator[str]:
+    """Split a paragraph longer than chunk_size at word boundaries."""
+    while len(paragraph) > chunk_size:
+        cut = paragraph.rfind(" ", 0, chunk_size + 1)
+        if cut <= 0:
+            cut = chunk_size
+        yield paragraph[:cut].strip()
+        paragraph = paragraph[cut:].strip()
+    if paragraph:
+        yield paragraph
+
+
+def iter_chunks(path: Path, category: str, source: str, chunk_size: int = 512) -> Iterator[TextChunk]:
+    """
+    Chunk one text file.
+
+    Paragraphs are packed into chunks of up to chunk_size characters;
+    longer paragraphs are split. Editing a paragraph therefore only changes
+    the chunks around it.
+
+    Args:
+        path: Text file
+        category: Category directory name
+        source: Source name stored in the metadata ("<category>/<file>")
+        chunk_size: Maximum characters per chunk
+
+    Yields:
+        TextChunk per chunk, in file order
+    """
+    index = 0
+    parts: List[str] = []
+    size = 0
+    for paragraph in _iter_paragraphs(path):
+        for piece in _split_long(paragraph, chunk_size):
+            if parts and size + 2 + len(piece) > chunk_size:
+                yield TextChunk("\n\n".join(parts), source, category, index)
+                index += 1
+                parts, size = [], 0
+            size += len(piece) + (2 if parts else 0)
+            parts.append(piece)
+    if parts:
+        yield TextChunk("\n\n".join(parts), source, category, index)
+
+
+# ==================== MANIFEST ====================
+
+def _file_signature(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_manifest(index_path: str, chunk_size: int) -> Dict[str, List[int]]:
+    """
+    Read the file signatures recorded by the last run.
+
+    Returns:
+        source -> [mtime_ns, size]; empty if missing, unreadable or written
+        with another chunk size
+    """
+    try:
+        with open(os.path.join(index_path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("chunk_size") != chunk_size:
+        return {}
+    return manifest.get("files", {})
+
+
+def write_manifest(index_path: str, chunk_size: int, files: Dict[str, List[int]]) -> None:
+    """Atomically replace the manifest."""
+    path = os.path.join(index_path, MANIFEST_FILE)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "chunk_size": chunk_size, "files": files}, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def indexed_sources(store: FAISSVectorStore) -> Dict[str, np.ndarray]:
+    """
+    Group the live vector ids of a store by metadata source.
+
+    Mapped metadata is grouped through its dictionary column without
+    decoding rows.
+
+    Returns:
+        source -> int64 ids
+    """
+    live = store.live_ids()
+    encoded = None
+    if isinstance(store.metadata, MappedMetadata):
+        encoded = store.metadata.column_codes("source")
+    if encoded is None:
+        sources = [store.metadata[int(i)].get("source") for i in live]
+        values = list(dict.fromkeys(sources))
+        lookup = {value: code for code, value in enumerate(values)}
+        codes = np.array([lookup[s] for s in sources], dtype=np.int32)
+    else:
+        values, codes = encoded
+        codes = codes[live]
+
+    groups: Dict[str, np.ndarray] = {}
+    order = np.argsort(codes, kind="stable")
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    for positions in np.split(order, boundaries) if len(order) else []:
+        code = codes[positions[0]]
+        if code >= 0 and values[code] is not None:
+            groups[values[code]] = live[positions]
+    return groups
+
+
+# ==================== INGESTION ====================
+
+@dataclass
+class IngestStats:
+    """Totals for one ingestion run."""
+    files_scanned: int = 0
+    files_skipped: int = 0
+    files_changed: int = 0
+    files_removed: int = 0
+    chunks_added: int = 0
+    chunks_removed: int = 0
+    chunks_unchanged: int = 0
+    checkpoints: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files_scanned": self.files_scanned,
+            "files_skipped": self.files_skipped,
+            "files_changed": self.files_changed,
+            "files_removed": self.files_removed,
+            "chunks_added": self.chunks_added,
+            "chunks_removed": self.chunks_removed,
+            "chunks_unchanged": self.chunks_unchanged,
+            "checkpoints": self.checkpoints,
+            "elapsed_seconds": round(time.perf_counter() - self.started, 3),
+        }
+
+
+class KnowledgeIngestor:
+    """
+    Incrementally indexes knowledge base texts into a FAISSVectorStore.
+
+    Example:
+        >>> ingestor = KnowledgeIngestor("knowledge_base", create_faiss_vector_store())
+        >>> ingestor.run()
+        {'files_scanned': 120, 'files_skipped': 119, 'chunks_added': 3, ...}
+    """
+
+    def __init__(
+        self,
+        kb_path: str,
+        vector_store: FAISSVectorStore,
+        chunk_size: int = 512,
+        batch_size: int = 256,
+        checkpoint_every: int = 5000,
+    ):
+        """
+        Initialize the ingestor.
+
+        Args:
+            kb_path: Knowledge base root (texts are under <kb_path>/texts)
+            vector_store: Store to update (loaded from its index_path if saved)
+            chunk_size: Maximum characters per chunk
+            batch_size: Chunks embedded and added per add_texts call
+            checkpoint_every: Embedded chunks between saves
+        """
+        self.texts_path = Path(kb_path) / "texts"
+        self.store = vector_store
+        self.chunk_size = chunk_size
+        self.batch_size = max(1, batch_size)
+        self.checkpoint_every = max(1, checkpoint_every)
+
+    def run(self, full: bool = False, compact: bool = False) -> Dict[str, Any]:
+        """
+        Bring the store up to date with the texts on disk.
+
+        Args:
+            full: Re-chunk every file instead of trusting the manifest
+                (unchanged chunks are still not re-embedded)
+            compact: Rebuild the index afterwards to drop removed vectors
+
+        Returns:
+            IngestStats.to_dict()
+        """
+        stats = IngestStats()
+        if self.store.index is None:
+            self.store.load()
+
+        manifest = {} if full else load_manifest(self.store.index_path, self.chunk_size)
+        indexed = indexed_sources(self.store)
+        done: Dict[str, List[int]] = {}
+        pending: List[TextChunk] = []
+        stale: List[int] = []
+        since_checkpoint = 0
+
+        for category, path in iter_source_files(self.texts_path):
+            source = path.relative_to(self.texts_path).as_posix()
+            signature = _file_signature(path)
+            stats.files_scanned += 1
+            ids = indexed.pop(source, None)
+
+            if manifest.get(source) == signature and ids is not None:
+                stats.files_skipped += 1
+                done[source] = signature
+                continue
+
+            new_chunks, removed, unchanged = self._diff_file(path, category, source, ids)
+            if new_chunks or removed:
+                stats.files_changed += 1
+            stats.chunks_unchanged += unchanged
+            pending.extend(new_chunks)
+            stale.extend(removed)
+            done[source] = signature
+
+            if len(pending) >= self.batch_size:
+                since_checkpoint += self._apply(pending, stale, stats)
+                pending, stale = [], []
+            if since_checkpoint >= self.checkpoint_every:
+                self._checkpoint(done, stats)
+                since_checkpoint = 0
+
+        # Sources left over no longer exist on disk
+        for ids in indexed.values():
+            stale.extend(ids.tolist())
+            stats.files_removed += 1
+
+        self._apply(pending, stale, stats)
+        if compact and self.store._deleted and self.store.text_count:
+            self.store.rebuild_index()
+        if self.store.index is not None:
+            self._checkpoint(done, stats)
+
+        result = stats.to_dict()
+        logger.info(f"Knowledge ingestion finished: {result}")
+        return result
+
+    def _diff_file(
+        self,
+        path: Path,
+        category: str,
+        source: str,
+        ids: Optional[np.ndarray],
+    ) -> Tuple[List[TextChunk], List[int], int]:
+        """
+        Compare a file's chunks with its indexed vectors by content_hash.
+
+        Returns:
+            (chunks to embed, ids to remove, number of unchanged chunks)
+        """
+        existing: Dict[str, List[int]] = {}
+        for i in ids if ids is not None else ():
+            existing.setdefault(self.store.metadata[int(i)].get("content_hash"), []).append(int(i))
+
+        new_chunks = []
+        unchanged = 0
+        for chunk in iter_chunks(path, category, source, self.chunk_size):
+            kept = existing.get(chunk.content_hash)
+            if kept:
+                kept.pop()
+                unchanged += 1
+            else:
+                new_chunks.append(chunk)
+        removed = [i for remaining in existing.values() for i in remaining]
+        return new_chunks, removed, unchanged
+
+    def _apply(self, chunks: List[TextChunk], stale: List[int], stats: IngestStats) -> int:
+        """Remove stale ids and embed new chunks; returns chunks added."""
+        if stale:
+            stats.chunks_removed += self.store.remove_ids(stale)
+        for start in range(0, len(chunks), self.batch_size):
+            batch = chunks[start:start + self.batch_size]
+            self.store.add_texts(
+                [c.content for c in batch],
+                [{"category": c.category, "source": c.source_file, "content": c.content} for c in batch],
+            )
+        stats.chunks_added += len(chunks)
+        return len(chunks)
+
+    def _checkpoint(self, done: Dict[str, List[int]], stats: IngestStats) -> None:
+        """Save the store, then record the files it now reflects."""
+        if self.store.save():
+            write_manifest(self.store.index_path, self.chunk_size, done)
+            stats.checkpoints += 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Incrementally index knowledge base texts")
+    parser.add_argument('--kb-path', default="knowledge_base", help="Knowledge base root")
+    parser.add_argument('--index-path', help="Vector store directory (default: FAISS_INDEX_PATH)")
+    parser.add_argument('--chunk-size', type=int, default=512, help="Maximum characters per chunk")
+    parser.add_argument('--batch-size', type=int, default=256, help="Chunks per embedding batch")
+    parser.add_argument('--checkpoint-every', type=int, default=5000, help="Embedded chunks between saves")
+    parser.add_argument('--full', action='store_true', help="Re-chunk every file, ignoring the manifest")
+    parser.add_argument('--compact', action='store_true', help="Rebuild the index to drop removed vectors")
+    args = parser.parse_args()
+    if args.index_path:
+        os.environ["FAISS_INDEX_PATH"] = args.index_path
+
+    logging.basicConfig(level=logging.INFO)
+    ingestor = KnowledgeIngestor(
+        args.kb_path, create_faiss_vector_store(),
+        chunk_size=args.chunk_size, batch_size=args.batch_size, checkpoint_every=args.checkpoint_every,
+    )
+    print(json.dumps(ingestor.run(full=args.full, compact=args.compact)))
@@ -0,0 +1,277 @@
+"""
+Async Perplexity HTTP Client
+Pooled, non-blocking transport for PerplexityLLMService
+
+- One httpx.AsyncClient per service: connections are kept alive and reused
+  (bounded by max_connections / max_keepalive_connections)
+- A semaphore caps requests in flight upstream; callers over the cap wait
+  without blocking the event loop
+- Rate limits (429) and transient 5xx/timeouts back off with asyncio.sleep,
+  honouring Retry-After when the API sends it
+- Concurrent calls with an identical payload share one upstream request
+- Upstream latency and queue wait are recorded in fixed-bucket histograms
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (Prometheus-style cumulative export)."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.reset()
+
+    def observe(self, seconds: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if empty)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative: List[int] = []
+        seen = 0
+        for count in self.counts:
+            seen += count
+            cumulative.append(seen)
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 6),
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+            "p50_le_seconds": self.quantile(0.5),
+            "p95_le_seconds": self.quantile(0.95),
+            "p99_le_seconds": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): cumulative[i] for i, bound in enumerate(self.buckets)},
+                "+Inf": cumulative[-1],
+            },
+        }
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+def payload_key(payload: Dict[str, Any]) -> str:
+    """Coalescing key of a request payload."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class AsyncPerplexityClient:
+    """
+    Async chat-completions client with pooling, backoff and coalescing.
+
+    The underlying httpx.AsyncClient is created on first use, inside the
+    running event loop, and released by aclose().
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.perplexity.ai",
+        timeout: float = 30.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        max_concurrency: int = 8,
+        retries: int = 3,
+        backoff_base: float = 1.0,
+        max_backoff: float = 20.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: Perplexity API key
+            base_url: API root
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle connections kept open
+            max_concurrency: Upstream requests in flight at once
+            retries: Attempts per request (including the first)
+            backoff_base: First backoff delay in seconds (doubles per attempt)
+            max_backoff: Cap on any single backoff delay, including Retry-After
+            transport: httpx transport override (e.g. a local mock server app)
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self.retries = max(1, retries)
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self.latency = LatencyHistogram()
+        self.queue_wait = LatencyHistogram()
+        self.reset_stats()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=self.transport,
+            )
+        return self._client
+
+    async def chat(self, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        POST /chat/completions, sharing the call with identical in-flight payloads.
+
+        Args:
+            payload: Request body
+
+        Returns:
+            Tuple of (response JSON or {"error": ...} dict, coalesced) where
+            coalesced is True if another caller's request was reused
+        """
+        key = payload_key(payload)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # Shielded so one cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future), True
+
+        future = asyncio.ensure_future(self._request(payload))
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future), False
+
+    async def _request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request with retries; errors are returned, not raised."""
+        queued = time.perf_counter()
+        async with self._semaphore:
+            self.queue_wait.observe(time.perf_counter() - queued)
+            client = self._get_client()
+
+            for attempt in range(self.retries):
+                self.requests += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.post("/chat/completions", json=payload)
+                except httpx.TimeoutException:
+                    self.latency.observe(time.perf_counter() - start)
+                    if attempt < self.retries - 1:
+                        logger.warning(f"Timeout on attempt {attempt + 1}, retrying...")
+                        await self._backoff(attempt)
+                        continue
+                    self.errors += 1
+                    return {"error": "Request timeout after retries"}
+                except httpx.HTTPError as e:
+                    self.errors += 1
+                    return {"error": f"Request error: {str(e)}"}
+                self.latency.observe(time.perf_counter() - start)
+
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code in RETRY_STATUS_CODES and attempt < self.retries - 1:
+                    if response.status_code == 429:
+                        self.rate_limited += 1
+                    delay = await self._backoff(attempt, response.headers.get("Retry-After"))
+                    logger.warning(f"Upstream returned {response.status_code}, retried after {delay:.2f}s")
+                    continue
+
+                self.errors += 1
+                return {
+                    "error": f"API error: {response.status_code}",
+                    "status": response.status_code,
+                }
+
+        self.errors += 1
+        return {"error": "All retries exhausted"}
+
+    async def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Sleep before the next attempt without blocking the event loop."""
+        delay = self.backoff_base * (2 ** attempt)
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        delay = min(max(delay, 0.0), self.max_backoff)
+        self.retry_count += 1
+        await asyncio.sleep(delay)
+        return delay
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get client statistics.
+
+        Returns:
+            Dict with request counters and latency / queue-wait histograms
+        """
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "retries": self.retry_count,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "in_flight": len(self._in_flight),
+            "max_concurrency": self.max_concurrency,
+            "latency": self.latency.to_dict(),
+            "queue_wait": self.queue_wait.to_dict(),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters and histograms."""
+        self.requests = 0
+        self.coalesced = 0
+        self.retry_count = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.latency.reset()
+        self.queue_wait.reset()
@@ -11,6 +11,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
+from backend.services.perplexity_client import AsyncPerplexityClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +25,10 @@ class PerplexityLLMService:
     - Output: $0.0003 per 1K tokens (~$0.0000003 per token)
     - Per call estimate: ~$0.00001 (100 input + 50 output tokens)
     - Monthly capacity: 47,000+ interpretations on $5 budget
+    
+    Async callers (FastAPI endpoints) should use agenerate_interpretation,
+    which goes through a pooled AsyncPerplexityClient; the synchronous
+    generate_interpretation remains for agents and scripts.
     """
     
     MODEL = "sonar-small"
@@ -42,6 +48,9 @@ class PerplexityLLMService:
         top_p: float = 0.9,
         max_tokens: int = 1024,
         timeout: int = 30,
+        max_connections: int = 20,
+        max_concurrency: int = 8,
+        async_client: Optional[AsyncPerplexityClient] = None,
     ):
         """
         Initialize Perplexity LLM Service
@@ -53,6 +62,9 @@ class PerplexityLLMService:
             top_p: Top-p sampling parameter
             max_tokens: Maximum tokens in response
             timeout: Request timeout in seconds
+            max_connections: Async client connection pool size
+            max_concurrency: Async requests in flight upstream at once
+            async_client: Async client override (default: built on first async call)
         """
         if not api_key:
             raise ValueError("PERPLEXITY_API_KEY is required")
@@ -63,6 +75,9 @@ class PerplexityLLMService:
         self.top_p = top_p
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self._async_client = async_client
         
         # Tracking
         self.total_input_tokens = 0
@@ -114,44 +129,46 @@ class PerplexityLLMService:
                 prompt,
                 max_tokens or self.max_tokens,
             )
+            return self._build_result(response, interpretation_type, budget_status)
             
-            if response.get("error"):
-                logger.error(f"API error: {response['error']}")
-                return response
-            
-            # Extract data
-            interpretation = response.get("choices", [{}])[0].get("message", {}).get("content", "")
-            input_tokens = response.get("usage", {}).get("prompt_tokens", 0)
-            output_tokens = response.get("usage", {}).get("completion_tokens", 0)
-            
-            # Calculate cost
-            cost = self._calculate_cost(input_tokens, output_tokens)
-            
-            # Update tracking
-            self.total_input_tokens += input_tokens
-            self.total_output_tokens += output_tokens
-            self.total_cost += cost
-            self.call_count += 1
-            
-            logger.info(
-                f"Generated {interpretation_type} interpretation: "
-                f"tokens={input_tokens + output_tokens}, cost=${cost:.6f}"
-            )
-            
+        except Exception as e:
+            logger.error(f"Error generating interpretation: {str(e)}")
             return {
-                "interpretation": interpretation,
+                "error": str(e),
                 "type": interpretation_type,
-                "model": self.MODEL,
-                "cost": cost,
-                "tokens": {
-                    "input": input_tokens,
-                    "output": output_tokens,
-                    "total": input_tokens + output_tokens,
-                },
-                "budget": budget_status,
-                "quality": 0.85,  # LLM strategy quality score
-                "strategy": "llm",
+                "cost": 0.0,
+                "strategy": "llm_error",
             }
+    
+    async def agenerate_interpretation(
+        self,
+        chart_data: Dict[str, Any],
+        interpretation_type: str,
+        context: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate interpretation without blocking the event loop
+        
+        Same arguments and result as generate_interpretation. Concurrent
+        identical prompts share one upstream call, which is billed once.
+        """
+        try:
+            prompt = self._build_prompt(chart_data, interpretation_type, context)
+            
+            budget_status = self.get_budget_remaining()
+            if budget_status["cost_remaining"] <= 0:
+                logger.warning("Monthly budget exhausted")
+                return {
+                    "error": "Budget exhausted",
+                    "strategy": "budget_exhausted",
+                    "cost": 0.0,
+                }
+            
+            response, coalesced = await self.get_async_client().chat(
+                self._build_payload(prompt, max_tokens or self.max_tokens)
+            )
+            return self._build_result(response, interpretation_type, budget_status, billed=not coalesced)
             
         except Exception as e:
             logger.error(f"Error generating interpretation: {str(e)}")
@@ -162,6 +179,68 @@ class PerplexityLLMService:
                 "strategy": "llm_error",
             }
     
+    def _build_result(
+        self,
+        response: Dict[str, Any],
+        interpretation_type: str,
+        budget_status: Dict[str, Any],
+        billed: bool = True,
+    ) -> Dict[str, Any]:
+        """Turn an API response into an interpretation result and track usage"""
+        if response.get("error"):
+            logger.error(f"API error: {response['error']}")
+            return response
+        
+        # Extract data
+        interpretation = response.get("choices", [{}])[0].get("message", {}).get("content", "")
+        input_tokens = response.get("usage", {}).get("prompt_tokens", 0)
+        output_tokens = response.get("usage", {}).get("completion_tokens", 0)
+        
+        # Calculate cost (a coalesced call reuses another caller's response)
+        cost = self._calculate_cost(input_tokens, output_tokens) if billed else 0.0
+        
+        # Update tracking
+        if billed:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cost += cost
+            self.call_count += 1
+        
+        logger.info(
+            f"Generated {interpretation_type} interpretation: "
+            f"tokens={input_tokens + output_tokens}, cost=${cost:.6f}"
+        )
+        
+        return {
+            "interpretation": interpretation,
+            "type": interpretation_type,
+            "model": self.MODEL,
+            "cost": cost,
+            "tokens": {
+                "input": input_tokens,
+                "output": output_tokens,
+                "total": input_tokens + output_tokens,
+            },
+            "budget": budget_status,
+            "quality": 0.85,  # LLM strategy quality score
+            "strategy": "llm",
+        }
+    
+    def _build_payload(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Build chat-completions request body"""
+        return {
+            "model": self.MODEL,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "max_tokens": max_tokens,
+        }
+    
     def _build_prompt(
         self,
         chart_data: Dict[str, Any],
@@ -212,18 +291,7 @@ Keep the response concise but meaningful (200-400 words)."""
             "Content-Type": "application/json",
         }
         
-        payload = {
-            "model": self.MODEL,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            "temperature": self.temperature,
-            "top_p": self.top_p,
-            "max_tokens": max_tokens,
-        }
+        payload = self._build_payload(prompt, max_tokens)
         
         for attempt in range(retries):
             try:
@@ -257,6 +325,28 @@ Keep the response concise but meaningful (200-400 words)."""
         
         return {"error": "All retries exhausted"}
     
+    def get_async_client(self) -> AsyncPerplexityClient:
+        """Pooled async client (created on first use)"""
+        if self._async_client is None:
+            self._async_client = AsyncPerplexityClient(
+                api_key=self.api_key,
+                base_url=self.BASE_URL,
+                timeout=self.timeout,
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                max_concurrency=self.max_concurrency,
+            )
+        return self._async_client
+    
+    def get_client_stats(self) -> Dict[str, Any]:
+        """Async client counters and latency histograms (empty before first async call)"""
+        return self._async_client.get_stats() if self._async_client else {}
+    
+    async def aclose(self) -> None:
+        """Close the async client's pooled connections"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+    
     def _calculate_cost(
         self,
         input_tokens: int,
@@ -339,4 +429,6 @@ def create_perplexity_service() -> PerplexityLLMService:
         top_p=float(os.getenv("TOP_P", "0.9")),
         max_tokens=int(os.getenv("MAX_TOKENS", "1024")),
         timeout=int(os.getenv("TIMEOUT", "30")),
+        max_connections=int(os.getenv("PERPLEXITY_MAX_CONNECTIONS", "20")),
+        max_concurrency=int(os.getenv("PERPLEXITY_MAX_CONCURRENCY", "8")),
     )
@@ -0,0 +1,426 @@
+"""
+Persistent Calculation Result Store
+Database tier behind the calculation engines
+
+Wires the ephemeris_cache and transit_calculations tables into the
+calculation path so a cold worker can warm from the database instead of
+recomputing. Only results that cost more than a database round trip
+belong here (transit windows, ephemeris ranges): a single-instant planet
+lookup takes tens of microseconds, a store hit hundreds. Provides:
+- Read-through on exact-key hits (instant + body; chart + transit day + request key)
+- Write-through with batched bulk upserts
+- Reads on the read pool, writes on the write engine
+- A background sweeper that deletes expired rows
+- Hit/miss/write counters per table
+
+Database errors never fail a calculation: they are logged and treated as
+misses.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, or_, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.config.settings import settings
+from backend.models.database import EphemerisCache, TransitCalculation
+
+logger = logging.getLogger(__name__)
+
+EPHEMERIS_TABLE = EphemerisCache.__tablename__
+TRANSIT_TABLE = TransitCalculation.__tablename__
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Normalize to the naive-UTC datetimes stored in DateTime columns."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+@dataclass
+class TableStats:
+    """Counters for one table."""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    swept: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "swept": self.swept,
+            "errors": self.errors,
+            "hit_rate_percentage": (self.hits / lookups * 100) if lookups else 0,
+        }
+
+
+class ResultStore:
+    """
+    Read-through / write-through persistence for ephemeris and transit results.
+
+    Example:
+        >>> store = get_result_store()
+        >>> positions = store.get_positions(instant, ["Sun:LAHIRI"])
+        >>> store.put_positions([(instant, "Sun:LAHIRI", {...})])
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        read_session_factory: Optional[Callable] = None,
+        batch_size: int = 500,
+        ephemeris_ttl_seconds: Optional[int] = None,
+        transit_ttl_seconds: Optional[int] = 86400,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            session_factory: Callable returning a Session for writes and sweeps
+                (default: the write session factory)
+            read_session_factory: Callable returning a Session for lookups
+                (default: session_factory if given, else the read pool)
+            batch_size: Rows per upsert / delete statement
+            ephemeris_ttl_seconds: Ephemeris row lifetime (None = never expires)
+            transit_ttl_seconds: Default transit row lifetime (None = never expires)
+        """
+        if read_session_factory is None:
+            if session_factory is not None:
+                read_session_factory = session_factory
+            else:
+                from backend.config.database import SessionLocal
+                read_session_factory = SessionLocal
+        if session_factory is None:
+            from backend.config.database import WriteSessionLocal
+            session_factory = WriteSessionLocal
+
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.batch_size = batch_size
+        self.ephemeris_ttl_seconds = ephemeris_ttl_seconds
+        self.transit_ttl_seconds = transit_ttl_seconds
+
+        self._lock = threading.Lock()
+        self._stats = {EPHEMERIS_TABLE: TableStats(), TRANSIT_TABLE: TableStats()}
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+
+    def _count(self, table: str, **increments: int) -> None:
+        with self._lock:
+            stats = self._stats[table]
+            for name, value in increments.items():
+                setattr(stats, name, getattr(stats, name) + value)
+
+    @staticmethod
+    def _expiry(ttl_seconds: Optional[int]) -> Optional[datetime]:
+        return _utcnow() + timedelta(seconds=ttl_seconds) if ttl_seconds else None
+
+    # ==================== EPHEMERIS ====================
+
+    def get_positions(self, calculation_date: datetime, bodies: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read stored positions for an exact instant.
+
+        Args:
+            calculation_date: Calculation instant
+            bodies: Body keys (e.g. "Sun:LAHIRI")
+
+        Returns:
+            Dict mapping body key to position_data (misses are omitted)
+        """
+        instant = _naive_utc(calculation_date)
+        try:
+            with self.read_session_factory() as db:
+                rows = db.execute(
+                    select(EphemerisCache.body, EphemerisCache.position_data).where(
+                        EphemerisCache.calculation_date == instant,
+                        EphemerisCache.body.in_(bodies),
+                        or_(EphemerisCache.expires_at.is_(None), EphemerisCache.expires_at > _utcnow()),
+                    )
+                ).all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Result store ephemeris read error: {str(e)}")
+            self._count(EPHEMERIS_TABLE, errors=1, misses=len(bodies))
+            return {}
+
+        found = {body: data for body, data in rows}
+        self._count(EPHEMERIS_TABLE, hits=len(found), misses=len(bodies) - len(found))
+        return found
+
+    def put_positions(self, rows: Iterable[Tuple[datetime, str, Dict[str, Any]]]) -> int:
+        """
+        Upsert positions in batches.
+
+        Args:
+            rows: (calculation_date, body, position_data) tuples
+
+        Returns:
+            Number of rows written
+        """
+        expires_at = self._expiry(self.ephemeris_ttl_seconds)
+        records = [
+            {
+                "calculation_date": _naive_utc(date),
+                "body": body,
+                "position_data": data,
+                "expires_at": expires_at,
+            }
+            for date, body, data in rows
+        ]
+        written = 0
+        try:
+            with self.session_factory() as db:
+                for start in range(0, len(records), self.batch_size):
+                    batch = records[start:start + self.batch_size]
+                    self._upsert_ephemeris_batch(db, batch)
+                    db.commit()
+                    written += len(batch)
+        except SQLAlchemyError as e:
+            logger.warning(f"Result store ephemeris write error: {str(e)}")
+            self._count(EPHEMERIS_TABLE, errors=1)
+        self._count(EPHEMERIS_TABLE, writes=written)
+        return written
+
+    def _upsert_ephemeris_batch(self, db, batch: List[Dict[str, Any]]) -> None:
+        keys = [(r["calculation_date"], r["body"]) for r in batch]
+        existing = {
+            (date, body): cache_id
+            for cache_id, date, body in db.execute(
+                select(EphemerisCache.cache_id, EphemerisCache.calculation_date, EphemerisCache.body).where(
+                    tuple_(EphemerisCache.calculation_date, EphemerisCache.body).in_(keys)
+                )
+            )
+        }
+        updates, inserts = [], []
+        for record in batch:
+            cache_id = existing.get((record["calculation_date"], record["body"]))
+            if cache_id is None:
+                inserts.append(record)
+            else:
+                updates.append({
+                    "cache_id": cache_id,
+                    "position_data": record["position_data"],
+                    "expires_at": record["expires_at"],
+                })
+        if inserts:
+            db.execute(insert(EphemerisCache), inserts)
+        if updates:
+            db.execute(update(EphemerisCache), updates)
+
+    # ==================== TRANSITS ====================
+
+    def get_transit(self, chart_id: str, transit_date: datetime, request_key: str) -> Optional[Any]:
+        """
+        Read a stored transit result.
+
+        Args:
+            chart_id: Saved birth chart id
+            transit_date: Transit date the result belongs to
+            request_key: Identifies the analysis (type, window, chart content)
+
+        Returns:
+            The stored result, or None
+        """
+        try:
+            with self.read_session_factory() as db:
+                rows = db.execute(
+                    select(TransitCalculation.calculation_data).where(
+                        TransitCalculation.chart_id == chart_id,
+                        TransitCalculation.transit_date == _naive_utc(transit_date),
+                        or_(TransitCalculation.expires_at.is_(None), TransitCalculation.expires_at > _utcnow()),
+                    )
+                ).scalars().all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Result store transit read error: {str(e)}")
+            self._count(TRANSIT_TABLE, errors=1, misses=1)
+            return None
+
+        for data in rows:
+            if data and data.get("key") == request_key:
+                self._count(TRANSIT_TABLE, hits=1)
+                return data.get("result")
+        self._count(TRANSIT_TABLE, misses=1)
+        return None
+
+    def put_transits(
+        self,
+        rows: Iterable[Tuple[str, datetime, str, Any, Optional[float]]],
+        expires_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Upsert transit results in batches.
+
+        Args:
+            rows: (chart_id, transit_date, request_key, result, event_probability) tuples
+            expires_at: Expiry for these rows (default: now + transit_ttl_seconds)
+
+        Returns:
+            Number of rows written
+        """
+        expires_at = _naive_utc(expires_at) if expires_at else self._expiry(self.transit_ttl_seconds)
+        records = [
+            {
+                "chart_id": chart_id,
+                "transit_date": _naive_utc(transit_date),
+                "calculation_data": {"key": request_key, "result": result},
+                "event_probability": probability,
+                "expires_at": expires_at,
+            }
+            for chart_id, transit_date, request_key, result, probability in rows
+        ]
+        written = 0
+        try:
+            with self.session_factory() as db:
+                for start in range(0, len(records), self.batch_size):
+                    batch = records[start:start + self.batch_size]
+                    self._upsert_transit_batch(db, batch)
+                    db.commit()
+                    written += len(batch)
+        except SQLAlchemyError as e:
+            logger.warning(f"Result store transit write error: {str(e)}")
+            self._count(TRANSIT_TABLE, errors=1)
+        self._count(TRANSIT_TABLE, writes=written)
+        return written
+
+    def _upsert_transit_batch(self, db, batch: List[Dict[str, Any]]) -> None:
+        # The request key lives inside calculation_data, so candidates are
+        # fetched by (chart_id, transit_date) and matched here
+        pairs = list({(r["chart_id"], r["transit_date"]) for r in batch})
+        existing = {}
+        for calc_id, chart_id, transit_date, data in db.execute(
+            select(
+                TransitCalculation.calc_id,
+                TransitCalculation.chart_id,
+                TransitCalculation.transit_date,
+                TransitCalculation.calculation_data,
+            ).where(tuple_(TransitCalculation.chart_id, TransitCalculation.transit_date).in_(pairs))
+        ):
+            existing[(chart_id, transit_date, (data or {}).get("key"))] = calc_id
+
+        updates, inserts = [], []
+        for record in batch:
+            calc_id = existing.get(
+                (record["chart_id"], record["transit_date"], record["calculation_data"]["key"])
+            )
+            if calc_id is None:
+                inserts.append(record)
+            else:
+                updates.append({
+                    "calc_id": calc_id,
+                    "calculation_data": record["calculation_data"],
+                    "event_probability": record["event_probability"],
+                    "expires_at": record["expires_at"],
+                })
+        if inserts:
+            db.execute(insert(TransitCalculation), inserts)
+        if updates:
+            db.execute(update(TransitCalculation), updates)
+
+    # ==================== EXPIRY ====================
+
+    def sweep_expired(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Delete expired rows from both tables in batches.
+
+        Args:
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Dict mapping table name to rows deleted
+        """
+        now = _naive_utc(now) if now else _utcnow()
+        deleted = {}
+        for model, pk in ((EphemerisCache, EphemerisCache.cache_id), (TransitCalculation, TransitCalculation.calc_id)):
+            table = model.__tablename__
+            deleted[table] = 0
+            try:
+                with self.session_factory() as db:
+                    while True:
+                        ids = db.execute(
+                            select(pk).where(model.expires_at <= now).limit(self.batch_size)
+                        ).scalars().all()
+                        if not ids:
+                            break
+                        db.execute(delete(model).where(pk.in_(ids)))
+                        db.commit()
+                        deleted[table] += len(ids)
+            except SQLAlchemyError as e:
+                logger.warning(f"Result store sweep error ({table}): {str(e)}")
+                self._count(table, errors=1)
+            self._count(table, swept=deleted[table])
+        return deleted
+
+    def start_sweeper(self, interval_seconds: int = 3600) -> None:
+        """Sweep expired rows every interval_seconds on a daemon thread."""
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop_sweeper.clear()
+
+        def run():
+            while not self._stop_sweeper.wait(interval_seconds):
+                deleted = self.sweep_expired()
+                if any(deleted.values()):
+                    logger.info(f"Result store swept expired rows: {deleted}")
+
+        self._sweeper = threading.Thread(target=run, name="result-store-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper."""
+        self._stop_sweeper.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=5)
+            self._sweeper = None
+
+    # ==================== METRICS ====================
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-table statistics.
+
+        Returns:
+            Dict mapping table name to hit/miss/write counters
+        """
+        with self._lock:
+            return {table: stats.to_dict() for table, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._stats = {EPHEMERIS_TABLE: TableStats(), TRANSIT_TABLE: TableStats()}
+
+
+_default_store: Optional[ResultStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_result_store() -> Optional[ResultStore]:
+    """
+    Process-wide result store configured from settings.
+
+    Returns:
+        Shared ResultStore, or None when the result store is disabled
+    """
+    global _default_store
+    if not settings.api.result_store_enabled:
+        return None
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ResultStore(
+                batch_size=settings.api.result_store_batch_size,
+                ephemeris_ttl_seconds=settings.api.result_store_ephemeris_ttl_seconds or None,
+            )
+        return _default_store
@@ -0,0 +1,176 @@
+"""
+Memory-Mapped Vector Metadata
+Columnar on-disk layout for FAISSVectorStore metadata
+
+Replaces the pickled metadata list. Files in the store's generation
+directory:
+- metadata.offsets.npy: int64 byte offset of each row in the blob (n + 1)
+- metadata.blob: concatenated compact JSON rows
+- metadata.<column>.npy: int32 dictionary codes per row (-1 = key missing)
+- metadata.json: format version, row count and the dictionary values
+
+Everything is opened with mmap, so loading does not depend on corpus size
+and all worker processes share the same page-cache pages. Rows are decoded
+only when accessed. Files are written once into a fresh generation
+directory (see FAISSVectorStore.save), never replaced in place, so a
+process still mapping a previous generation keeps a consistent view.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+METADATA_FORMAT_VERSION = 1
+HEADER_FILE = "metadata.json"
+OFFSETS_FILE = "metadata.offsets.npy"
+BLOB_FILE = "metadata.blob"
+
+# Keys stored as dictionary-encoded columns (readable without decoding rows)
+DICTIONARY_COLUMNS = ("category", "source")
+
+
+def _column_file(name: str) -> str:
+    return f"metadata.{name}.npy"
+
+
+def encode_column(
+    metadata: Sequence[Dict[str, Any]], name: str
+) -> Tuple[List[Any], np.ndarray]:
+    """
+    Dictionary-encode one metadata key.
+
+    Returns:
+        Tuple of (distinct values, int32 code per row with -1 where the key is missing)
+    """
+    values: Dict[Any, int] = {}
+    codes = np.full(len(metadata), -1, dtype=np.int32)
+    for i, row in enumerate(metadata):
+        if name in row:
+            codes[i] = values.setdefault(row[name], len(values))
+    return list(values), codes
+
+
+def write_metadata(
+    directory: str,
+    metadata: Sequence[Dict[str, Any]],
+    columns: Sequence[str] = DICTIONARY_COLUMNS,
+) -> None:
+    """
+    Write metadata in the mapped layout.
+
+    Args:
+        directory: New (empty) generation directory
+        metadata: JSON-serializable dicts, one per vector
+        columns: Keys to dictionary-encode
+    """
+    rows = [json.dumps(row, separators=(",", ":"), default=str).encode() for row in metadata]
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+
+    with open(os.path.join(directory, BLOB_FILE), "wb") as f:
+        f.write(b"".join(rows))
+    np.save(os.path.join(directory, OFFSETS_FILE), offsets)
+
+    dictionaries = {}
+    for name in columns:
+        values, codes = encode_column(metadata, name)
+        dictionaries[name] = values
+        np.save(os.path.join(directory, _column_file(name)), codes)
+
+    header = {"version": METADATA_FORMAT_VERSION, "count": len(rows), "columns": dictionaries}
+    with open(os.path.join(directory, HEADER_FILE), "w") as f:
+        json.dump(header, f)
+
+
+def metadata_exists(directory: str) -> bool:
+    """True if the directory holds mapped metadata."""
+    return os.path.exists(os.path.join(directory, HEADER_FILE))
+
+
+class MappedMetadata(Sequence):
+    """
+    Read-only view of mapped metadata that also accepts appended rows.
+
+    Rows appended after loading are kept in memory until the store is
+    saved again.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Map the metadata files in directory.
+
+        Raises:
+            ValueError: If the files are from another format version or inconsistent
+        """
+        with open(os.path.join(directory, HEADER_FILE)) as f:
+            header = json.load(f)
+        if header.get("version") != METADATA_FORMAT_VERSION:
+            raise ValueError(f"Unsupported metadata format version: {header.get('version')}")
+
+        self._count = header["count"]
+        self._dictionaries: Dict[str, List[Any]] = header["columns"]
+        self._offsets = np.load(os.path.join(directory, OFFSETS_FILE), mmap_mode="r")
+        if len(self._offsets) != self._count + 1:
+            raise ValueError("Metadata offsets do not match the header row count")
+
+        blob_path = os.path.join(directory, BLOB_FILE)
+        if os.path.getsize(blob_path):
+            self._blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+        else:
+            self._blob = np.empty(0, dtype=np.uint8)
+
+        self._codes = {
+            name: np.load(os.path.join(directory, _column_file(name)), mmap_mode="r")
+            for name in self._dictionaries
+        }
+        self._extra: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return self._count + len(self._extra)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("metadata index out of range")
+        if index >= self._count:
+            return self._extra[index - self._count]
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return json.loads(self._blob[start:end].tobytes())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self._extra.append(row)
+
+    def extend(self, rows: Sequence[Dict[str, Any]]) -> None:
+        self._extra.extend(rows)
+
+    def column_codes(self, name: str) -> Optional[Tuple[List[Any], np.ndarray]]:
+        """
+        Dictionary values and per-row codes for a column, without decoding rows.
+
+        Returns:
+            Tuple of (values, int32 codes with -1 = missing), or None if the
+            column is not stored
+        """
+        if name not in self._codes:
+            return None
+        values = list(self._dictionaries[name])
+        codes = np.asarray(self._codes[name])
+        if self._extra:
+            lookup = {value: code for code, value in enumerate(values)}
+            extra = np.full(len(self._extra), -1, dtype=np.int32)
+            for i, row in enumerate(self._extra):
+                if name in row:
+                    extra[i] = lookup.setdefault(row[name], len(lookup))
+            values = list(lookup)
+            codes = np.concatenate([codes, extra])
+        return values, codes
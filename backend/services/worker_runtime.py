@@ -0,0 +1,258 @@
+"""
+Worker Runtime
+Preloading and per-worker lifecycle for the multi-worker server
+
+The production runner (backend/gunicorn_conf.py) imports the app in the
+master process, calls preload_shared_state() once and then forks the
+workers, so everything loaded here is shared copy-on-write:
+- API modules and their module-level engine singletons
+- KP sub-lord tables (built when kp_engine is imported)
+- The memory-mapped ephemeris table (EPHEMERIS_TABLE_PATH), paged in
+- Swiss Ephemeris files, read once to fill the OS page cache and then
+  closed, since stdio file offsets must not be shared between workers
+- Optionally the embedding model and FAISS index (PRELOAD_KNOWLEDGE_BASE)
+
+Preloading must not start threads, pools or connections. Each forked
+worker calls reset_after_fork() before serving, marks itself ready when
+the app lifespan has started, and records that in a WorkerRegistry shared
+by the workers of one master. The readiness probe reports the worker
+that serves it, so recycling or losing one worker never fails the whole
+instance; the registry backs the pool view (pool_status), which compares
+the ready workers with RUNTIME_EXPECTED_WORKERS (set by the runner).
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+STATE_DIR_ENV = "RUNTIME_STATE_DIR"
+EXPECTED_WORKERS_ENV = "RUNTIME_EXPECTED_WORKERS"
+
+PRELOAD_STEPS = ("app", "kp_tables", "ephemeris_table", "swiss_ephemeris", "knowledge_base")
+
+
+# ==================== PRELOAD (MASTER) ====================
+
+def _preload_app() -> Dict[str, Any]:
+    from backend.api.v1 import routes  # noqa: F401  (builds module-level services)
+    return {}
+
+
+def _preload_kp_tables() -> Dict[str, Any]:
+    from backend.calculations import kp_engine
+    return {"entries": len(kp_engine._SUB_TABLE_ENTRIES)}
+
+
+def _preload_ephemeris_table() -> Dict[str, Any]:
+    from backend.calculations.ephemeris_table import get_default_ephemeris_table
+
+    table = get_default_ephemeris_table()
+    if table is None:
+        return {"loaded": False}
+    # Summing reads every page of the mapping once
+    table._longitude.sum()
+    table._speed.sum()
+    return {"loaded": True, "path": str(table.path), "steps": table.n_steps}
+
+
+def _preload_swiss_ephemeris() -> Dict[str, Any]:
+    import swisseph as swe
+    from backend.calculations.ephemeris import EphemerisCalculator
+
+    calculator = EphemerisCalculator()
+    positions = calculator.get_all_planets(datetime.utcnow())
+    # swe.close() also resets the sidereal mode, which is process-global
+    swe.close()
+    swe.set_sid_mode(calculator.ayanamsa_system.value)
+    return {"planets": len(positions)}
+
+
+def _preload_knowledge_base() -> Dict[str, Any]:
+    from backend.api.v1 import perplexity_endpoints
+
+    perplexity_endpoints._init_services()
+    store = perplexity_endpoints._vector_store
+    return {"texts": store.text_count if store is not None else 0}
+
+
+_PRELOADERS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "app": _preload_app,
+    "kp_tables": _preload_kp_tables,
+    "ephemeris_table": _preload_ephemeris_table,
+    "swiss_ephemeris": _preload_swiss_ephemeris,
+    "knowledge_base": _preload_knowledge_base,
+}
+
+_preload_report: Dict[str, Any] = {}
+
+
+def preload_shared_state(steps: Optional[Sequence[str]] = None, knowledge_base: bool = False) -> Dict[str, Any]:
+    """
+    Load shared read-only state before workers are forked.
+
+    A failing step is logged and reported; workers then load that state
+    lazily, as a single-process server does.
+
+    Args:
+        steps: Steps to run (default: PRELOAD_STEPS, without knowledge_base
+            unless knowledge_base is True)
+        knowledge_base: Also load the embedding model and FAISS index
+
+    Returns:
+        Dict of step name -> {"ok", "seconds", ...step details}
+    """
+    if steps is None:
+        steps = [s for s in PRELOAD_STEPS if knowledge_base or s != "knowledge_base"]
+
+    report: Dict[str, Any] = {}
+    for step in steps:
+        start = time.perf_counter()
+        try:
+            details = _PRELOADERS[step]()
+            report[step] = {"ok": True, **details}
+        except Exception as e:
+            logger.warning(f"Preload step {step} failed, workers will load it lazily: {str(e)}")
+            report[step] = {"ok": False, "error": str(e)}
+        report[step]["seconds"] = round(time.perf_counter() - start, 3)
+        logger.info(f"Preloaded {step} in {report[step]['seconds']}s")
+
+    _preload_report.clear()
+    _preload_report.update(report)
+    return report
+
+
+# ==================== WORKER LIFECYCLE ====================
+
+def reset_after_fork() -> None:
+    """Drop state a forked worker must not share with its parent."""
+    from backend.config.database import reset_engines_after_fork
+    from backend.services.calculation_executor import reset_calculation_executor_after_fork
+
+    reset_engines_after_fork()
+    reset_calculation_executor_after_fork()
+    _state.update(pid=os.getpid(), ready=False, started_at=None)
+
+
+class WorkerRegistry:
+    """
+    One JSON file per live worker in a directory shared by one master's workers.
+
+    Files of processes that no longer exist are ignored and removed when read.
+    """
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        os.makedirs(state_dir, exist_ok=True)
+
+    def _path(self, pid: int) -> str:
+        return os.path.join(self.state_dir, f"worker-{pid}.json")
+
+    def register(self, info: Dict[str, Any]) -> None:
+        path = self._path(info["pid"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(info, f)
+        os.replace(tmp_path, path)
+
+    def unregister(self, pid: int) -> None:
+        try:
+            os.remove(self._path(pid))
+        except FileNotFoundError:
+            pass
+
+    def workers(self) -> List[Dict[str, Any]]:
+        """Registered workers that are still alive, by pid."""
+        workers = []
+        for name in sorted(os.listdir(self.state_dir)):
+            if not (name.startswith("worker-") and name.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(self.state_dir, name)) as f:
+                    info = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if _pid_alive(info["pid"]):
+                if info.get("started_at"):
+                    info["uptime_seconds"] = round(time.time() - info["started_at"], 3)
+                workers.append(info)
+            else:
+                self.unregister(info["pid"])
+        return workers
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def get_worker_registry() -> Optional[WorkerRegistry]:
+    """Registry of the running master (None when not started by the multi-worker runner)."""
+    state_dir = os.getenv(STATE_DIR_ENV)
+    return WorkerRegistry(state_dir) if state_dir else None
+
+
+_state: Dict[str, Any] = {"pid": os.getpid(), "ready": False, "started_at": None}
+
+
+def mark_ready() -> None:
+    """Mark this worker ready to serve (called at the end of app startup)."""
+    _state.update(pid=os.getpid(), ready=True, started_at=time.time())
+    registry = get_worker_registry()
+    if registry is not None:
+        registry.register(worker_status())
+
+
+def mark_stopping() -> None:
+    """Mark this worker as draining (called at the start of app shutdown)."""
+    _state["ready"] = False
+    registry = get_worker_registry()
+    if registry is not None:
+        registry.unregister(os.getpid())
+
+
+def worker_status() -> Dict[str, Any]:
+    """Readiness of this worker."""
+    started_at = _state["started_at"]
+    return {
+        "pid": _state["pid"],
+        "ready": _state["ready"],
+        "started_at": started_at,
+        "uptime_seconds": round(time.time() - started_at, 3) if started_at else 0.0,
+        "preloaded": sorted(step for step, result in _preload_report.items() if result["ok"]),
+    }
+
+
+def pool_status() -> Dict[str, Any]:
+    """
+    Readiness of the whole worker pool.
+
+    Under the multi-worker runner "ready" means as many live workers as the
+    runner forks have registered ready, which is briefly false while a
+    worker is recycled; it is informational and not used as the readiness
+    probe. A single-process server reports itself.
+    """
+    registry = get_worker_registry()
+    if registry is None:
+        workers = [worker_status()]
+        expected = 1
+    else:
+        workers = registry.workers()
+        expected = int(os.getenv(EXPECTED_WORKERS_ENV, "1"))
+    ready = sum(1 for w in workers if w["ready"])
+    return {
+        "ready": ready >= expected,
+        "workers": workers,
+        "total": len(workers),
+        "ready_workers": ready,
+        "expected": expected,
+    }
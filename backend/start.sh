@@ -4,5 +4,10 @@
 # Use Railway's PORT environment variable, default to 8000 for local dev
 PORT=${PORT:-8000}
 
+# Production: pre-forked workers sharing preloaded state (see backend/gunicorn_conf.py)
+if [ "${SERVER_MODE:-single}" = "production" ]; then
+    exec gunicorn -c backend/gunicorn_conf.py backend.main:app
+fi
+
 # Start uvicorn with the correct module path
 uvicorn backend.main:app --host 0.0.0.0 --port $PORT
@@ -0,0 +1,215 @@
+"""
+Auth Fast Path Tests
+Covers the principal cache, the in-memory API key map and off-loop bcrypt
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.config.database import create_engines
+from backend.config.settings import DatabaseConfig
+from backend.models.database import APIKey, Base, User
+from backend.services import auth_cache, auth_service
+from backend.services.auth_cache import APIKeyMap, PrincipalCache
+from backend.services.auth_service import AuthenticationService
+
+
+@pytest.fixture
+def db_setup(tmp_path, monkeypatch):
+    engine, write_engine = create_engines(
+        DatabaseConfig(driver="sqlite", sqlite_db_path=str(tmp_path / "auth.db"))
+    )
+    Base.metadata.create_all(bind=write_engine)
+
+    queries = []
+    event.listen(write_engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+
+    monkeypatch.setattr(auth_cache, "_principal_cache", PrincipalCache(ttl=30))
+    monkeypatch.setattr(auth_cache, "_api_key_map", APIKeyMap(refresh_seconds=60, touch_seconds=60))
+    yield sessionmaker(bind=write_engine), queries
+    engine.dispose()
+    write_engine.dispose()
+
+
+@pytest.fixture
+def user_id(db_setup):
+    session_factory, _ = db_setup
+    with session_factory() as db:
+        user = User(email="cache@example.com", password_hash="x", is_active=True)
+        db.add(user)
+        db.commit()
+        return user.user_id
+
+
+class TestPrincipalCache:
+    def test_second_lookup_skips_database(self, db_setup, user_id):
+        session_factory, queries = db_setup
+        with session_factory() as db:
+            first = AuthenticationService.get_principal(db, user_id)
+            queries.clear()
+            second = AuthenticationService.get_principal(db, user_id)
+
+        assert first.email == second.email == "cache@example.com"
+        assert second.password_hash is None
+        assert queries == []
+
+    def test_deactivate_invalidates(self, db_setup, user_id):
+        session_factory, _ = db_setup
+        with session_factory() as db:
+            assert AuthenticationService.get_principal(db, user_id) is not None
+            assert AuthenticationService.deactivate_user(db, user_id)
+            assert AuthenticationService.get_principal(db, user_id) is None
+
+    def test_entries_expire(self, db_setup, user_id, monkeypatch):
+        session_factory, _ = db_setup
+        cache = PrincipalCache(ttl=30)
+        with session_factory() as db:
+            cache.put(AuthenticationService.get_user_by_id(db, user_id))
+
+        now = time.monotonic()
+        monkeypatch.setattr(auth_cache.time, "monotonic", lambda: now + 31)
+        assert cache.get(user_id) is None
+
+
+class TestAPIKeyMap:
+    def test_verify_served_from_memory(self, db_setup, user_id):
+        session_factory, queries = db_setup
+        with session_factory() as db:
+            raw_key, key_id = AuthenticationService.create_api_key(db, user_id, "test")
+            assert AuthenticationService.verify_api_key(db, raw_key).user_id == user_id
+            assert db.query(APIKey).filter(APIKey.key_id == key_id).one().last_used_at is not None
+
+            queries.clear()
+            assert AuthenticationService.verify_api_key(db, raw_key).user_id == user_id
+            assert queries == []
+
+    def test_touch_uses_write_session(self, db_setup, user_id):
+        session_factory, _ = db_setup
+        # The fixture's write engine holds one connection; reads use their own engine
+        read_engine = create_engine(session_factory.kw["bind"].url)
+        with Session(read_engine) as db, session_factory() as write_db:
+            raw_key, _ = AuthenticationService.create_api_key(write_db, user_id, "test")
+            statements = {"read": [], "write": []}
+            event.listen(db, "do_orm_execute", lambda ctx: statements["read"].append(ctx.is_update))
+            event.listen(write_db, "do_orm_execute", lambda ctx: statements["write"].append(ctx.is_update))
+
+            assert AuthenticationService.verify_api_key(db, raw_key, write_db=write_db).user_id == user_id
+
+        read_engine.dispose()
+        assert statements["write"] == [True]
+        assert not any(statements["read"])
+
+    def test_revoked_and_unknown_keys_rejected(self, db_setup, user_id):
+        session_factory, _ = db_setup
+        with session_factory() as db:
+            raw_key, key_id = AuthenticationService.create_api_key(db, user_id, "test")
+            assert AuthenticationService.verify_api_key(db, raw_key) is not None
+            AuthenticationService.revoke_api_key(db, key_id)
+            assert AuthenticationService.verify_api_key(db, raw_key) is None
+            assert AuthenticationService.verify_api_key(db, "sk_unknown") is None
+
+    def test_key_created_elsewhere_found_before_reload(self, db_setup, user_id):
+        session_factory, _ = db_setup
+        with session_factory() as db:
+            auth_cache.get_api_key_map().load(db)
+            raw_key, hashed_key = AuthenticationService.generate_api_key()
+            db.add(APIKey(user_id=user_id, key_name="other-worker", api_key_hash=hashed_key, is_active=True))
+            db.commit()
+
+            assert AuthenticationService.verify_api_key(db, raw_key).user_id == user_id
+            assert auth_cache.get_api_key_map().fallback_queries == 1
+
+    def test_revocation_elsewhere_honoured_within_principal_ttl(self, db_setup, user_id, monkeypatch):
+        session_factory, _ = db_setup
+        monkeypatch.setattr(auth_cache, "_api_key_map", None)
+        monkeypatch.setattr(auth_cache.settings.security, "principal_cache_ttl_seconds", 30.0)
+        monkeypatch.setattr(auth_cache.settings.security, "api_key_refresh_seconds", 600.0)
+        now = [1000.0]
+        monkeypatch.setattr(auth_cache.time, "monotonic", lambda: now[0])
+
+        with session_factory() as db:
+            raw_key, key_id = AuthenticationService.create_api_key(db, user_id, "test")
+            assert AuthenticationService.verify_api_key(db, raw_key) is not None
+            assert auth_cache.get_api_key_map().refresh_seconds == 30.0
+
+            # Revoked by another worker: only the database changes here
+            db.query(APIKey).filter(APIKey.key_id == key_id).update({APIKey.is_active: False})
+            db.commit()
+            now[0] += 31
+            assert AuthenticationService.verify_api_key(db, raw_key) is None
+
+    def test_zero_refresh_queries_every_lookup(self, db_setup, user_id):
+        session_factory, _ = db_setup
+        api_keys = APIKeyMap(refresh_seconds=0)
+        with session_factory() as db:
+            raw_key, hashed_key = AuthenticationService.generate_api_key()
+            key = APIKey(user_id=user_id, key_name="k", api_key_hash=hashed_key, is_active=True)
+            db.add(key)
+            db.commit()
+            assert api_keys.lookup(db, hashed_key).user_id == str(user_id)
+
+            key.is_active = False
+            db.commit()
+            assert api_keys.lookup(db, hashed_key) is None
+
+
+class TestWriteSessions:
+    def test_writing_auth_endpoints_use_write_engine(self):
+        from backend.api.v1 import auth_endpoints
+        from backend.config.database import get_db, get_write_db
+
+        def session_dependencies(path, method):
+            route = next(
+                r for r in auth_endpoints.router.routes
+                if r.path == f"/auth{path}" and method in r.methods
+            )
+            return {d.call for d in route.dependant.dependencies} & {get_db, get_write_db}
+
+        for path, method in (("/register", "POST"), ("/login", "POST"),
+                             ("/api-keys", "POST"), ("/api-keys/{key_id}", "DELETE")):
+            assert session_dependencies(path, method) == {get_write_db}
+        assert session_dependencies("/api-keys", "GET") == {get_db}
+
+
+class TestBcryptPool:
+    @pytest.mark.asyncio
+    async def test_hashing_runs_off_loop_with_bounded_concurrency(self, monkeypatch):
+        state = {"running": 0, "peak": 0}
+        lock = threading.Lock()
+
+        class SlowContext:
+            def verify(self, plain, hashed):
+                with lock:
+                    state["running"] += 1
+                    state["peak"] = max(state["peak"], state["running"])
+                time.sleep(0.05)
+                with lock:
+                    state["running"] -= 1
+                return plain == hashed
+
+        monkeypatch.setattr(auth_service, "pwd_context", SlowContext())
+        monkeypatch.setattr(auth_service, "_bcrypt_executor", ThreadPoolExecutor(max_workers=2))
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        tick_task = asyncio.create_task(ticker())
+        results = await asyncio.gather(
+            *(AuthenticationService.averify_password("pw", "pw" if i % 2 else "other") for i in range(6))
+        )
+        tick_task.cancel()
+
+        assert results == [False, True, False, True, False, True]
+        assert state["peak"] == 2
+        assert ticks >= 10
@@ -0,0 +1,137 @@
+"""
+Calculation Executor Tests
+Checks offloading, backpressure and timing statistics
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.calculations.exceptions import CalculationBusyError
+from backend.schemas import BirthDataInput
+from backend.services.calculation_executor import CalculationExecutor
+from backend.services.calculation_service import CalculationService
+from backend.services.chart_cache import ChartCache
+
+
+BIRTH_DATA = BirthDataInput(
+    date="1984-12-19", time="12:00:00", timezone="America/Chicago",
+    latitude=29.98, longitude=-90.15, location_name="New Orleans"
+)
+
+
+@pytest.mark.asyncio
+async def test_inline_mode_records_timing():
+    executor = CalculationExecutor(mode="inline")
+    assert await executor.run("sum", sum, [1, 2, 3]) == 6
+
+    stats = executor.get_stats()
+    assert stats["tasks"]["sum"]["count"] == 1
+    assert stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_limit_rejects_excess_tasks():
+    executor = CalculationExecutor(mode="thread", max_workers=1, max_pending=1)
+    try:
+        running = asyncio.ensure_future(executor.run("sleep", time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        with pytest.raises(CalculationBusyError):
+            await executor.run("sleep", time.sleep, 0)
+        await running
+
+        assert executor.get_stats()["rejected"] == 1
+        assert await executor.run("sleep", time.sleep, 0) is None
+    finally:
+        executor.shutdown()
+
+
+def _slow_square(n):
+    time.sleep(0.02)
+    return n * n
+
+
+@pytest.mark.asyncio
+async def test_map_holds_slots_and_caps_in_flight():
+    executor = CalculationExecutor(mode="thread", max_workers=4, max_pending=3)
+    try:
+        peak = []
+        original_claim = executor._claim
+
+        def claim(task_name):
+            timing = original_claim(task_name)
+            peak.append(executor._pending)
+            return timing
+
+        executor._claim = claim
+        squares = await asyncio.to_thread(executor.map, _slow_square, range(10), max_in_flight=2)
+
+        assert squares == [n * n for n in range(10)]
+        assert max(peak) == 2
+        stats = executor.get_stats()
+        assert stats["pending"] == 0
+        assert stats["tasks"]["_slow_square"]["count"] == 10
+
+        # Another request holding the free slots makes the fan-out fail fast
+        slots = [executor.reserve("stream") for _ in range(3)]
+        with pytest.raises(CalculationBusyError):
+            executor.map(_slow_square, range(4))
+        for slot in slots:
+            slot.release()
+        assert executor.get_stats()["pending"] == 0
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_and_are_counted():
+    executor = CalculationExecutor(mode="inline")
+    with pytest.raises(ZeroDivisionError):
+        await executor.run("divide", divmod, 1, 0)
+    assert executor.get_stats()["tasks"]["divide"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_chart_matches_direct_call():
+    """Charts computed in a worker process equal the in-process result"""
+    service = CalculationService(chart_cache=ChartCache())
+    executor = CalculationExecutor(mode="process", max_workers=1)
+    try:
+        chart = await executor.generate_birth_chart(BIRTH_DATA, service)
+    finally:
+        executor.shutdown()
+
+    assert chart == CalculationService(chart_cache=ChartCache()).generate_birth_chart(BIRTH_DATA)
+    # The worker result was stored in the caller's cache
+    assert service.get_cached_chart(BIRTH_DATA) == chart
+
+
+@pytest.mark.asyncio
+async def test_redis_chart_cache_calls_leave_event_loop():
+    """Chart cache lookups and stores that reach Redis run off the loop thread"""
+    import threading
+
+    class FakeRedis:
+        def __init__(self):
+            self.data = {}
+            self.threads = []
+
+        def get(self, key):
+            self.threads.append(threading.get_ident())
+            return self.data.get(key)
+
+        def setex(self, key, ttl, value):
+            self.threads.append(threading.get_ident())
+            self.data[key] = value
+
+    redis_client = FakeRedis()
+    service = CalculationService(chart_cache=ChartCache(redis_client=redis_client))
+    executor = CalculationExecutor(mode="inline")
+
+    chart = await executor.generate_birth_chart(BIRTH_DATA, service)
+    service.chart_cache.clear()
+    assert await executor.generate_birth_chart(BIRTH_DATA, service) == chart
+
+    assert len(redis_client.threads) == 3
+    assert threading.get_ident() not in redis_client.threads
@@ -0,0 +1,177 @@
+"""
+Chart Batch Tests
+Covers CSV/JSONL parsing, pooled bulk inserts and the /chart/batch endpoint
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.api.v1 import charts
+from backend.api.v1.auth import get_current_user
+from backend.config.database import create_engines
+from backend.config.settings import DatabaseConfig, settings
+from backend.models.database import Base, BirthChart, ChartPlanetPosition, User
+from backend.services.calculation_executor import CalculationExecutor
+from backend.services import chart_batch
+from backend.services.chart_batch import ChartBatchImporter, iter_birth_data_rows
+
+
+CSV_INPUT = (
+    "date,time,timezone,latitude,longitude,location_name\n"
+    "1984-12-19,12:00:00,America/Chicago,29.98,-90.15,New Orleans\n"
+    "1990-05-01,08:30:00,Asia/Kolkata,28.61,77.21,\n"
+    "1990-13-01,08:30:00,Asia/Kolkata,28.61,77.21,Delhi\n"
+    "1975-03-10,23:15:00,Europe/London,51.51,-0.13,London\n"
+    "1980-01-01,06:00:00,Not/A_Zone,10.0,10.0,Nowhere\n"
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine, write_engine = create_engines(
+        DatabaseConfig(driver="sqlite", sqlite_db_path=str(tmp_path / "batch.db"))
+    )
+    Base.metadata.create_all(bind=write_engine)
+    yield sessionmaker(bind=write_engine)
+    engine.dispose()
+    write_engine.dispose()
+
+
+@pytest.fixture
+def user_id(session_factory):
+    with session_factory() as db:
+        user = User(email="batch@example.com", password_hash="x")
+        db.add(user)
+        db.commit()
+        return user.user_id
+
+
+def count_charts(session_factory):
+    with session_factory() as db:
+        return db.execute(select(func.count()).select_from(BirthChart)).scalar()
+
+
+class TestParsing:
+    """Test CSV and JSONL row parsing"""
+
+    def test_csv_rows_and_errors(self):
+        rows = list(iter_birth_data_rows(io.StringIO(CSV_INPUT), "csv"))
+        assert [line for line, _, _ in rows] == [2, 3, 4, 5, 6]
+        assert rows[1][1].location_name is None
+        assert rows[2][1] is None and "date" in rows[2][2]
+
+    def test_csv_missing_columns_rejected(self):
+        with pytest.raises(ValueError):
+            list(iter_birth_data_rows(io.StringIO("date,time\n"), "csv"))
+
+    def test_jsonl_accepts_wrapped_rows(self):
+        lines = [
+            json.dumps({"birth_data": {"date": "1984-12-19", "time": "12:00:00", "timezone": "UTC",
+                                       "latitude": 1.0, "longitude": 2.0}}),
+            "",
+            "{not json",
+            json.dumps({"date": "1984-12-19", "time": "12:00:00", "timezone": "UTC",
+                        "latitude": 95.0, "longitude": 2.0}),
+        ]
+        rows = list(iter_birth_data_rows(lines, "jsonl"))
+        assert [line for line, _, _ in rows] == [1, 3, 4]
+        assert rows[0][1].latitude == 1.0
+        assert rows[1][2].startswith("Invalid JSON")
+        assert "latitude" in rows[2][2]
+
+
+class TestImporter:
+    """Test pooled computation and chunked inserts"""
+
+    @pytest.mark.asyncio
+    async def test_import_streams_errors_and_inserts_rest(self, session_factory, user_id):
+        importer = ChartBatchImporter(
+            CalculationExecutor(mode="thread", max_workers=2),
+            session_factory=session_factory, task_size=1, insert_size=2,
+        )
+        rows = iter_birth_data_rows(io.StringIO(CSV_INPUT), "csv")
+        records = [r async for r in importer.run(rows, user_id)]
+
+        errors = sorted(r["line"] for r in records if r["type"] == "error")
+        assert errors == [4, 6]
+        assert [r["inserted"] for r in records if r["type"] == "progress"] == [2, 3]
+
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert (summary["total"], summary["inserted"], summary["failed"]) == (5, 3, 2)
+        assert summary["rows_per_second"] > 0
+        assert count_charts(session_factory) == 3
+
+        with session_factory() as db:
+            chart = db.execute(select(BirthChart).where(BirthChart.birth_location == "London")).scalar_one()
+        assert chart.user_id == user_id
+        assert chart.ayanamsa == "24.6978"
+        assert chart.chart_data["planet_positions"]
+
+        with session_factory() as db:
+            columnar = db.execute(select(func.count(func.distinct(ChartPlanetPosition.chart_id)))).scalar()
+        assert columnar == 3
+
+
+class TestBatchEndpoint:
+    """Test POST /chart/batch"""
+
+    @pytest.fixture
+    def client(self, session_factory, user_id, monkeypatch):
+        monkeypatch.setattr(charts, "WriteSessionLocal", session_factory)
+        monkeypatch.setattr(charts, "calc_executor", CalculationExecutor(mode="inline"))
+        app = FastAPI()
+        app.include_router(charts.router)
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(user_id=user_id)
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_csv_body_streams_ndjson(self, client, session_factory):
+        async with client:
+            response = await client.post(
+                "/chart/batch", content=CSV_INPUT, headers={"Content-Type": "text/csv"}
+            )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["inserted"] == 3
+        assert count_charts(session_factory) == 3
+
+    @pytest.mark.asyncio
+    async def test_large_body_spooled_and_limited(self, client, session_factory, monkeypatch):
+        monkeypatch.setattr(chart_batch, "SPOOL_MEMORY_BYTES", 64)
+
+        async def chunks(data, size=16):
+            for start in range(0, len(data), size):
+                yield data[start:start + size]
+
+        async with client:
+            response = await client.post(
+                "/chart/batch", content=chunks(("\ufeff" + CSV_INPUT).encode()),
+                headers={"Content-Type": "text/csv"},
+            )
+            not_utf8 = await client.post("/chart/batch?format=jsonl", content=b"\xff\xfe{}\n")
+            monkeypatch.setattr(settings.api, "chart_batch_max_bytes", 100)
+            too_large = await client.post(
+                "/chart/batch", content=chunks(CSV_INPUT.encode()), headers={"Content-Type": "text/csv"}
+            )
+
+        assert json.loads(response.text.splitlines()[-1])["inserted"] == 3
+        assert not_utf8.status_code == 400
+        assert too_large.status_code == 413
+        assert count_charts(session_factory) == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected(self, client):
+        async with client:
+            response = await client.post("/chart/batch", content="x", headers={"Content-Type": "text/plain"})
+        assert response.status_code == 400
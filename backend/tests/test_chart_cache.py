@@ -0,0 +1,134 @@
+"""
+Birth Chart Cache Tests
+Covers key canonicalization, LRU eviction, the Redis tier and invalidation
+"""
+
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from backend.services.chart_cache import ChartCache, chart_cache_key
+from backend.services.calculation_service import CalculationService
+from backend.schemas import BirthDataInput
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client API used by ChartCache"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode()
+
+    def scan_iter(self, match="*"):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.store) if k.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+        return len(keys)
+
+
+UTC_INSTANT = datetime(1984, 12, 19, 18, 0, tzinfo=timezone.utc)
+
+
+class TestChartCacheKey:
+    """Test canonical hashing"""
+
+    def test_same_instant_in_other_timezone(self):
+        chicago = UTC_INSTANT.astimezone(timezone(timedelta(hours=-6)))
+        assert chart_cache_key(UTC_INSTANT, 29.98, -90.15, "LAHIRI", "PLACIDUS") == \
+            chart_cache_key(chicago, 29.98, -90.15, "lahiri", "placidus")
+
+    def test_inputs_change_key(self):
+        base = chart_cache_key(UTC_INSTANT, 29.98, -90.15, "LAHIRI", "PLACIDUS")
+        assert base != chart_cache_key(UTC_INSTANT, 29.99, -90.15, "LAHIRI", "PLACIDUS")
+        assert base != chart_cache_key(UTC_INSTANT, 29.98, -90.15, "RAMAN", "PLACIDUS")
+        assert base != chart_cache_key(UTC_INSTANT, 29.98, -90.15, "LAHIRI", "PLACIDUS", "other")
+
+
+class TestChartCache:
+    """Test the two cache tiers"""
+
+    def test_lru_eviction_and_stats(self):
+        cache = ChartCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        assert cache.get("a") == {"v": 1}  # "a" becomes most recent
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["memory_hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_byte_bound(self):
+        cache = ChartCache(max_entries=100, max_bytes=40)
+        cache.set("a", {"payload": "x" * 20})
+        cache.set("b", {"payload": "y" * 20})
+        assert cache.get_stats()["memory_bytes"] <= 40
+        assert cache.get("a") is None
+
+    def test_get_returns_copy(self):
+        cache = ChartCache()
+        cache.set("a", {"planets": [1, 2]})
+        cache.get("a")["planets"].append(3)
+        assert cache.get("a") == {"planets": [1, 2]}
+
+    def test_redis_tier_shared_between_caches(self):
+        redis = FakeRedis()
+        ChartCache(redis_client=redis).set("a", {"v": 1})
+
+        other_worker = ChartCache(redis_client=redis)
+        assert other_worker.get("a") == {"v": 1}
+        assert other_worker.get_stats()["redis_hits"] == 1
+        assert other_worker.get("a") == {"v": 1}
+        assert other_worker.get_stats()["memory_hits"] == 1
+
+    def test_engine_version_invalidates(self):
+        redis = FakeRedis()
+        cache = ChartCache(redis_client=redis, engine_version="v1")
+        cache.set("a", {"v": 1})
+
+        cache.set_engine_version("v2")
+        assert cache.get("a") is None
+        assert cache.purge_redis() == 1
+        assert redis.store == {}
+
+
+class TestCalculationServiceCaching:
+    """Test chart caching inside CalculationService"""
+
+    def test_repeat_chart_is_cached(self):
+        service = CalculationService(chart_cache=ChartCache())
+        birth_data = BirthDataInput(
+            date="1984-12-19", time="12:00:00", timezone="America/Chicago",
+            latitude=29.98, longitude=-90.15, location_name="New Orleans"
+        )
+        first = service.generate_birth_chart(birth_data)
+        second = service.generate_birth_chart(birth_data)
+
+        assert first == second
+        assert service.chart_cache.get_stats()["memory_hits"] == 1
+
+    def test_timezone_label_follows_request(self):
+        service = CalculationService(chart_cache=ChartCache())
+        chicago = BirthDataInput(
+            date="1984-12-19", time="12:00:00", timezone="America/Chicago",
+            latitude=29.98, longitude=-90.15, location_name="New Orleans"
+        )
+        utc = BirthDataInput(
+            date="1984-12-19", time="18:00:00", timezone="UTC",
+            latitude=29.98, longitude=-90.15, location_name="New Orleans"
+        )
+        first = service.generate_birth_chart(chicago)
+        second = service.generate_birth_chart(utc)
+
+        assert second["timezone"] == "UTC"
+        assert second["planet_positions"] == first["planet_positions"]
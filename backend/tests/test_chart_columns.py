@@ -0,0 +1,181 @@
+"""
+Columnar Chart Storage Tests
+Covers row extraction, projections, blob fallback and indexed searches
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.api.v1 import charts
+from backend.api.v1.auth import get_current_user
+from backend.config.database import create_engines, get_db
+from backend.config.settings import DatabaseConfig
+from backend.models.database import Base, BirthChart, ChartHouseCusp, ChartPlanetPosition, User
+from backend.schemas import BirthDataInput
+from backend.services.calculation_service import CalculationService
+from backend.services.chart_cache import ChartCache
+from backend.services.chart_columns import (
+    backfill_chart_columns, find_chart_ids, load_projections, parse_fields, write_chart_columns
+)
+
+
+BIRTH_DATA = [
+    BirthDataInput(date="1984-12-19", time="12:00:00", timezone="America/Chicago",
+                   latitude=29.98, longitude=-90.15, location_name="New Orleans"),
+    BirthDataInput(date="1990-05-01", time="08:30:00", timezone="Asia/Kolkata",
+                   latitude=28.61, longitude=77.21, location_name="Delhi"),
+]
+
+
+@pytest.fixture(scope="module")
+def chart_data():
+    service = CalculationService(chart_cache=ChartCache())
+    return [service.generate_birth_chart(bd) for bd in BIRTH_DATA]
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine, write_engine = create_engines(
+        DatabaseConfig(driver="sqlite", sqlite_db_path=str(tmp_path / "columns.db"))
+    )
+    Base.metadata.create_all(bind=write_engine)
+    yield sessionmaker(bind=write_engine)
+    engine.dispose()
+    write_engine.dispose()
+
+
+@pytest.fixture
+def stored(session_factory, chart_data):
+    """User id and chart ids; only the first chart has columnar rows."""
+    with session_factory() as db:
+        user = User(email="columns@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        chart_ids = []
+        for bd, data in zip(BIRTH_DATA, chart_data):
+            chart = BirthChart(
+                user_id=user.user_id, birth_date=bd.date, birth_time=bd.time,
+                birth_latitude=bd.latitude, birth_longitude=bd.longitude,
+                birth_location=bd.location_name, chart_data=data, ayanamsa="24.6978",
+            )
+            db.add(chart)
+            db.flush()
+            chart_ids.append(chart.chart_id)
+        write_chart_columns(db, [(chart_ids[0], chart_data[0])])
+        db.commit()
+        return user.user_id, chart_ids
+
+
+class TestProjection:
+    """Test projected reads"""
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError):
+            parse_fields("chart_data")
+
+    def test_columnar_and_blob_charts_agree(self, session_factory, stored, chart_data):
+        user_id, chart_ids = stored
+        with session_factory() as db:
+            projected = load_projections(
+                db, chart_ids, ["birth_location", "ayanamsa", "planet_positions", "ascendant", "house_cusps"],
+                planets=["Sun", "Moon"],
+            )
+
+        columnar, from_blob = projected
+        assert columnar["birth_location"] == "New Orleans"
+        assert columnar["ayanamsa"] == 24.6978
+        assert [p["planet"] for p in columnar["planet_positions"]] == ["Sun", "Moon"]
+        assert [p["planet"] for p in from_blob["planet_positions"]] == ["Sun", "Moon"]
+
+        expected = chart_data[0]
+        assert columnar["ascendant"]["zodiac_sign"] == expected["ascendant"]["zodiac_sign"]
+        assert columnar["ascendant"]["degree"] == pytest.approx(expected["ascendant"]["degree"])
+        assert columnar["planet_positions"][1]["nakshatra"] == expected["planet_positions"][1]["nakshatra"]
+        assert len(columnar["house_cusps"]) == len(expected["house_cusps"])
+
+    def test_backfill_writes_missing_charts(self, session_factory, stored):
+        assert backfill_chart_columns(session_factory) == 1
+        assert backfill_chart_columns(session_factory) == 0
+        with session_factory() as db:
+            assert db.execute(select(func.count(func.distinct(ChartHouseCusp.chart_id)))).scalar() == 2
+
+    def test_backfill_continues_past_empty_batches(self, session_factory, stored):
+        user_id, chart_ids = stored
+        with session_factory() as db:
+            for n in range(3):
+                db.add(BirthChart(
+                    chart_id=f"00000000-0000-0000-0000-00000000000{n}", user_id=user_id,
+                    birth_date=BIRTH_DATA[0].date, birth_latitude=0.0, birth_longitude=0.0, chart_data={},
+                ))
+            db.commit()
+
+        assert backfill_chart_columns(session_factory, batch_size=1) == 4
+        with session_factory() as db:
+            found = db.execute(select(ChartPlanetPosition.chart_id).distinct()).scalars().all()
+            assert sorted(found) == sorted(chart_ids)
+
+
+class TestSearch:
+    """Test indexed placement searches"""
+
+    def test_find_by_nakshatra(self, session_factory, stored, chart_data):
+        backfill_chart_columns(session_factory)
+        user_id, chart_ids = stored
+        moon = next(p for p in chart_data[1]["planet_positions"] if p["planet"] == "Moon")
+
+        with session_factory() as db:
+            found = find_chart_ids(db, user_id, "Moon", nakshatra=moon["nakshatra"])
+            assert chart_ids[1] in found
+            assert find_chart_ids(db, "someone-else", "Moon", nakshatra=moon["nakshatra"]) == []
+
+    def test_search_uses_index(self, session_factory):
+        with session_factory() as db:
+            plan = db.execute(text(
+                "EXPLAIN QUERY PLAN SELECT chart_id FROM chart_planet_positions "
+                "WHERE planet = 'Moon' AND nakshatra = 'Rohini'"
+            )).all()
+        assert "idx_chart_planet_nakshatra" in " ".join(str(row[-1]) for row in plan)
+
+
+class TestEndpoints:
+    """Test ?fields= and /chart/search"""
+
+    @pytest.fixture
+    def client(self, session_factory, stored):
+        def override_db():
+            with session_factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(charts.router)
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(user_id=stored[0])
+        app.dependency_overrides[get_db] = override_db
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_list_with_fields(self, client):
+        async with client:
+            response = await client.get("/chart?fields=birth_date,planet_positions&planets=Moon")
+        assert response.status_code == 200
+        for chart in response.json():
+            assert set(chart) == {"chart_id", "birth_date", "planet_positions"}
+            assert [p["planet"] for p in chart["planet_positions"]] == ["Moon"]
+
+    @pytest.mark.asyncio
+    async def test_list_bad_field(self, client):
+        async with client:
+            response = await client.get("/chart?fields=nope")
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_search_endpoint(self, client, chart_data):
+        sun = chart_data[0]["planet_positions"][0]
+        async with client:
+            response = await client.get(f"/chart/search?planet=Sun&zodiac_sign={sun['zodiac_sign']}")
+        assert response.status_code == 200
+        assert [c["birth_location"] for c in response.json()] == ["New Orleans"]
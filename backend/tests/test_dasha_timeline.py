@@ -0,0 +1,105 @@
+"""
+Dasha Timeline Tests
+Checks the precomputed Vimshottari timeline against the per-date calculator
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from backend.calculations.dasha_engine import (
+    DashaCalculator,
+    DashaTimeline,
+    DASHA_LEVELS,
+    DASHA_SEQUENCE,
+)
+from backend.calculations.exceptions import DashaCalculationError
+
+
+BIRTH = datetime(1990, 5, 1, 6, 30, tzinfo=timezone.utc)
+BALANCE = 12.3
+
+
+@pytest.fixture(scope="module")
+def timeline():
+    return DashaTimeline(BIRTH, BALANCE)
+
+
+class TestDashaTimeline:
+    """Test timeline construction and lookups"""
+
+    def test_matches_calculator(self, timeline):
+        """Every level and the remaining years agree with calculate_dasha_position"""
+        calculator = DashaCalculator()
+        for days in np.random.default_rng(1).uniform(0, 100 * 365.25, 300):
+            query = BIRTH + timedelta(days=float(days))
+            expected = calculator.calculate_dasha_position(BIRTH, 0.0, BALANCE, query)
+            position = timeline.position_at(query)
+            assert position.dasha_planet == expected.dasha_planet
+            assert position.antardasha_planet == expected.antardasha_planet
+            assert position.pratyantardasha_planet == expected.pratyantardasha_planet
+            assert position.dasha_remaining == pytest.approx(expected.dasha_remaining)
+            assert expected.dasha_start <= query < expected.dasha_end
+
+    def test_calculator_periods(self):
+        """Balance 0 starts Ketu at birth; Venus follows 7 years later"""
+        calculator = DashaCalculator()
+        query = BIRTH + timedelta(days=8 * 365.25)
+        position = calculator.calculate_dasha_position(BIRTH, 0.0, 0.0, query)
+
+        assert position.dasha_planet == 'Venus'
+        assert position.dasha_start == BIRTH + timedelta(days=7 * 365.25)
+        assert position.dasha_remaining == pytest.approx(19.0)
+        assert position.antardasha_planet == 'Ketu'
+        assert position.antardasha_end == position.dasha_start + timedelta(days=20 * 7 / 120 * 365.25)
+        assert position.pratyantardasha_start <= query < position.pratyantardasha_end
+
+    def test_prediction_dasha_events_follow_timeline(self):
+        from backend.services.calculation_service import CalculationService
+
+        start = BIRTH + timedelta(days=365.25 * 30)
+        end = start + timedelta(days=365.25 * 20)
+        events = CalculationService._analyze_dasha_system(
+            None, DashaCalculator(), start, end, BIRTH, BALANCE
+        )
+        periods = DashaTimeline(BIRTH, BALANCE, years=60).periods_between(start, end)
+
+        assert [e.primary_planet for e in events] == [p.planet for p in periods]
+        assert [e.event_window_start for e in events] == [p.start_date for p in periods]
+
+    def test_levels_nest(self, timeline):
+        """Each period lies inside its parent"""
+        query = BIRTH + timedelta(days=4000)
+        periods = timeline.periods_at(query)
+        assert [p.level for p in periods] == DASHA_LEVELS
+        for parent, child in zip(periods, periods[1:]):
+            assert parent.start_date <= child.start_date <= query < child.end_date <= parent.end_date
+
+    def test_periods_between_are_contiguous(self, timeline):
+        start = BIRTH + timedelta(days=1000)
+        periods = timeline.periods_between(start, start + timedelta(days=60), 'Sookshma')
+        assert periods[0].start_date <= start < periods[0].end_date
+        for previous, current in zip(periods, periods[1:]):
+            assert previous.end_date == current.start_date
+
+    def test_vectorized_lookup(self, timeline):
+        dates = [BIRTH + timedelta(days=i * 37) for i in range(200)]
+        lords = timeline.lords_at(dates, 'Pratyantardasha')
+        for date, lord in zip(dates, lords):
+            assert timeline.period_at(date, 'Pratyantardasha').planet == DASHA_SEQUENCE[lord]
+
+        datetime64 = np.array([d.replace(tzinfo=None) for d in dates], dtype='datetime64[us]')
+        assert (timeline.lords_at(datetime64, 'Pratyantardasha') == lords).all()
+
+    def test_positions_at_matches_position_at(self, timeline):
+        dates = [BIRTH + timedelta(days=i) for i in range(0, 730, 13)]
+        assert timeline.positions_at(dates) == [timeline.position_at(d) for d in dates]
+
+    def test_out_of_range_raises(self, timeline):
+        with pytest.raises(DashaCalculationError):
+            timeline.period_at(BIRTH - timedelta(days=365.25 * 20))
+
+    def test_unknown_level_raises(self):
+        shallow = DashaTimeline(BIRTH, BALANCE, depth=2)
+        with pytest.raises(DashaCalculationError):
+            shallow.period_at(BIRTH, 'Prana')
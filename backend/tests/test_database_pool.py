@@ -0,0 +1,101 @@
+"""
+Database Pooling Tests
+Covers SQLite WAL setup, the dedicated write engine and pool metrics
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from backend.api.v1 import health
+from backend.config import database
+from backend.config.database import _pool_stats, create_engines, dispose_async_engine, get_pool_stats
+from backend.config.settings import DatabaseConfig, settings
+
+
+@pytest.fixture
+def sqlite_config(tmp_path):
+    return DatabaseConfig(driver="sqlite", sqlite_db_path=str(tmp_path / "pool.db"))
+
+
+class TestSQLiteEngines:
+    """Test the SQLite read/write engine pair"""
+
+    def test_file_database_uses_wal_and_single_writer(self, sqlite_config):
+        engine, write_engine = create_engines(sqlite_config)
+        try:
+            assert engine is not write_engine
+            assert write_engine.pool.size() == 1
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        finally:
+            engine.dispose()
+            write_engine.dispose()
+
+    def test_reader_sees_committed_writes(self, sqlite_config):
+        engine, write_engine = create_engines(sqlite_config)
+        try:
+            with write_engine.begin() as conn:
+                conn.execute(text("CREATE TABLE t (x INTEGER)"))
+                conn.execute(text("INSERT INTO t VALUES (1)"))
+            with engine.connect() as reader:
+                assert reader.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+        finally:
+            engine.dispose()
+            write_engine.dispose()
+
+    def test_memory_database_shares_one_engine(self):
+        engine, write_engine = create_engines(DatabaseConfig(driver="sqlite", sqlite_db_path=":memory:"))
+        assert engine is write_engine
+        assert "status" in _pool_stats(engine.pool)
+
+
+class TestPoolStats:
+    """Test pool utilization reporting"""
+
+    def test_checked_out_connections_are_counted(self, sqlite_config):
+        engine, write_engine = create_engines(sqlite_config)
+        try:
+            with engine.connect():
+                stats = _pool_stats(engine.pool)
+                assert stats["checked_out"] == 1
+                assert stats["utilization"] == pytest.approx(1 / sqlite_config.sqlite_read_pool_size)
+            assert _pool_stats(engine.pool)["checked_out"] == 0
+        finally:
+            engine.dispose()
+            write_engine.dispose()
+
+    def test_overflow_uses_configured_limit(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'overflow.db'}", poolclass=QueuePool, pool_size=1, max_overflow=2
+        )
+        try:
+            assert _pool_stats(engine.pool, max_overflow=2)["overflow"] == 0
+            with engine.connect(), engine.connect():
+                stats = _pool_stats(engine.pool, max_overflow=2)
+                assert stats["overflow"] == 1
+                assert stats["utilization"] == pytest.approx(2 / 3)
+        finally:
+            engine.dispose()
+
+
+class TestAsyncSession:
+    """Test the async engine behind async routes"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_queries_async_engine(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings.database, "sqlite_db_path", str(tmp_path / "async.db"))
+        monkeypatch.setattr(database, "_async_engine", None)
+        app = FastAPI()
+        app.include_router(health.router, prefix="/api/v1")
+
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/api/v1/health")
+            assert response.json()["database_status"] == "connected"
+            assert get_pool_stats()["async"]["checked_out"] == 0
+        finally:
+            await dispose_async_engine()
@@ -0,0 +1,129 @@
+"""
+Embedding Cache Tests
+Covers the memory and file tiers, batch deduplication in EmbeddingService
+and warm-up from FAISS metadata
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from backend.services.embedding_cache import EmbeddingCache, content_hash
+from backend.services.embedding_service import EmbeddingService
+
+
+DIMENSION = EmbeddingService.EMBEDDING_DIM
+
+
+class CountingModel:
+    """SentenceTransformer stand-in that records what it was asked to encode"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        return np.stack([
+            np.random.default_rng(zlib.crc32(t.encode())).normal(size=DIMENSION).astype(np.float32)
+            for t in texts
+        ])
+
+
+def vectors(n, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, DIMENSION)).astype(np.float32)
+
+
+class TestCacheTiers:
+    """Test LRU and binary file tiers"""
+
+    def test_memory_lru_evicts_oldest(self):
+        cache = EmbeddingCache(DIMENSION, "m", max_entries=2)
+        keys = [content_hash(t) for t in ("a", "b", "c")]
+        cache.put_many(keys, vectors(3))
+        assert [v is None for v in cache.get_many(keys)] == [True, False, False]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_file_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache.bin")
+        keys = [content_hash(f"text {i}") for i in range(5)]
+        data = vectors(5)
+
+        cache = EmbeddingCache(DIMENSION, "m", path=path)
+        cache.put_many(keys, data)
+        cache.put_many(keys[:2], data[:2])
+        cache.close()
+
+        reopened = EmbeddingCache(DIMENSION, "m", path=path)
+        found = reopened.get_many(keys[::-1])
+        np.testing.assert_array_equal(np.stack(found), data[::-1])
+        stats = reopened.get_stats()
+        assert (stats["disk_hits"], stats["disk_entries"]) == (5, 5)
+
+    def test_other_model_file_ignored(self, tmp_path):
+        path = str(tmp_path / "cache.bin")
+        cache = EmbeddingCache(DIMENSION, "model-a", path=path)
+        cache.put_many([content_hash("x")], vectors(1))
+        cache.close()
+
+        other = EmbeddingCache(DIMENSION, "model-b", path=path)
+        assert other.get_many([content_hash("x")]) == [None]
+        assert other.path is None
+
+    def test_partial_record_dropped(self, tmp_path):
+        path = tmp_path / "cache.bin"
+        cache = EmbeddingCache(DIMENSION, "m", path=str(path))
+        cache.put_many([content_hash("x")], vectors(1))
+        cache.close()
+        with open(path, "ab") as f:
+            f.write(b"\x01" * 100)
+
+        reopened = EmbeddingCache(DIMENSION, "m", path=str(path))
+        assert reopened.get_many([content_hash("x")])[0] is not None
+        reopened.put_many([content_hash("y")], vectors(1, seed=1))
+        reopened.close()
+        np.testing.assert_array_equal(
+            EmbeddingCache(DIMENSION, "m", path=str(path)).get_many([content_hash("y")])[0],
+            vectors(1, seed=1)[0],
+        )
+
+
+class TestEncode:
+    """Test EmbeddingService deduplication and cache use"""
+
+    def test_duplicates_encoded_once_and_repeats_skip_model(self):
+        model = CountingModel()
+        service = EmbeddingService(model=model)
+
+        first = service.encode(["sun", "moon", "sun"])
+        assert model.calls == [["sun", "moon"]]
+        np.testing.assert_array_equal(first[0], first[2])
+
+        again = service.encode(["moon", "mars", "sun"])
+        assert model.calls[-1] == ["mars"]
+        np.testing.assert_array_equal(again[0], first[1])
+
+        service.encode_single("mars")
+        assert len(model.calls) == 2
+
+
+class TestWarmUp:
+    """Test warming the cache from an indexed corpus"""
+
+    def test_warm_from_vector_store(self, tmp_path):
+        pytest.importorskip("faiss")
+        from backend.services.faiss_vector_store import FAISSIndexConfig, FAISSVectorStore
+
+        model = CountingModel()
+        store = FAISSVectorStore(
+            EmbeddingService(model=model), index_path=str(tmp_path), index_config=FAISSIndexConfig()
+        )
+        texts = [f"chunk {i}" for i in range(20)]
+        store.add_texts(texts, [{"category": "19_misc", "source": f"doc_{i}"} for i in range(20)])
+        assert store.metadata[3]["content_hash"] == content_hash("chunk 3")
+
+        fresh = EmbeddingService(model=model, cache=EmbeddingCache(DIMENSION, "m"))
+        assert fresh.cache.warm_from_vector_store(store) == 20
+        calls = len(model.calls)
+        fresh.encode(texts)
+        assert len(model.calls) == calls
@@ -0,0 +1,74 @@
+"""
+Batch Ephemeris Tests
+Checks the vectorized get_positions_batch API against the scalar path
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from backend.calculations.ephemeris import (
+    EphemerisCalculator,
+    sign_indices,
+    nakshatra_indices,
+    retrograde_mask,
+)
+from backend.calculations.exceptions import PlanetNotFoundError
+
+
+@pytest.fixture
+def calc():
+    return EphemerisCalculator()
+
+
+class TestPositionsBatch:
+    """Test batch planetary positions"""
+
+    def test_shape_matches_times_and_planets(self, calc):
+        """Arrays are shaped [n_times, n_planets]"""
+        jd = calc.jd_range(datetime(2025, 1, 1), datetime(2025, 12, 31))
+        batch = calc.get_positions_batch(jd)
+
+        assert len(jd) == 365
+        assert batch.longitude.shape == (365, 12)
+        assert batch.speed.shape == (365, 12)
+        assert batch.planets == EphemerisCalculator.ALL_PLANETS
+
+    def test_matches_scalar_positions(self, calc):
+        """Batch rows agree with get_all_planets"""
+        dates = [datetime(1984, 12, 19, 18, 0), datetime(2025, 6, 1, 0, 0)]
+        batch = calc.get_positions_batch(calc.datetimes_to_jd(dates))
+
+        for row, date in enumerate(dates):
+            scalar = calc.get_all_planets(date)
+            materialized = batch.to_positions(row)
+            for name, position in scalar.items():
+                assert materialized[name].longitude == pytest.approx(position.longitude)
+                assert materialized[name].sign == position.sign
+                assert materialized[name].is_retrograde == position.is_retrograde
+
+    def test_ketu_opposes_rahu(self, calc):
+        """Ketu column is derived from Rahu"""
+        batch = calc.get_positions_batch([2460676.5], planets=['Rahu', 'Ketu'])
+        diff = (batch.longitude[0, 1] - batch.longitude[0, 0]) % 360
+        assert diff == pytest.approx(180.0)
+
+    def test_unknown_planet_raises(self, calc):
+        """Unknown planet names are rejected"""
+        with pytest.raises(PlanetNotFoundError):
+            calc.get_positions_batch([2460676.5], planets=['Vulcan'])
+
+
+class TestVectorizedDerivations:
+    """Test sign, nakshatra and retrograde helpers"""
+
+    def test_sign_indices(self):
+        lon = np.array([0.0, 29.999, 30.0, 359.9, 360.0])
+        assert sign_indices(lon).tolist() == [0, 0, 1, 11, 0]
+
+    def test_nakshatra_indices(self):
+        lon = np.array([0.0, 13.34, 359.99])
+        assert nakshatra_indices(lon).tolist() == [0, 1, 26]
+
+    def test_retrograde_mask(self):
+        assert retrograde_mask(np.array([0.5, -0.1, 0.0])).tolist() == [False, True, False]
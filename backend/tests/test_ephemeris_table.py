@@ -0,0 +1,62 @@
+"""
+Ephemeris Table Tests
+Checks the memory-mapped table and its Hermite interpolation
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from backend.calculations.ephemeris import EphemerisCalculator
+from backend.calculations.ephemeris_table import EphemerisTable
+from backend.calculations.exceptions import EphemerisError
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephemeris") / "table_6h"
+    return EphemerisTable.build(
+        str(path),
+        start=datetime(2025, 1, 1),
+        end=datetime(2025, 3, 1),
+        step_hours=6.0,
+    )
+
+
+class TestEphemerisTable:
+    """Test table build, load and interpolation"""
+
+    def test_loaded_as_memory_map(self, table):
+        """Reloaded tables are backed by a read-only memmap"""
+        reloaded = EphemerisTable.load(str(table.path))
+        assert isinstance(reloaded._longitude, np.memmap)
+        assert not reloaded._longitude.flags.writeable
+        assert reloaded.planets == EphemerisCalculator.ALL_PLANETS
+        assert reloaded.n_steps == table.n_steps
+
+    def test_interpolation_matches_swiss_ephemeris(self, table):
+        """Interpolated longitudes are within one arc-second"""
+        rng = np.random.default_rng(7)
+        jd = rng.uniform(table.start_jd, table.end_jd, 200)
+
+        longitude, speed = table.interpolate(jd)
+        exact = EphemerisCalculator().get_positions_batch(jd)
+
+        error = np.abs(np.mod(longitude - exact.longitude + 180.0, 360.0) - 180.0)
+        assert error.max() * 3600 < 1.0
+        assert np.abs(speed - exact.speed).max() < 0.05
+
+    def test_grid_points_are_exact(self, table):
+        """Grid points return the stored values"""
+        jd = table.start_jd + np.arange(5) * table.step_days
+        longitude, _ = table.interpolate(jd, planets=['Moon'])
+        assert np.allclose(longitude[:, 0], table._longitude[:5, 1])
+
+    def test_out_of_range_raises(self, table):
+        """Lookups outside the table are rejected"""
+        with pytest.raises(EphemerisError):
+            table.interpolate([table.end_jd + 1.0])
+
+    def test_missing_table_raises(self, tmp_path):
+        with pytest.raises(EphemerisError):
+            EphemerisTable.load(str(tmp_path / "missing"))
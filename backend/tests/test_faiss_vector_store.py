@@ -0,0 +1,218 @@
+"""
+FAISS Vector Store Tests
+Covers the index factory, in-index category filtering, recall reporting
+and memory-mapped persistence
+"""
+
+import pickle
+import zlib
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from backend.services.faiss_vector_store import FAISSIndexConfig, FAISSVectorStore
+from backend.services.vector_metadata import MappedMetadata
+
+
+DIMENSION = 32
+
+
+class FakeEmbeddingService:
+    """Deterministic random embeddings keyed by text"""
+
+    EMBEDDING_DIM = DIMENSION
+
+    def __init__(self):
+        self.vectors = {}
+
+    def encode_single(self, text):
+        if text not in self.vectors:
+            seed = zlib.crc32(text.encode())
+            self.vectors[text] = np.random.default_rng(seed).normal(size=DIMENSION).astype(np.float32)
+        return self.vectors[text]
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        return np.stack([self.encode_single(t) for t in texts])
+
+
+def build_store(tmp_path, config, n_texts=2000):
+    store = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path), index_config=config)
+    texts = [f"chunk {i}" for i in range(n_texts)]
+    metadata = [
+        {"category": "02_vedic_core" if i % 4 == 0 else "19_misc", "source": f"doc_{i}"}
+        for i in range(n_texts)
+    ]
+    store.add_texts(texts, metadata)
+    return store
+
+
+class TestIndexFactory:
+    """Test index construction"""
+
+    def test_unknown_type_rejected(self):
+        with pytest.raises(ValueError):
+            FAISSIndexConfig(index_type="lsh")
+
+    @pytest.mark.parametrize("index_type", ["ivf_flat", "ivf_pq", "hnsw"])
+    def test_ann_index_types(self, tmp_path, index_type):
+        config = FAISSIndexConfig(index_type=index_type, nlist=8, pq_m=8, pq_nbits=4)
+        store = build_store(tmp_path, config)
+        assert store.index_type == index_type
+        assert store.index.ntotal == 2000
+
+    def test_too_few_vectors_falls_back_to_flat(self, tmp_path):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type="ivf_flat", nlist=64), n_texts=100)
+        assert store.index_type == "flat"
+
+
+class TestSearch:
+    """Test search and category filtering"""
+
+    @pytest.mark.parametrize("index_type", ["flat", "ivf_flat", "hnsw"])
+    def test_category_filter_inside_index(self, tmp_path, index_type):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type=index_type, nlist=8))
+        results = store.search("chunk 17", k=5, category_filter="02_vedic_core")
+        assert len(results) == 5
+        assert all(r["category"] == "02_vedic_core" for r in results)
+
+    def test_exact_match_found(self, tmp_path):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type="ivf_flat", nlist=8, nprobe=8))
+        assert store.search("chunk 12", k=1)[0]["text"] == "doc_12"
+
+    def test_recall_report(self, tmp_path):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type="ivf_flat", nlist=16))
+        queries = np.random.default_rng(1).normal(size=(20, DIMENSION)).astype(np.float32)
+        report = store.evaluate_search(queries, k=5, nprobe_values=[1, 16])
+        assert [r["nprobe"] for r in report] == [1, 16]
+        assert report[-1]["recall_at_k"] == pytest.approx(1.0)
+        assert report[0]["recall_at_k"] <= report[-1]["recall_at_k"]
+
+    def test_save_load_keeps_index_type(self, tmp_path):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type="hnsw"))
+        assert store.save()
+
+        loaded = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert loaded.load()
+        assert loaded.index_type == "hnsw"
+        assert loaded.search("chunk 3", k=2, category_filter="19_misc")
+
+    def test_category_weight_reranks_past_raw_top_k(self, tmp_path):
+        embeddings = FakeEmbeddingService()
+        unit = np.eye(DIMENSION, dtype=np.float32)
+        embeddings.vectors["query"] = np.zeros(DIMENSION, dtype=np.float32)
+        texts = ["misc 0", "misc 1", "misc 2", "apex"]
+        # Squared L2 distances 0.1, 0.2, 0.3 and 0.5 from the query
+        for i, (text, distance) in enumerate(zip(texts, [0.1, 0.2, 0.3, 0.5])):
+            embeddings.vectors[text] = unit[i] * distance ** 0.5
+        metadata = [{"category": "19_misc", "source": f"misc_{i}"} for i in range(3)]
+        metadata.append({"category": "01_voodoo_spiritual_apex", "source": "apex_doc"})
+
+        store = FAISSVectorStore(embeddings, index_path=str(tmp_path), index_config=FAISSIndexConfig())
+        store.add_texts(texts, metadata)
+        results = store.search("query", k=2)
+
+        # Fourth by raw distance, first once weighted 1.5x
+        assert [r["text"] for r in results] == ["apex_doc", "misc_0"]
+
+
+class TestMappedPersistence:
+    """Test mmap-backed save/load"""
+
+    @pytest.mark.parametrize("index_type", ["flat", "ivf_flat", "hnsw"])
+    def test_mapped_load_matches_in_memory(self, tmp_path, index_type):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type=index_type, nlist=8, nprobe=8))
+        assert store.save()
+
+        mapped = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert mapped.load()
+        assert isinstance(mapped.metadata, MappedMetadata)
+        assert mapped.get_stats()["memory_mapped"]
+        assert mapped.metadata[5] == store.metadata[5]
+        for query in ("chunk 4", "chunk 99"):
+            assert mapped.search(query, k=5, category_filter="02_vedic_core") == \
+                store.search(query, k=5, category_filter="02_vedic_core")
+
+    def test_add_after_mapped_load(self, tmp_path):
+        build_store(tmp_path, FAISSIndexConfig(), n_texts=50).save()
+
+        store = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert store.load()
+        store.add_texts(["new text"], [{"category": "08_tarot", "source": "new_doc"}])
+        assert not store.get_stats()["memory_mapped"]
+        assert store.search("new text", k=1)[0]["text"] == "new_doc"
+        assert store.search("chunk 7", k=1, category_filter="08_tarot")[0]["text"] == "new_doc"
+
+        # Saving replaces the files; an older mapping stays readable
+        other = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert other.load()
+        assert store.save()
+        assert other.metadata[49]["source"] == "doc_49"
+
+        reloaded = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert reloaded.load()
+        assert reloaded.text_count == 51
+        assert reloaded.metadata[-1]["category"] == "08_tarot"
+
+    def test_save_swaps_whole_generation(self, tmp_path, monkeypatch):
+        store = build_store(tmp_path, FAISSIndexConfig(), n_texts=30)
+        assert store.save()
+        store.add_texts(["second"], [{"category": "08_tarot", "source": "second_doc"}])
+        assert store.save()
+
+        # A save that fails part-way leaves CURRENT on the previous generation
+        store.add_texts(["third"], [{"category": "08_tarot", "source": "third_doc"}])
+        monkeypatch.setattr(
+            "backend.services.faiss_vector_store.write_metadata",
+            lambda directory, metadata: (_ for _ in ()).throw(OSError("disk full"))
+        )
+        assert not store.save()
+
+        reloaded = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert reloaded.load()
+        assert reloaded.text_count == len(reloaded.metadata) == reloaded.index.ntotal == 31
+        assert reloaded.metadata[-1]["source"] == "second_doc"
+        assert len(list((tmp_path / "generations").iterdir())) == 2
+
+    def test_legacy_pickle_metadata(self, tmp_path):
+        store = build_store(tmp_path, FAISSIndexConfig(), n_texts=20)
+        faiss.write_index(store.index, str(tmp_path / "faiss.index"))
+        with open(tmp_path / "metadata.pkl", "wb") as f:
+            pickle.dump(store.metadata, f)
+
+        legacy = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert legacy.load()
+        assert legacy.metadata == store.metadata
+        assert legacy.search("chunk 2", k=1)[0]["text"] == "doc_2"
+
+
+class TestRemoval:
+    """Test removing vectors by id"""
+
+    @pytest.mark.parametrize("index_type", ["flat", "ivf_flat", "hnsw"])
+    def test_removed_ids_not_returned(self, tmp_path, index_type):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type=index_type, nlist=8))
+        assert store.remove_ids([0, 4, 4, 5000]) == 2
+        assert store.text_count == 1998
+
+        assert store.search("chunk 0", k=1)[0]["index"] != 0
+        assert all(r["index"] != 4 for r in store.search("chunk 4", k=10, category_filter="02_vedic_core"))
+        assert store.search("chunk 8", k=1)[0]["text"] == "doc_8"
+
+        store.add_texts(["fresh"], [{"category": "19_misc", "source": "fresh_doc"}])
+        assert store.search("fresh", k=1)[0]["index"] == 2000
+
+    def test_deletions_persist_and_compact(self, tmp_path):
+        store = build_store(tmp_path, FAISSIndexConfig(index_type="hnsw"), n_texts=200)
+        store.remove_ids(range(0, 200, 2))
+        assert store.save()
+
+        reloaded = FAISSVectorStore(FakeEmbeddingService(), index_path=str(tmp_path))
+        assert reloaded.load()
+        assert reloaded.text_count == 100
+        assert reloaded.search("chunk 10", k=1)[0]["text"] != "doc_10"
+
+        reloaded.rebuild_index()
+        assert len(reloaded.metadata) == 100
+        assert reloaded.search("chunk 11", k=1)[0]["text"] == "doc_11"
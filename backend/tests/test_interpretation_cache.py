@@ -0,0 +1,245 @@
+"""
+Interpretation Cache Tests
+Covers feature-key normalization, the semantic context tier,
+stale-while-revalidate and tag / SCAN invalidation
+"""
+
+import json
+import zlib
+
+import numpy as np
+import pytest
+
+from backend.services.cached_perplexity_service import CachedPerplexityService
+from backend.services.interpretation_cache import InterpretationCache, chart_features
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client API used by InterpretationCache (no KEYS)"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        value = self.store.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = str(value)
+        self.ttls.pop(key, None)
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    def expire(self, key, seconds):
+        if key not in self.store:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    def delete(self, *keys):
+        keys = [k.decode() if isinstance(k, bytes) else k for k in keys]
+        for key in keys:
+            self.ttls.pop(key, None)
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def hset(self, key, field, value):
+        self.store.setdefault(key, {})[field] = value
+
+    def hlen(self, key):
+        return len(self.store.get(key, {}))
+
+    def hgetall(self, key):
+        return {k.encode(): v for k, v in self.store.get(key, {}).items()}
+
+    def hdel(self, key, *fields):
+        return sum(self.store.get(key, {}).pop(field, None) is not None for field in fields)
+
+    def zadd(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        return sum(self.store.get(key, {}).pop(member, None) is not None for member in members)
+
+    def zcard(self, key):
+        return len(self.store.get(key, {}))
+
+    def zpopmin(self, key, count=1):
+        ranked = sorted(self.store.get(key, {}).items(), key=lambda item: item[1])[:count]
+        for member, _ in ranked:
+            del self.store[key][member]
+        return [(member.encode(), score) for member, score in ranked]
+
+    def zremrangebyscore(self, key, low, high):
+        low, high = float(low), float(high)
+        zset = self.store.get(key, {})
+        removed = [m for m, score in zset.items() if low <= score <= high]
+        for member in removed:
+            del zset[member]
+        return len(removed)
+
+    def zscan_iter(self, key, count=None):
+        return iter([(m.encode(), score) for m, score in self.store.get(key, {}).items()])
+
+    def scan_iter(self, match="*", count=None):
+        prefix = match.rstrip("*")
+        return iter([k.encode() for k in list(self.store) if k.startswith(prefix)])
+
+
+class BagOfWordsEmbedding:
+    """Hashed bag-of-words vectors: rewordings with the same words are close"""
+
+    def encode_single(self, text):
+        vector = np.zeros(64, dtype=np.float32)
+        for word in text.split():
+            vector[zlib.crc32(word.encode()) % 64] += 1.0
+        return vector
+
+
+CHART = {
+    "planet_positions": [
+        {"planet": "Sun", "longitude": 125.2, "house": 10, "nakshatra": "Magha", "pada": 2},
+        {"planet": "Moon", "longitude": 214.0, "house": 1, "nakshatra": "Vishakha", "pada": 4},
+    ],
+    "ascendant": {"degree": 210.5, "zodiac_sign": "Libra", "zodiac_degree": 0.5},
+}
+
+
+def api_response(text="Fresh reading"):
+    return {
+        "choices": [{"message": {"content": text}}],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+    }
+
+
+@pytest.fixture
+def service():
+    service = CachedPerplexityService(
+        api_key="test-key", redis_client=FakeRedis(),
+        embedding_service=BagOfWordsEmbedding(), similarity_threshold=0.85,
+    )
+    service.api_calls = []
+    service._call_perplexity_api = lambda prompt, max_tokens: service.api_calls.append(prompt) or api_response()
+    return service
+
+
+class TestFeatureKeys:
+    """Test chart normalization"""
+
+    def test_sub_pada_differences_share_features(self):
+        moved = json.loads(json.dumps(CHART))
+        moved["planet_positions"][0]["longitude"] = 125.9
+        assert chart_features(moved) == chart_features(CHART)
+
+        rehoused = json.loads(json.dumps(CHART))
+        rehoused["planet_positions"][0]["house"] = 11
+        assert chart_features(rehoused) != chart_features(CHART)
+
+    def test_string_placements_and_context_normalized(self):
+        cache = InterpretationCache(FakeRedis())
+        assert cache.key_for({"sun": "Leo", "moon": "scorpio"}, "sun", "Career focus!") == \
+            cache.key_for({"sun": "leo", "moon": "Scorpio"}, " Sun", "career   focus")
+        assert cache.key_for({"sun": "Leo", "moon": "Scorpio"}, "sun") != \
+            cache.key_for({"sun": "Leo", "moon": "Aries"}, "sun")
+        assert chart_features({"sun": "Leo 15°"}) == ["sun:Leo::purva phalguni:1"]
+
+
+class TestCachedService:
+    """Test the cache tiers through CachedPerplexityService"""
+
+    def test_exact_and_semantic_hits(self, service):
+        first = service.generate_interpretation(CHART, "sun", "focus on my career path")
+        assert first["from_cache"] is False
+
+        assert service.generate_interpretation(CHART, "sun", "Focus on my career path.")["cache_state"] == "fresh"
+        assert service.generate_interpretation(CHART, "sun", "my career path focus")["cache_state"] == "semantic"
+        assert service.generate_interpretation(CHART, "sun", "relationships and family")["from_cache"] is False
+        assert len(service.api_calls) == 2
+
+        stats = service.get_cache_stats()
+        assert (stats["exact_hits"], stats["semantic_hits"], stats["cache_misses"]) == (1, 1, 2)
+        assert stats["hit_rate_percentage"] == 50.0
+
+    def test_hot_stale_entry_served_while_refreshing(self, service):
+        service.generate_interpretation(CHART, "sun")
+        key = service._generate_cache_key(CHART, "sun")
+        redis = service.redis_client
+        entry = json.loads(redis.get(key))
+        entry["cached_at"] -= service.cache_ttl + 1
+        redis.set(key, json.dumps(entry))
+        redis.set(f"{service.CACHE_PREFIX}hits:{key}", 5)
+
+        served = service.generate_interpretation(CHART, "sun")
+        assert served["cache_state"] == "refresh"
+        service._refresh_executor.shutdown(wait=True)
+
+        assert len(service.api_calls) == 2
+        assert service.get_cache_stats()["refreshes"] == 1
+        assert service.generate_interpretation(CHART, "sun")["cache_state"] == "fresh"
+
+    def test_cold_stale_entry_is_a_miss(self, service):
+        cache = service.cache
+        cache.set(CHART, "moon", None, {"interpretation": "old"})
+        key = cache.key_for(CHART, "moon")
+        entry = json.loads(service.redis_client.get(key))
+        entry["cached_at"] = 0
+        service.redis_client.set(key, json.dumps(entry))
+        assert cache.get(CHART, "moon") == (None, "miss")
+
+    def test_tag_invalidation_and_scan_clear(self, service):
+        service.generate_interpretation(CHART, "sun")
+        service.generate_interpretation(CHART, "moon", "emotional needs")
+        service.generate_interpretation({"sun": "Aries"}, "sun")
+
+        assert service.invalidate_cache_tags(["type:sun"]) == 2
+        assert service.generate_interpretation(CHART, "moon", "emotional needs")["from_cache"] is True
+        assert service.generate_interpretation(CHART, "sun")["from_cache"] is False
+
+        assert service.clear_cache() > 0
+        assert not [k for k in service.redis_client.store if k.startswith(service.CACHE_PREFIX)]
+
+
+class TestRedisLayout:
+    """Test that index keys expire and stay bounded"""
+
+    def test_every_key_gets_entry_lifetime(self, service):
+        service.generate_interpretation(CHART, "sun", "focus on my career path")
+        service.generate_interpretation(CHART, "sun", "focus on my career path")
+        redis = service.redis_client
+        expiry = service.cache.ttl + service.cache.stale_ttl
+
+        keys = [k for k in redis.store if k.startswith(service.CACHE_PREFIX)]
+        assert {k[len(service.CACHE_PREFIX):].split(":")[0] for k in keys} >= {"hits", "ctx", "ctxage", "tag"}
+        assert all(redis.ttls.get(k) == expiry for k in keys)
+
+    def test_contexts_evicted_oldest_first(self):
+        redis = FakeRedis()
+        cache = InterpretationCache(redis, embedding_service=BagOfWordsEmbedding(), max_contexts=2)
+        for context in ("career", "marriage", "health"):
+            cache.set(CHART, "sun", context, {"interpretation": context})
+
+        groups = [v for k, v in redis.store.items() if k.startswith(f"{cache.KEY_PREFIX}ctx:")]
+        assert len(groups) == 1
+        assert set(groups[0]) == {cache.key_for(CHART, "sun", c) for c in ("marriage", "health")}
+        assert cache.get(CHART, "sun", "health")[0] == {"interpretation": "health"}
+
+    def test_expired_tag_members_pruned(self, monkeypatch):
+        redis = FakeRedis()
+        cache = InterpretationCache(redis, ttl=10, stale_ttl=10)
+        now = [1000.0]
+        monkeypatch.setattr("backend.services.interpretation_cache.time.time", lambda: now[0])
+        cache.set(CHART, "sun", None, {"interpretation": "old"}, tags=["chart:1"])
+        now[0] += 30
+        cache.set(CHART, "moon", None, {"interpretation": "new"}, tags=["chart:1"])
+
+        assert list(redis.store[f"{cache.KEY_PREFIX}tag:chart:1"]) == [cache.key_for(CHART, "moon")]
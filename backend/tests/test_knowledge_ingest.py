@@ -0,0 +1,124 @@
+"""
+Knowledge Ingestion Tests
+Covers paragraph chunking and incremental indexing of changed, unchanged
+and deleted knowledge base files
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from backend.services.faiss_vector_store import FAISSIndexConfig, FAISSVectorStore
+from backend.services.knowledge_ingest import KnowledgeIngestor, iter_chunks
+
+
+DIMENSION = 32
+
+
+class CountingEmbeddingService:
+    """Deterministic embeddings that record every encoded text"""
+
+    EMBEDDING_DIM = DIMENSION
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode_single(self, text):
+        return np.random.default_rng(zlib.crc32(text.encode())).normal(size=DIMENSION).astype(np.float32)
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        self.encoded.extend(texts)
+        return np.stack([self.encode_single(t) for t in texts])
+
+
+def write_book(path, paragraphs):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n\n".join(paragraphs) + "\n")
+
+
+@pytest.fixture
+def kb(tmp_path):
+    texts = tmp_path / "kb" / "texts"
+    write_book(texts / "02_vedic_core" / "book.md", [f"Vedic paragraph {i} " + "x" * 80 for i in range(20)])
+    write_book(texts / "08_tarot" / "cards.txt", [f"Tarot card {i} " + "y" * 80 for i in range(10)])
+    (texts / "08_tarot" / "cover.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+def make_ingestor(kb, embedding_service=None):
+    store = FAISSVectorStore(
+        embedding_service or CountingEmbeddingService(),
+        index_path=str(kb / "index"),
+        index_config=FAISSIndexConfig(),
+    )
+    return KnowledgeIngestor(str(kb / "kb"), store, chunk_size=200, batch_size=4, checkpoint_every=8)
+
+
+class TestChunking:
+    """Test the paragraph chunker"""
+
+    def test_packs_and_splits_paragraphs(self, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("one\ntwo\n\nthree\n\n\n" + "word " * 100)
+        chunks = list(iter_chunks(path, "19_misc", "19_misc/a.md", chunk_size=60))
+
+        assert chunks[0].content.startswith("one two\n\nthree")
+        assert all(len(c.content) <= 60 for c in chunks)
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+        assert " ".join(c.content.replace("\n\n", " ") for c in chunks).split() == (
+            ["one", "two", "three"] + ["word"] * 100
+        )
+
+
+class TestIncrementalIngest:
+    """Test change detection across runs"""
+
+    def test_second_run_is_noop(self, kb):
+        first = make_ingestor(kb).run()
+        assert first["files_scanned"] == 2
+        assert first["chunks_added"] == 15
+        assert first["checkpoints"] >= 2
+
+        embedder = CountingEmbeddingService()
+        second = make_ingestor(kb, embedder).run()
+        assert second["files_skipped"] == 2
+        assert second["chunks_added"] == second["chunks_removed"] == 0
+        assert embedder.encoded == []
+
+    def test_edit_embeds_only_changed_chunks(self, kb):
+        make_ingestor(kb).run()
+        paragraphs = [f"Vedic paragraph {i} " + "x" * 80 for i in range(20)]
+        paragraphs[7] = "Rewritten paragraph about nakshatras " + "z" * 60
+        write_book(kb / "kb" / "texts" / "02_vedic_core" / "book.md", paragraphs)
+
+        embedder = CountingEmbeddingService()
+        ingestor = make_ingestor(kb, embedder)
+        stats = ingestor.run()
+        assert (stats["files_changed"], stats["files_skipped"]) == (1, 1)
+        assert stats["chunks_added"] == stats["chunks_removed"] == 1
+        assert stats["chunks_unchanged"] == 9
+        assert len(embedder.encoded) == 1 and "nakshatras" in embedder.encoded[0]
+
+        store = ingestor.store
+        assert store.text_count == 15
+        top = store.search(embedder.encoded[0], k=1)[0]
+        assert top["text"] == "02_vedic_core/book.md"
+        assert "nakshatras" in store.metadata[top["index"]]["content"]
+
+    def test_deleted_file_removes_vectors(self, kb):
+        make_ingestor(kb).run()
+        (kb / "kb" / "texts" / "08_tarot" / "cards.txt").unlink()
+
+        ingestor = make_ingestor(kb)
+        stats = ingestor.run(compact=True)
+        assert stats["files_removed"] == 1
+        assert stats["chunks_removed"] == 5
+        assert ingestor.store.text_count == 10
+        assert ingestor.store.search("Tarot card 1", k=1, category_filter="08_tarot") == []
+
+        reloaded = make_ingestor(kb)
+        assert reloaded.run()["files_skipped"] == 1
+        assert len(reloaded.store.metadata) == 10
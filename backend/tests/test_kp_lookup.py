@@ -0,0 +1,112 @@
+"""
+KP Lookup Tests
+Checks the precomputed sub-lord table and the all-houses significator matrix
+"""
+
+import numpy as np
+import pytest
+
+from backend.calculations.kp_engine import (
+    get_sub_lord,
+    get_sub_lords,
+    get_star_lord,
+    get_sub_lord_boundaries,
+    get_significators_for_house,
+    compute_significator_matrix,
+    SIGNIFICATOR_PRIMARY,
+    NAKSHATRA_LENGTH,
+    SUB_LORD_SEQUENCE,
+    VIMSHOTTARI_PROPORTIONS,
+)
+
+
+def _scan_sub_lord(longitude):
+    """Reference linear scan over the nine subs of a nakshatra"""
+    nakshatra = int((longitude + 1e-9) / NAKSHATRA_LENGTH) % 27
+    position = longitude - nakshatra * NAKSHATRA_LENGTH
+    cumulative = 0.0
+    for planet in SUB_LORD_SEQUENCE:
+        cumulative += VIMSHOTTARI_PROPORTIONS[planet]
+        if position < cumulative:
+            return nakshatra + 1, planet
+    return nakshatra + 1, 'Mercury'
+
+
+class TestSubLordTable:
+    """Test table-driven sub-lord lookups"""
+
+    def test_matches_linear_scan(self):
+        """Random longitudes resolve to the same nakshatra and sub-lord"""
+        for longitude in np.random.default_rng(3).uniform(0, 360, 5000):
+            result = get_sub_lord(float(longitude))
+            assert (result.nakshatra_num, result.sub_lord) == _scan_sub_lord(float(longitude))
+
+    def test_boundaries_are_inclusive(self):
+        """Each sub starts exactly at its boundary"""
+        boundaries = get_sub_lord_boundaries()
+        assert len(boundaries) == 243
+        for start, nakshatra, lord in boundaries:
+            result = get_sub_lord(start + 1e-7)
+            assert result.nakshatra_num == nakshatra + 1
+            assert result.sub_lord == lord
+
+    @pytest.mark.parametrize("longitude", [0.0, 360.0, 359.9999999, -0.5, 720.25])
+    def test_wraps_longitude(self, longitude):
+        result = get_sub_lord(longitude)
+        assert 1 <= result.nakshatra_num <= 27
+        assert result.sub_lord in SUB_LORD_SEQUENCE
+
+    def test_vectorized_matches_scalar(self):
+        longitudes = np.random.default_rng(5).uniform(-360, 720, 2000)
+        subs = get_sub_lords(longitudes)
+        for i, longitude in enumerate(longitudes):
+            scalar = get_sub_lord(float(longitude))
+            assert subs.nakshatra[i] + 1 == scalar.nakshatra_num
+            assert subs.sub_lord_names[i] == scalar.sub_lord
+            assert subs.nakshatra_lord_names[i] == scalar.nakshatra_lord
+            assert subs.sign[i] == int(subs.longitude[i] // 30)
+
+    def test_star_lord(self):
+        assert get_star_lord(135.0) == get_sub_lord(135.0).nakshatra_lord == 'Venus'
+
+
+PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+
+def _random_chart(rng):
+    planets = {
+        name: {'longitude': float(rng.uniform(0, 360)), 'house': int(rng.integers(1, 13))}
+        for name in PLANETS
+    }
+    return planets, sorted(rng.uniform(0, 360, 12).tolist())
+
+
+class TestSignificatorMatrix:
+    """Test the single-pass significator computation"""
+
+    def test_matches_per_house_function(self):
+        rng = np.random.default_rng(11)
+        for _ in range(200):
+            planets, cusps = _random_chart(rng)
+            matrix = compute_significator_matrix(planets, cusps)
+            for house in range(1, 13):
+                assert matrix.for_house(house) == get_significators_for_house(house, planets, cusps)
+
+    def test_matrix_shape_and_occupants(self):
+        planets, cusps = _random_chart(np.random.default_rng(2))
+        matrix = compute_significator_matrix(planets, cusps)
+        assert matrix.flags.shape == (12, len(PLANETS))
+        for col, name in enumerate(matrix.planets):
+            house = planets[name]['house']
+            assert matrix.flags[house - 1, col] & SIGNIFICATOR_PRIMARY
+            assert matrix.strength[house - 1, col] == 1.0
+
+    def test_every_house_has_a_significator(self):
+        planets, cusps = _random_chart(np.random.default_rng(4))
+        matrix = compute_significator_matrix(planets, cusps)
+        assert (matrix.strength.max(axis=1) > 0).all()
+
+    def test_requires_twelve_cusps(self):
+        planets, _ = _random_chart(np.random.default_rng(0))
+        with pytest.raises(ValueError):
+            compute_significator_matrix(planets, [0.0] * 11)
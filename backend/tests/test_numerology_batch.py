@@ -0,0 +1,62 @@
+"""
+Batch Numerology Tests
+Covers vectorized name/date numbers against the scalar calculator
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from backend.calculations.numerology_engine import (
+    NumerologyCalculator, normalize_name, reduce_number, reduce_numbers
+)
+
+
+NAMES = ["Ann Lee", "JOHN o'brien", "Zoë Straße", "", None, "  ", "Mary-Kate Olsen", "ıſ ﬁ"]
+DATES = [date(1984, 12, 19), date(2000, 2, 29), date(1929, 11, 29), date(1901, 1, 1),
+         date(1990, 5, 1), date(2022, 2, 2), date(1975, 3, 10), date(1999, 9, 9)]
+
+
+@pytest.fixture
+def calc():
+    return NumerologyCalculator()
+
+
+class TestReduction:
+    """Test digit reduction"""
+
+    def test_vectorized_matches_scalar(self):
+        numbers = np.arange(0, 5000)
+        assert list(reduce_numbers(numbers)) == [reduce_number(int(n)) for n in numbers]
+
+    def test_master_numbers_kept(self):
+        assert list(reduce_numbers([11, 22, 33, 29, 38, 44])) == [11, 22, 33, 11, 11, 8]
+
+
+class TestBatch:
+    """Test batch numbers against the scalar methods"""
+
+    def test_normalize_name(self):
+        assert normalize_name("Zoë Straße-Ng") == b"ZOSTRASSENG"
+        assert normalize_name("john smith") == normalize_name("JOHN  SMITH!")
+
+    def test_all_numbers_match_scalar(self, calc):
+        batch = calc.get_all_numbers_batch(DATES, NAMES)
+        for i, (birth_date, name) in enumerate(zip(DATES, NAMES)):
+            expected = calc.get_all_numbers(birth_date, name)
+            assert batch["life_path"][i] == expected["life_path"]
+            for key in ("destiny", "soul_urge", "personality"):
+                assert batch[key][i] == expected.get(key, 0)
+
+    def test_accepts_iso_strings_and_datetime64(self, calc):
+        iso = [d.isoformat() for d in DATES]
+        expected = calc.calculate_life_path_numbers(DATES)
+        np.testing.assert_array_equal(calc.calculate_life_path_numbers(iso), expected)
+        np.testing.assert_array_equal(
+            calc.calculate_life_path_numbers(np.array(iso, dtype="datetime64[D]")), expected
+        )
+
+    def test_length_mismatch_rejected(self, calc):
+        with pytest.raises(ValueError):
+            calc.get_all_numbers_batch(DATES, NAMES[:2])
@@ -0,0 +1,153 @@
+"""
+Async Perplexity Client Tests
+Covers request coalescing, the concurrency limit, non-blocking backoff and
+latency histograms against a local mock chat-completions server
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from backend.api.v1 import perplexity_endpoints
+from backend.services.perplexity_client import AsyncPerplexityClient, LatencyHistogram
+from backend.services.perplexity_llm_service import PerplexityLLMService
+
+
+class MockPerplexity:
+    """Local chat-completions server recording calls and concurrency"""
+
+    def __init__(self, delay=0.05, failures=0, retry_after="0"):
+        self.delay = delay
+        self.failures = failures
+        self.retry_after = retry_after
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.app = FastAPI()
+        self.app.post("/chat/completions")(self.completions)
+
+    async def completions(self, request: Request):
+        body = await request.json()
+        self.calls.append(body)
+        if self.failures:
+            self.failures -= 1
+            return JSONResponse({"error": "rate limited"}, status_code=429, headers={"Retry-After": self.retry_after})
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return {
+            "choices": [{"message": {"content": f"Reading for: {body['messages'][0]['content'][:20]}"}}],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+        }
+
+
+def make_service(server, **client_options):
+    client = AsyncPerplexityClient(
+        api_key="test-key", base_url="http://mock", transport=httpx.ASGITransport(app=server.app),
+        backoff_base=0.01, **client_options,
+    )
+    return PerplexityLLMService(api_key="test-key", async_client=client)
+
+
+class TestAsyncClient:
+    """Test the pooled async client through PerplexityLLMService"""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_coalesced(self):
+        server = MockPerplexity()
+        service = make_service(server)
+
+        results = await asyncio.gather(*[
+            service.agenerate_interpretation({"sun": "Leo"}, "sun") for _ in range(10)
+        ])
+        await service.aclose()
+
+        assert len(server.calls) == 1
+        assert all(r["interpretation"] == results[0]["interpretation"] for r in results)
+        assert service.call_count == 1
+        assert sum(r["cost"] for r in results) == pytest.approx(service._calculate_cost(100, 50))
+        assert service.get_client_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited(self):
+        server = MockPerplexity()
+        service = make_service(server, max_concurrency=2)
+
+        results = await asyncio.gather(*[
+            service.agenerate_interpretation({"sun": sign}, "sun")
+            for sign in ("Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo")
+        ])
+        await service.aclose()
+
+        assert all("error" not in r for r in results)
+        assert len(server.calls) == 6
+        assert server.peak == 2
+        stats = service.get_client_stats()
+        assert stats["queue_wait"]["count"] == 6
+        assert stats["latency"]["count"] == 6
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backoff_does_not_block_loop(self):
+        server = MockPerplexity(failures=2, retry_after="0.1")
+        service = make_service(server)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        result = await service.agenerate_interpretation({"sun": "Leo"}, "sun")
+        task.cancel()
+        await service.aclose()
+
+        assert "error" not in result
+        assert len(server.calls) == 3
+        assert ticks >= 10
+        stats = service.get_client_stats()
+        assert (stats["rate_limited"], stats["retries"]) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_returns_error(self):
+        server = MockPerplexity(failures=5)
+        service = make_service(server, retries=2)
+
+        result = await service.agenerate_interpretation({"sun": "Leo"}, "sun")
+        await service.aclose()
+
+        assert result["status"] == 429
+        assert service.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_app_shutdown_closes_pool(self, monkeypatch):
+        server = MockPerplexity()
+        service = make_service(server)
+        monkeypatch.setattr(perplexity_endpoints, "_llm_service", service)
+
+        await service.agenerate_interpretation({"sun": "Leo"}, "sun")
+        client = service.get_async_client()
+        assert client._client is not None
+
+        await perplexity_endpoints.shutdown_services()
+        assert client._client is None
+
+
+class TestLatencyHistogram:
+    """Test bucket counting"""
+
+    def test_cumulative_buckets_and_quantiles(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.05, 0.5, 3.0):
+            histogram.observe(seconds)
+
+        report = histogram.to_dict()
+        assert report["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert report["p50_le_seconds"] == 0.1
+        assert report["p99_le_seconds"] == 3.0
+        assert report["max_ms"] == 3000.0
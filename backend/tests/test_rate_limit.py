@@ -0,0 +1,159 @@
+"""
+Tests for the rate limiting / admission control middleware.
+"""
+
+import asyncio
+import hashlib
+import secrets
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.middleware.rate_limit import (
+    MemoryBucketStore,
+    RateLimitMiddleware,
+    RedisBucketStore,
+)
+
+
+def make_app(**kwargs):
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.get("/api/v1/lookup")
+    async def lookup():
+        return {"ok": True}
+
+    @app.post("/api/v1/predict")
+    async def predict():
+        await release.wait()
+        return {"ok": True}
+
+    @app.get("/api/v1/health")
+    async def health():
+        return {"status": "healthy"}
+
+    known = {hashlib.sha256(key.encode()).hexdigest() for key in ("key-a", "key-b")}
+    kwargs.setdefault("api_key_lookup", lambda key_hash: key_hash if key_hash in known else None)
+    app.add_middleware(RateLimitMiddleware, **kwargs)
+    app.state.release = release
+    return app
+
+
+def client_for(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestMemoryBucketStore:
+    @pytest.mark.asyncio
+    async def test_take_and_refill(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("backend.middleware.rate_limit.time.monotonic", lambda: now[0])
+        store = MemoryBucketStore()
+
+        assert (await store.take("a", 3, capacity=5, rate=1.0)).allowed
+        decision = await store.take("a", 3, capacity=5, rate=1.0)
+        assert not decision.allowed
+        assert decision.retry_after == pytest.approx(1.0)
+
+        now[0] += 1.0
+        assert (await store.take("a", 3, capacity=5, rate=1.0)).allowed
+        assert (await store.take("b", 5, capacity=5, rate=1.0)).allowed
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        store = MemoryBucketStore(max_keys=2)
+        for key in ("a", "b", "c"):
+            await store.take(key, 1, capacity=5, rate=1.0)
+        assert list(store._buckets) == ["b", "c"]
+
+
+class TestRateLimitMiddleware:
+    @pytest.mark.asyncio
+    async def test_429_with_retry_after(self):
+        app = make_app(requests=3, period_seconds=60)
+        async with client_for(app) as client:
+            responses = [await client.get("/api/v1/lookup") for _ in range(4)]
+
+        assert [r.status_code for r in responses] == [200, 200, 200, 429]
+        assert responses[0].headers["x-ratelimit-remaining"] == "2"
+        assert responses[3].headers["retry-after"] == "20"
+        assert responses[3].json()["error_code"] == "RATE_LIMIT_EXCEEDED"
+
+    @pytest.mark.asyncio
+    async def test_route_costs_and_client_isolation(self):
+        app = make_app(requests=6, period_seconds=60)
+        app.state.release.set()
+        async with client_for(app) as client:
+            first = await client.post("/api/v1/predict", headers={"X-API-Key": "key-a"})
+            second = await client.post("/api/v1/predict", headers={"X-API-Key": "key-a"})
+            other = await client.post("/api/v1/predict", headers={"X-API-Key": "key-b"})
+            health = [await client.get("/api/v1/health") for _ in range(10)]
+
+        assert first.status_code == 200
+        assert first.headers["x-ratelimit-cost"] == "5"
+        assert second.status_code == 429
+        assert other.status_code == 200
+        assert all(r.status_code == 200 for r in health)
+
+    @pytest.mark.asyncio
+    async def test_rotating_unknown_keys_share_address_bucket(self):
+        app = make_app(requests=3, period_seconds=60)
+        async with client_for(app) as client:
+            responses = [
+                await client.get("/api/v1/lookup", headers={"X-API-Key": f"sk_{secrets.token_hex(8)}"})
+                for _ in range(8)
+            ]
+            plain = await client.get("/api/v1/lookup")
+            known = await client.get("/api/v1/lookup", headers={"X-API-Key": "key-a"})
+
+        assert [r.status_code for r in responses] == [200, 200, 200] + [429] * 5
+        assert plain.status_code == 429
+        assert known.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_heavy_concurrency_cap(self):
+        app = make_app(requests=1000, period_seconds=1, heavy_concurrency=2, heavy_queue_seconds=0.05)
+        async with client_for(app) as client:
+            running = [asyncio.create_task(client.post("/api/v1/predict")) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            rejected = await client.post("/api/v1/predict")
+            lookup = await client.get("/api/v1/lookup")
+
+            app.state.release.set()
+            done = await asyncio.gather(*running)
+
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "1"
+        assert lookup.status_code == 200
+        assert [r.status_code for r in done] == [200, 200]
+
+    @pytest.mark.asyncio
+    async def test_queued_heavy_request_gets_slot(self):
+        app = make_app(requests=1000, period_seconds=1, heavy_concurrency=1, heavy_queue_seconds=2)
+        async with client_for(app) as client:
+            running = asyncio.create_task(client.post("/api/v1/predict"))
+            await asyncio.sleep(0.05)
+            queued = asyncio.create_task(client.post("/api/v1/predict"))
+            await asyncio.sleep(0.05)
+            app.state.release.set()
+            responses = await asyncio.gather(running, queued)
+
+        assert [r.status_code for r in responses] == [200, 200]
+
+
+class TestRedisBucketStore:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_on_error(self):
+        class BrokenRedis:
+            def register_script(self, script):
+                async def call(keys, args):
+                    raise ConnectionError("down")
+                return call
+
+        store = RedisBucketStore(BrokenRedis())
+        assert (await store.take("a", 1, capacity=1, rate=1.0)).allowed
+        assert not (await store.take("a", 1, capacity=1, rate=1.0)).allowed
+        assert store.errors == 1
@@ -0,0 +1,163 @@
+"""
+Result Store Tests
+Covers read/write-through, batched upserts, expiry sweeps and service wiring
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.config.database import create_engines
+from backend.config.settings import DatabaseConfig
+from backend.models.database import Base, BirthChart, EphemerisCache, TransitCalculation, User
+from backend.schemas import BirthDataInput
+from backend.services.calculation_service import CalculationService
+from backend.services.chart_cache import ChartCache
+from backend.services.result_store import EPHEMERIS_TABLE, TRANSIT_TABLE, ResultStore
+
+
+INSTANT = datetime(1984, 12, 19, 18, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine, write_engine = create_engines(
+        DatabaseConfig(driver="sqlite", sqlite_db_path=str(tmp_path / "results.db"))
+    )
+    Base.metadata.create_all(bind=write_engine)
+    yield sessionmaker(bind=write_engine)
+    engine.dispose()
+    write_engine.dispose()
+
+
+@pytest.fixture
+def chart_id(session_factory):
+    with session_factory() as db:
+        user = User(email="store@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        chart = BirthChart(
+            user_id=user.user_id, birth_date="1984-12-19", birth_time="12:00:00",
+            birth_latitude=29.98, birth_longitude=-90.15, chart_data={},
+        )
+        db.add(chart)
+        db.commit()
+        return chart.chart_id
+
+
+def count_rows(session_factory, model):
+    with session_factory() as db:
+        return db.execute(select(func.count()).select_from(model)).scalar()
+
+
+class TestEphemerisTier:
+    """Test position persistence"""
+
+    def test_write_through_then_exact_hit(self, session_factory):
+        store = ResultStore(session_factory, batch_size=2)
+        rows = [(INSTANT, f"Body{i}:LAHIRI", {"longitude": float(i)}) for i in range(5)]
+        assert store.put_positions(rows) == 5
+
+        found = store.get_positions(INSTANT, ["Body1:LAHIRI", "Body4:LAHIRI", "Other:LAHIRI"])
+        assert found == {"Body1:LAHIRI": {"longitude": 1.0}, "Body4:LAHIRI": {"longitude": 4.0}}
+        assert store.get_positions(INSTANT + timedelta(seconds=1), ["Body1:LAHIRI"]) == {}
+
+        stats = store.get_stats()[EPHEMERIS_TABLE]
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (2, 2, 5)
+
+    def test_upsert_replaces_existing_rows(self, session_factory):
+        store = ResultStore(session_factory)
+        store.put_positions([(INSTANT, "Sun:LAHIRI", {"longitude": 1.0})])
+        store.put_positions([(INSTANT, "Sun:LAHIRI", {"longitude": 2.0})])
+
+        assert count_rows(session_factory, EphemerisCache) == 1
+        assert store.get_positions(INSTANT, ["Sun:LAHIRI"])["Sun:LAHIRI"] == {"longitude": 2.0}
+
+
+class TestTransitTier:
+    """Test transit result persistence"""
+
+    def test_request_key_must_match(self, session_factory, chart_id):
+        store = ResultStore(session_factory)
+        day = datetime(2025, 1, 1)
+        store.put_transits([
+            (chart_id, day, "windows:30", [{"peak": 0.9}], 0.9),
+            (chart_id, day, "windows:60", [{"peak": 0.8}], 0.8),
+        ])
+
+        assert store.get_transit(chart_id, day, "windows:60") == [{"peak": 0.8}]
+        assert store.get_transit(chart_id, day, "windows:90") is None
+        assert store.get_stats()[TRANSIT_TABLE]["hit_rate_percentage"] == 50
+
+    def test_expired_rows_are_missed_and_swept(self, session_factory, chart_id):
+        store = ResultStore(session_factory)
+        day = datetime(2025, 1, 1)
+        store.put_transits([(chart_id, day, "windows:30", [], None)], expires_at=day + timedelta(days=1))
+        store.put_positions([(INSTANT, "Sun:LAHIRI", {"longitude": 1.0})])
+
+        assert store.get_transit(chart_id, day, "windows:30") is None
+        assert store.sweep_expired() == {EPHEMERIS_TABLE: 0, TRANSIT_TABLE: 1}
+        assert count_rows(session_factory, TransitCalculation) == 0
+
+
+class TestSessions:
+    """Test lookups use the read pool"""
+
+    def test_reads_and_writes_use_separate_factories(self, session_factory):
+        reads = []
+
+        def read_factory():
+            reads.append(1)
+            return session_factory()
+
+        def no_reads():
+            raise AssertionError("lookup used the write session factory")
+
+        writer = ResultStore(session_factory)
+        writer.put_positions([(INSTANT, "Sun:LAHIRI", {"longitude": 1.0})])
+        store = ResultStore(no_reads, read_session_factory=read_factory)
+
+        assert store.get_positions(INSTANT, ["Sun:LAHIRI"]) == {"Sun:LAHIRI": {"longitude": 1.0}}
+        assert store.get_transit("missing", INSTANT, "windows:30") is None
+        assert len(reads) == 2
+
+
+class TestCalculationServiceWiring:
+    """Test the service reads through the store"""
+
+    BIRTH_DATA = BirthDataInput(
+        date="1984-12-19", time="12:00:00", timezone="America/Chicago",
+        latitude=29.98, longitude=-90.15, location_name="New Orleans"
+    )
+
+    def test_natal_positions_not_persisted(self, session_factory):
+        store = ResultStore(session_factory)
+        CalculationService(chart_cache=ChartCache(), result_store=store).generate_birth_chart(self.BIRTH_DATA)
+
+        # A single-instant lookup is cheaper to compute than to read back
+        assert count_rows(session_factory, EphemerisCache) == 0
+        assert store.get_stats()[EPHEMERIS_TABLE]["misses"] == 0
+
+    def test_transit_windows_persisted_per_chart(self, session_factory, chart_id, monkeypatch):
+        from backend.calculations.transit_engine import ActivationWindow, TransitAnalyzer
+
+        store = ResultStore(session_factory)
+        service = CalculationService(chart_cache=ChartCache(), result_store=store)
+        start = datetime.now(timezone.utc)
+        end = start + timedelta(days=60)
+        window = ActivationWindow(
+            start_date=start, end_date=end, duration_days=61, event_type="Marriage",
+            key_planets=["Venus"], favorable_days=3, unfavorable_days=58,
+            peak_date=start + timedelta(days=5), peak_confidence=0.8,
+        )
+        analyzer = TransitAnalyzer()
+        monkeypatch.setattr(analyzer, "get_favorable_windows", lambda *args: [window])
+
+        computed = service._get_favorable_windows(analyzer, {}, start, end, chart_id, "key")
+        monkeypatch.setattr(analyzer, "get_favorable_windows", lambda *args: pytest.fail("recomputed"))
+        stored = service._get_favorable_windows(analyzer, {}, start, end, chart_id, "key")
+
+        assert stored == computed == [window]
+        assert store.get_stats()[TRANSIT_TABLE]["hits"] == 1
@@ -0,0 +1,139 @@
+"""
+Streaming Tests
+Covers generator/top-k transit scans and the NDJSON/SSE prediction endpoints
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.api.v1.auth import get_current_user
+from backend.api.v1 import predictions
+from backend.api.v1.predictions import router
+from backend.calculations.transit_engine import TransitAnalyzer
+from backend.schemas import BirthDataInput
+from backend.services.calculation_executor import CalculationExecutor
+from backend.services.calculation_service import CalculationService
+from backend.services.chart_cache import ChartCache
+
+
+BIRTH_DATA = BirthDataInput(
+    date="1984-12-19", time="12:00:00", timezone="America/Chicago",
+    latitude=29.98, longitude=-90.15, location_name="New Orleans"
+)
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def chart():
+    return CalculationService(chart_cache=ChartCache()).generate_birth_chart(BIRTH_DATA)
+
+
+def make_client():
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: None
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestTransitGenerators:
+    """Test the generator and heap variants of the transit scan"""
+
+    def test_iterator_matches_list(self, chart):
+        analyzer = TransitAnalyzer()
+        end = START + timedelta(days=90)
+        streamed = list(analyzer.iter_transit_activations(chart, START, end))
+        full = analyzer.get_transit_activations(chart, START, end)
+
+        assert [e.event_date for e in streamed] == sorted(e.event_date for e in streamed)
+        assert sorted(streamed, key=lambda e: e.combined_confidence, reverse=True) == full
+
+    def test_top_k_matches_sorted_prefix(self, chart):
+        analyzer = TransitAnalyzer()
+        end = START + timedelta(days=90)
+        full = analyzer.get_transit_activations(chart, START, end)
+
+        assert analyzer.top_transit_activations(chart, START, end, k=15) == full[:15]
+
+    def test_exact_timing_one_event_per_ingress(self, chart):
+        analyzer = TransitAnalyzer()
+        events = analyzer.get_transit_activations(
+            chart, START, START + timedelta(days=60), exact_timing=True
+        )
+        keys = [(e.event_date, e.transiting_planet, e.house_matter) for e in events]
+
+        assert events
+        assert len(set(keys)) == len(keys)
+
+
+class TestStreamingEndpoints:
+    """Test NDJSON and SSE responses"""
+
+    TRANSIT_BODY = {
+        "birth_data": BIRTH_DATA.model_dump(),
+        "query_date": START.isoformat(),
+        "window_days": 30,
+    }
+
+    @pytest.mark.asyncio
+    async def test_transit_ndjson(self):
+        async with make_client() as client:
+            response = await client.post("/predict/transits/stream", json=self.TRANSIT_BODY)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["event_count"] == len(records) - 1
+
+    @pytest.mark.asyncio
+    async def test_transit_sse_top_k(self):
+        async with make_client() as client:
+            response = await client.post("/predict/transits/stream?format=sse&top_k=3", json=self.TRANSIT_BODY)
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        messages = [m for m in response.text.split("\n\n") if m]
+        assert messages[-1].startswith("event: summary")
+        confidences = [
+            json.loads(m.split("data: ", 1)[1])["event"]["combined_confidence"] for m in messages[:-1]
+        ]
+        assert len(confidences) == 3
+        assert confidences == sorted(confidences, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_prediction_ndjson_ends_with_summary(self):
+        async with make_client() as client:
+            response = await client.post("/predict/stream", json={
+                "birth_data": BIRTH_DATA.model_dump(),
+                "query": "When is a good time for a career move?",
+                "prediction_window_days": 30,
+            })
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records[-1]["type"] == "summary"
+        assert {r["source"] for r in records[:-1]} <= {"kp", "dasha", "transit"}
+
+    @pytest.mark.asyncio
+    async def test_streams_hold_executor_slot(self, monkeypatch):
+        executor = CalculationExecutor(mode="inline", max_pending=1)
+        monkeypatch.setattr(predictions, "calc_executor", executor)
+        prediction_body = {
+            "birth_data": BIRTH_DATA.model_dump(),
+            "query": "When is a good time for a career move?",
+            "prediction_window_days": 30,
+        }
+
+        async with make_client() as client:
+            with executor.reserve("other"):
+                busy = await client.post("/predict/stream", json=prediction_body)
+                busy_transits = await client.post("/predict/transits/stream", json=self.TRANSIT_BODY)
+            served = await client.post("/predict/transits/stream", json=self.TRANSIT_BODY)
+
+        assert busy.status_code == busy_transits.status_code == 503
+        assert busy.headers["retry-after"] == "1"
+        assert served.status_code == 200
+        stats = executor.get_stats()
+        assert stats["pending"] == 0
+        assert stats["tasks"]["transit_stream"]["count"] == 1
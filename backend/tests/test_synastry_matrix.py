@@ -0,0 +1,118 @@
+"""
+Matrix Synastry Tests
+Covers broadcast scoring parity with calculate_synastry, top-k ranking and
+loading candidates from the columnar chart tables
+"""
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.calculations.synastry_engine import SynastryCalculator, SynastryMatrix
+from backend.config.database import create_engines
+from backend.config.settings import DatabaseConfig
+from backend.models.database import Base, BirthChart, User
+from backend.schemas import BirthDataInput
+from backend.services.calculation_service import CalculationService
+from backend.services.chart_cache import ChartCache
+from backend.services.chart_columns import load_synastry_matrix, write_chart_columns
+
+
+@pytest.fixture(scope="module")
+def charts():
+    rng = np.random.default_rng(7)
+    service = CalculationService(chart_cache=ChartCache())
+    result = []
+    for _ in range(25):
+        birth_data = BirthDataInput(
+            date=f"{rng.integers(1950, 2005)}-{rng.integers(1, 13):02d}-{rng.integers(1, 29):02d}",
+            time=f"{rng.integers(0, 24):02d}:{rng.integers(0, 60):02d}:00",
+            timezone="UTC",
+            latitude=float(rng.uniform(-60, 60)),
+            longitude=float(rng.uniform(-170, 170)),
+        )
+        result.append(service.generate_birth_chart(birth_data))
+    return result
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return SynastryCalculator()
+
+
+class TestMatrixScoring:
+    """Test the broadcast scorer against the pairwise engine"""
+
+    def test_scores_match_pairwise_synastry(self, charts, calculator):
+        query, candidates = charts[0], charts[1:]
+        scores = calculator.score_candidates(
+            query, SynastryMatrix.from_charts((str(i), c) for i, c in enumerate(candidates))
+        )
+
+        for i, candidate in enumerate(candidates):
+            expected = calculator.calculate_synastry(query, candidate, include_composite=False).compatibility_score
+            assert scores["overall"][i] == pytest.approx(expected.overall_score)
+            assert scores["emotional"][i] == pytest.approx(expected.emotional_compatibility)
+            assert scores["sexual"][i] == pytest.approx(expected.sexual_compatibility)
+            assert scores["harmonious_aspects"][i] == expected.harmonious_aspects
+            assert scores["challenging_aspects"][i] == expected.challenging_aspects
+
+    def test_rank_matches_orders_top_k(self, charts, calculator):
+        matrix = SynastryMatrix.from_charts((str(i), c) for i, c in enumerate(charts[1:]))
+        overall = calculator.score_candidates(charts[0], matrix)["overall"]
+
+        matches = calculator.rank_matches(charts[0], matrix, top_k=5)
+        assert [m.overall_score for m in matches] == pytest.approx(sorted(overall, reverse=True)[:5])
+
+        best = charts[1 + int(matches[0].candidate_id)]
+        overlays = calculator._calculate_house_overlays(charts[0], best, "q", "c")
+        expected = {o.planet: o.falls_in_house for o in overlays if o.person == "q"}
+        for planet, house in matches[0].house_overlays["query_in_candidate"].items():
+            assert expected[planet] == house
+
+    def test_missing_bodies_are_ignored(self, calculator):
+        query = {"planet_positions": [{"planet": "Sun", "longitude": 10.0}]}
+        matrix = SynastryMatrix(
+            ids=["a", "b"],
+            longitudes=np.array([[12.0] + [np.nan] * 10, [np.nan] * 11]),
+        )
+        scores = calculator.score_candidates(query, matrix)
+        assert list(scores["harmonious_aspects"]) == [1, 0]
+        assert scores["overall"][1] == pytest.approx(50.0)
+
+
+class TestLoadMatrix:
+    """Test packing stored charts"""
+
+    def test_columnar_and_blob_rows(self, tmp_path, charts):
+        engine, write_engine = create_engines(
+            DatabaseConfig(driver="sqlite", sqlite_db_path=str(tmp_path / "synastry.db"))
+        )
+        Base.metadata.create_all(bind=write_engine)
+        session_factory = sessionmaker(bind=write_engine)
+
+        with session_factory() as db:
+            user = User(email="matrix@example.com", password_hash="x")
+            db.add(user)
+            db.flush()
+            for i, chart_data in enumerate(charts[:3]):
+                chart = BirthChart(
+                    user_id=user.user_id, birth_date="2000-01-01", birth_latitude=0.0,
+                    birth_longitude=0.0, chart_data=chart_data,
+                )
+                db.add(chart)
+                db.flush()
+                if i != 1:
+                    write_chart_columns(db, [(chart.chart_id, chart_data)])
+            db.commit()
+
+            matrix = load_synastry_matrix(db, user.user_id)
+        engine.dispose()
+        write_engine.dispose()
+
+        expected = SynastryMatrix.from_charts((str(i), c) for i, c in enumerate(charts[:3]))
+        assert len(matrix) == 3
+        np.testing.assert_allclose(
+            np.sort(matrix.longitudes, axis=0), np.sort(expected.longitudes, axis=0)
+        )
+        np.testing.assert_allclose(np.sort(matrix.cusps, axis=0), np.sort(expected.cusps, axis=0))
@@ -0,0 +1,103 @@
+"""
+Team Synergy Matrix Tests
+Covers vectorized scoring parity, incremental add/remove and the reading cache
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from backend.calculations.team_dynamics_engine import SynergyMatrix, TeamDynamicsEngine
+
+
+def make_members(count, start=0):
+    members = []
+    for i in range(start, start + count):
+        member = {
+            "id": f"m{i}",
+            "name": f"Person {i}",
+            "birth_date": (date(1970, 1, 1) + timedelta(days=97 * i)).isoformat(),
+        }
+        if i % 3 == 0:
+            member.update(birth_time="10:30:00", latitude=40.0 + i % 10, longitude=-74.0,
+                          timezone="UTC", full_name=f"Person Number {i}")
+        members.append(member)
+    return members
+
+
+@pytest.fixture
+def engine():
+    return TeamDynamicsEngine()
+
+
+def scalar_top_pairs(engine, members, top_n=5):
+    """The original row-by-row pairwise scan."""
+    synergies = []
+    for i, member1 in enumerate(members):
+        for member2 in members[i + 1:]:
+            score = engine._calculate_pairwise_synergy(member1.reading, member2.reading)
+            synergies.append((member1.name, member2.name, score))
+    synergies.sort(key=lambda x: x[2], reverse=True)
+    return synergies[:top_n]
+
+
+class TestSynergyMatrix:
+    """Test vectorized scores against the scalar engine"""
+
+    def test_matrix_matches_pairwise_scores(self, engine):
+        analysis = engine.analyze_team(make_members(30))
+        members = analysis.members
+        scores = analysis.synergy_matrix.as_array()
+
+        for i, member1 in enumerate(members):
+            for j, member2 in enumerate(members):
+                if i != j:
+                    assert scores[i, j] == engine._calculate_pairwise_synergy(
+                        member1.reading, member2.reading
+                    )
+        assert analysis.strongest_synergies == scalar_top_pairs(engine, members)
+
+    def test_incremental_updates_match_rebuild(self, engine):
+        analysis = engine.analyze_team(make_members(12))
+        for member_data in make_members(8, start=12):
+            analysis = engine.add_member(analysis, member_data)
+        for member_id in ("m0", "m7", "m19", "m3"):
+            analysis = engine.remove_member(analysis, member_id)
+
+        rebuilt = SynergyMatrix.from_members(analysis.members)
+        assert analysis.synergy_matrix.member_ids == [m.member_id for m in analysis.members]
+        np.testing.assert_array_equal(analysis.synergy_matrix.as_array(), rebuilt.as_array())
+        assert analysis.strongest_synergies == scalar_top_pairs(engine, analysis.members)
+        assert analysis.member_count == 16
+
+    def test_remove_unknown_member(self, engine):
+        analysis = engine.analyze_team(make_members(3))
+        with pytest.raises(KeyError):
+            engine.remove_member(analysis, "nobody")
+
+
+class TestReadingCache:
+    """Test cached and parallel member readings"""
+
+    def test_duplicates_and_repeat_requests_hit_cache(self, engine):
+        members = make_members(6)
+        engine.analyze_team(members + members[:2])
+        assert engine.reading_misses == 6
+
+        engine.analyze_team(members)
+        assert engine.reading_misses == 6
+        assert engine.reading_hits == 6
+
+    def test_executor_readings_match_serial(self, engine):
+        members = make_members(40)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = engine.analyze_team(members, executor=pool)
+        serial = TeamDynamicsEngine().analyze_team(members)
+
+        assert [m.reading.life_path_number for m in parallel.members] == \
+            [m.reading.life_path_number for m in serial.members]
+        assert [m.reading.sun_sign for m in parallel.members] == \
+            [m.reading.sun_sign for m in serial.members]
+        assert parallel.strongest_synergies == serial.strongest_synergies
@@ -0,0 +1,110 @@
+"""
+Exact Transit Event Tests
+Validates root-found ingresses, stations and the exact-timing transit mode
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from backend.calculations.ephemeris import EphemerisCalculator
+from backend.calculations.kp_engine import get_sub_lord
+from backend.calculations.transit_events import (
+    TransitEventFinder,
+    brent_root,
+    SIGN_INGRESS,
+    NAKSHATRA_INGRESS,
+    SUB_LORD_INGRESS,
+    EXACT_ASPECT,
+    STATION,
+)
+from backend.calculations.exceptions import InvalidDateRangeError
+
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def finder():
+    return TransitEventFinder()
+
+
+def _longitude(planet, jd):
+    batch = EphemerisCalculator().get_positions_batch([jd], [planet])
+    return float(batch.longitude[0, 0])
+
+
+class TestBrentRoot:
+    """Test the scalar root finder"""
+
+    def test_finds_root(self):
+        root = brent_root(lambda x: x * x - 2.0, 0.0, 2.0, -2.0, 2.0, xtol=1e-12)
+        assert root == pytest.approx(2 ** 0.5, abs=1e-10)
+
+
+class TestTransitEventFinder:
+    """Test exact event search"""
+
+    def test_sun_sign_ingress(self, finder):
+        """Sidereal Sun enters Capricorn in mid-January"""
+        events = finder.find_events(
+            START, START + timedelta(days=31), planets=['Sun'], event_types=(SIGN_INGRESS,)
+        )
+        assert len(events) == 1
+        assert events[0].target == 'Capricorn'
+        assert 13 <= events[0].event_date.day <= 15
+
+    def test_ingresses_are_minute_precise(self, finder):
+        """A minute either side of each ingress lies in different divisions"""
+        events = finder.find_events(
+            START, START + timedelta(days=10),
+            planets=['Moon', 'Mercury'],
+            event_types=(NAKSHATRA_INGRESS, SUB_LORD_INGRESS)
+        )
+        assert events
+        minute = 1.0 / 1440
+        for event in events:
+            after = get_sub_lord(_longitude(event.planet, event.jd + minute))
+            before = get_sub_lord(_longitude(event.planet, event.jd - minute))
+            if event.event_type == NAKSHATRA_INGRESS:
+                assert after.nakshatra_name == event.target
+                assert before.nakshatra_name != event.target
+            else:
+                assert after.sub_lord == event.target_lord
+
+    def test_events_sorted_by_time(self, finder):
+        events = finder.find_events(START, START + timedelta(days=30))
+        assert [e.jd for e in events] == sorted(e.jd for e in events)
+
+    def test_mercury_stations(self, finder):
+        """Mercury turned retrograde on 2025-03-15 and direct on 2025-04-07"""
+        events = finder.find_events(
+            START + timedelta(days=60), START + timedelta(days=110),
+            planets=['Mercury'], event_types=(STATION,)
+        )
+        assert [e.target for e in events] == ['Retrograde', 'Direct']
+        assert events[0].event_date.date().isoformat() == '2025-03-15'
+        assert events[1].event_date.date().isoformat() == '2025-04-07'
+
+    def test_fewer_evaluations_than_daily_scan(self, finder):
+        """One year of nakshatra ingresses costs less than a daily scan"""
+        finder.find_events(START, START + timedelta(days=365), event_types=(NAKSHATRA_INGRESS,))
+        daily_scan_samples = 366 * len(EphemerisCalculator.ALL_PLANETS) * 12 * 3
+        assert finder.evaluations < daily_scan_samples / 10
+
+    def test_one_event_per_aspect_crossing(self, finder):
+        """In a year the Sun conjoins and opposes a natal point once, squares it twice"""
+        events = finder.find_events(
+            START, START + timedelta(days=365),
+            planets=['Sun'], event_types=(EXACT_ASPECT,),
+            natal_points={'Moon': 100.0},
+            aspect_angles={'Conjunction': 0.0, 'Opposition': 180.0, 'Square': 90.0}
+        )
+        targets = [e.target for e in events]
+        assert targets.count('Conjunction natal Moon') == 1
+        assert targets.count('Opposition natal Moon') == 1
+        assert targets.count('Square natal Moon') == 2
+        assert len({round(e.jd, 6) for e in events}) == len(events)
+
+    def test_invalid_range_raises(self, finder):
+        with pytest.raises(InvalidDateRangeError):
+            finder.find_events(START, START - timedelta(days=1))
@@ -0,0 +1,100 @@
+"""
+Worker Runtime Tests
+Covers preloading, fork safety of the preloaded engines and worker readiness
+"""
+
+import json
+import os
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.api.v1 import health
+from backend.calculations.ephemeris import EphemerisCalculator
+from backend.services import worker_runtime
+from backend.services.worker_runtime import WorkerRegistry
+
+
+INSTANT = datetime(1984, 12, 19, 18, 0)
+
+
+def longitudes(calculator):
+    return {name: round(p.longitude, 9) for name, p in calculator.get_all_planets(INSTANT).items()}
+
+
+class TestPreload:
+    def test_steps_reported(self):
+        report = worker_runtime.preload_shared_state(steps=("kp_tables", "ephemeris_table", "swiss_ephemeris"))
+
+        assert report["kp_tables"]["ok"] and report["kp_tables"]["entries"] == 252
+        assert report["swiss_ephemeris"]["ok"]
+        assert set(worker_runtime.worker_status()["preloaded"]) == set(report)
+
+    def test_failed_step_does_not_raise(self, monkeypatch):
+        def broken():
+            raise RuntimeError("model missing")
+
+        monkeypatch.setitem(worker_runtime._PRELOADERS, "knowledge_base", broken)
+        report = worker_runtime.preload_shared_state(steps=("knowledge_base",))
+        assert report["knowledge_base"] == {"ok": False, "error": "model missing", "seconds": pytest.approx(0, abs=1)}
+
+    def test_forked_worker_matches_parent(self):
+        calculator = EphemerisCalculator()
+        expected = longitudes(calculator)
+        worker_runtime.preload_shared_state(steps=("swiss_ephemeris",))
+        assert longitudes(calculator) == expected
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                worker_runtime.reset_after_fork()
+                os.write(write_fd, json.dumps(longitudes(calculator)).encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            child = json.loads(f.read())
+        os.waitpid(pid, 0)
+
+        assert child == expected
+
+
+class TestReadiness:
+    def test_registry_prunes_dead_workers(self, tmp_path):
+        registry = WorkerRegistry(str(tmp_path))
+        registry.register({"pid": os.getpid(), "ready": True, "started_at": 1.0})
+        registry.register({"pid": 2 ** 22 + 1, "ready": True, "started_at": 1.0})
+
+        assert [w["pid"] for w in registry.workers()] == [os.getpid()]
+        assert len(os.listdir(tmp_path)) == 1
+
+    @pytest.mark.asyncio
+    async def test_ready_reports_own_worker(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(worker_runtime.STATE_DIR_ENV, str(tmp_path))
+        monkeypatch.setenv(worker_runtime.EXPECTED_WORKERS_ENV, "2")
+        app = FastAPI()
+        app.include_router(health.router, prefix="/api/v1")
+        sibling = {"pid": os.getppid(), "ready": True, "started_at": 1.0}
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            worker_runtime.mark_stopping()
+            assert (await client.get("/api/v1/health/ready")).status_code == 503
+
+            # A sibling still starting (or being recycled) does not fail this worker's probe
+            worker_runtime.mark_ready()
+            alone = await client.get("/api/v1/health/ready")
+            partial = (await client.get("/api/v1/health/workers")).json()
+
+            WorkerRegistry(str(tmp_path)).register(sibling)
+            workers = (await client.get("/api/v1/health/workers")).json()
+
+            worker_runtime.mark_stopping()
+            draining = await client.get("/api/v1/health/ready")
+
+        assert alone.status_code == 200 and alone.json()["pid"] == os.getpid()
+        assert not partial["ready"] and partial["ready_workers"] == 1
+        assert workers["ready"] and workers["total"] == workers["ready_workers"] == workers["expected"] == 2
+        assert draining.status_code == 503 and not draining.json()["ready"]
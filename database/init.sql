@@ -40,5 +40,42 @@ CREATE TABLE IF NOT EXISTS charts (
 CREATE INDEX IF NOT EXISTS idx_charts_user_id ON charts(user_id);
 CREATE INDEX IF NOT EXISTS idx_charts_uuid ON charts(uuid);
 
+-- Chart planet positions (columnar copy of chart_data planets and angles)
+CREATE TABLE IF NOT EXISTS chart_planet_positions (
+    chart_id UUID NOT NULL REFERENCES charts(uuid) ON DELETE CASCADE,
+    planet VARCHAR(20) NOT NULL,
+    position INTEGER NOT NULL,
+    longitude DOUBLE PRECISION NOT NULL,
+    zodiac_sign VARCHAR(20) NOT NULL,
+    degree INTEGER,
+    minutes INTEGER,
+    seconds DOUBLE PRECISION,
+    house INTEGER,
+    retrograde BOOLEAN DEFAULT FALSE,
+    nakshatra VARCHAR(30),
+    pada INTEGER,
+    PRIMARY KEY (chart_id, planet)
+);
+
+CREATE INDEX IF NOT EXISTS idx_chart_planet_nakshatra ON chart_planet_positions(planet, nakshatra);
+CREATE INDEX IF NOT EXISTS idx_chart_planet_sign ON chart_planet_positions(planet, zodiac_sign);
+CREATE INDEX IF NOT EXISTS idx_chart_planet_house ON chart_planet_positions(planet, house);
+
+-- Chart house cusps (columnar copy of chart_data house cusps)
+CREATE TABLE IF NOT EXISTS chart_house_cusps (
+    chart_id UUID NOT NULL REFERENCES charts(uuid) ON DELETE CASCADE,
+    house INTEGER NOT NULL,
+    longitude DOUBLE PRECISION NOT NULL,
+    zodiac_sign VARCHAR(20) NOT NULL,
+    degree INTEGER,
+    minutes INTEGER,
+    seconds DOUBLE PRECISION,
+    PRIMARY KEY (chart_id, house)
+);
+
+CREATE INDEX IF NOT EXISTS idx_chart_cusp_sign ON chart_house_cusps(house, zodiac_sign);
+
 COMMENT ON TABLE users IS 'Stores user account information';
 COMMENT ON TABLE charts IS 'Stores astrological birth chart data';
+COMMENT ON TABLE chart_planet_positions IS 'Indexed planet and angle placements copied from chart_data';
+COMMENT ON TABLE chart_house_cusps IS 'Indexed house cusps copied from chart_data';
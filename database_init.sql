@@ -81,6 +81,41 @@ CREATE INDEX idx_charts_created ON birth_charts(created_at);
 CREATE INDEX idx_charts_location ON birth_charts(birth_latitude, birth_longitude);
 CREATE INDEX idx_charts_deleted_at ON birth_charts(deleted_at);
 
+-- Chart Planet Positions - columnar copy of chart_data planets and angles
+CREATE TABLE IF NOT EXISTS chart_planet_positions (
+  chart_id UUID NOT NULL REFERENCES birth_charts(chart_id) ON DELETE CASCADE,
+  planet VARCHAR(20) NOT NULL,
+  position INTEGER NOT NULL,
+  longitude DOUBLE PRECISION NOT NULL,
+  zodiac_sign VARCHAR(20) NOT NULL,
+  degree INTEGER,
+  minutes INTEGER,
+  seconds DOUBLE PRECISION,
+  house INTEGER,
+  retrograde BOOLEAN DEFAULT false,
+  nakshatra VARCHAR(30),
+  pada INTEGER,
+  PRIMARY KEY (chart_id, planet)
+);
+
+CREATE INDEX idx_chart_planet_nakshatra ON chart_planet_positions(planet, nakshatra);
+CREATE INDEX idx_chart_planet_sign ON chart_planet_positions(planet, zodiac_sign);
+CREATE INDEX idx_chart_planet_house ON chart_planet_positions(planet, house);
+
+-- Chart House Cusps - columnar copy of chart_data house cusps
+CREATE TABLE IF NOT EXISTS chart_house_cusps (
+  chart_id UUID NOT NULL REFERENCES birth_charts(chart_id) ON DELETE CASCADE,
+  house INTEGER NOT NULL,
+  longitude DOUBLE PRECISION NOT NULL,
+  zodiac_sign VARCHAR(20) NOT NULL,
+  degree INTEGER,
+  minutes INTEGER,
+  seconds DOUBLE PRECISION,
+  PRIMARY KEY (chart_id, house)
+);
+
+CREATE INDEX idx_chart_cusp_sign ON chart_house_cusps(house, zodiac_sign);
+
 -- Predictions table - Prediction results from engines
 CREATE TABLE IF NOT EXISTS predictions (
   prediction_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
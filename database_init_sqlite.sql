@@ -54,7 +54,7 @@ CREATE INDEX IF NOT EXISTS idx_api_keys_hash ON api_keys(api_key_hash);
 CREATE INDEX IF NOT EXISTS idx_api_keys_is_active ON api_keys(is_active);
 
 -- ============================================================================
--- DATA LAYER (3 tables)
+-- DATA LAYER (5 tables)
 -- ============================================================================
 
 -- Birth Charts table - User's astrological birth charts
@@ -82,6 +82,41 @@ CREATE INDEX IF NOT EXISTS idx_birth_charts_birth_date ON birth_charts(birth_dat
 CREATE INDEX IF NOT EXISTS idx_birth_charts_created_at ON birth_charts(created_at);
 CREATE INDEX IF NOT EXISTS idx_birth_charts_deleted_at ON birth_charts(deleted_at);
 
+-- Chart Planet Positions - columnar copy of chart_data planets and angles
+CREATE TABLE IF NOT EXISTS chart_planet_positions (
+  chart_id TEXT NOT NULL REFERENCES birth_charts(chart_id) ON DELETE CASCADE,
+  planet TEXT NOT NULL,
+  position INTEGER NOT NULL,
+  longitude REAL NOT NULL,
+  zodiac_sign TEXT NOT NULL,
+  degree INTEGER,
+  minutes INTEGER,
+  seconds REAL,
+  house INTEGER,
+  retrograde BOOLEAN DEFAULT 0,
+  nakshatra TEXT,
+  pada INTEGER,
+  PRIMARY KEY (chart_id, planet)
+);
+
+CREATE INDEX IF NOT EXISTS idx_chart_planet_nakshatra ON chart_planet_positions(planet, nakshatra);
+CREATE INDEX IF NOT EXISTS idx_chart_planet_sign ON chart_planet_positions(planet, zodiac_sign);
+CREATE INDEX IF NOT EXISTS idx_chart_planet_house ON chart_planet_positions(planet, house);
+
+-- Chart House Cusps - columnar copy of chart_data house cusps
+CREATE TABLE IF NOT EXISTS chart_house_cusps (
+  chart_id TEXT NOT NULL REFERENCES birth_charts(chart_id) ON DELETE CASCADE,
+  house INTEGER NOT NULL,
+  longitude REAL NOT NULL,
+  zodiac_sign TEXT NOT NULL,
+  degree INTEGER,
+  minutes INTEGER,
+  seconds REAL,
+  PRIMARY KEY (chart_id, house)
+);
+
+CREATE INDEX IF NOT EXISTS idx_chart_cusp_sign ON chart_house_cusps(house, zodiac_sign);
+
 -- Predictions table - Astrological predictions for users
 CREATE TABLE IF NOT EXISTS predictions (
   prediction_id TEXT PRIMARY KEY,